@@ -0,0 +1,311 @@
+"""
+This module provides codecs that decode and validate the string
+arguments of Tango commands, before they are passed to a command's
+``do()`` method.
+
+A codec is built once, as a class attribute of the command class that
+uses it, so that its validation rules are compiled once rather than on
+every call; and the decoded argument is passed through to ``do()``, so
+that it is never parsed twice. A device that needs different decoding
+or validation overrides the ``argument_codec`` attribute of its command
+class.
+
+JSON is decoded with `orjson <https://github.com/ijl/orjson>`_ if it is
+installed, falling back to the standard library ``json`` module for
+documents that ``orjson`` rejects but ``json`` accepts, such as those
+containing ``NaN`` or very large integers.
+
+Codecs also decode ``DevEncoded`` arguments: a tuple of an encoding
+name and the encoded bytes. The "json" encoding, UTF-8 encoded JSON, is
+always available; the more compact "msgpack" encoding is available if
+`msgpack <https://msgpack.org/>`_ is installed. Decoded ``DevEncoded``
+arguments are validated by the same rules as string arguments.
+"""
+import json
+from collections.abc import Mapping
+
+from ska_tango_base.faults import ArgumentValidationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+__all__ = [
+    "ArgumentCodec",
+    "JsonArgumentCodec",
+    "dumps_encoded",
+    "encoded_text",
+    "encodings",
+    "json_backend",
+    "loads",
+    "loads_encoded",
+    "preferred_encoding",
+]
+
+
+json_backend = "json" if orjson is None else "orjson"
+"""The name of the fastest JSON decoder available."""
+
+encodings = ("json",) if msgpack is None else ("json", "msgpack")
+"""The names of the ``DevEncoded`` encodings available."""
+
+preferred_encoding = encodings[-1]
+"""The name of the most compact ``DevEncoded`` encoding available."""
+
+
+def loads(text):
+    """
+    Decode a JSON document, with the fastest JSON decoder available.
+
+    :param text: the JSON document
+    :type text: str
+
+    :return: the decoded document
+
+    :raises json.JSONDecodeError: if the document is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # let the standard library accept it, or explain why not
+    return json.loads(text)
+
+
+def loads_encoded(argin):
+    """
+    Decode a ``DevEncoded`` value.
+
+    :param argin: the name of the encoding, and the encoded bytes
+    :type argin: (str, bytes)
+
+    :return: the decoded value
+
+    :raises ArgumentValidationError: if the encoding is not available,
+        or the bytes cannot be decoded
+    """
+    (encoding, data) = argin
+    try:
+        if encoding == "json":
+            return loads(data)
+        if encoding == "msgpack" and msgpack is not None:
+            return msgpack.unpackb(data)
+    except ValueError as error:
+        raise ArgumentValidationError(f"Invalid {encoding}: {error}") from error
+    raise ArgumentValidationError(
+        f"Unsupported encoding '{encoding}'; expected one of {list(encodings)}"
+    )
+
+
+def dumps_encoded(value, encoding=None):
+    """
+    Encode a value as a ``DevEncoded`` value.
+
+    :param value: the value to encode
+    :param encoding: the name of the encoding, or None for the most
+        compact encoding available
+    :type encoding: str
+
+    :return: the name of the encoding, and the encoded bytes
+    :rtype: (str, bytes)
+
+    :raises ValueError: if the encoding is not available
+    """
+    encoding = encoding or preferred_encoding
+    if encoding == "json":
+        return (encoding, json.dumps(value).encode("utf-8"))
+    if encoding == "msgpack" and msgpack is not None:
+        return (encoding, msgpack.packb(value))
+    raise ValueError(
+        f"Unsupported encoding '{encoding}'; expected one of {list(encodings)}"
+    )
+
+
+def encoded_text(argin, decoded):
+    """
+    Return the JSON text of a ``DevEncoded`` value that has already been
+    decoded, without decoding it again.
+
+    For the "json" encoding, this is the encoded bytes as a string, so
+    it is exactly the text that the client sent, and hashes the same as
+    that text sent as a string argument. Other encodings carry no JSON
+    text, so the decoded value is serialised; any bytes in it are
+    decoded as UTF-8, with undecodable bytes escaped, as JSON has no
+    bytes type.
+
+    :param argin: the name of the encoding, and the encoded bytes
+    :type argin: (str, bytes)
+    :param decoded: the value decoded from ``argin``
+
+    :return: the JSON text of the value
+    :rtype: str
+    """
+    (encoding, data) = argin
+    if encoding == "json":
+        return bytes(data).decode("utf-8")
+    return json.dumps(decoded, default=_bytes_to_text)
+
+
+def _bytes_to_text(value):
+    """
+    Helper function that converts a value that JSON cannot represent,
+    for :py:func:`.encoded_text`.
+
+    :param value: the value
+
+    :return: the value as a string, if it is bytes
+
+    :raises TypeError: if the value is not bytes
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value).decode("utf-8", "backslashreplace")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ArgumentCodec:
+    """
+    A codec that passes string command arguments through unchanged,
+    and decodes ``DevEncoded`` arguments without validating them.
+
+    Subclasses override :py:meth:`.decode` and
+    :py:meth:`.decode_encoded`.
+    """
+
+    def decode(self, argin):
+        """
+        Decode and validate a command argument.
+
+        :param argin: the argument, as received by the Tango command
+
+        :return: the decoded argument
+        """
+        return argin
+
+    def decode_encoded(self, argin):
+        """
+        Decode and validate a ``DevEncoded`` command argument.
+
+        :param argin: the name of the encoding, and the encoded bytes
+        :type argin: (str, bytes)
+
+        :return: the decoded argument
+
+        :raises ArgumentValidationError: if the encoding is not
+            available, or the bytes cannot be decoded
+        """
+        return loads_encoded(argin)
+
+
+class JsonArgumentCodec(ArgumentCodec):
+    """
+    A codec for JSON-encoded command arguments.
+    """
+
+    def __init__(self, expected_type=None, required_keys=None):
+        """
+        Initialise a new JsonArgumentCodec.
+
+        :param expected_type: the type, or tuple of types, that the
+            decoded argument must be, such as ``dict`` or ``list``; or
+            None for no check
+        :type expected_type: type or tuple of type
+        :param required_keys: keys that a decoded ``dict`` must have;
+            either an iterable of keys, or a mapping from each key to
+            the type, or tuple of types, that its value must be, or to
+            None for no check
+        :type required_keys: iterable or dict
+        """
+        self._expected_type = expected_type
+        if required_keys is None:
+            required_keys = {}
+        elif not isinstance(required_keys, Mapping):
+            required_keys = dict.fromkeys(required_keys)
+        self._required_keys = tuple(required_keys.items())
+
+    def decode(self, argin):
+        """
+        Decode and validate a JSON-encoded command argument.
+
+        :param argin: the JSON-encoded argument
+        :type argin: str
+
+        :return: the decoded argument
+
+        :raises ArgumentValidationError: if the argument is not valid
+            JSON, or fails validation
+        """
+        try:
+            decoded = loads(argin)
+        except ValueError as error:
+            raise ArgumentValidationError(f"Invalid JSON: {error}") from error
+        return self._validate(decoded)
+
+    def decode_encoded(self, argin):
+        """
+        Decode and validate a ``DevEncoded`` command argument.
+
+        :param argin: the name of the encoding, and the encoded bytes
+        :type argin: (str, bytes)
+
+        :return: the decoded argument
+
+        :raises ArgumentValidationError: if the encoding is not
+            available, the bytes cannot be decoded, or the decoded
+            argument fails validation
+        """
+        return self._validate(loads_encoded(argin))
+
+    def _validate(self, decoded):
+        """
+        Helper method that validates a decoded argument.
+
+        :param decoded: the decoded argument
+
+        :return: the decoded argument
+
+        :raises ArgumentValidationError: if the argument fails
+            validation
+        """
+        expected_type = self._expected_type
+        if expected_type is not None and not isinstance(decoded, expected_type):
+            raise ArgumentValidationError(
+                f"Expected {self._describe(expected_type)}, "
+                f"got {type(decoded).__name__}"
+            )
+
+        if self._required_keys:
+            if not isinstance(decoded, dict):
+                raise ArgumentValidationError(
+                    f"Expected dict, got {type(decoded).__name__}"
+                )
+            for (key, value_type) in self._required_keys:
+                if key not in decoded:
+                    raise ArgumentValidationError(f"Missing key '{key}'")
+                if value_type is not None and not isinstance(decoded[key], value_type):
+                    raise ArgumentValidationError(
+                        f"Expected {self._describe(value_type)} for key '{key}', "
+                        f"got {type(decoded[key]).__name__}"
+                    )
+        return decoded
+
+    @staticmethod
+    def _describe(types):
+        """
+        Helper method that describes a type, or tuple of types, for an
+        error message.
+
+        :param types: the type, or tuple of types
+        :type types: type or tuple of type
+
+        :return: the names of the types
+        :rtype: str
+        """
+        if isinstance(types, tuple):
+            return " or ".join(t.__name__ for t in types)
+        return types.__name__
@@ -7,20 +7,20 @@ reported by Tango devices through the ``AdminMode`` attribute.
 """
 from transitions.extensions import LockedMachine as Machine
 
+from ska_tango_base.batching import BatchedActionsMixin
 from ska_tango_base.control_model import AdminMode
 from ska_tango_base.faults import StateModelError
-from ska_tango_base.utils import for_testing_only
+from ska_tango_base.table_machine import TableMachine
+from ska_tango_base.utils import compile_trigger_table, for_testing_only
 
 
 __all__ = ["AdminModeModel"]
 
 
-class _AdminModeMachine(Machine):
+class _AdminModeMachineMixin:
     """
-    The state machine governing admin modes.
-
-    For documentation of states and transitions, see the documentation
-    of the public :py:class:`.AdminModeModel` class.
+    Mixin that defines the states and transitions of the admin mode
+    state machine, independently of the engine that implements it.
     """
 
     def __init__(self, callback=None, **extra_kwargs):
@@ -88,7 +88,25 @@ class _AdminModeMachine(Machine):
             self._callback(self.state)
 
 
-class AdminModeModel:
+class _AdminModeMachine(_AdminModeMachineMixin, Machine):
+    """
+    The state machine governing admin modes.
+
+    For documentation of states and transitions, see the documentation
+    of the public :py:class:`.AdminModeModel` class.
+    """
+
+
+class _AdminModeTableMachine(_AdminModeMachineMixin, TableMachine):
+    """
+    The admin mode state machine, implemented by the compact,
+    table-driven :py:class:`~ska_tango_base.table_machine.TableMachine`
+    engine rather than by ``transitions``. See
+    :py:class:`._AdminModeMachine`.
+    """
+
+
+class AdminModeModel(BatchedActionsMixin):
     """
     This class implements the state model for device adminMode.
 
@@ -143,7 +161,9 @@ class AdminModeModel:
 
     """
 
-    def __init__(self, logger, callback=None):
+    _batched_attribute = "admin_mode"
+
+    def __init__(self, logger, callback=None, table_machine=False):
         """
         Initialises the state model.
 
@@ -153,13 +173,21 @@ class AdminModeModel:
         :param callback: A callback to be called when the state machine
             for admin_mode reports a change of state
         :type callback: callable
+        :param table_machine: whether to use the compact, table-driven
+            :py:class:`~ska_tango_base.table_machine.TableMachine`
+            engine for the underlying state machine, rather than
+            ``transitions``
+        :type table_machine: bool
         """
         self.logger = logger
 
         self._admin_mode = None
         self._callback = callback
+        self._init_batching()
 
-        self._admin_mode_machine = _AdminModeMachine(callback=self._admin_mode_changed)
+        machine_class = _AdminModeTableMachine if table_machine else _AdminModeMachine
+        self._admin_mode_machine = machine_class(callback=self._admin_mode_changed)
+        self._allowed_actions = compile_trigger_table(self._admin_mode_machine)
 
     @property
     def admin_mode(self):
@@ -184,8 +212,7 @@ class AdminModeModel:
         admin_mode = AdminMode[machine_state]
         if self._admin_mode != admin_mode:
             self._admin_mode = admin_mode
-            if self._callback is not None:
-                self._callback(admin_mode)
+            self._call_callback(admin_mode)
 
     def is_action_allowed(self, action, raise_if_disallowed=False):
         """
@@ -204,9 +231,7 @@ class AdminModeModel:
         :return: whether the action is allowed in the current state
         :rtype: bool
         """
-        if action in self._admin_mode_machine.get_triggers(
-            self._admin_mode_machine.state
-        ):
+        if action in self._allowed_actions[self._admin_mode_machine.state]:
             return True
 
         if raise_if_disallowed:
@@ -222,8 +247,9 @@ class AdminModeModel:
         :param action: an action, as given in the transitions table
         :type action: str
         """
-        _ = self.is_action_allowed(action, raise_if_disallowed=True)
-        self._admin_mode_machine.trigger(action)
+        with self._batch_lock:
+            _ = self.is_action_allowed(action, raise_if_disallowed=True)
+            self._admin_mode_machine.trigger(action)
 
     @for_testing_only
     def _straight_to_state(self, *, admin_mode):
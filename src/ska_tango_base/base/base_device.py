@@ -12,13 +12,18 @@ device.
 """
 # PROTECTED REGION ID(SKABaseDevice.additionnal_import) ENABLED START #
 # Standard imports
+import collections
+import copy
 import enum
 import inspect
+import itertools
+import json
 import logging
 import logging.handlers
 import socket
 import sys
 import threading
+import time
 import typing
 import warnings
 
@@ -35,6 +40,8 @@ import debugpy
 import ska_ser_logging
 from ska_tango_base import release
 from ska_tango_base.base import AdminModeModel, OpStateModel, BaseComponentManager
+from ska_tango_base.command_logging import CommandLogging
+from ska_tango_base.command_statistics import CommandStatistics
 from ska_tango_base.commands import (
     BaseCommand,
     CompletionCommand,
@@ -42,6 +49,10 @@ from ska_tango_base.commands import (
     ResponseCommand,
     ResultCode,
 )
+from ska_tango_base.event_publisher import EventPublisher
+from ska_tango_base.executor import CommandExecutor, CommandStatus
+from ska_tango_base.group_snapshot import GroupSnapshotReader
+from ska_tango_base.health_rollup import HealthRollup
 from ska_tango_base.control_model import (
     AdminMode,
     ControlMode,
@@ -51,7 +62,7 @@ from ska_tango_base.control_model import (
     LoggingLevel,
 )
 
-from ska_tango_base.utils import get_groups_from_json
+from ska_tango_base.utils import get_lazy_groups_from_json
 from ska_tango_base.faults import (
     GroupDefinitionsError,
     LoggingTargetError,
@@ -141,13 +152,297 @@ class TangoLoggingServiceHandler(logging.Handler):
         )
 
 
+class AsyncLoggingHandler(logging.Handler):
+    """
+    Handler that hands records to another handler on a background thread.
+
+    Records are held in a bounded buffer, from which a drain thread
+    passes them to the wrapped handler, so that a slow or unreachable
+    log server delays only the drain thread, never the thread that
+    logs. When the buffer is full, a record is dropped according to the
+    drop policy:
+
+    * "oldest": the oldest buffered record is dropped;
+    * "newest": the new record is dropped;
+    * "level": the oldest buffered record of the lowest level is
+      dropped, unless the new record is of a lower level still, in
+      which case the new record is dropped.
+
+    Buffered records are held in a deque for each level, so that the
+    cost of dropping a record, and of taking the next one to handle,
+    depends on the number of levels buffered rather than on the
+    capacity. Each record carries a sequence number, by which records
+    are handled in the order in which they were logged.
+    """
+
+    DROP_POLICIES = ("oldest", "newest", "level")
+
+    def __init__(self, handler, capacity=1000, drop_policy="oldest", close_timeout=1.0):
+        """
+        Initialise a new AsyncLoggingHandler, and start its drain thread.
+
+        :param handler: the handler to which records are passed
+        :type handler: :py:class:`logging.Handler`
+        :param capacity: the maximum number of records buffered
+        :type capacity: int
+        :param drop_policy: which record to drop when the buffer is
+            full; one of "oldest", "newest" or "level"
+        :type drop_policy: str
+        :param close_timeout: the maximum time, in seconds, for which
+            :py:meth:`.flush` and :py:meth:`.close` wait for buffered
+            records to be handled
+        :type close_timeout: float
+
+        :raises ValueError: if the drop policy is not recognised
+        """
+        if drop_policy not in self.DROP_POLICIES:
+            raise ValueError(
+                f"Invalid drop policy '{drop_policy}' - options are "
+                f"{list(self.DROP_POLICIES)}"
+            )
+        super().__init__()
+        self.handler = handler
+        self._capacity = max(1, capacity)
+        self._drop_policy = drop_policy
+        self._close_timeout = close_timeout
+
+        # deque of (sequence number, enqueue time, record) for each
+        # level, removed when empty
+        self._records = {}
+        self._size = 0
+        self._sequence = itertools.count()
+        self._condition = threading.Condition(threading.Lock())
+        self._busy = False
+        self._closing = False
+
+        self._dropped = 0
+        self._handled = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+        self._thread = threading.Thread(
+            target=self._drain,
+            name=f"{self.__class__.__name__}-{handler.name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def emit(self, record):
+        """
+        Buffer a record, to be passed to the wrapped handler by the
+        drain thread.
+
+        The message is merged with its arguments here, in the logging
+        thread, so that the record does not refer to objects that may
+        change before it is handled.
+
+        :param record: the record to buffer
+        :type record: :py:class:`logging.LogRecord`
+        """
+        try:
+            record = copy.copy(record)
+            record.msg = record.getMessage()
+            record.args = None
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self._condition:
+            if self._closing:
+                self._dropped += 1
+                return
+            if self._size >= self._capacity:
+                self._dropped += 1
+                if not self._make_room(record):
+                    return
+            level_records = self._records.get(record.levelno)
+            if level_records is None:
+                level_records = self._records[record.levelno] = collections.deque()
+            level_records.append((next(self._sequence), time.monotonic(), record))
+            self._size += 1
+            self._condition.notify()
+
+    def _make_room(self, record):
+        """
+        Helper method that drops a buffered record, according to the
+        drop policy, to make room for a new one.
+
+        Must be called with the lock held.
+
+        :param record: the new record
+        :type record: :py:class:`logging.LogRecord`
+
+        :return: whether room was made; if not, the new record is to be
+            dropped
+        :rtype: bool
+        """
+        if self._drop_policy == "oldest":
+            self._pop(self._oldest_level())
+            return True
+        if self._drop_policy == "newest":
+            return False
+
+        lowest = min(self._records)
+        if lowest > record.levelno:
+            return False
+        self._pop(lowest)
+        return True
+
+    def _oldest_level(self):
+        """
+        Helper method that returns the level of the oldest buffered
+        record.
+
+        Must be called with the lock held, and with records buffered.
+
+        :return: the level of the oldest buffered record
+        :rtype: int
+        """
+        return min(self._records, key=lambda level: self._records[level][0][0])
+
+    def _pop(self, level):
+        """
+        Helper method that removes and returns the oldest buffered
+        record of a level.
+
+        Must be called with the lock held.
+
+        :param level: the level of the record
+        :type level: int
+
+        :return: the enqueue time of the record, and the record
+        :rtype: (float, :py:class:`logging.LogRecord`)
+        """
+        level_records = self._records[level]
+        (_, enqueue_time, record) = level_records.popleft()
+        if not level_records:
+            del self._records[level]
+        self._size -= 1
+        return (enqueue_time, record)
+
+    def _drain(self):
+        """
+        Body of the drain thread, which passes buffered records to the
+        wrapped handler until this handler is closed.
+        """
+        while True:
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+                while not self._records and not self._closing:
+                    self._condition.wait()
+                if not self._records:
+                    return
+                (enqueue_time, record) = self._pop(self._oldest_level())
+                self._busy = True
+
+            try:
+                self.handler.handle(record)
+            except Exception:
+                self.handleError(record)
+
+            latency = time.monotonic() - enqueue_time
+            with self._condition:
+                self._handled += 1
+                self._total_latency += latency
+                if latency > self._max_latency:
+                    self._max_latency = latency
+
+    def flush(self):
+        """
+        Wait, for no longer than the close timeout, for buffered records
+        to be handled, then flush the wrapped handler.
+        """
+        deadline = time.monotonic() + self._close_timeout
+        with self._condition:
+            while (self._records or self._busy) and self._thread.is_alive():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+        self.handler.flush()
+
+    def close(self):
+        """
+        Stop the drain thread, once it has handled buffered records or
+        the close timeout has expired, and close the wrapped handler.
+        Records that remain buffered are dropped.
+        """
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        self._thread.join(self._close_timeout)
+        with self._condition:
+            self._dropped += self._size
+            self._records.clear()
+            self._size = 0
+        self.handler.close()
+        super().close()
+
+    @property
+    def dropped(self):
+        """
+        Return the number of records dropped.
+
+        :return: the number of records dropped
+        :rtype: int
+        """
+        return self._dropped
+
+    @property
+    def handled(self):
+        """
+        Return the number of records passed to the wrapped handler.
+
+        :return: the number of records handled
+        :rtype: int
+        """
+        return self._handled
+
+    @property
+    def mean_latency(self):
+        """
+        Return the mean time from buffering a record to its having been
+        handled.
+
+        :return: the mean latency, in seconds
+        :rtype: float
+        """
+        with self._condition:
+            return self._total_latency / self._handled if self._handled else 0.0
+
+    @property
+    def max_latency(self):
+        """
+        Return the maximum time from buffering a record to its having
+        been handled.
+
+        :return: the maximum latency, in seconds
+        :rtype: float
+        """
+        return self._max_latency
+
+    def __repr__(self):
+        return "<{} {!r} ({}, capacity {})>".format(
+            self.__class__.__name__, self.handler, self._drop_policy, self._capacity
+        )
+
+
 class LoggingUtils:
     """Utility functions to aid logger configuration.
 
     These functions are encapsulated in class to aid testing - it
     allows dependent functions to be mocked.
+
+    Handlers for all targets other than "tango" targets are shared by
+    the devices in a process: devices that log to the same target use
+    the same handler, and so the same file or socket.  Each device's
+    records are still tagged with its name, by a filter on its logger.
     """
 
+    _shared_handlers = {}
+    _shared_handlers_lock = threading.Lock()
+
     @staticmethod
     def sanitise_logging_targets(targets, device_name):
         """Validate and return logging targets '<type>::<name>' strings.
@@ -155,6 +450,8 @@ class LoggingUtils:
         :param targets:
             List of candidate logging target strings, like '<type>[::<name>]'
             Empty and whitespace-only strings are ignored.  Can also be None.
+            For the 'async' type, the name is itself a target, other than
+            an 'async' target, which is validated in turn.
 
         :param device_name:
             Tango device name, like 'domain/family/member', used
@@ -169,6 +466,7 @@ class LoggingUtils:
             "file": "{}.log".format(device_name.replace("/", "_")),
             "syslog": None,
             "tango": "logger",
+            "async": None,
         }
 
         valid_targets = []
@@ -194,6 +492,20 @@ class LoggingUtils:
                     raise LoggingTargetError(
                         "Target name required for type {}".format(target_type)
                     )
+                if target_type == "async":
+                    if target_name.split("::", 1)[0].strip() == "async":
+                        raise LoggingTargetError(
+                            "Invalid target: {} - async targets cannot be "
+                            "nested".format(target)
+                        )
+                    inner_targets = LoggingUtils.sanitise_logging_targets(
+                        [target_name], device_name
+                    )
+                    if not inner_targets:
+                        raise LoggingTargetError(
+                            "Target name required for type {}".format(target_type)
+                        )
+                    target_name = inner_targets[0]
                 valid_target = "{}::{}".format(target_type, target_name)
                 valid_targets.append(valid_target)
 
@@ -270,17 +582,27 @@ class LoggingUtils:
         return address, socktype
 
     @staticmethod
-    def create_logging_handler(target, tango_logger=None):
-        """Create a Python log handler based on the target type (console, file, syslog, tango)
+    def create_logging_handler(
+        target, tango_logger=None, buffer_size=1000, drop_policy="oldest"
+    ):
+        """Create a Python log handler based on the target type (console, file, syslog, tango, async)
 
         :param target:
             Logging target for logger, <type>::<name>
 
         :param tango_logger:
             Instance of tango.Logger, optional.  Only required if creating
-            a target of type "tango".
+            a target of type "tango", or of type "async" wrapping one.
+
+        :param buffer_size:
+            Maximum number of records buffered by an "async" target.
 
-        :return: StreamHandler, RotatingFileHandler, SysLogHandler, or TangoLoggingServiceHandler
+        :param drop_policy:
+            Which record an "async" target drops when its buffer is full:
+            "oldest", "newest" or "level".  See :py:class:`.AsyncLoggingHandler`.
+
+        :return: StreamHandler, RotatingFileHandler, SysLogHandler,
+            TangoLoggingServiceHandler, or AsyncLoggingHandler wrapping one of these
 
         :raises LoggingTargetError: for invalid target string
         """
@@ -313,6 +635,17 @@ class LoggingUtils:
                 raise LoggingTargetError(
                     "Missing tango_logger instance for 'tango' target type"
                 )
+        elif target_type == "async":
+            inner_handler = LoggingUtils.create_logging_handler(
+                target_name, tango_logger
+            )
+            try:
+                handler = AsyncLoggingHandler(
+                    inner_handler, capacity=buffer_size, drop_policy=drop_policy
+                )
+            except ValueError as error:
+                inner_handler.close()
+                raise LoggingTargetError(str(error))
         else:
             raise LoggingTargetError(
                 "Invalid target type requested: '{}' in '{}'".format(
@@ -324,6 +657,65 @@ class LoggingUtils:
         handler.name = target
         return handler
 
+    @staticmethod
+    def acquire_logging_handler(target, tango_logger=None, **options):
+        """Return a handler for a logging target, shared with other devices if possible.
+
+        If a handler for the target is already in use in this process, it is
+        returned, and its reference count incremented; otherwise a handler is
+        created.  Handlers for "tango" targets, which log to a particular
+        device's Tango logger, are never shared.
+
+        :param target:
+            Logging target for logger, <type>::<name>
+
+        :param tango_logger:
+            Instance of tango.Logger, optional.  Only required if creating
+            a target of type "tango", or of type "async" wrapping one.
+
+        :param options:
+            Keyword arguments for :py:meth:`.create_logging_handler`.  A
+            shared handler keeps the options with which it was created.
+
+        :return: the handler, to be released with :py:meth:`.release_logging_handler`
+
+        :raises LoggingTargetError: for invalid target string
+        """
+        inner_target = (
+            target[len("async::") :] if target.startswith("async::") else target
+        )
+        if inner_target.startswith("tango::"):
+            return LoggingUtils.create_logging_handler(target, tango_logger, **options)
+
+        with LoggingUtils._shared_handlers_lock:
+            entry = LoggingUtils._shared_handlers.get(target)
+            if entry is None:
+                handler = LoggingUtils.create_logging_handler(
+                    target, tango_logger, **options
+                )
+                entry = LoggingUtils._shared_handlers[target] = [handler, 0]
+            entry[1] += 1
+            return entry[0]
+
+    @staticmethod
+    def release_logging_handler(handler):
+        """Release a handler returned by :py:meth:`.acquire_logging_handler`.
+
+        A shared handler is closed once it has been released by every device
+        that acquired it; any other handler is closed immediately.
+
+        :param handler:
+            The handler to release
+        """
+        with LoggingUtils._shared_handlers_lock:
+            entry = LoggingUtils._shared_handlers.get(handler.name)
+            if entry is not None and entry[0] is handler:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    return
+                del LoggingUtils._shared_handlers[handler.name]
+        handler.close()
+
     @staticmethod
     def update_logging_handlers(targets, logger):
         old_targets = [handler.name for handler in logger.handlers]
@@ -333,10 +725,15 @@ class LoggingUtils:
         for handler in list(logger.handlers):
             if handler.name in removed_targets:
                 logger.removeHandler(handler)
+                LoggingUtils.release_logging_handler(handler)
         for target in targets:
             if target in added_targets:
-                handler = LoggingUtils.create_logging_handler(
-                    target, logger.tango_logger
+                if target.startswith("async::"):
+                    options = getattr(logger, "async_handler_options", {})
+                else:
+                    options = {}
+                handler = LoggingUtils.acquire_logging_handler(
+                    target, logger.tango_logger, **options
                 )
                 logger.addHandler(handler)
 
@@ -398,6 +795,14 @@ class SKABaseDevice(Device):
             device.set_archive_event("state", True, True)
             device.set_change_event("status", True, True)
             device.set_archive_event("status", True, True)
+            for attribute_name in [
+                "longRunningCommandsInQueue",
+                "longRunningCommandIDsInQueue",
+                "longRunningCommandStatus",
+                "longRunningCommandProgress",
+                "longRunningCommandResult",
+            ]:
+                device.set_change_event(attribute_name, True, False)
 
             device._health_state = HealthState.OK
             device._control_mode = ControlMode.REMOTE
@@ -410,19 +815,38 @@ class SKABaseDevice(Device):
             device._version_id = release.version
             device._methods_patched_for_debugger = False
 
-            try:
-                # create Tango Groups dict, according to property
-                self.logger.debug(
-                    "Groups definitions: {}".format(device.GroupDefinitions)
-                )
-                device.groups = get_groups_from_json(device.GroupDefinitions)
-                self.logger.info(
-                    "Groups loaded: {}".format(sorted(device.groups.keys()))
-                )
-            except GroupDefinitionsError:
-                self.logger.debug(
-                    "No Groups loaded for device: {}".format(device.get_name())
-                )
+            if (
+                getattr(device, "groups", None) is not None
+                and getattr(device, "_group_definitions", None)
+                == device.GroupDefinitions
+            ):
+                # re-initialisation with unchanged definitions, so keep
+                # the groups, including any that have already been built
+                self.logger.debug("Groups definitions unchanged")
+            else:
+                try:
+                    # create Tango Groups mapping, according to property;
+                    # each group is built on first access
+                    self.logger.debug(
+                        "Groups definitions: {}".format(device.GroupDefinitions)
+                    )
+                    device.groups = get_lazy_groups_from_json(device.GroupDefinitions)
+                    device._group_definitions = device.GroupDefinitions
+                    self.logger.info(
+                        "Groups defined: {}".format(sorted(device.groups.keys()))
+                    )
+                except GroupDefinitionsError:
+                    self.logger.debug(
+                        "No Groups loaded for device: {}".format(device.get_name())
+                    )
+            device.group_snapshots = GroupSnapshotReader(
+                getattr(device, "groups", {}),
+                time_to_live=device.GroupSnapshotTimeToLive,
+            )
+
+            device.set_change_event("healthState", True, False)
+            device.set_archive_event("healthState", True, False)
+            device._init_health_rollup()
 
             message = "SKABaseDevice Init command completed OK"
             self.logger.info(message)
@@ -458,6 +882,7 @@ class SKABaseDevice(Device):
         # device may be reinitialised, so remove existing handlers and filters
         for handler in list(self.logger.handlers):
             self.logger.removeHandler(handler)
+            LoggingUtils.release_logging_handler(handler)
         for filt in list(self.logger.filters):
             self.logger.removeFilter(filt)
 
@@ -475,6 +900,12 @@ class SKABaseDevice(Device):
         # to support the TangoLoggingServiceHandler target option
         self.logger.tango_logger = self.get_logger()
 
+        # options for any asynchronous targets
+        self.logger.async_handler_options = {
+            "buffer_size": self.AsyncLoggingBufferSize,
+            "drop_policy": self.AsyncLoggingDropPolicy,
+        }
+
         # initialise using defaults in device properties
         self._logging_level = None
         self.write_loggingLevel(self.LoggingLevelDefault)
@@ -511,7 +942,8 @@ class SKABaseDevice(Device):
 
     Each string in the list is a JSON serialised dict defining the ``group_name``,
     ``devices`` and ``subgroups`` in the group.  A Tango Group object is created
-    for each item in the list, according to the hierarchy defined.  This provides
+    for each item in the list, according to the hierarchy defined, when it is
+    first accessed through the device's ``groups`` mapping.  This provides
     easy access to the managed devices in bulk, or individually.
 
     The general format of the list is as follows, with optional ``devices`` and
@@ -548,6 +980,52 @@ class SKABaseDevice(Device):
 
     """
 
+    GroupSnapshotTimeToLive = device_property(dtype="double", default_value=1.0)
+    """
+    Device property.
+
+    Time, in seconds, for which a snapshot of attributes read across one
+    of the device's groups, through ``group_snapshots``, is cached before
+    it is read afresh. See
+    :py:class:`~ska_tango_base.group_snapshot.GroupSnapshotReader`.
+    """
+
+    HealthRollupEnabled = device_property(dtype="bool", default_value=False)
+    """
+    Device property.
+
+    Whether the device's healthState is rolled up from the healthState
+    of the devices in its groups (see ``GroupDefinitions``), to whose
+    change events it subscribes. See
+    :py:class:`~ska_tango_base.health_rollup.HealthRollup`.
+    """
+
+    HealthRollupFailedThreshold = device_property(dtype="uint16", default_value=0)
+    """
+    Device property.
+
+    When health is rolled up, healthState is FAILED if more than this
+    many of the devices in the device's groups are FAILED.
+    """
+
+    HealthRollupDegradedThreshold = device_property(dtype="uint16", default_value=0)
+    """
+    Device property.
+
+    When health is rolled up, healthState is DEGRADED, if not FAILED, if
+    more than this many of the devices in the device's groups are FAILED
+    or DEGRADED.
+    """
+
+    HealthRollupUnknownThreshold = device_property(dtype="uint16", default_value=0)
+    """
+    Device property.
+
+    When health is rolled up, healthState is UNKNOWN, if not FAILED or
+    DEGRADED, if more than this many of the devices in the device's
+    groups are UNKNOWN.
+    """
+
     LoggingLevelDefault = device_property(
         dtype="uint16", default_value=LoggingLevel.INFO
     )
@@ -568,6 +1046,155 @@ class SKABaseDevice(Device):
     See the project readme for details.
     """
 
+    AsyncLoggingBufferSize = device_property(dtype="uint16", default_value=1000)
+    """
+    Device property.
+
+    Maximum number of log records buffered by each asynchronous
+    logging target, like "async::syslog::tcp://server.domain:601".
+    """
+
+    AsyncLoggingDropPolicy = device_property(dtype="str", default_value="oldest")
+    """
+    Device property.
+
+    Which log record an asynchronous logging target drops when its
+    buffer is full: "oldest", "newest" or "level". The "level" policy
+    drops the oldest record of the lowest level. See
+    :py:class:`~ska_tango_base.base.base_device.AsyncLoggingHandler`.
+    """
+
+    UseTableStateMachines = device_property(dtype="bool", default_value=False)
+    """
+    Device property.
+
+    Whether the device's state models use the compact, table-driven
+    :py:class:`~ska_tango_base.table_machine.TableMachine` engine for
+    their state machines, rather than ``transitions``. The table-driven
+    engine is much cheaper to construct, which matters when a device
+    server runs many device instances.
+    """
+
+    CommandExecutorMaxWorkers = device_property(dtype="uint16", default_value=1)
+    """
+    Device property.
+
+    Maximum number of worker threads in the pool on which asynchronous
+    commands are executed. With the default of a single worker,
+    asynchronous commands are executed one at a time, in the order in
+    which they were called.
+    """
+
+    AsynchronousCommands = device_property(
+        dtype=("str",),
+    )
+    """
+    Device property.
+
+    Names of the commands that are to be run asynchronously on the
+    device's command executor, rather than in the Tango request thread.
+    Each must be handled by a
+    :py:class:`~ska_tango_base.commands.ResponseCommand`. Calls to
+    these commands return ``(ResultCode.QUEUED, command_id)``
+    immediately.
+
+    Example:
+
+    * ["AssignResources", "Configure"]
+    """
+
+    CommandQueueMaxDepth = device_property(dtype="uint16", default_value=16)
+    """
+    Device property.
+
+    Maximum number of asynchronous commands that may be in the device's
+    command queue at one time, including those being executed. Further
+    commands are rejected with ``ResultCode.REJECTED`` until there is
+    room in the queue. Values greater than 64 are treated as 64.
+    """
+
+    EventMinimumIntervals = device_property(
+        dtype=("str",),
+    )
+    """
+    Device property.
+
+    Minimum interval, in seconds, between change events for each of the
+    device's state, status, adminMode and obsState attributes, given as
+    "<attribute>:<seconds>". A change that would follow the previous
+    event too soon is held back until the attribute is quiescent (see
+    ``EventQuiescencePeriod``). Attributes that are not listed are not
+    rate limited.
+
+    Example:
+
+    * ["state:0.5", "status:0.5", "obsState:0.1"]
+    """
+
+    ArchiveEventDecimation = device_property(dtype="uint16", default_value=1)
+    """
+    Device property.
+
+    Archive only one in this many successive values of each of the
+    device's state, status, adminMode and obsState attributes. The
+    default of 1 archives every value.
+    """
+
+    DropDuplicateEvents = device_property(dtype="bool", default_value=False)
+    """
+    Device property.
+
+    Whether to drop change and archive events for the device's state,
+    status, adminMode and obsState attributes, when the value is the
+    same as the value most recently published.
+    """
+
+    CommandLogArginMaxLength = device_property(dtype="uint16", default_value=0)
+    """
+    Device property.
+
+    Length to which command arguments are truncated when they are
+    logged. The default of 0 means that they are not truncated.
+    """
+
+    CommandLogArginHash = device_property(dtype="bool", default_value=False)
+    """
+    Device property.
+
+    Whether to log the length and a hash of each command argument,
+    instead of the argument itself; for example, to keep large
+    configuration strings out of the logs.
+    """
+
+    CommandTraceBufferSize = device_property(dtype="uint16", default_value=0)
+    """
+    Device property.
+
+    Number of records held in the device's command trace buffer. If
+    non-zero, command entry and exit records are written to this ring
+    buffer, and read through the ``commandTraces`` attribute, instead of
+    being logged; only warnings, errors and exceptions are still logged.
+    The default of 0 means that there is no trace buffer. Values greater
+    than 1024 are treated as 1024.
+    """
+
+    CommandTraceSampleRate = device_property(dtype="uint16", default_value=1)
+    """
+    Device property.
+
+    Trace one command call in this many, when there is a command trace
+    buffer. The default of 1 traces every call.
+    """
+
+    EventQuiescencePeriod = device_property(dtype="double", default_value=1.0)
+    """
+    Device property.
+
+    Time, in seconds, for which an attribute must be unchanged before
+    any change or archive event that has been held back for it, by rate
+    limiting or decimation, is pushed.
+    """
+
     # ----------
     # Attributes
     # ----------
@@ -605,6 +1232,29 @@ class SKABaseDevice(Device):
     )
     """Device attribute."""
 
+    asyncLoggingDroppedRecords = attribute(
+        dtype="uint64",
+        doc="Number of log records dropped by the device's asynchronous logging "
+        "targets, because their buffers were full.",
+    )
+    """Device attribute."""
+
+    asyncLoggingMeanLatency = attribute(
+        dtype="double",
+        unit="s",
+        doc="Mean time from a log record being buffered by one of the device's "
+        "asynchronous logging targets to its having been handled.",
+    )
+    """Device attribute."""
+
+    asyncLoggingMaxLatency = attribute(
+        dtype="double",
+        unit="s",
+        doc="Maximum time from a log record being buffered by one of the device's "
+        "asynchronous logging targets to its having been handled.",
+    )
+    """Device attribute."""
+
     healthState = attribute(
         dtype=HealthState,
         doc="The health state reported for this device. "
@@ -659,6 +1309,65 @@ class SKABaseDevice(Device):
     )
     """Device attribute."""
 
+    longRunningCommandsInQueue = attribute(
+        dtype=("str",),
+        max_dim_x=64,
+        doc="Names of the asynchronous commands in the command queue, "
+        "including those being executed, in the order in which they were called.",
+    )
+    """Device attribute."""
+
+    longRunningCommandIDsInQueue = attribute(
+        dtype=("str",),
+        max_dim_x=64,
+        doc="IDs of the asynchronous commands in the command queue, "
+        "including those being executed, in the order in which they were called.",
+    )
+    """Device attribute."""
+
+    longRunningCommandStatus = attribute(
+        dtype=("str",),
+        max_dim_x=256,
+        doc="ID and status of each asynchronous command in the command queue, "
+        "and of those that most recently left it; e.g.\n"
+        "[id_1, IN_PROGRESS, id_2, QUEUED].",
+    )
+    """Device attribute."""
+
+    longRunningCommandProgress = attribute(
+        dtype=("str",),
+        max_dim_x=128,
+        doc="ID and most recently reported progress of each asynchronous "
+        "command in the command queue that has reported progress; e.g.\n"
+        "[id_1, 50].",
+    )
+    """Device attribute."""
+
+    longRunningCommandResult = attribute(
+        dtype=("str",),
+        max_dim_x=3,
+        doc="ID, result code and message of the asynchronous command that "
+        "most recently completed; e.g.\n[id_1, 0, Configure command completed OK].",
+    )
+    """Device attribute."""
+
+    commandTraces = attribute(
+        dtype=("str",),
+        max_dim_x=1024,
+        doc="Command entry and exit records in the command trace buffer, "
+        "oldest first. Empty unless the CommandTraceBufferSize property is set.",
+    )
+    """Device attribute."""
+
+    commandStatistics = attribute(
+        dtype="str",
+        doc="JSON-encoded statistics of the calls to each command of this device "
+        "since initialisation or the last ResetCommandStatistics: the number of "
+        "calls and failures, and the 50th, 95th and 99th percentile and maximum "
+        "latency, in milliseconds.",
+    )
+    """Device attribute."""
+
     # ---------------
     # General methods
     # ---------------
@@ -671,8 +1380,18 @@ class SKABaseDevice(Device):
         :param admin_mode: the new admin_mode value
         :type admin_mode: :py:class:`~ska_tango_base.control_model.AdminMode`
         """
-        self.push_change_event("adminMode", admin_mode)
-        self.push_archive_event("adminMode", admin_mode)
+        self._publish_event("adminMode", admin_mode)
+
+    def _update_health_state(self, health_state):
+        """
+        Helper method for changing health_state; passed to the health
+        roll-up engine as a callback
+
+        :param health_state: the new health_state value
+        :type health_state: :py:class:`~ska_tango_base.control_model.HealthState`
+        """
+        self._health_state = health_state
+        self._publish_event("healthState", health_state)
 
     def _update_state(self, state):
         """
@@ -696,8 +1415,7 @@ class SKABaseDevice(Device):
         :type state: :py:class:`tango.DevState`
         """
         super().set_state(state)
-        self.push_change_event("state")
-        self.push_archive_event("state")
+        self._publish_event("state", state)
 
     def set_status(self, status):
         """
@@ -708,8 +1426,58 @@ class SKABaseDevice(Device):
         :type status: str
         """
         super().set_status(status)
-        self.push_change_event("status")
-        self.push_archive_event("status")
+        self._publish_event("status", status)
+
+    def _publish_event(self, name, value):
+        """
+        Helper method for publishing change and archive events for an
+        attribute, through the device's event publisher.
+
+        :param name: name of the attribute
+        :type name: str
+        :param value: the new value of the attribute
+        """
+        event_publisher = getattr(self, "event_publisher", None)
+        if event_publisher is None:
+            # device is not yet initialised
+            self._push_change_event(name, value)
+            self._push_archive_event(name, value)
+        else:
+            event_publisher.publish(name, value)
+
+    def _push_change_event(self, name, value):
+        """
+        Helper method for pushing a change event; passed to the event
+        publisher.
+
+        The state and status attributes are pushed without a value, so
+        that Tango reads the device's current state or status.
+
+        :param name: name of the attribute
+        :type name: str
+        :param value: the value of the attribute
+        """
+        if name in ("state", "status"):
+            self.push_change_event(name)
+        else:
+            self.push_change_event(name, value)
+
+    def _push_archive_event(self, name, value):
+        """
+        Helper method for pushing an archive event; passed to the event
+        publisher.
+
+        The state and status attributes are pushed without a value, so
+        that Tango reads the device's current state or status.
+
+        :param name: name of the attribute
+        :type name: str
+        :param value: the value of the attribute
+        """
+        if name in ("state", "status"):
+            self.push_archive_event(name)
+        else:
+            self.push_archive_event(name, value)
 
     def init_device(self):
         """
@@ -724,10 +1492,16 @@ class SKABaseDevice(Device):
             super().init_device()
 
             self._init_logging()
+            self._init_event_publisher()
             self._init_state_model()
+            if getattr(self, "component_manager", None) is not None:
+                # device is being reinitialised
+                self.component_manager.teardown()
             self.component_manager = self.create_component_manager()
+            self._init_command_executor()
             self.InitCommand(self, self.op_state_model, self.logger)()
             self.init_command_objects()
+            self._init_asynchronous_commands()
         except Exception as exc:
             self.set_state(DevState.FAULT)
             self.set_status("The device is in FAULT state - init_device failed.")
@@ -736,6 +1510,64 @@ class SKABaseDevice(Device):
             else:
                 print(f"ERROR: init_device failed, and no logger: {exc}.")
 
+    def _init_event_publisher(self):
+        """
+        Creates the publisher through which the device pushes change and
+        archive events for its state, status, adminMode and obsState.
+        """
+        if getattr(self, "event_publisher", None) is not None:
+            # device is being reinitialised
+            self.event_publisher.shutdown()
+
+        min_intervals = {}
+        for item in self.EventMinimumIntervals or []:
+            (name, _, interval) = item.rpartition(":")
+            try:
+                min_intervals[name] = float(interval)
+            except ValueError:
+                self.logger.warning(
+                    f"Ignoring invalid EventMinimumIntervals entry '{item}'; "
+                    "expected '<attribute>:<seconds>'."
+                )
+
+        self.event_publisher = EventPublisher(
+            self._push_change_event,
+            self._push_archive_event,
+            min_intervals=min_intervals,
+            archive_decimation=self.ArchiveEventDecimation,
+            drop_duplicates=self.DropDuplicateEvents,
+            quiescence_period=self.EventQuiescencePeriod,
+            logger=self.logger,
+        )
+
+    def _init_health_rollup(self):
+        """
+        Creates the engine that rolls up the health of the devices in
+        the device's groups into its healthState, if the
+        HealthRollupEnabled property is set. The devices are subscribed
+        to in the background, so that initialisation does not wait for
+        them to be reached.
+        """
+        if getattr(self, "health_rollup", None) is not None:
+            # device is being reinitialised
+            self.health_rollup.unsubscribe()
+        self.health_rollup = None
+        if not self.HealthRollupEnabled:
+            return
+
+        self.health_rollup = HealthRollup(
+            self._update_health_state,
+            failed_threshold=self.HealthRollupFailedThreshold,
+            degraded_threshold=self.HealthRollupDegradedThreshold,
+            unknown_threshold=self.HealthRollupUnknownThreshold,
+            logger=self.logger,
+        )
+        groups = getattr(self, "groups", None)
+        self._health_state = self.health_rollup.health
+        self.health_rollup.subscribe(
+            groups.device_names() if groups else [], background=True
+        )
+
     def _init_state_model(self):
         """
         Creates the state model for the device
@@ -743,15 +1575,131 @@ class SKABaseDevice(Device):
         self.op_state_model = OpStateModel(
             logger=self.logger,
             callback=self._update_state,
+            table_machine=self.UseTableStateMachines,
         )
         self.admin_mode_model = AdminModeModel(
             logger=self.logger,
             callback=self._update_admin_mode,
+            table_machine=self.UseTableStateMachines,
         )
 
     def create_component_manager(self):
         return BaseComponentManager(self.op_state_model)
 
+    def _init_command_executor(self):
+        """
+        Creates the executor on which asynchronous commands are run.
+        """
+        if getattr(self, "command_executor", None) is not None:
+            # device is being reinitialised
+            self.command_executor.shutdown(wait=False)
+
+        max_queue_size = self.CommandQueueMaxDepth
+        if max_queue_size > 64:
+            self.logger.warning(
+                f"CommandQueueMaxDepth of {max_queue_size} exceeds maximum of 64; "
+                "using 64."
+            )
+            max_queue_size = 64
+
+        self._commands_in_queue = []
+        self._command_ids_in_queue = []
+        self._command_statuses = []
+        self._command_progresses = []
+        self._command_result = []
+
+        self.command_executor = CommandExecutor(
+            max_workers=self.CommandExecutorMaxWorkers,
+            max_queue_size=max_queue_size,
+            logger=self.logger,
+            queue_callback=self._update_command_queue,
+            status_callback=self._update_command_statuses,
+            progress_callback=self._update_command_progresses,
+            result_callback=self._update_command_result,
+        )
+
+    def _update_command_queue(self, commands_in_queue):
+        """
+        Helper method for changes to the command queue; passed to the
+        command executor as a callback
+
+        :param commands_in_queue: the commands in the queue, as a list
+            of ``(command_id, command_name)`` tuples
+        :type commands_in_queue: list
+        """
+        self._command_ids_in_queue = [
+            command_id for (command_id, _) in commands_in_queue
+        ]
+        self._commands_in_queue = [
+            command_name for (_, command_name) in commands_in_queue
+        ]
+        self.push_change_event("longRunningCommandsInQueue", self._commands_in_queue)
+        self.push_change_event(
+            "longRunningCommandIDsInQueue", self._command_ids_in_queue
+        )
+
+    def _update_command_statuses(self, command_statuses):
+        """
+        Helper method for changes to command statuses; passed to the
+        command executor as a callback
+
+        :param command_statuses: the status of each command, as a list
+            of ``(command_id, CommandStatus)`` tuples
+        :type command_statuses: list
+        """
+        self._command_statuses = [
+            item
+            for (command_id, status) in command_statuses
+            for item in (command_id, CommandStatus(status).name)
+        ]
+        self.push_change_event("longRunningCommandStatus", self._command_statuses)
+
+    def _update_command_progresses(self, command_progresses):
+        """
+        Helper method for changes to command progress; passed to the
+        command executor as a callback
+
+        :param command_progresses: the progress of each command, as a
+            list of ``(command_id, progress)`` tuples
+        :type command_progresses: list
+        """
+        self._command_progresses = [
+            item
+            for (command_id, progress) in command_progresses
+            for item in (command_id, str(progress))
+        ]
+        self.push_change_event("longRunningCommandProgress", self._command_progresses)
+
+    def _update_command_result(self, command_result):
+        """
+        Helper method for command results; passed to the command
+        executor as a callback
+
+        :param command_result: the result of the command that most
+            recently completed, as a ``(command_id, result_code,
+            message)`` tuple
+        :type command_result: tuple
+        """
+        (command_id, result_code, message) = command_result
+        self._command_result = [command_id, str(int(result_code)), str(message)]
+        self.push_change_event("longRunningCommandResult", self._command_result)
+
+    def _init_asynchronous_commands(self):
+        """
+        Attaches the command executor to the command objects named in
+        the ``AsynchronousCommands`` device property.
+        """
+        for command_name in self.AsynchronousCommands or []:
+            command_object = self._command_objects.get(command_name)
+            if not isinstance(command_object, ResponseCommand):
+                self.logger.warning(
+                    f"Command {command_name} cannot be run asynchronously; "
+                    "only ResponseCommands are supported."
+                )
+                continue
+            command_object.executor = self.command_executor
+            self.logger.info(f"Command {command_name} will run asynchronously.")
+
     def register_command_object(self, command_name, command_object):
         """
         Registers a command object as the object to handle invocations
@@ -765,6 +1713,10 @@ class SKABaseDevice(Device):
         :type command_object: Command instance
         """
         self._command_objects[command_name] = command_object
+        command_object.statistics = self._command_statistics.setdefault(
+            command_name, CommandStatistics()
+        )
+        command_object.command_logging = self._command_logging
 
     def get_command_object(self, command_name):
         """
@@ -785,6 +1737,21 @@ class SKABaseDevice(Device):
         commands supported by this device.
         """
         self._command_objects = {}
+        self._command_statistics = {}
+
+        trace_buffer_size = self.CommandTraceBufferSize
+        if trace_buffer_size > 1024:
+            self.logger.warning(
+                f"CommandTraceBufferSize of {trace_buffer_size} exceeds maximum of "
+                "1024; using 1024."
+            )
+            trace_buffer_size = 1024
+        self._command_logging = CommandLogging(
+            argin_max_length=self.CommandLogArginMaxLength,
+            hash_argin=self.CommandLogArginHash,
+            trace_buffer_size=trace_buffer_size,
+            trace_sample_rate=self.CommandTraceSampleRate,
+        )
 
         component_args = (self.component_manager, self.op_state_model, self.logger)
         self.register_command_object("Standby", self.StandbyCommand(*component_args))
@@ -799,6 +1766,9 @@ class SKABaseDevice(Device):
         self.register_command_object(
             "DebugDevice", self.DebugDeviceCommand(*device_args)
         )
+        self.register_command_object(
+            "ResetCommandStatistics", self.ResetCommandStatisticsCommand(*device_args)
+        )
 
     def always_executed_hook(self):
         # PROTECTED REGION ID(SKABaseDevice.always_executed_hook) ENABLED START #
@@ -812,6 +1782,20 @@ class SKABaseDevice(Device):
         """
         Method to cleanup when device is stopped.
         """
+        if getattr(self, "command_executor", None) is not None:
+            self.command_executor.shutdown(wait=False)
+            self.command_executor = None
+        if getattr(self, "event_publisher", None) is not None:
+            self.event_publisher.shutdown()
+            self.event_publisher = None
+        if getattr(self, "health_rollup", None) is not None:
+            self.health_rollup.unsubscribe()
+            self.health_rollup = None
+        if getattr(self, "component_manager", None) is not None:
+            self.component_manager.teardown()
+        if getattr(self, "logger", None) is not None:
+            # release this device's references to shared logging handlers
+            LoggingUtils.update_logging_handlers([], self.logger)
         # PROTECTED REGION END #    //  SKABaseDevice.delete_device
 
     # ------------------
@@ -905,6 +1889,62 @@ class SKABaseDevice(Device):
         LoggingUtils.update_logging_handlers(valid_targets, self.logger)
         # PROTECTED REGION END #    //  SKABaseDevice.loggingTargets_write
 
+    def _async_logging_handlers(self):
+        """
+        Return the handlers of the device's asynchronous logging targets.
+
+        :return: the asynchronous logging handlers
+        :rtype: list of :py:class:`.AsyncLoggingHandler`
+        """
+        return [
+            handler
+            for handler in self.logger.handlers
+            if isinstance(handler, AsyncLoggingHandler)
+        ]
+
+    def read_asyncLoggingDroppedRecords(self):
+        # PROTECTED REGION ID(SKABaseDevice.asyncLoggingDroppedRecords_read) ENABLED START #
+        """
+        Reads the number of log records dropped by the device's
+        asynchronous logging targets.
+
+        :return: the number of log records dropped
+        """
+        return sum(handler.dropped for handler in self._async_logging_handlers())
+        # PROTECTED REGION END #    //  SKABaseDevice.asyncLoggingDroppedRecords_read
+
+    def read_asyncLoggingMeanLatency(self):
+        # PROTECTED REGION ID(SKABaseDevice.asyncLoggingMeanLatency_read) ENABLED START #
+        """
+        Reads the mean latency of the device's asynchronous logging
+        targets.
+
+        :return: the mean latency, in seconds
+        """
+        handlers = self._async_logging_handlers()
+        handled = sum(handler.handled for handler in handlers)
+        if not handled:
+            return 0.0
+        return (
+            sum(handler.mean_latency * handler.handled for handler in handlers)
+            / handled
+        )
+        # PROTECTED REGION END #    //  SKABaseDevice.asyncLoggingMeanLatency_read
+
+    def read_asyncLoggingMaxLatency(self):
+        # PROTECTED REGION ID(SKABaseDevice.asyncLoggingMaxLatency_read) ENABLED START #
+        """
+        Reads the maximum latency of the device's asynchronous logging
+        targets.
+
+        :return: the maximum latency, in seconds
+        """
+        return max(
+            (handler.max_latency for handler in self._async_logging_handlers()),
+            default=0.0,
+        )
+        # PROTECTED REGION END #    //  SKABaseDevice.asyncLoggingMaxLatency_read
+
     def read_healthState(self):
         # PROTECTED REGION ID(SKABaseDevice.healthState_read) ENABLED START #
         """
@@ -1016,6 +2056,83 @@ class SKABaseDevice(Device):
         self._test_mode = value
         # PROTECTED REGION END #    //  SKABaseDevice.testMode_write
 
+    def read_longRunningCommandsInQueue(self):
+        # PROTECTED REGION ID(SKABaseDevice.longRunningCommandsInQueue_read) ENABLED START #
+        """
+        Reads the names of the commands in the command queue.
+
+        :return: names of the commands in the command queue
+        """
+        return self._commands_in_queue
+        # PROTECTED REGION END #    //  SKABaseDevice.longRunningCommandsInQueue_read
+
+    def read_longRunningCommandIDsInQueue(self):
+        # PROTECTED REGION ID(SKABaseDevice.longRunningCommandIDsInQueue_read) ENABLED START #
+        """
+        Reads the IDs of the commands in the command queue.
+
+        :return: IDs of the commands in the command queue
+        """
+        return self._command_ids_in_queue
+        # PROTECTED REGION END #    //  SKABaseDevice.longRunningCommandIDsInQueue_read
+
+    def read_longRunningCommandStatus(self):
+        # PROTECTED REGION ID(SKABaseDevice.longRunningCommandStatus_read) ENABLED START #
+        """
+        Reads the ID and status of each queued command.
+
+        :return: ID and status of each queued command
+        """
+        return self._command_statuses
+        # PROTECTED REGION END #    //  SKABaseDevice.longRunningCommandStatus_read
+
+    def read_longRunningCommandProgress(self):
+        # PROTECTED REGION ID(SKABaseDevice.longRunningCommandProgress_read) ENABLED START #
+        """
+        Reads the ID and progress of each queued command.
+
+        :return: ID and progress of each queued command
+        """
+        return self._command_progresses
+        # PROTECTED REGION END #    //  SKABaseDevice.longRunningCommandProgress_read
+
+    def read_longRunningCommandResult(self):
+        # PROTECTED REGION ID(SKABaseDevice.longRunningCommandResult_read) ENABLED START #
+        """
+        Reads the result of the queued command that most recently
+        completed.
+
+        :return: ID, result code and message of the queued command that
+            most recently completed
+        """
+        return self._command_result
+        # PROTECTED REGION END #    //  SKABaseDevice.longRunningCommandResult_read
+
+    def read_commandTraces(self):
+        # PROTECTED REGION ID(SKABaseDevice.commandTraces_read) ENABLED START #
+        """
+        Reads the records in the command trace buffer.
+
+        :return: the records in the command trace buffer, oldest first
+        """
+        return self._command_logging.traces
+        # PROTECTED REGION END #    //  SKABaseDevice.commandTraces_read
+
+    def read_commandStatistics(self):
+        # PROTECTED REGION ID(SKABaseDevice.commandStatistics_read) ENABLED START #
+        """
+        Reads the statistics of the calls to each command of this device.
+
+        :return: JSON-encoded statistics, keyed by command name
+        """
+        return json.dumps(
+            {
+                command_name: statistics.as_dict()
+                for (command_name, statistics) in self._command_statistics.items()
+            }
+        )
+        # PROTECTED REGION END #    //  SKABaseDevice.commandStatistics_read
+
     # --------
     # Commands
     # --------
@@ -1446,6 +2563,61 @@ class SKABaseDevice(Device):
         command = self.get_command_object("DebugDevice")
         return command()
 
+    class ResetCommandStatisticsCommand(ResponseCommand):
+        """
+        A class for the SKABaseDevice's ResetCommandStatistics() command.
+        """
+
+        def do(self):
+            """
+            Stateless hook for device ResetCommandStatistics() command.
+
+            :return: A tuple containing a return code and a string
+                message indicating status. The message is for
+                information purpose only.
+            :rtype: (ResultCode, str)
+            """
+            for statistics in self.target._command_statistics.values():
+                statistics.reset()
+
+            message = "Command statistics reset"
+            self.logger.info(message)
+            return (ResultCode.OK, message)
+
+        def _record_call(self, start, failed):
+            """
+            Does not record the call, so that the statistics are empty
+            straight after they have been reset.
+
+            :param start: the ``time.perf_counter_ns()`` at which the
+                call started
+            :type start: int
+            :param failed: whether the call failed
+            :type failed: bool
+            """
+
+    @command(
+        dtype_out="DevVarLongStringArray",
+        doc_out="(ReturnType, 'informational message')",
+    )
+    @DebugIt()
+    def ResetCommandStatistics(self):
+        """
+        Clears the statistics of the calls to each command of this
+        device, reported by the ``commandStatistics`` attribute.
+
+        To modify behaviour for this command, modify the do() method of
+        the command class.
+
+        :return: A tuple containing a return code and a string
+            message indicating status. The message is for
+            information purpose only.
+        :rtype: (ResultCode, str)
+        """
+        command = self.get_command_object("ResetCommandStatistics")
+        (return_code, message) = command()
+        return [[return_code], [message]]
+
 
 # ----------
 # Run server
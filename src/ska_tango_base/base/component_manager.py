@@ -73,6 +73,17 @@ class BaseComponentManager:
         """
         raise NotImplementedError("BaseComponentManager is abstract.")
 
+    def teardown(self):
+        """
+        Release anything that this component manager holds outside
+        itself, such as claims in a shared registry, before it is
+        discarded; for example, because its device is being deleted or
+        reinitialised.
+
+        This default implementation does nothing.
+        """
+        pass
+
     @property
     def is_communicating(self):
         """
@@ -11,78 +11,19 @@ Tango devices. It consists of:
 from tango import DevState
 from transitions.extensions import LockedMachine as Machine
 
+from ska_tango_base.batching import BatchedActionsMixin
 from ska_tango_base.faults import StateModelError
-from ska_tango_base.utils import for_testing_only
+from ska_tango_base.table_machine import TableMachine
+from ska_tango_base.utils import compile_trigger_table, for_testing_only
 
 
 __all__ = ["OpStateModel"]
 
 
-class _OpStateMachine(Machine):
+class _OpStateMachineMixin:
     """
-    State machine representing the overall state of the device with
-    respect to system component that it monitors.
-
-    The post-init states supported are:
-
-    * **DISABLE**: the device has been told not to monitor its telescope
-      component
-    * **UNKNOWN**: the device is monitoring (or at least trying to
-      monitor) its telescope component but is unable to determine the
-      component's state
-    * **OFF**: the device is monitoring its telescope component and the
-      component is powered off
-    * **STANDBY**: the device is monitoring its telescope component and
-      the component is in low-power standby mode
-    * **ON**: the device is monitoring its telescope component and the
-      component is turned on
-    * **FAULT**: the device is monitoring its telescope component and
-      the component has failed or is in an inconsistent state.
-
-    There are also corresponding initialising states: **INIT_DISABLE**,
-    **INIT_UNKNOWN**, **INIT_OFF**, **INIT_STANDBY**, **INIT_ON** and
-    **INIT_FAULT**. These states allow for the underlying system
-    component to change its state during long-running initialisation,
-    and for a device to transition to an appropriate state at the end of
-    initialisation.
-
-    Finally, there is an **_UNINITIALISED** starting state, representing
-    a device that hasn't started initialising yet.
-
-    The actions supported are:
-
-    * **init_invoked**: the device has started initialising
-    * **init_completed**: the device has finished initialising
-    * **component_disconnected**: the device his disconnected from the
-      telescope component that it is supposed to manage (for example
-      because its admin mode was set to OFFLINE). Note, this action
-      indicates a device-initiated, deliberate disconnect; a lost
-      connection would be indicated by a "component_fault" or
-      "component_unknown** action, depending on circumstances.
-    * **component_unknown**: the device is unable to determine the state
-      of its component.
-    * **component_off**: the component has been switched off
-    * **component_standby**: the component has switched to low-power
-      standby mode
-    * **component_on**: the component has been switched on
-
-    A diagram of the state machine is shown below. Essentially, the
-    machine has three "super-states", representing a device before,
-    during and after initialisation. Transition between these
-    "super-states" is triggered by the "init_invoked" and
-    "init_completed" actions. In the last two "super-states", the device
-    monitors the component and updates its state accordingly.
-
-    .. uml:: op_state_machine.uml
-       :caption: Diagram of the op state machine
-
-    The following is a diagram of the state machine, automatically
-    generated from the code. Its equivalence to the diagram above
-    demonstrates that the implementation is faithful to the design.
-
-    .. figure:: _OpStateMachine_autogenerated.png
-      :alt: Diagram of the op state machine, as implemented
-
+    Mixin that defines the states and transitions of the op state
+    machine, independently of the engine that implements it.
     """
 
     def __init__(self, callback=None, **extra_kwargs):
@@ -297,7 +238,83 @@ class _OpStateMachine(Machine):
             self._callback(self.state)
 
 
-class OpStateModel:
+class _OpStateMachine(_OpStateMachineMixin, Machine):
+    """
+    State machine representing the overall state of the device with
+    respect to system component that it monitors.
+
+    The post-init states supported are:
+
+    * **DISABLE**: the device has been told not to monitor its telescope
+      component
+    * **UNKNOWN**: the device is monitoring (or at least trying to
+      monitor) its telescope component but is unable to determine the
+      component's state
+    * **OFF**: the device is monitoring its telescope component and the
+      component is powered off
+    * **STANDBY**: the device is monitoring its telescope component and
+      the component is in low-power standby mode
+    * **ON**: the device is monitoring its telescope component and the
+      component is turned on
+    * **FAULT**: the device is monitoring its telescope component and
+      the component has failed or is in an inconsistent state.
+
+    There are also corresponding initialising states: **INIT_DISABLE**,
+    **INIT_UNKNOWN**, **INIT_OFF**, **INIT_STANDBY**, **INIT_ON** and
+    **INIT_FAULT**. These states allow for the underlying system
+    component to change its state during long-running initialisation,
+    and for a device to transition to an appropriate state at the end of
+    initialisation.
+
+    Finally, there is an **_UNINITIALISED** starting state, representing
+    a device that hasn't started initialising yet.
+
+    The actions supported are:
+
+    * **init_invoked**: the device has started initialising
+    * **init_completed**: the device has finished initialising
+    * **component_disconnected**: the device his disconnected from the
+      telescope component that it is supposed to manage (for example
+      because its admin mode was set to OFFLINE). Note, this action
+      indicates a device-initiated, deliberate disconnect; a lost
+      connection would be indicated by a "component_fault" or
+      "component_unknown** action, depending on circumstances.
+    * **component_unknown**: the device is unable to determine the state
+      of its component.
+    * **component_off**: the component has been switched off
+    * **component_standby**: the component has switched to low-power
+      standby mode
+    * **component_on**: the component has been switched on
+
+    A diagram of the state machine is shown below. Essentially, the
+    machine has three "super-states", representing a device before,
+    during and after initialisation. Transition between these
+    "super-states" is triggered by the "init_invoked" and
+    "init_completed" actions. In the last two "super-states", the device
+    monitors the component and updates its state accordingly.
+
+    .. uml:: op_state_machine.uml
+       :caption: Diagram of the op state machine
+
+    The following is a diagram of the state machine, automatically
+    generated from the code. Its equivalence to the diagram above
+    demonstrates that the implementation is faithful to the design.
+
+    .. figure:: _OpStateMachine_autogenerated.png
+      :alt: Diagram of the op state machine, as implemented
+
+    """
+
+
+class _OpStateTableMachine(_OpStateMachineMixin, TableMachine):
+    """
+    The op state machine, implemented by the compact, table-driven
+    :py:class:`~ska_tango_base.table_machine.TableMachine` engine rather
+    than by ``transitions``. See :py:class:`._OpStateMachine`.
+    """
+
+
+class OpStateModel(BatchedActionsMixin):
     """
     This class implements the state model for device operational state
     ("opState").
@@ -354,7 +371,9 @@ class OpStateModel:
        :caption: Diagram of the operational state model
     """
 
-    def __init__(self, logger, callback=None):
+    _batched_attribute = "op_state"
+
+    def __init__(self, logger, callback=None, table_machine=False):
         """
         Initialises the operational state model.
 
@@ -364,13 +383,21 @@ class OpStateModel:
         :param callback: A callback to be called when the state machine
             for op_state reports a change of state
         :type callback: callable
+        :param table_machine: whether to use the compact, table-driven
+            :py:class:`~ska_tango_base.table_machine.TableMachine`
+            engine for the underlying state machine, rather than
+            ``transitions``
+        :type table_machine: bool
         """
         self.logger = logger
 
         self._op_state = None
         self._callback = callback
+        self._init_batching()
 
-        self._op_state_machine = _OpStateMachine(callback=self._op_state_changed)
+        machine_class = _OpStateTableMachine if table_machine else _OpStateMachine
+        self._op_state_machine = machine_class(callback=self._op_state_changed)
+        self._allowed_actions = compile_trigger_table(self._op_state_machine)
 
     @property
     def op_state(self):
@@ -411,8 +438,7 @@ class OpStateModel:
         op_state = self._op_state_mapping[machine_state]
         if self._op_state != op_state:
             self._op_state = op_state
-            if self._callback is not None:
-                self._callback(op_state)
+            self._call_callback(op_state)
 
     def is_action_allowed(self, action, raise_if_disallowed=False):
         """
@@ -431,7 +457,7 @@ class OpStateModel:
         :return: whether the action is allowed in the current state
         :rtype: bool
         """
-        if action in self._op_state_machine.get_triggers(self._op_state_machine.state):
+        if action in self._allowed_actions[self._op_state_machine.state]:
             return True
 
         if raise_if_disallowed:
@@ -447,8 +473,9 @@ class OpStateModel:
         :param action: an action, as given in the transitions table
         :type action: str
         """
-        _ = self.is_action_allowed(action, raise_if_disallowed=True)
-        self._op_state_machine.trigger(action)
+        with self._batch_lock:
+            _ = self.is_action_allowed(action, raise_if_disallowed=True)
+            self._op_state_machine.trigger(action)
 
     @for_testing_only
     def _straight_to_state(self, op_state_name):
@@ -260,15 +260,11 @@ class ReferenceBaseComponentManager(BaseComponentManager):
         if self._connected:
             return
 
-        # trigger transition to UNKNOWN (e.g. from DISABLE) first,
-        # before trying to connect, because connection might take a
-        # little while, and we want to be in UNKNOWN state meanwhile.
-        self.op_state_model.perform_action("component_unknown")
-
-        # Now connect to the component. Here we simply consult the
+        # Connect to the component. Here we simply consult the
         # _fail_communicate attribute and either pretend to fail or pretend
         # to succeed.
         if self._fail_communicate:
+            self.op_state_model.perform_action("component_unknown")
             raise ConnectionError("Failed to connect")
 
         self._connected = True
@@ -277,11 +273,19 @@ class ReferenceBaseComponentManager(BaseComponentManager):
         )
         # we've been disconnected and we might have missed some
         # changes, so we need to check the component's state, and
-        # make our state model correspond
+        # make our state model correspond. We pass through UNKNOWN
+        # (e.g. from DISABLE) on the way, but since our connection is
+        # immediate, we perform both actions as a batch, so that only
+        # the final state is reported.
+        #
+        # A component manager whose connection takes a while should
+        # instead perform "component_unknown" before connecting, so that
+        # the device reports UNKNOWN in the meantime.
         if self._component.faulty:
-            self.component_fault()
+            action = "component_fault"
         else:
-            self.component_power_mode_changed(self._component.power_mode)
+            action = self.action_map[self._component.power_mode]
+        self.op_state_model.perform_actions(["component_unknown", action])
 
     def stop_communicating(self):
         """
@@ -0,0 +1,119 @@
+"""
+This module provides :py:class:`.BatchedActionsMixin`, which allows a
+sequence of actions to be performed on a state model as a single batch,
+with only the net change of state reported to the model's callback.
+
+For example, when a component manager re-establishes communication
+with its component, it may drive the op state model through several
+actions in quick succession:
+
+.. code-block:: py
+
+  op_state_model.perform_actions(["component_unknown", "component_on"])
+
+Performed one at a time, these actions would result in two calls to the
+callback, and hence two sets of change and archive events for the
+device state, the first of them reporting a transient UNKNOWN state.
+Performed as a batch, they result in a single call to the callback,
+reporting the final ON state; or no call at all, if the device was
+already ON beforehand.
+
+A batch may also be opened as a context manager:
+
+.. code-block:: py
+
+  with obs_state_model.batch():
+      obs_state_model.perform_action("component_resourced")
+      obs_state_model.perform_action("component_configured")
+"""
+import contextlib
+import threading
+
+__all__ = ["BatchedActionsMixin"]
+
+
+class BatchedActionsMixin:
+    """
+    A mixin that adds batched actions to a state model.
+
+    A class that uses this mixin must:
+
+    * call :py:meth:`._init_batching` on initialisation;
+    * set the ``_batched_attribute`` class attribute to the name of the
+      property through which the model's state is read; for example,
+      "op_state";
+    * hold ``self._batch_lock`` while performing an action;
+    * report changes of state through :py:meth:`._call_callback`,
+      rather than by calling its callback directly.
+    """
+
+    _batched_attribute = None
+
+    def _init_batching(self):
+        """
+        Initialise the batching state of this model.
+        """
+        self._batch_lock = threading.RLock()
+        self._batch_depth = 0
+        self._batch_initial_state = None
+
+    def _call_callback(self, state):
+        """
+        Helper method that calls this model's callback with a new state,
+        unless a batch is open, in which case the call is deferred until
+        the batch is closed.
+
+        :param state: the new state of the model
+        """
+        if self._batch_depth == 0 and self._callback is not None:
+            self._callback(state)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Context manager that opens a batch of actions on this model.
+
+        While the batch is open, changes of state are not reported to
+        the callback, and actions from other threads are blocked. When
+        the batch is closed, the callback is called once, with the final
+        state, provided that it differs from the state when the batch
+        was opened.
+
+        Batches may be nested, in which case the callback is called only
+        when the outermost batch is closed. If an exception is raised
+        within a batch, actions already performed are not undone: the
+        model continues to reflect them, and the net change of state is
+        still reported when the batch is closed.
+
+        :yield: this state model
+        """
+        with self._batch_lock:
+            if self._batch_depth == 0:
+                self._batch_initial_state = getattr(self, self._batched_attribute)
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    state = getattr(self, self._batched_attribute)
+                    if state != self._batch_initial_state:
+                        self._call_callback(state)
+
+    def perform_actions(self, actions):
+        """
+        Performs a sequence of actions on the state model, in order, as
+        a single batch. The callback is called at most once, with the
+        state that results from the whole sequence.
+
+        :param actions: the actions to be performed, each as given in
+            the transitions table
+        :type actions: list of str
+
+        :raises StateModelError: if an action is not allowed in the
+            state that results from the actions before it. The actions
+            before it remain performed.
+        """
+        with self.batch():
+            for action in actions:
+                self.perform_action(action)
@@ -0,0 +1,510 @@
+"""
+This module provides ``CapabilityLedger``: an account of the maximum
+and available number of instances of each capability type of a
+controller.
+
+Each capability type is assigned an index, and the maximum and
+available instances of all types are held in arrays, so that checking,
+allocating and freeing instances costs a dictionary lookup and an array
+access per type, rather than a scan of all types. Allocations and frees
+are atomic: either all of the requested instances are allocated or
+freed, or none are.
+
+The formatted lists of maximum and available capabilities, as reported
+by a controller's ``maxCapabilities`` and ``availableCapabilities``
+attributes, are cached, and rebuilt only after a change.
+
+The maximum and available instances may also be read and written as
+dictionaries through ``CapabilityCounts`` views, for code that treats
+them as dictionaries keyed by capability type.
+"""
+import collections.abc
+import threading
+
+import numpy as np
+
+from ska_tango_base.faults import CapabilityValidationError
+
+__all__ = ["CapabilityCounts", "CapabilityLedger"]
+
+
+class CapabilityLedger:
+    """
+    An account of the maximum and available number of instances of each
+    capability type.
+    """
+
+    def __init__(self, max_capabilities):
+        """
+        Initialise a new CapabilityLedger, with all instances available.
+
+        :param max_capabilities: the maximum number of instances of each
+            capability type, keyed by capability type
+        :type max_capabilities: dict
+        """
+        self._lock = threading.Lock()
+        self._set_max(max_capabilities)
+        self._available = self._max.copy()
+        self._formatted_available = None
+
+    @classmethod
+    def from_strings(cls, max_capabilities):
+        """
+        Return a new CapabilityLedger, with the maximum number of
+        instances of each capability type given as strings like
+        "CORRELATOR:512", as in a controller's ``MaxCapabilities``
+        property.
+
+        :param max_capabilities: the maximum number of instances of each
+            capability type, or None for no capability types
+        :type max_capabilities: sequence of str
+
+        :return: a new CapabilityLedger
+        :rtype: :py:class:`.CapabilityLedger`
+        """
+        capabilities = {}
+        for max_capability in max_capabilities or []:
+            capability_type, max_capability_instances = max_capability.split(":")
+            capabilities[capability_type] = int(max_capability_instances)
+        return cls(capabilities)
+
+    @property
+    def capability_types(self):
+        """
+        Return the capability types in this ledger.
+
+        :return: the capability types
+        :rtype: tuple of str
+        """
+        return self._types
+
+    def has_types(self, capability_types):
+        """
+        Return whether all of the given capability types are in this
+        ledger.
+
+        :param capability_types: the capability types
+        :type capability_types: iterable of str
+
+        :return: whether all of the capability types are in this ledger
+        :rtype: bool
+        """
+        index = self._index
+        return all(capability_type in index for capability_type in capability_types)
+
+    def max_instances(self, capability_type):
+        """
+        Return the maximum number of instances of a capability type.
+
+        :param capability_type: the capability type
+        :type capability_type: str
+
+        :return: the maximum number of instances
+        :rtype: int
+
+        :raises CapabilityValidationError: if the capability type is not
+            in this ledger
+        """
+        return int(self._max[self._indices([capability_type])[0]])
+
+    def available_instances(self, capability_type):
+        """
+        Return the number of available instances of a capability type.
+
+        :param capability_type: the capability type
+        :type capability_type: str
+
+        :return: the number of available instances
+        :rtype: int
+
+        :raises CapabilityValidationError: if the capability type is not
+            in this ledger
+        """
+        return int(self._available[self._indices([capability_type])[0]])
+
+    def is_achievable(self, capabilities_instances, capability_types):
+        """
+        Return whether each of the given numbers of instances of the
+        corresponding capability types is available.
+
+        :param capabilities_instances: the number of instances of each
+            capability type
+        :type capabilities_instances: sequence of int
+        :param capability_types: the capability types
+        :type capability_types: sequence of str
+
+        :return: whether all of the instances are available
+        :rtype: bool
+
+        :raises CapabilityValidationError: if any capability type is not
+            in this ledger
+        """
+        indices = self._indices(capability_types)
+        available = self._available
+        return all(
+            available[index] >= instances
+            for (index, instances) in zip(indices, capabilities_instances)
+        )
+
+    def are_achievable(self, candidates, capability_types):
+        """
+        Return whether each of many candidate allocations could be made
+        from the available instances, in a single vectorised comparison.
+
+        Unlike :py:meth:`.is_achievable`, the instances of a capability
+        type that is repeated within a candidate are summed, as they
+        would be by :py:meth:`.allocate`.
+
+        :param candidates: the candidate allocations; one row per
+            candidate, and one column per capability type
+        :type candidates: 2-dimensional array-like of int
+        :param capability_types: the capability type of each column
+        :type capability_types: sequence of str
+
+        :return: whether each candidate allocation could be made
+        :rtype: :py:class:`numpy.ndarray` of bool
+
+        :raises CapabilityValidationError: if any capability type is not
+            in this ledger, if the candidates do not have one column
+            per capability type, or if any number of instances is
+            negative
+        """
+        indices = self._indices(capability_types)
+        candidates = np.asarray(candidates, dtype=np.int64)
+        if candidates.size == 0:
+            candidates = candidates.reshape(0, len(indices))
+        if candidates.ndim != 2 or candidates.shape[1] != len(indices):
+            raise CapabilityValidationError(
+                "Candidates must have one column per capability type"
+            )
+        if np.any(candidates < 0):
+            raise CapabilityValidationError(
+                "Number of capability instances must not be negative"
+            )
+        selection = np.zeros((len(indices), len(self._types)), dtype=np.int64)
+        selection[np.arange(len(indices)), indices] = 1
+        return np.all(candidates @ selection <= self._available, axis=1)
+
+    def allocate(self, capabilities_instances, capability_types):
+        """
+        Allocate instances of capability types, if they are all
+        available; otherwise allocate none of them.
+
+        :param capabilities_instances: the number of instances of each
+            capability type
+        :type capabilities_instances: sequence of int
+        :param capability_types: the capability types
+        :type capability_types: sequence of str
+
+        :return: whether the instances were allocated
+        :rtype: bool
+
+        :raises CapabilityValidationError: if any capability type is not
+            in this ledger, or if there is not one valid number of
+            instances per capability type
+        """
+        request = self._request(capabilities_instances, capability_types)
+        with self._lock:
+            if np.any(self._available < request):
+                return False
+            self._available -= request
+            self._formatted_available = None
+        return True
+
+    def free(self, capabilities_instances, capability_types):
+        """
+        Free instances of capability types that were allocated.
+
+        :param capabilities_instances: the number of instances of each
+            capability type
+        :type capabilities_instances: sequence of int
+        :param capability_types: the capability types
+        :type capability_types: sequence of str
+
+        :raises CapabilityValidationError: if any capability type is not
+            in this ledger, if there is not one valid number of
+            instances per capability type, or if more instances of any
+            type would be available than its maximum; in which case no
+            instances are freed
+        """
+        request = self._request(capabilities_instances, capability_types)
+        with self._lock:
+            available = self._available + request
+            if np.any(available > self._max):
+                raise CapabilityValidationError(
+                    "Cannot free more capability instances than were allocated"
+                )
+            self._available = available
+            self._formatted_available = None
+
+    def set_available(self, available_capabilities):
+        """
+        Set the number of available instances of some capability types.
+
+        :param available_capabilities: the number of available
+            instances, keyed by capability type
+        :type available_capabilities: dict
+
+        :raises CapabilityValidationError: if any capability type is not
+            in this ledger, or if any number of instances is negative or
+            more than the maximum; in which case none are set
+        """
+        indices = self._indices(available_capabilities)
+        instances = np.asarray(
+            list(available_capabilities.values()), dtype=np.int64
+        ).reshape(len(indices))
+        with self._lock:
+            if np.any(instances < 0) or np.any(instances > self._max[indices]):
+                raise CapabilityValidationError(
+                    "Number of available capability instances must be between 0 "
+                    "and the maximum"
+                )
+            available = self._available.copy()
+            available[indices] = instances
+            self._available = available
+            self._formatted_available = None
+
+    def reconfigure(self, max_capabilities):
+        """
+        Replace the capability types and their maximum number of
+        instances.
+
+        The number of allocated instances of each capability type that
+        remains is kept, as far as the new maximum allows; all instances
+        of a new capability type are available.
+
+        :param max_capabilities: the maximum number of instances of each
+            capability type, keyed by capability type
+        :type max_capabilities: dict
+        """
+        with self._lock:
+            allocated = dict(zip(self._types, (self._max - self._available).tolist()))
+            self._set_max(max_capabilities)
+            still_allocated = np.array(
+                [allocated.get(capability_type, 0) for capability_type in self._types],
+                dtype=np.int64,
+            ).reshape(len(self._types))
+            self._available = np.maximum(self._max - still_allocated, 0)
+            self._formatted_available = None
+
+    def reset(self):
+        """
+        Make all instances of all capability types available.
+        """
+        with self._lock:
+            self._available = self._max.copy()
+            self._formatted_available = None
+
+    @property
+    def max_capabilities(self):
+        """
+        Return the maximum number of instances of each capability type,
+        formatted like "CORRELATOR:512", and sorted.
+
+        :return: the formatted maximum number of instances of each
+            capability type
+        :rtype: list of str
+        """
+        return self._formatted_max
+
+    @property
+    def available_capabilities(self):
+        """
+        Return the number of available instances of each capability
+        type, formatted like "CORRELATOR:512", and sorted.
+
+        :return: the formatted number of available instances of each
+            capability type
+        :rtype: list of str
+        """
+        with self._lock:
+            if self._formatted_available is None:
+                self._formatted_available = self._format(self._available)
+            return self._formatted_available
+
+    def _set_max(self, max_capabilities):
+        """
+        Helper method that sets the capability types and their maximum
+        number of instances.
+
+        Must be called with the lock held, unless the ledger is being
+        initialised.
+
+        :param max_capabilities: the maximum number of instances of each
+            capability type, keyed by capability type
+        :type max_capabilities: dict
+        """
+        types = tuple(max_capabilities)
+        self._max = np.array(
+            [max_capabilities[capability_type] for capability_type in types],
+            dtype=np.int64,
+        ).reshape(len(types))
+        self._index = {
+            capability_type: index for (index, capability_type) in enumerate(types)
+        }
+        self._types = types
+        self._formatted_max = self._format(self._max)
+
+    def _indices(self, capability_types):
+        """
+        Helper method that returns the indices of capability types.
+
+        :param capability_types: the capability types
+        :type capability_types: sequence of str
+
+        :return: the index of each capability type
+        :rtype: list of int
+
+        :raises CapabilityValidationError: if any capability type is not
+            in this ledger
+        """
+        try:
+            return [
+                self._index[capability_type] for capability_type in capability_types
+            ]
+        except KeyError as key_error:
+            raise CapabilityValidationError(
+                f"Invalid capability type {key_error.args[0]}"
+            ) from None
+
+    def _request(self, capabilities_instances, capability_types):
+        """
+        Helper method that returns an array of the number of instances
+        requested of every capability type in this ledger, summing
+        repeated types.
+
+        :param capabilities_instances: the number of instances of each
+            capability type
+        :type capabilities_instances: sequence of int
+        :param capability_types: the capability types
+        :type capability_types: sequence of str
+
+        :return: the number of instances of each capability type
+        :rtype: :py:class:`numpy.ndarray`
+
+        :raises CapabilityValidationError: if any capability type is not
+            in this ledger, if there is not one number of instances per
+            capability type, or if any number of instances is negative
+        """
+        indices = self._indices(capability_types)
+        instances = np.asarray(capabilities_instances, dtype=np.int64)
+        if instances.shape != (len(indices),):
+            raise CapabilityValidationError(
+                "Expected one number of instances per capability type"
+            )
+        if np.any(instances < 0):
+            raise CapabilityValidationError(
+                "Number of capability instances must not be negative"
+            )
+        return np.bincount(
+            indices, weights=instances, minlength=len(self._types)
+        ).astype(np.int64)
+
+    def _format(self, counts):
+        """
+        Helper method that formats the number of instances of each
+        capability type.
+
+        :param counts: the number of instances of each capability type
+        :type counts: :py:class:`numpy.ndarray`
+
+        :return: the formatted number of instances of each capability
+            type, sorted
+        :rtype: list of str
+        """
+        return sorted(
+            f"{capability_type}:{count}"
+            for (capability_type, count) in zip(self._types, counts.tolist())
+        )
+
+
+class CapabilityCounts(collections.abc.MutableMapping):
+    """
+    A view of the maximum or available number of instances of each
+    capability type in a ledger, as a dictionary keyed by capability
+    type.
+
+    Writes go to the ledger. Setting an available number of instances
+    sets it in the ledger; setting or deleting a maximum number of
+    instances reconfigures the ledger.
+    """
+
+    def __init__(self, ledger, available):
+        """
+        Initialise a new CapabilityCounts view.
+
+        :param ledger: the ledger
+        :type ledger: :py:class:`.CapabilityLedger`
+        :param available: whether this is a view of the available
+            instances, rather than of the maximum instances
+        :type available: bool
+        """
+        self._ledger = ledger
+        self._available = available
+
+    def __getitem__(self, capability_type):
+        """
+        Return the number of instances of a capability type.
+
+        :param capability_type: the capability type
+        :type capability_type: str
+
+        :return: the number of instances
+        :rtype: int
+
+        :raises KeyError: if the capability type is not in the ledger
+        """
+        if not self._ledger.has_types([capability_type]):
+            raise KeyError(capability_type)
+        if self._available:
+            return self._ledger.available_instances(capability_type)
+        return self._ledger.max_instances(capability_type)
+
+    def __setitem__(self, capability_type, instances):
+        """
+        Set the number of instances of a capability type.
+
+        :param capability_type: the capability type
+        :type capability_type: str
+        :param instances: the number of instances
+        :type instances: int
+
+        :raises CapabilityValidationError: if this is a view of the
+            available instances, and the capability type is not in the
+            ledger, or the number of instances is out of range
+        """
+        if self._available:
+            self._ledger.set_available({capability_type: instances})
+        else:
+            max_capabilities = dict(self)
+            max_capabilities[capability_type] = instances
+            self._ledger.reconfigure(max_capabilities)
+
+    def __delitem__(self, capability_type):
+        """
+        Remove a capability type from the ledger.
+
+        :param capability_type: the capability type
+        :type capability_type: str
+
+        :raises KeyError: if the capability type is not in the ledger
+        :raises CapabilityValidationError: if this is a view of the
+            available instances, from which capability types cannot be
+            removed
+        """
+        if self._available:
+            raise CapabilityValidationError(
+                "Capability types can be removed only from the maximum instances"
+            )
+        max_capabilities = dict(self)
+        del max_capabilities[capability_type]
+        self._ledger.reconfigure(max_capabilities)
+
+    def __iter__(self):
+        return iter(self._ledger.capability_types)
+
+    def __len__(self):
+        return len(self._ledger.capability_types)
+
+    def __repr__(self):
+        return repr(dict(self))
@@ -0,0 +1,238 @@
+"""
+This module provides ``CommandLogging``: a policy for how commands log
+their calls.
+
+Commands log a record when they are entered and when they exit. These
+records are formatted lazily, only if the logger will emit them; and
+the command argument, which may be a large JSON configuration string,
+is summarised by truncating it to a maximum length, or by replacing it
+with its length and a hash.
+
+A ``CommandLogging`` policy may also keep a trace buffer: a bounded
+ring buffer of entry and exit records, to which a sample of calls is
+traced instead of being logged. Only exit records at WARNING level or
+above, and exceptions, are then sent to the logger. Records in the
+trace buffer are not formatted until they are read, except for the
+command argument, which is summarised when the record is traced, so
+that the buffer does not keep large arguments alive.
+"""
+import collections
+import datetime
+import hashlib
+import itertools
+import logging
+import threading
+import time
+
+__all__ = ["CommandLogging", "TRACE_ARGIN_MAX_LENGTH"]
+
+TRACE_ARGIN_MAX_LENGTH = 256
+"""
+The length to which command arguments are truncated in the trace
+buffer, if no shorter maximum length is configured.
+"""
+
+
+class _ArginSummary:
+    """
+    A command argument, summarised when it is converted to a string.
+    """
+
+    __slots__ = ("_argin", "_max_length", "_hash")
+
+    def __init__(self, argin, max_length, hash_argin):
+        """
+        Initialise a new summary.
+
+        :param argin: the command argument
+        :param max_length: the length to which to truncate the argument,
+            or 0 for no truncation
+        :type max_length: int
+        :param hash_argin: whether to replace the argument with its
+            length and a hash
+        :type hash_argin: bool
+        """
+        self._argin = argin
+        self._max_length = max_length
+        self._hash = hash_argin
+
+    def __str__(self):
+        """
+        Return the summary of the command argument.
+
+        :return: the summary of the command argument
+        :rtype: str
+        """
+        text = str(self._argin)
+        if self._hash:
+            digest = hashlib.sha256(text.encode()).hexdigest()[:16]
+            return f"<{len(text)} chars, sha256 {digest}>"
+        if self._max_length and len(text) > self._max_length:
+            return f"{text[:self._max_length]}... <{len(text)} chars>"
+        return text
+
+
+class CommandLogging:
+    """
+    A policy for how commands log their calls.
+    """
+
+    def __init__(
+        self,
+        argin_max_length=0,
+        hash_argin=False,
+        trace_buffer_size=0,
+        trace_sample_rate=1,
+    ):
+        """
+        Initialise a new CommandLogging policy.
+
+        :param argin_max_length: the length to which command arguments
+            are truncated when logged, or 0 for no truncation
+        :type argin_max_length: int
+        :param hash_argin: whether to log the length and a hash of each
+            command argument, instead of the argument itself
+        :type hash_argin: bool
+        :param trace_buffer_size: the number of records that the trace
+            buffer holds, or 0 for no trace buffer, in which case calls
+            are logged
+        :type trace_buffer_size: int
+        :param trace_sample_rate: trace one call in this many
+        :type trace_sample_rate: int
+        """
+        self._argin_max_length = argin_max_length
+        self._hash_argin = hash_argin
+        self._trace_sample_rate = max(1, trace_sample_rate)
+
+        self._lock = threading.Lock()
+        self._call_counter = itertools.count()
+        if trace_buffer_size:
+            self._traces = collections.deque(maxlen=trace_buffer_size)
+        else:
+            self._traces = None
+
+    def summarise(self, argin):
+        """
+        Return a summary of a command argument, which is formatted only
+        if it is converted to a string.
+
+        :param argin: the command argument
+
+        :return: a lazy summary of the command argument
+        """
+        return _ArginSummary(argin, self._argin_max_length, self._hash_argin)
+
+    def entered(self, logger, command_name, argin=None):
+        """
+        Record that a command has been entered.
+
+        :param logger: the command's logger
+        :type logger: a logger that implements the standard library
+            logger interface
+        :param command_name: the name of the command
+        :type command_name: str
+        :param argin: the argument passed to the command, if any
+
+        :return: whether the call is traced; to be passed to
+            :py:meth:`.exited`
+        :rtype: bool
+        """
+        if self._traces is not None:
+            traced = next(self._call_counter) % self._trace_sample_rate == 0
+            if traced:
+                summary = _ArginSummary(
+                    argin,
+                    min(
+                        self._argin_max_length or TRACE_ARGIN_MAX_LENGTH,
+                        TRACE_ARGIN_MAX_LENGTH,
+                    ),
+                    self._hash_argin,
+                )
+                self._trace(
+                    "Entering command %s with argin '%s'",
+                    (command_name, str(summary)),
+                )
+            return traced
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Entering command %s with argin '%s'",
+                command_name,
+                self.summarise(argin),
+            )
+        return False
+
+    def exited(self, logger, level, traced, msg, *args):
+        """
+        Record that a command has exited.
+
+        :param logger: the command's logger
+        :type logger: a logger that implements the standard library
+            logger interface
+        :param level: the level at which to log the exit
+        :type level: int
+        :param traced: whether the call is traced, as returned by
+            :py:meth:`.entered`
+        :type traced: bool
+        :param msg: the message format string
+        :type msg: str
+        :param args: the arguments to the message format string
+        """
+        if self._traces is None or level >= logging.WARNING:
+            logger.log(level, msg, *args)
+        elif traced:
+            self._trace(msg, args)
+
+    def _trace(self, msg, args):
+        """
+        Helper method that appends a record to the trace buffer.
+
+        :param msg: the message format string
+        :type msg: str
+        :param args: the arguments to the message format string
+        :type args: tuple
+        """
+        with self._lock:
+            self._traces.append((time.time(), msg, args))
+
+    @property
+    def traces(self):
+        """
+        Return the records in the trace buffer, oldest first.
+
+        :return: the formatted records in the trace buffer
+        :rtype: list of str
+        """
+        if self._traces is None:
+            return []
+        with self._lock:
+            records = list(self._traces)
+        return [
+            f"{self._format_timestamp(timestamp)} {msg % args}"
+            for (timestamp, msg, args) in records
+        ]
+
+    @staticmethod
+    def _format_timestamp(timestamp):
+        """
+        Helper method that formats the timestamp of a trace record as
+        an ISO 8601 UTC time.
+
+        :param timestamp: the time of the record, in seconds since the
+            epoch
+        :type timestamp: float
+
+        :return: the formatted time; for example,
+            "2021-06-01T12:00:00.123456Z"
+        :rtype: str
+        """
+        utc = datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+        return f"{utc.replace(tzinfo=None).isoformat()}Z"
+
+    def clear_traces(self):
+        """
+        Clear the trace buffer.
+        """
+        if self._traces is not None:
+            with self._lock:
+                self._traces.clear()
@@ -0,0 +1,478 @@
+"""
+This module provides ``CommandProgress``: a tracker of the progress,
+measured duration and timeout of the calls to a command, as reported by
+the CSP ``*Progress``, ``*MeasuredDuration`` and ``*TimeoutExpiredFlag``
+attributes.
+
+A command that has a ``CommandProgress`` starts it when its ``do()``
+method is called, and finishes it when ``do()`` returns, so that its
+measured duration is updated without any work by the command. The
+command may report its progress in the meantime. Durations are measured
+with a monotonic clock, so they are unaffected by changes to the system
+time.
+
+If the command has a maximum duration, a watchdog is armed when the call
+starts, and the timeout expired flag is set if the call has not finished
+when it fires. Watchdogs are scheduled on a ``TimerWheel`` shared by all
+trackers in the process, which runs every watchdog on a single thread,
+rather than on a thread per call.
+"""
+
+import logging
+import math
+import threading
+import time
+
+__all__ = ["CommandProgress", "TimerWheel", "timer_wheel"]
+
+module_logger = logging.getLogger(__name__)
+
+
+class _Timer:
+    """
+    A callback scheduled on a :py:class:`.TimerWheel`.
+    """
+
+    __slots__ = ("deadline", "callback")
+
+    def __init__(self, deadline, callback):
+        """
+        Initialise a new timer.
+
+        :param deadline: the tick of the wheel at or after which the
+            timer fires
+        :type deadline: int
+        :param callback: the callable to be called when the timer fires
+        :type callback: callable
+        """
+        self.deadline = deadline
+        self.callback = callback
+
+
+class TimerWheel:
+    """
+    A hashed timer wheel: a fixed ring of slots, each holding the timers
+    that fall due on the ticks that map to it, serviced by a single
+    thread.
+
+    Scheduling and cancelling a timer take constant time, however many
+    timers are scheduled, and the thread only wakes while there are
+    timers to service. Timers fire no earlier than their delay, and no
+    more than about a tick later.
+    """
+
+    def __init__(self, tick=0.05, slot_count=256, logger=None):
+        """
+        Initialise a new TimerWheel. Its thread is not started until a
+        timer is first scheduled.
+
+        :param tick: the resolution of the wheel, in seconds
+        :type tick: float
+        :param slot_count: the number of slots in the wheel
+        :type slot_count: int
+        :param logger: the logger to be used by this wheel. If not
+            provided, then a default module logger will be used.
+        :type logger: a logger that implements the standard library
+            logger interface
+        """
+        self._tick = tick
+        self._slots = [set() for _ in range(max(1, slot_count))]
+        self._logger = logger or module_logger
+
+        self._condition = threading.Condition()
+        self._origin = time.monotonic()
+        self._next_tick = 0
+        self._timer_count = 0
+        self._thread = None
+
+    def schedule(self, delay, callback):
+        """
+        Schedule a callback to be called after a delay, on the wheel's
+        thread. The callback should return promptly, since it delays
+        any other timers that fall due.
+
+        :param delay: the delay, in seconds
+        :type delay: float
+        :param callback: the callable to be called, without arguments
+        :type callback: callable
+
+        :return: a handle by which the timer may be cancelled
+        :rtype: object
+        """
+        with self._condition:
+            if self._timer_count == 0:
+                # idle: catch up with the current tick without visiting
+                # the slots in between, which are empty
+                self._next_tick = self._current_tick()
+            deadline = max(
+                math.ceil((time.monotonic() + delay - self._origin) / self._tick),
+                self._next_tick,
+            )
+            timer = _Timer(deadline, callback)
+            self._slots[deadline % len(self._slots)].add(timer)
+            self._timer_count += 1
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="TimerWheel", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return timer
+
+    def cancel(self, timer):
+        """
+        Cancel a timer, if it has not already fired.
+
+        :param timer: the handle returned when the timer was scheduled
+        :type timer: object
+
+        :return: whether the timer was cancelled before it fired
+        :rtype: bool
+        """
+        with self._condition:
+            slot = self._slots[timer.deadline % len(self._slots)]
+            if timer not in slot:
+                return False
+            slot.remove(timer)
+            self._timer_count -= 1
+            return True
+
+    def __len__(self):
+        """
+        Return the number of timers scheduled.
+
+        :return: the number of timers scheduled
+        :rtype: int
+        """
+        with self._condition:
+            return self._timer_count
+
+    def _current_tick(self):
+        """
+        Helper method that returns the current tick of the wheel.
+
+        :return: the current tick
+        :rtype: int
+        """
+        return int((time.monotonic() - self._origin) / self._tick)
+
+    def _run(self):
+        """
+        The body of the wheel's thread, which calls the timers that fall
+        due, tick by tick.
+        """
+        with self._condition:
+            while True:
+                while self._timer_count == 0:
+                    self._condition.wait()
+
+                current_tick = self._current_tick()
+                span = min(current_tick - self._next_tick + 1, len(self._slots))
+                expired = []
+                for offset in range(max(span, 0)):
+                    slot = self._slots[(self._next_tick + offset) % len(self._slots)]
+                    due = [timer for timer in slot if timer.deadline <= current_tick]
+                    slot.difference_update(due)
+                    expired.extend(due)
+                self._next_tick = max(self._next_tick, current_tick + 1)
+                self._timer_count -= len(expired)
+
+                self._condition.release()
+                try:
+                    for timer in expired:
+                        try:
+                            timer.callback()
+                        except Exception:
+                            self._logger.exception("Timer callback failed.")
+                finally:
+                    self._condition.acquire()
+
+                if self._timer_count:
+                    self._condition.wait(
+                        self._origin + self._next_tick * self._tick - time.monotonic()
+                    )
+
+
+timer_wheel = TimerWheel()
+"""
+The process-wide timer wheel, on which command watchdogs are scheduled.
+"""
+
+
+class CommandProgress:
+    """
+    A tracker of the progress, measured duration and timeout of the
+    calls to a command.
+
+    Changes are published through a callback, as values of the
+    attributes named by appending ``Progress``, ``MeasuredDuration`` and
+    ``TimeoutExpiredFlag`` to the tracker's name; for example,
+    ``assignResourcesProgress``.
+    """
+
+    def __init__(
+        self,
+        name,
+        publish=None,
+        granularity=1,
+        maximum_duration=0.0,
+        wheel=None,
+        logger=None,
+    ):
+        """
+        Initialise a new CommandProgress.
+
+        :param name: the name of the tracker, used as the prefix of the
+            names of the attributes whose values it publishes; for
+            example, "assignResources"
+        :type name: str
+        :param publish: callable that publishes a new attribute value,
+            called with the attribute name and value
+        :type publish: callable
+        :param granularity: the change of progress, in percent, that is
+            published. Smaller changes are recorded, but not published
+            until they add up to this much, or the call finishes.
+        :type granularity: int
+        :param maximum_duration: the maximum expected duration of a
+            call, in seconds, after which the timeout expired flag is
+            set; or 0 for no timeout
+        :type maximum_duration: float
+        :param wheel: the timer wheel on which the watchdog is
+            scheduled. If not provided, then the process-wide
+            :py:data:`.timer_wheel` is used.
+        :type wheel: :py:class:`.TimerWheel`
+        :param logger: the logger to be used by this tracker. If not
+            provided, then a default module logger will be used.
+        :type logger: a logger that implements the standard library
+            logger interface
+        """
+        self._name = name
+        self._publish = publish
+        self._granularity = max(1, granularity)
+        self._maximum_duration = maximum_duration
+        self._timer_wheel = wheel or timer_wheel
+        self._logger = logger or module_logger
+
+        self._lock = threading.Lock()
+        self._progress = 0
+        self._published_progress = 0
+        self._measured_duration = 0.0
+        self._timeout_expired = False
+        self._start_time = None
+        self._watchdog = None
+
+    @property
+    def name(self):
+        """
+        Return the name of this tracker.
+
+        :return: the name of this tracker
+        :rtype: str
+        """
+        return self._name
+
+    @property
+    def maximum_duration(self):
+        """
+        Return the maximum expected duration of a call.
+
+        :return: the maximum expected duration, in seconds, or 0 for no
+            timeout
+        :rtype: float
+        """
+        return self._maximum_duration
+
+    @maximum_duration.setter
+    def maximum_duration(self, maximum_duration):
+        """
+        Set the maximum expected duration of a call. This takes effect
+        from the next call.
+
+        :param maximum_duration: the maximum expected duration, in
+            seconds, or 0 for no timeout
+        :type maximum_duration: float
+        """
+        self._maximum_duration = maximum_duration
+
+    @property
+    def progress(self):
+        """
+        Return the progress of the current or most recent call.
+
+        :return: the progress, in percent
+        :rtype: int
+        """
+        return self._progress
+
+    @property
+    def measured_duration(self):
+        """
+        Return the measured duration of the most recent call to have
+        finished.
+
+        :return: the measured duration, in seconds
+        :rtype: float
+        """
+        return self._measured_duration
+
+    @property
+    def timeout_expired(self):
+        """
+        Return whether the current or most recent call ran for longer
+        than the maximum expected duration.
+
+        :return: whether the timeout expired
+        :rtype: bool
+        """
+        return self._timeout_expired
+
+    @property
+    def running(self):
+        """
+        Return whether a call is running.
+
+        :return: whether a call is running
+        :rtype: bool
+        """
+        return self._start_time is not None
+
+    def start(self):
+        """
+        Record the start of a call: reset the progress and the timeout
+        expired flag, and arm the watchdog if there is a maximum
+        duration.
+        """
+        with self._lock:
+            self._cancel_watchdog()
+            self._start_time = time.monotonic()
+            self._set_progress(0, force=True)
+            self._set_timeout_expired(False)
+
+            if self._maximum_duration > 0:
+                start_time = self._start_time
+                self._watchdog = self._timer_wheel.schedule(
+                    self._maximum_duration, lambda: self._watchdog_fired(start_time)
+                )
+
+    def update(self, progress):
+        """
+        Record the progress of the current call. The progress is
+        published if it has changed by at least the granularity since
+        it was last published.
+
+        :param progress: the progress, in percent
+        :type progress: int
+        """
+        with self._lock:
+            if self._start_time is not None:
+                self._set_progress(min(max(int(progress), 0), 100))
+
+    def finish(self, succeeded=True):
+        """
+        Record the end of the current call: disarm the watchdog, and
+        publish the measured duration and, if the call succeeded, a
+        progress of 100 percent.
+
+        :param succeeded: whether the call succeeded
+        :type succeeded: bool
+        """
+        with self._lock:
+            if self._start_time is None:
+                return
+            self._cancel_watchdog()
+            self._measured_duration = time.monotonic() - self._start_time
+            self._start_time = None
+
+            if succeeded:
+                self._set_progress(100, force=True)
+            elif self._progress != self._published_progress:
+                self._set_progress(self._progress, force=True)
+            self._call_publish("MeasuredDuration", self._measured_duration)
+
+    def cancel(self):
+        """
+        Disarm the watchdog of the current call, if any, without
+        finishing the call; for example, because the device is being
+        deleted.
+        """
+        with self._lock:
+            self._cancel_watchdog()
+
+    def _set_progress(self, progress, force=False):
+        """
+        Helper method that records the progress, and publishes it if
+        forced, or if it has changed by at least the granularity.
+
+        Must be called with the lock held.
+
+        :param progress: the progress, in percent
+        :type progress: int
+        :param force: whether to publish the progress regardless of the
+            granularity
+        :type force: bool
+        """
+        self._progress = progress
+        if force or abs(progress - self._published_progress) >= self._granularity:
+            self._published_progress = progress
+            self._call_publish("Progress", progress)
+
+    def _set_timeout_expired(self, timeout_expired):
+        """
+        Helper method that records whether the timeout has expired, and
+        publishes it if it has changed.
+
+        Must be called with the lock held.
+
+        :param timeout_expired: whether the timeout has expired
+        :type timeout_expired: bool
+        """
+        if self._timeout_expired != timeout_expired:
+            self._timeout_expired = timeout_expired
+            self._call_publish("TimeoutExpiredFlag", timeout_expired)
+
+    def _cancel_watchdog(self):
+        """
+        Helper method that disarms the watchdog, if armed.
+
+        Must be called with the lock held.
+        """
+        if self._watchdog is not None:
+            self._timer_wheel.cancel(self._watchdog)
+            self._watchdog = None
+
+    def _watchdog_fired(self, start_time):
+        """
+        Callback for the watchdog of a call, which sets the timeout
+        expired flag if the call is still running.
+
+        :param start_time: the monotonic time at which the call started
+        :type start_time: float
+        """
+        with self._lock:
+            if self._start_time != start_time:
+                # the call has finished, and possibly another started
+                return
+            self._watchdog = None
+            self._logger.warning(
+                f"{self._name} has not finished within its maximum duration of "
+                f"{self._maximum_duration} s."
+            )
+            self._set_timeout_expired(True)
+
+    def _call_publish(self, suffix, value):
+        """
+        Helper method that publishes a new value of one of this
+        tracker's attributes.
+
+        :param suffix: the suffix of the attribute name; for example,
+            "Progress"
+        :type suffix: str
+        :param value: the new value of the attribute
+        """
+        if self._publish is None:
+            return
+        try:
+            self._publish(f"{self._name}{suffix}", value)
+        except Exception:
+            self._logger.exception(f"Failed to publish {self._name}{suffix}.")
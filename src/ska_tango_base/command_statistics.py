@@ -0,0 +1,194 @@
+"""
+This module provides ``CommandStatistics``: a record of the number of
+calls to a command, the number of those calls that failed, and a
+streaming histogram of their latencies.
+
+The histogram uses a fixed set of logarithmically spaced buckets, each
+no more than 12.5% wide, covering latencies from a nanosecond to about
+eighteen minutes. It therefore takes constant memory, however many calls
+are recorded, and latency percentiles are reported to within the width
+of a bucket. The maximum latency is recorded exactly.
+"""
+import threading
+
+__all__ = ["CommandStatistics"]
+
+_SUB_BUCKET_BITS = 3
+"""
+Number of bits of each latency, after the leading bit, that determine
+its bucket; so each power of two is divided into 8 buckets.
+"""
+
+_MAX_EXPONENT = 41
+"""
+Latencies of 2**40 ns (about 18 minutes) or more all fall in the last
+bucket.
+"""
+
+_BUCKET_COUNT = (_MAX_EXPONENT - _SUB_BUCKET_BITS) << _SUB_BUCKET_BITS
+
+
+def _bucket_index(latency_ns):
+    """
+    Return the index of the histogram bucket for a latency.
+
+    :param latency_ns: the latency, in nanoseconds
+    :type latency_ns: int
+
+    :return: the index of the bucket
+    :rtype: int
+    """
+    shift = latency_ns.bit_length() - _SUB_BUCKET_BITS - 1
+    if shift <= 0:
+        return latency_ns
+    return min((shift << _SUB_BUCKET_BITS) + (latency_ns >> shift), _BUCKET_COUNT - 1)
+
+
+def _bucket_upper_bound(index):
+    """
+    Return the largest latency that falls in a histogram bucket.
+
+    :param index: the index of the bucket
+    :type index: int
+
+    :return: the largest latency in the bucket, in nanoseconds
+    :rtype: int
+    """
+    shift = (index >> _SUB_BUCKET_BITS) - 1
+    if shift <= 0:
+        return index
+    mantissa = index - (shift << _SUB_BUCKET_BITS)
+    return ((mantissa + 1) << shift) - 1
+
+
+class CommandStatistics:
+    """
+    Statistics of the calls to a command.
+    """
+
+    PERCENTILES = (50, 95, 99)
+    """
+    The latency percentiles that are reported.
+    """
+
+    def __init__(self):
+        """
+        Initialise a new, empty, CommandStatistics.
+        """
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Clear these statistics.
+        """
+        with self._lock:
+            self._count = 0
+            self._failures = 0
+            self._max_ns = 0
+            self._buckets = [0] * _BUCKET_COUNT
+
+    def record(self, latency_ns, failed=False):
+        """
+        Record a call to the command.
+
+        :param latency_ns: the latency of the call, in nanoseconds
+        :type latency_ns: int
+        :param failed: whether the call failed
+        :type failed: bool
+        """
+        index = _bucket_index(latency_ns)
+        with self._lock:
+            self._count += 1
+            if failed:
+                self._failures += 1
+            self._buckets[index] += 1
+            if latency_ns > self._max_ns:
+                self._max_ns = latency_ns
+
+    @property
+    def count(self):
+        """
+        Return the number of calls recorded.
+
+        :return: the number of calls recorded
+        :rtype: int
+        """
+        return self._count
+
+    @property
+    def failures(self):
+        """
+        Return the number of failed calls recorded.
+
+        :return: the number of failed calls recorded
+        :rtype: int
+        """
+        return self._failures
+
+    def latency_percentile(self, percentile):
+        """
+        Return a percentile of the latency of the calls recorded; that
+        is, an upper bound on the latency of the given percentage of
+        calls, to within the width of a histogram bucket.
+
+        :param percentile: the percentile; for example, 95
+        :type percentile: float
+
+        :return: the latency percentile, in seconds, or None if no calls
+            have been recorded
+        :rtype: float
+        """
+        with self._lock:
+            return self._latency_percentile(percentile)
+
+    def as_dict(self):
+        """
+        Return these statistics as a dictionary, with latencies given in
+        milliseconds; for example::
+
+            {
+                "count": 12,
+                "failures": 1,
+                "latency_ms": {"p50": 0.12, "p95": 1.5, "p99": 1.5, "max": 1.43}
+            }
+
+        :return: a dictionary of statistics
+        :rtype: dict
+        """
+        with self._lock:
+            latency_ms = {}
+            for percentile in self.PERCENTILES:
+                latency = self._latency_percentile(percentile)
+                latency_ms[f"p{percentile}"] = (
+                    None if latency is None else latency * 1e3
+                )
+            latency_ms["max"] = self._max_ns / 1e6 if self._count else None
+            return {
+                "count": self._count,
+                "failures": self._failures,
+                "latency_ms": latency_ms,
+            }
+
+    def _latency_percentile(self, percentile):
+        """
+        Helper method that returns a percentile of the latency of the
+        calls recorded. Must be called with the lock held.
+
+        :param percentile: the percentile; for example, 95
+        :type percentile: float
+
+        :return: the latency percentile, in seconds, or None if no calls
+            have been recorded
+        :rtype: float
+        """
+        if self._count == 0:
+            return None
+
+        target = self._count * percentile / 100.0
+        cumulative = 0
+        for (index, bucket_count) in enumerate(self._buckets):
+            cumulative += bucket_count
+            if cumulative >= target and bucket_count:
+                return min(_bucket_upper_bound(index), self._max_ns) / 1e9
+        return self._max_ns / 1e9
@@ -18,13 +18,32 @@ The following command classes are provided:
   ``AssignResources()``, ``Configure()``, ``Scan()``.
 
 * **ResponseCommand**: for commands that return a ``(ResultCode,
-  message)`` tuple.
+  message)`` tuple. A ``ResponseCommand`` may optionally be given a
+  :py:class:`~ska_tango_base.executor.CommandExecutor`, in which case
+  it returns ``(ResultCode.QUEUED, command_id)`` immediately, and its
+  ``do()`` method is run later on one of the executor's worker threads;
+  or, if the executor's queue is full, it returns
+  ``(ResultCode.REJECTED, message)`` without running at all.
 
 * **CompletionCommand**: for commands that need to let their state
   machine know when they have completed; that is, long-running commands
   with transitional states, such as ``AssignResources()`` and
   ``Configure()``.
 
+A command may also be given a
+:py:class:`~ska_tango_base.command_statistics.CommandStatistics`, by
+setting its ``statistics`` attribute, in which case every call to it is
+counted and timed; and a
+:py:class:`~ska_tango_base.command_logging.CommandLogging` policy, by
+setting its ``command_logging`` attribute, to control how its calls are
+logged. ``SKABaseDevice`` does both for all of its registered command
+objects.
+
+A command may also be given a
+:py:class:`~ska_tango_base.command_progress.CommandProgress`, by setting
+its ``progress_tracker`` attribute, in which case the progress, measured
+duration and timeout of every call to its ``do()`` method are tracked.
+
 .. inheritance-diagram::
    ska_tango_base.commands.BaseCommand
    ska_tango_base.commands.StateModelCommand
@@ -59,12 +78,20 @@ implement the ``__init__`` and ``do`` methods. For example:
             # do stuff
             return (ResultCode.OK, "AssignResources command completed OK")
 
+If that command is constructed with an ``executor`` keyword argument,
+or has its ``executor`` attribute set, then a call to it returns as soon
+as the "assign_invoked" action has been performed on the state model,
+and the "assign_completed" action is performed by the worker thread once
+``do()`` has returned.
 """
 import enum
 import logging
+import threading
+import time
 
 from tango import DevState
 
+from ska_tango_base.command_logging import CommandLogging
 from ska_tango_base.faults import CommandError, StateModelError
 
 module_logger = logging.getLogger(__name__)
@@ -100,6 +127,12 @@ class ResultCode(enum.IntEnum):
     The status of the command is not known.
     """
 
+    REJECTED = 5
+    """
+    The command was rejected without being executed; for example,
+    because the device's command queue is full.
+    """
+
 
 class BaseCommand:
     """
@@ -108,6 +141,34 @@ class BaseCommand:
     command.
     """
 
+    executor = None
+    """
+    The executor on which calls to this command are run; if None, the
+    command runs synchronously in the calling thread. Only
+    ``ResponseCommand`` supports execution on an executor.
+    """
+
+    statistics = None
+    """
+    The :py:class:`~ska_tango_base.command_statistics.CommandStatistics`
+    in which calls to this command are recorded; if None, calls are not
+    recorded.
+    """
+
+    command_logging = CommandLogging()
+    """
+    The :py:class:`~ska_tango_base.command_logging.CommandLogging`
+    policy for how calls to this command are logged. By default, command
+    arguments are logged in full, and nothing is traced.
+    """
+
+    progress_tracker = None
+    """
+    The :py:class:`~ska_tango_base.command_progress.CommandProgress`
+    that tracks calls to this command's ``do()`` method; if None, calls
+    are not tracked.
+    """
+
     def __init__(self, target, *args, logger=None, **kwargs):
         """
         Creates a new BaseCommand object for a device.
@@ -126,19 +187,86 @@ class BaseCommand:
 
     def __call__(self, argin=None):
         """
-        What to do when the command is called. This base class simply
+        What to do when the command is called. Unless the call is
+        rejected, this invokes the command; and if this command has
+        statistics, the call and its latency are recorded. A call that
+        is queued on an executor is recorded by the worker thread
+        instead, once ``do()`` has returned, so that its latency is
+        that of ``do()`` rather than of queueing it.
+
+        Subclasses should override :py:meth:`._invoke` rather than this
+        method, so that everything they do is included in the recorded
+        latency.
+
+        :param argin: the argument passed to the Tango command, if
+            present
+        :type argin: ANY
+
+        :return: result of call
+        """
+        if self.statistics is None:
+            return self._invoke_unless_rejected(argin)
+
+        start = time.perf_counter_ns()
+        try:
+            result = self._invoke_unless_rejected(argin)
+        except BaseException:
+            self._record_call(start, failed=True)
+            raise
+        if not self._is_queued(result):
+            self._record_call(start, failed=self._is_failure(result))
+        return result
+
+    def _record_call(self, start, failed):
+        """
+        Helper method that records a call in this command's statistics,
+        if it has any.
+
+        :param start: the ``time.perf_counter_ns()`` at which the call
+            started
+        :type start: int
+        :param failed: whether the call failed
+        :type failed: bool
+        """
+        statistics = self.statistics
+        if statistics is not None:
+            statistics.record(time.perf_counter_ns() - start, failed=failed)
+
+    def _invoke_unless_rejected(self, argin=None):
+        """
+        Helper method that invokes the command, unless the call is
+        rejected.
+
+        :param argin: the argument passed to the Tango command, if
+            present
+        :type argin: ANY
+
+        :return: result of call, or the rejection
+        """
+        rejection = self._rejection()
+        if rejection is not None:
+            return rejection
+        return self._invoke(argin)
+
+    def _invoke(self, argin=None):
+        """
+        What to do when the command is invoked. This base class simply
         calls ``do()`` or ``do(argin)``, depending on whether the
         ``argin`` argument is provided.
 
         :param argin: the argument passed to the Tango command, if
             present
         :type argin: ANY
+
+        :return: result of call
         """
         try:
             return self._call_do(argin)
         except Exception:
             self.logger.exception(
-                f"Error executing command {self.name} with argin '{argin}'"
+                "Error executing command %s with argin '%s'",
+                self.name,
+                self.command_logging.summarise(argin),
             )
             raise
 
@@ -151,12 +279,37 @@ class BaseCommand:
             present
         :type argin: ANY
         """
-        if argin is None:
-            returned = self.do()
-        else:
-            returned = self.do(argin=argin)
+        traced = self.command_logging.entered(self.logger, self.name, argin)
+        returned = self._do_tracked(argin)
 
-        self.logger.info(f"Exiting command {self.name}")
+        self.command_logging.exited(
+            self.logger, logging.INFO, traced, "Exiting command %s", self.name
+        )
+        return returned
+
+    def _do_tracked(self, argin=None):
+        """
+        Helper method that calls the ``do`` method with the right
+        arguments and, if this command has a progress tracker, tracks
+        the call.
+
+        :param argin: the argument passed to the Tango command, if
+            present
+        :type argin: ANY
+
+        :return: result of the ``do`` method
+        """
+        progress_tracker = self.progress_tracker
+        if progress_tracker is None:
+            return self.do() if argin is None else self.do(argin=argin)
+
+        progress_tracker.start()
+        try:
+            returned = self.do() if argin is None else self.do(argin=argin)
+        except BaseException:
+            progress_tracker.finish(succeeded=False)
+            raise
+        progress_tracker.finish(succeeded=not self._is_failure(returned))
         return returned
 
     def do(self, argin=None):
@@ -173,6 +326,55 @@ class BaseCommand:
             "BaseCommand is abstract; do() must be subclassed not called."
         )
 
+    def _rejection(self):
+        """
+        Hook that determines whether a call to this command is to be
+        rejected before anything is done; for example, before an action
+        is performed on a state model. This class never rejects a call;
+        subclasses may override it.
+
+        :return: None if the call is accepted; otherwise a
+            ``(ResultCode, message)`` tuple to be returned to the caller
+        :rtype: (ResultCode, str) or None
+        """
+        return None
+
+    def _queued_call_completed(self):
+        """
+        Hook called on the executor's worker thread when a queued call
+        to this command has completed. This class does nothing;
+        subclasses may override it.
+        """
+
+    def _is_queued(self, result):
+        """
+        Hook that determines whether the result of a call to this
+        command means that the call was queued on an executor, and so
+        is yet to be recorded in the statistics. This class does not
+        support an executor, so returns False; subclasses may override
+        it.
+
+        :param result: the result of the call
+
+        :return: whether the call was queued
+        :rtype: bool
+        """
+        return False
+
+    def _is_failure(self, result):
+        """
+        Hook that determines whether the result of a call to this
+        command represents a failure, for the purpose of recording
+        statistics. This class treats only exceptions as failures, so
+        returns False; subclasses may override it.
+
+        :param result: the result of the call
+
+        :return: whether the result represents a failure
+        :rtype: bool
+        """
+        return False
+
 
 class StateModelCommand(BaseCommand):
     def __init__(self, target, state_model, action_slug, *args, logger=None, **kwargs):
@@ -208,9 +410,9 @@ class StateModelCommand(BaseCommand):
 
         super().__init__(target, *args, logger=logger, **kwargs)
 
-    def __call__(self, argin=None):
+    def _invoke(self, argin=None):
         """
-        What to do when the command is called. Ensures that we perform
+        What to do when the command is invoked. Ensures that we perform
         the "invoked" action on the state machine.
 
         :param argin: the argument passed to the Tango command, if
@@ -227,7 +429,7 @@ class StateModelCommand(BaseCommand):
             except StateModelError as sme:
                 raise CommandError("Command not permitted by state model.") from sme
 
-        return super().__call__(argin)
+        return super()._invoke(argin)
 
     def is_allowed(self, raise_if_disallowed=False):
         """
@@ -339,12 +541,161 @@ class ResponseCommand(BaseCommand):
         ResultCode.QUEUED: logging.INFO,
         ResultCode.FAILED: logging.ERROR,
         ResultCode.UNKNOWN: logging.WARNING,
+        ResultCode.REJECTED: logging.WARNING,
     }
 
+    def __init__(self, target, *args, executor=None, logger=None, **kwargs):
+        """
+        Create a new ResponseCommand for a device.
+
+        :param target: the object that this command acts upon; for
+            example, a component manager
+        :type target: object
+        :param args: additional positional arguments
+        :param executor: an optional executor on which to run this
+            command. If provided, calls to this command return
+            ``(ResultCode.QUEUED, command_id)`` immediately, and
+            ``do()`` is run later on one of the executor's worker
+            threads; or ``(ResultCode.REJECTED, message)`` if the
+            executor's queue is full.
+        :type executor: :py:class:`~ska_tango_base.executor.CommandExecutor`
+        :param logger: the logger to be used by this Command. If not
+            provided, then a default module logger will be used.
+        :type logger: a logger that implements the standard library
+            logger interface
+        :param kwargs: additional keyword arguments
+        """
+        self.executor = executor
+        self._pending = threading.local()
+        super().__init__(target, *args, logger=logger, **kwargs)
+
+    def _invoke_unless_rejected(self, argin=None):
+        """
+        Helper method that invokes the command, unless the call is
+        rejected. If this command has an executor, a place in its queue
+        is reserved before anything else is done, so that a call that
+        is not rejected is certain to be queued.
+
+        :param argin: the argument passed to the Tango command, if
+            present
+        :type argin: ANY
+
+        :return: result of call, or the rejection
+        """
+        executor = self.executor
+        if executor is None:
+            return super()._invoke_unless_rejected(argin)
+
+        self._pending.reservation = executor.reserve()
+        try:
+            return super()._invoke_unless_rejected(argin)
+        finally:
+            reservation = self._pending.reservation
+            self._pending.reservation = None
+            if reservation is not None:
+                executor.release(reservation)
+
+    def _rejection(self):
+        """
+        Rejects the call if this command has an executor, and no place
+        could be reserved in the executor's queue because it is full.
+
+        :return: None if the call is accepted; otherwise a
+            ``(ResultCode.REJECTED, message)`` tuple
+        :rtype: (ResultCode, str) or None
+        """
+        if (
+            self.executor is not None
+            and getattr(self._pending, "reservation", None) is None
+        ):
+            message = f"Command {self.name} rejected: the command queue is full."
+            self.logger.warning(message)
+            return (ResultCode.REJECTED, message)
+        return super()._rejection()
+
+    def _is_failure(self, result):
+        """
+        Treats a FAILED or REJECTED result as a failure, for the purpose
+        of recording statistics.
+
+        :param result: the result of the call
+        :type result: (ResultCode, str)
+
+        :return: whether the result represents a failure
+        :rtype: bool
+        """
+        return result[0] in (ResultCode.FAILED, ResultCode.REJECTED)
+
+    def _is_queued(self, result):
+        """
+        Treats a QUEUED result from a command that has an executor as a
+        queued call, which is recorded in the statistics by the worker
+        thread.
+
+        :param result: the result of the call
+        :type result: (ResultCode, str)
+
+        :return: whether the call was queued
+        :rtype: bool
+        """
+        return self.executor is not None and result[0] == ResultCode.QUEUED
+
+    def update_progress(self, progress):
+        """
+        Report the progress of this command. This may be called from
+        ``do()``. If the command is running on an executor, the progress
+        is reported to the executor; and if the command has a progress
+        tracker, a numeric progress is recorded in it, as a percentage.
+        Otherwise it has no effect.
+
+        :param progress: the progress of the command; for example, a
+            percentage
+        :type progress: int or str
+        """
+        if self.executor is not None:
+            self.executor.update_progress(progress)
+        if self.progress_tracker is not None and not isinstance(progress, str):
+            self.progress_tracker.update(progress)
+
     def _call_do(self, argin=None):
         """
         Helper method that ensures the ``do`` method is called with the
-        right arguments, and that the call is logged.
+        right arguments, and that the call is logged. If this command
+        has an executor, the call is submitted to it, rather than made
+        immediately.
+
+        :param argin: the argument passed to the Tango command, if
+            present
+        :type argin: ANY
+
+        :return: A tuple containing a return code and a string
+            message indicating status. The message is for
+            information purpose only; or, if the call was queued,
+            the ID of the queued command.
+        :rtype: (ResultCode, str)
+        """
+        if self.executor is None:
+            return self._call_do_now(argin)
+
+        reservation = getattr(self._pending, "reservation", None)
+        if reservation is None:
+            command_id = self.executor.submit(self.name, self._call_queued, argin)
+        else:
+            self._pending.reservation = None
+            command_id = self.executor.submit_reserved(
+                reservation, self.name, self._call_queued, argin
+            )
+        self.logger.info("Command %s queued with command ID %s.", self.name, command_id)
+        return (ResultCode.QUEUED, command_id)
+
+    def _call_queued(self, argin=None):
+        """
+        Helper method that runs a queued call on the executor's worker
+        thread, and records it in this command's statistics, if any.
+        The queued call is completed whether ``do()`` returns or raises,
+        so that a failed call does not leave the state model waiting for
+        completion; an exception is left to the executor to log and
+        report.
 
         :param argin: the argument passed to the Tango command, if
             present
@@ -355,15 +706,43 @@ class ResponseCommand(BaseCommand):
             information purpose only.
         :rtype: (ResultCode, str)
         """
-        if argin is None:
-            (return_code, message) = self.do()
+        start = time.perf_counter_ns()
+        try:
+            result = self._call_do_now(argin)
+        except BaseException:
+            self._record_call(start, failed=True)
+            raise
         else:
-            (return_code, message) = self.do(argin=argin)
+            self._record_call(start, failed=self._is_failure(result))
+            return result
+        finally:
+            self._queued_call_completed()
 
-        self.logger.log(
+    def _call_do_now(self, argin=None):
+        """
+        Helper method that calls the ``do`` method with the right
+        arguments in the current thread, and logs the call.
+
+        :param argin: the argument passed to the Tango command, if
+            present
+        :type argin: ANY
+
+        :return: A tuple containing a return code and a string
+            message indicating status. The message is for
+            information purpose only.
+        :rtype: (ResultCode, str)
+        """
+        traced = self.command_logging.entered(self.logger, self.name, argin)
+        (return_code, message) = self._do_tracked(argin)
+
+        self.command_logging.exited(
+            self.logger,
             self.RESULT_LOG_LEVEL.get(return_code, logging.ERROR),
-            f"Exiting command {self.name} with return_code "
-            f"{return_code!s}, message: '{message}'.",
+            traced,
+            "Exiting command %s with return_code %s, message: '%s'.",
+            self.name,
+            return_code,
+            message,
         )
         return (return_code, message)
 
@@ -404,12 +783,14 @@ class CompletionCommand(StateModelCommand):
         )
         self._completed_hook = f"{action_slug}_completed"
 
-    def __call__(self, argin=None):
+    def _invoke(self, argin=None):
         """
-        What to do when the command is called. This is implemented to
+        What to do when the command is invoked. This is implemented to
         check that the command is allowed to run, then run the command,
         then send an action to the state model advising whether the
-        command succeeded or failed.
+        command succeeded or failed. If the command is run on an
+        executor, the action is sent by the worker thread instead, once
+        the queued call has completed.
 
         :param argin: the argument passed to the Tango command, if
             present
@@ -417,10 +798,19 @@ class CompletionCommand(StateModelCommand):
 
         :return: The result of the call.
         """
-        result = super().__call__(argin)
-        self.completed()
+        result = super()._invoke(argin)
+        if self.executor is None:
+            self.completed()
         return result
 
+    def _queued_call_completed(self):
+        """
+        Hook called on the executor's worker thread when a queued call
+        to this command has completed. Sends the "completed" action to
+        the state model.
+        """
+        self.completed()
+
     def completed(self):
         """
         Callback for the completion of the command.
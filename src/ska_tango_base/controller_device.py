@@ -10,17 +10,22 @@
 Controller device
 """
 # PROTECTED REGION ID(SKAController.additionnal_import) ENABLED START #
+import json
+
+import numpy as np
+
 # Tango imports
-from tango import DebugIt
+from tango import DebugIt, Except, ErrSeverity
 from tango.server import run, attribute, command, device_property
 
 # SKA specific imports
 from ska_tango_base import SKABaseDevice
+from ska_tango_base.capability_ledger import CapabilityCounts, CapabilityLedger
 from ska_tango_base.commands import BaseCommand, ResultCode
+from ska_tango_base.faults import CapabilityValidationError
 from ska_tango_base.utils import (
     validate_capability_types,
     validate_input_sizes,
-    convert_dict_to_list,
 )
 
 
@@ -43,6 +48,12 @@ class SKAController(SKABaseDevice):
             "IsCapabilityAchievable",
             self.IsCapabilityAchievableCommand(self, self.op_state_model, self.logger),
         )
+        self.register_command_object(
+            "IsCapabilityAchievableBulk",
+            self.IsCapabilityAchievableBulkCommand(
+                self, self.op_state_model, self.logger
+            ),
+        )
 
     class InitCommand(SKABaseDevice.InitCommand):
         """
@@ -68,16 +79,9 @@ class SKAController(SKABaseDevice):
             device._element_alarm_device = ""
             device._element_tel_state_device = ""
             device._element_database_device = ""
-            device._max_capabilities = {}
-            if device.MaxCapabilities:
-                for max_capability in device.MaxCapabilities:
-                    capability_type, max_capability_instances = max_capability.split(
-                        ":"
-                    )
-                    device._max_capabilities[capability_type] = int(
-                        max_capability_instances
-                    )
-            device._available_capabilities = device._max_capabilities.copy()
+            device.capability_ledger = CapabilityLedger.from_strings(
+                device.MaxCapabilities
+            )
 
             message = "SKAController Init command completed OK"
             self.logger.info(message)
@@ -157,6 +161,64 @@ class SKAController(SKABaseDevice):
         pass
         # PROTECTED REGION END #    //  SKAController.delete_device
 
+    @property
+    def _max_capabilities(self):
+        """
+        Return the maximum number of instances of each capability type,
+        as a dictionary view of the capability ledger. Kept for
+        compatibility with subclasses that use it; new code should use
+        ``capability_ledger``.
+
+        :return: the maximum number of instances, keyed by capability
+            type
+        :rtype: :py:class:`~ska_tango_base.capability_ledger.CapabilityCounts`
+        """
+        return CapabilityCounts(self.capability_ledger, available=False)
+
+    @_max_capabilities.setter
+    def _max_capabilities(self, max_capabilities):
+        """
+        Set the maximum number of instances of each capability type, by
+        reconfiguring the capability ledger.
+
+        :param max_capabilities: the maximum number of instances, keyed
+            by capability type
+        :type max_capabilities: dict
+        """
+        if getattr(self, "capability_ledger", None) is None:
+            self.capability_ledger = CapabilityLedger(max_capabilities)
+        else:
+            self.capability_ledger.reconfigure(max_capabilities)
+
+    @property
+    def _available_capabilities(self):
+        """
+        Return the number of available instances of each capability
+        type, as a dictionary view of the capability ledger. Kept for
+        compatibility with subclasses that use it; new code should use
+        ``capability_ledger``.
+
+        :return: the number of available instances, keyed by
+            capability type
+        :rtype: :py:class:`~ska_tango_base.capability_ledger.CapabilityCounts`
+        """
+        return CapabilityCounts(self.capability_ledger, available=True)
+
+    @_available_capabilities.setter
+    def _available_capabilities(self, available_capabilities):
+        """
+        Set the number of available instances of each capability type
+        in the capability ledger.
+
+        :param available_capabilities: the number of available
+            instances, keyed by capability type
+        :type available_capabilities: dict
+
+        :raises CapabilityValidationError: if any capability type is not
+            in the ledger, or any number of instances is out of range
+        """
+        self.capability_ledger.set_available(available_capabilities)
+
     # ------------------
     # Attributes methods
     # ------------------
@@ -188,13 +250,13 @@ class SKAController(SKABaseDevice):
     def read_maxCapabilities(self):
         # PROTECTED REGION ID(SKAController.maxCapabilities_read) ENABLED START #
         """Reads maximum number of instances of each capability type"""
-        return convert_dict_to_list(self._max_capabilities)
+        return self.capability_ledger.max_capabilities
         # PROTECTED REGION END #    //  SKAController.maxCapabilities_read
 
     def read_availableCapabilities(self):
         # PROTECTED REGION ID(SKAController.availableCapabilities_read) ENABLED START #
         """Reads list of available number of instances of each capability type"""
-        return convert_dict_to_list(self._available_capabilities)
+        return self.capability_ledger.available_capabilities
         # PROTECTED REGION END #    //  SKAController.availableCapabilities_read
 
     # --------
@@ -217,19 +279,12 @@ class SKAController(SKABaseDevice):
             command_name = "isCapabilityAchievable"
             capabilities_instances, capability_types = argin
             validate_input_sizes(command_name, argin)
-            validate_capability_types(
-                command_name, capability_types, list(device._max_capabilities.keys())
-            )
-
-            for capability_type, capability_instances in zip(
-                capability_types, capabilities_instances
-            ):
-                if (
-                    not device._available_capabilities[capability_type]
-                    >= capability_instances
-                ):
-                    return False
-            return True
+            ledger = device.capability_ledger
+            if not ledger.has_types(capability_types):
+                validate_capability_types(
+                    command_name, capability_types, list(ledger.capability_types)
+                )
+            return ledger.is_achievable(capabilities_instances, capability_types)
 
     @command(
         dtype_in="DevVarLongStringArray",
@@ -259,6 +314,138 @@ class SKAController(SKABaseDevice):
         return command(argin)
         # PROTECTED REGION END #    //  SKAController.isCapabilityAchievable
 
+    class IsCapabilityAchievableBulkCommand(BaseCommand):
+        """
+        A class for the SKAController's IsCapabilityAchievableBulk()
+        and IsCapabilityAchievableBulkJson() commands.
+        """
+
+        def do(self, argin):
+            """
+            Stateless hook for device IsCapabilityAchievableBulk() and
+            IsCapabilityAchievableBulkJson() commands.
+
+            :param argin: the candidate allocations, either as a JSON
+                string, or as a pair of a flat, row-major matrix of
+                numbers of instances and a header of capability types,
+                one per column
+            :type argin: str or (list(int), list(str))
+
+            :return: Whether each candidate allocation is achievable
+            :rtype: list(bool)
+            """
+            device = self.target
+            command_name = "isCapabilityAchievableBulk"
+            if isinstance(argin, str):
+                command_name = "isCapabilityAchievableBulkJson"
+                try:
+                    args = json.loads(argin)
+                    candidates = args["candidates"]
+                    capability_types = args["capability_types"]
+                except (ValueError, KeyError, TypeError) as error:
+                    Except.throw_exception(
+                        "Command failed!",
+                        f"Invalid candidate allocations: {error}",
+                        command_name,
+                        ErrSeverity.ERR,
+                    )
+            else:
+                candidates, capability_types = argin
+                if not capability_types or len(candidates) % len(capability_types):
+                    Except.throw_exception(
+                        "Command failed!",
+                        "Argin value list size is not a multiple of header size.",
+                        command_name,
+                        ErrSeverity.ERR,
+                    )
+                candidates = np.reshape(candidates, (-1, len(capability_types)))
+
+            ledger = device.capability_ledger
+            if not ledger.has_types(capability_types):
+                validate_capability_types(
+                    command_name, capability_types, list(ledger.capability_types)
+                )
+            try:
+                return ledger.are_achievable(candidates, capability_types)
+            except (CapabilityValidationError, ValueError, TypeError) as error:
+                Except.throw_exception(
+                    "Command failed!",
+                    f"Invalid candidate allocations: {error}",
+                    command_name,
+                    ErrSeverity.ERR,
+                )
+
+    @command(
+        dtype_in="DevVarLongStringArray",
+        doc_in="[Flat matrix of nrInstances, one row per candidate][Capability types]",
+        dtype_out=("bool",),
+        doc_out="Whether each candidate allocation is achievable",
+    )
+    @DebugIt()
+    def isCapabilityAchievableBulk(self, argin):
+        # PROTECTED REGION ID(SKAController.isCapabilityAchievableBulk) ENABLED START #
+        """
+        Checks whether each of many candidate allocations of
+        capabilities can be achieved by the resource(s), in a single
+        call.
+
+        To modify behaviour for this command, modify the do() method of
+        the command class.
+
+        :param argin: An array consisting pair of
+
+            * [nrInstances]: DevLong. A row-major matrix of the number
+              of instances of each capability, with one row per
+              candidate allocation and one column per capability type.
+            * [Capability types]: DevString. The type of capability of
+              each column.
+
+        :type argin: :py:class:`tango.DevVarLongStringArray`.
+
+        :return: For each candidate, True if it can be achieved, False
+            if it cannot
+        :rtype: DevVarBooleanArray
+        """
+        command = self.get_command_object("IsCapabilityAchievableBulk")
+        return command(argin)
+        # PROTECTED REGION END #    //  SKAController.isCapabilityAchievableBulk
+
+    @command(
+        dtype_in="str",
+        doc_in=(
+            'JSON object: {"capability_types": [types], '
+            '"candidates": [[nrInstances], ...]}'
+        ),
+        dtype_out=("bool",),
+        doc_out="Whether each candidate allocation is achievable",
+    )
+    @DebugIt()
+    def isCapabilityAchievableBulkJson(self, argin):
+        # PROTECTED REGION ID(SKAController.isCapabilityAchievableBulkJson) ENABLED START #
+        """
+        Checks whether each of many candidate allocations of
+        capabilities can be achieved by the resource(s), in a single
+        call.
+
+        To modify behaviour for this command, modify the do() method of
+        the command class.
+
+        :param argin: A JSON object, with
+
+            * "capability_types": the type of capability of each column.
+            * "candidates": a list of candidate allocations, each a list
+              of the number of instances of each capability type.
+
+        :type argin: str
+
+        :return: For each candidate, True if it can be achieved, False
+            if it cannot
+        :rtype: DevVarBooleanArray
+        """
+        command = self.get_command_object("IsCapabilityAchievableBulk")
+        return command(argin)
+        # PROTECTED REGION END #    //  SKAController.isCapabilityAchievableBulkJson
+
 
 # ----------
 # Run server
@@ -12,9 +12,6 @@
 Controller device for SKA CSP Subelement.
 """
 # PROTECTED REGION ID(CspSubElementController.additionnal_import) ENABLED START #
-# Python standard library
-from collections import defaultdict
-
 # Tango imports
 import tango
 from tango import DebugIt, AttrWriteType
@@ -23,6 +20,7 @@ from tango.server import run, attribute, command, device_property
 # SKA specific imports
 
 from ska_tango_base import SKAController
+from ska_tango_base.command_progress import CommandProgress
 from ska_tango_base.commands import ResultCode, ResponseCommand, StateModelCommand
 from ska_tango_base.control_model import AdminMode
 from ska_tango_base.faults import CommandError
@@ -46,6 +44,10 @@ class CspSubElementController(SKAController):
         PowerDelayStandByOff
             - Delay in sec between  power-up stages in Standby-> Off transition.
             - Type:'DevFloat'
+
+        CommandProgressGranularity
+            - Change in percent of a command's progress that is pushed as an event.
+            - Type:'DevUShort'
     """
 
     # PROTECTED REGION ID(CspSubElementController.class_variable) ENABLED START #
@@ -59,6 +61,8 @@ class CspSubElementController(SKAController):
 
     PowerDelayStandbyOff = device_property(dtype="DevFloat", default_value=1.5)
 
+    CommandProgressGranularity = device_property(dtype="DevUShort", default_value=1)
+
     # ----------
     # Attributes
     # ----------
@@ -107,6 +111,13 @@ class CspSubElementController(SKAController):
     )
     """Device attribute."""
 
+    onTimeoutExpiredFlag = attribute(
+        dtype="DevBoolean",
+        label="onTimeoutExpiredFlag",
+        doc="Flag reporting On command timeout expiration.",
+    )
+    """Device attribute."""
+
     standbyProgress = attribute(
         dtype="DevUShort",
         label="standbyProgress",
@@ -133,6 +144,13 @@ class CspSubElementController(SKAController):
     )
     """Device attribute."""
 
+    standbyTimeoutExpiredFlag = attribute(
+        dtype="DevBoolean",
+        label="standbyTimeoutExpiredFlag",
+        doc="Flag reporting Standby command timeout expiration.",
+    )
+    """Device attribute."""
+
     offProgress = attribute(
         dtype="DevUShort",
         label="offProgress",
@@ -159,6 +177,13 @@ class CspSubElementController(SKAController):
     )
     """Device attribute."""
 
+    offTimeoutExpiredFlag = attribute(
+        dtype="DevBoolean",
+        label="offTimeoutExpiredFlag",
+        doc="Flag reporting Off command timeout expiration.",
+    )
+    """Device attribute."""
+
     totalOutputDataRateToSdp = attribute(
         dtype="DevFloat",
         label="totalOutputDataRateToSdp",
@@ -193,6 +218,13 @@ class CspSubElementController(SKAController):
     )
     """Device attribute."""
 
+    loadFirmwareTimeoutExpiredFlag = attribute(
+        dtype="DevBoolean",
+        label="loadFirmwareTimeoutExpiredFlag",
+        doc="Flag reporting LoadFirmware command timeout expiration.",
+    )
+    """Device attribute."""
+
     # ---------------
     # General methods
     # ---------------
@@ -219,6 +251,9 @@ class CspSubElementController(SKAController):
             "ReInitDevices", self.ReInitDevicesCommand(*device_args)
         )
 
+        for (command_name, progress_tracker) in self._command_progress.items():
+            self.get_command_object(command_name).progress_tracker = progress_tracker
+
     class InitCommand(SKAController.InitCommand):
         """
         A class for the CspSubElementController's init_device() "command".
@@ -237,23 +272,27 @@ class CspSubElementController(SKAController):
 
             device = self.target
 
-            # _cmd_progress: command execution's progress percentage
-            # implemented as a default dictionary:
-            # keys: the command name in lower case(on, off, standby,..)
-            # values: the progress percentage (default 0)
-            device._cmd_progress = defaultdict(int)
-
-            # _cmd_maximun_duration: command execution's expected maximum duration (msec.)
-            # implemented as a default dictionary:
-            # keys: the command name in lower case(on, off, standby,..)
-            # values: the expected maximum duration in sec.
-            device._cmd_maximum_duration = defaultdict(float)
-
-            # _cmd_measure_duration: command execution's measured duration (msec.)
-            # implemented as a default dictionary:
-            # keys: the command name in lower case(on, off, standby,..)
-            # values: the measured execution time (sec.)
-            device._cmd_measured_duration = defaultdict(float)
+            # _command_progress: the progress percentage, expected maximum
+            # duration (sec.), measured duration (sec.) and timeout expired
+            # flag of each command's execution, implemented as a dictionary:
+            # keys: the command name (On, Off, Standby,..)
+            # values: the CommandProgress that tracks the command
+            device._command_progress = {}
+            for (command_name, attribute_prefix) in [
+                ("On", "on"),
+                ("Standby", "standby"),
+                ("Off", "off"),
+                ("LoadFirmware", "loadFirmware"),
+            ]:
+                device._command_progress[command_name] = CommandProgress(
+                    attribute_prefix,
+                    publish=device._publish_command_progress,
+                    granularity=device.CommandProgressGranularity,
+                    logger=device.logger,
+                )
+                for suffix in ["Progress", "MeasuredDuration", "TimeoutExpiredFlag"]:
+                    device.set_change_event(f"{attribute_prefix}{suffix}", True, False)
+                    device.set_archive_event(f"{attribute_prefix}{suffix}", True, False)
 
             device._total_output_rate_to_sdp = 0.0
 
@@ -278,8 +317,30 @@ class CspSubElementController(SKAController):
         destructor and by the device Init command.
         """
         # PROTECTED REGION ID(CspSubElementController.delete_device) ENABLED START #
+        for progress_tracker in getattr(self, "_command_progress", {}).values():
+            progress_tracker.cancel()
         # PROTECTED REGION END #    //  CspSubElementController.delete_device
 
+    def _publish_command_progress(self, name, value):
+        """
+        Helper method for publishing a change to the progress, measured
+        duration or timeout expired flag of a command; passed to each
+        command's progress tracker.
+
+        A timeout expired flag is pushed directly, rather than through
+        the event publisher, so that a flag that is set and then soon
+        reset is not coalesced away.
+
+        :param name: name of the attribute
+        :type name: str
+        :param value: the new value of the attribute
+        """
+        if name.endswith("TimeoutExpiredFlag"):
+            self._push_change_event(name, value)
+            self._push_archive_event(name, value)
+        else:
+            self._publish_event(name, value)
+
     # ------------------
     # Attributes methods
     # ------------------
@@ -299,75 +360,93 @@ class CspSubElementController(SKAController):
     def read_onProgress(self):
         # PROTECTED REGION ID(CspSubElementController.onProgress_read) ENABLED START #
         """Return the onProgress attribute."""
-        return self._cmd_progress["on"]
+        return self._command_progress["On"].progress
         # PROTECTED REGION END #    //  CspSubElementController.onProgress_read
 
     def read_onMaximumDuration(self):
         # PROTECTED REGION ID(CspSubElementController.onMaximumDuration_read) ENABLED START #
         """Return the onMaximumDuration attribute."""
-        return self._cmd_maximum_duration["on"]
+        return self._command_progress["On"].maximum_duration
         # PROTECTED REGION END #    //  CspSubElementController.onMaximumDuration_read
 
     def write_onMaximumDuration(self, value):
         # PROTECTED REGION ID(CspSubElementController.onMaximumDuration_write) ENABLED START #
         """Set the onMaximumDuration attribute."""
-        self._cmd_maximum_duration["on"] = value
+        self._command_progress["On"].maximum_duration = value
         # PROTECTED REGION END #    //  CspSubElementController.onMaximumDuration_write
 
     def read_onMeasuredDuration(self):
         # PROTECTED REGION ID(CspSubElementController.onMeasuredDuration_read) ENABLED START #
         """Return the onMeasuredDuration attribute."""
-        return self._cmd_measured_duration["on"]
+        return self._command_progress["On"].measured_duration
         # PROTECTED REGION END #    //  CspSubElementController.onMeasuredDuration_read
 
+    def read_onTimeoutExpiredFlag(self):
+        # PROTECTED REGION ID(CspSubElementController.onTimeoutExpiredFlag_read) ENABLED START #
+        """Return the onTimeoutExpiredFlag attribute."""
+        return self._command_progress["On"].timeout_expired
+        # PROTECTED REGION END #    //  CspSubElementController.onTimeoutExpiredFlag_read
+
     def read_standbyProgress(self):
         # PROTECTED REGION ID(CspSubElementController.standbyProgress_read) ENABLED START #
         """Return the standbyProgress attribute."""
-        return self._cmd_progress["standby"]
+        return self._command_progress["Standby"].progress
         # PROTECTED REGION END #    //  CspSubElementController.standbyProgress_read
 
     def read_standbyMaximumDuration(self):
         # PROTECTED REGION ID(CspSubElementController.standbyMaximumDuration_read) ENABLED START #
         """Return the standbyMaximumDuration attribute."""
-        return self._cmd_maximum_duration["standby"]
+        return self._command_progress["Standby"].maximum_duration
         # PROTECTED REGION END #    //  CspSubElementController.standbyMaximumDuration_read
 
     def write_standbyMaximumDuration(self, value):
         # PROTECTED REGION ID(CspSubElementController.standbyMaximumDuration_write) ENABLED START #
         """Set the standbyMaximumDuration attribute."""
-        self._cmd_maximum_duration["standby"] = value
+        self._command_progress["Standby"].maximum_duration = value
         # PROTECTED REGION END #    //  CspSubElementController.standbyMaximumDuration_write
 
     def read_standbyMeasuredDuration(self):
         # PROTECTED REGION ID(CspSubElementController.standbyMeasuredDuration_read) ENABLED START #
         """Return the standbyMeasuredDuration attribute."""
-        return self._cmd_measured_duration["standby"]
+        return self._command_progress["Standby"].measured_duration
         # PROTECTED REGION END #    //  CspSubElementController.standbyMeasuredDuration_read
 
+    def read_standbyTimeoutExpiredFlag(self):
+        # PROTECTED REGION ID(CspSubElementController.standbyTimeoutExpiredFlag_read) ENABLED START #
+        """Return the standbyTimeoutExpiredFlag attribute."""
+        return self._command_progress["Standby"].timeout_expired
+        # PROTECTED REGION END #    //  CspSubElementController.standbyTimeoutExpiredFlag_read
+
     def read_offProgress(self):
         # PROTECTED REGION ID(CspSubElementController.offProgress_read) ENABLED START #
         """Return the offProgress attribute."""
-        return self._cmd_progress["off"]
+        return self._command_progress["Off"].progress
         # PROTECTED REGION END #    //  CspSubElementController.offProgress_read
 
     def read_offMaximumDuration(self):
         # PROTECTED REGION ID(CspSubElementController.offMaximumDuration_read) ENABLED START #
         """Return the offMaximumDuration attribute."""
-        return self._cmd_maximum_duration["off"]
+        return self._command_progress["Off"].maximum_duration
         # PROTECTED REGION END #    //  CspSubElementController.offMaximumDuration_read
 
     def write_offMaximumDuration(self, value):
         # PROTECTED REGION ID(CspSubElementController.offMaximumDuration_write) ENABLED START #
         """Set the offMaximumDuration attribute."""
-        self._cmd_maximum_duration["off"] = value
+        self._command_progress["Off"].maximum_duration = value
         # PROTECTED REGION END #    //  CspSubElementController.offMaximumDuration_write
 
     def read_offMeasuredDuration(self):
         # PROTECTED REGION ID(CspSubElementController.offMeasuredDuration_read) ENABLED START #
         """Return the offMeasuredDuration attribute."""
-        return self._cmd_measured_duration["off"]
+        return self._command_progress["Off"].measured_duration
         # PROTECTED REGION END #    //  CspSubElementController.offMeasuredDuration_read
 
+    def read_offTimeoutExpiredFlag(self):
+        # PROTECTED REGION ID(CspSubElementController.offTimeoutExpiredFlag_read) ENABLED START #
+        """Return the offTimeoutExpiredFlag attribute."""
+        return self._command_progress["Off"].timeout_expired
+        # PROTECTED REGION END #    //  CspSubElementController.offTimeoutExpiredFlag_read
+
     def read_totalOutputDataRateToSdp(self):
         # PROTECTED REGION ID(CspSubElementController.totalOutputDataRateToSdp_read) ENABLED START #
         """Return the totalOutputDataRateToSdp attribute."""
@@ -389,27 +468,33 @@ class CspSubElementController(SKAController):
     def read_loadFirmwareProgress(self):
         # PROTECTED REGION ID(CspSubElementController.loadFirmwareProgress_read) ENABLED START #
         """Return the loadFirmwareProgress attribute."""
-        return self._cmd_progress["loadfirmware"]
+        return self._command_progress["LoadFirmware"].progress
         # PROTECTED REGION END #    //  CspSubElementController.loadFirmwareProgress_read
 
     def read_loadFirmwareMaximumDuration(self):
         # PROTECTED REGION ID(CspSubElementController.loadFirmwareMaximumDuration_read) ENABLED START #
         """Return the loadFirmwareMaximumDuration attribute."""
-        return self._cmd_maximum_duration["loadfirmware"]
+        return self._command_progress["LoadFirmware"].maximum_duration
         # PROTECTED REGION END #    //  CspSubElementController.loadFirmwareMaximumDuration_read
 
     def write_loadFirmwareMaximumDuration(self, value):
         # PROTECTED REGION ID(CspSubElementController.loadFirmwareMaximumDuration_write) ENABLED START #
         """Set the loadFirmwareMaximumDuration attribute."""
-        self._cmd_maximum_duration["loadfirmware"] = value
+        self._command_progress["LoadFirmware"].maximum_duration = value
         # PROTECTED REGION END #    //  CspSubElementController.loadFirmwareMaximumDuration_write
 
     def read_loadFirmwareMeasuredDuration(self):
         # PROTECTED REGION ID(CspSubElementController.loadFirmwareMeasuredDuration_read) ENABLED START #
         """Return the loadFirmwareMeasuredDuration attribute."""
-        return self._cmd_measured_duration["loadfirmware"]
+        return self._command_progress["LoadFirmware"].measured_duration
         # PROTECTED REGION END #    //  CspSubElementController.loadFirmwareMeasuredDuration_read
 
+    def read_loadFirmwareTimeoutExpiredFlag(self):
+        # PROTECTED REGION ID(CspSubElementController.loadFirmwareTimeoutExpiredFlag_read) ENABLED START #
+        """Return the loadFirmwareTimeoutExpiredFlag attribute."""
+        return self._command_progress["LoadFirmware"].timeout_expired
+        # PROTECTED REGION END #    //  CspSubElementController.loadFirmwareTimeoutExpiredFlag_read
+
     # --------
     # Commands
     # --------
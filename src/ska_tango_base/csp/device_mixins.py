@@ -0,0 +1,296 @@
+"""
+This module provides mixins that implement behaviour shared by the CSP
+observing devices: the ``CspSubElementObsDevice`` and the
+``CspSubElementSubarray``.
+
+``ScanConfigurationMixin`` keeps the last scan configuration, in the
+process-wide scan configuration cache, and implements the commands that
+configure a scan with a configuration that the device server already
+holds: by its hash, or by the ID under which it was preloaded.
+
+``SdpLinksMixin`` holds the state of the device's links to SDP, and
+pushes events reporting the links and addresses that change.
+
+A device that uses a mixin lists it before its device base class, and
+calls the mixin's initialisation helper from its ``InitCommand``. The
+mixins provide the ``is_<command>_allowed`` methods and the bodies of
+the Tango commands, but each device declares the commands themselves:
+PyTango attaches a command's is-allowed wrapper to the first device
+class that it builds with the command, so a command object shared by
+two device classes would not be guarded in the second.
+"""
+import json
+
+from ska_tango_base.commands import ResultCode
+from ska_tango_base.scan_configuration_cache import (
+    PreloadedConfigurations,
+    scan_configuration_cache,
+)
+from ska_tango_base.sdp_links import SdpLinks
+
+__all__ = ["ScanConfigurationMixin", "SdpLinksMixin"]
+
+
+class ScanConfigurationMixin:
+    """
+    Mixin for a CSP device that keeps its last scan configuration, and
+    can be configured with a recent configuration by its hash, or with
+    a preloaded configuration by its ID.
+
+    The device must have a "ConfigureScan" command object,
+    ``lastScanConfiguration`` and ``lastScanConfigurationHash``
+    attributes, and a ``MaxPreloadedConfigurations`` property.
+    """
+
+    def _init_scan_configuration(self):
+        """
+        Helper method that initialises the last scan configuration and
+        the store of preloaded configurations, and configures events
+        for the hash of the last scan configuration; to be called from
+        the device's ``InitCommand``.
+        """
+        # JSON string, deliberately left in Tango layer
+        self._last_scan_configuration = ""
+        self._last_scan_configuration_hash = ""
+        self._preloaded_configurations = PreloadedConfigurations(
+            self.MaxPreloadedConfigurations
+        )
+        self.set_change_event("lastScanConfigurationHash", True, False)
+        self.set_archive_event("lastScanConfigurationHash", True, False)
+
+    def _set_last_scan_configuration(self, configuration, config_hash=None):
+        """
+        Helper method that sets the last scan configuration, and pushes
+        an event if its hash has changed.
+
+        The configuration is stored in the process-wide scan
+        configuration cache, so that a repeated configuration is held
+        once.
+
+        :param configuration: the scan configuration, or an empty string
+            to clear it
+        :type configuration: str
+        :param config_hash: the hash of the configuration, if already
+            known
+        :type config_hash: str
+        """
+        if config_hash is None and configuration:
+            (config_hash, configuration) = scan_configuration_cache.add(configuration)
+        elif config_hash is None:
+            config_hash = ""
+        self._last_scan_configuration = configuration
+
+        if config_hash != self._last_scan_configuration_hash:
+            self._last_scan_configuration_hash = config_hash
+            self._push_change_event("lastScanConfigurationHash", config_hash)
+            self._push_archive_event("lastScanConfigurationHash", config_hash)
+
+    def is_PreloadConfiguration_allowed(self):
+        """
+        Check if command `PreloadConfiguration` is allowed in the current device
+        state. It is allowed in the same states as ConfigureScan.
+
+        :return: ``True`` if the command is allowed
+        :rtype: boolean
+
+        :raises CommandError: if the command is not allowed
+        """
+        command = self.get_command_object("ConfigureScan")
+        return command.is_allowed(raise_if_disallowed=True)
+
+    def _preload_configuration(self, scan_configuration):
+        """
+        Helper method that implements the PreloadConfiguration command:
+        validate a scan configuration, and store it under its ID, to be
+        applied later by ConfigureScanByID.
+
+        :param scan_configuration: JSON formatted string with the scan
+            configuration
+        :type scan_configuration: str
+
+        :return: A tuple containing a return code and a string message
+            indicating status. The message is for information purpose
+            only.
+        :rtype: (ResultCode, str)
+        """
+        command = self.get_command_object("ConfigureScan")
+
+        (configuration, result_code, message) = command.validate_input(
+            scan_configuration
+        )
+        if result_code == ResultCode.OK:
+            config_id = configuration["id"]
+            (config_hash, scan_configuration) = scan_configuration_cache.add(
+                scan_configuration
+            )
+            self._preloaded_configurations.store(
+                config_id, config_hash, scan_configuration, configuration
+            )
+            message = f"Configuration {config_id} preloaded"
+
+        return (result_code, message)
+
+    def is_ConfigureScanByID_allowed(self):
+        """
+        Check if command `ConfigureScanByID` is allowed in the current device
+        state. It is allowed in the same states as ConfigureScan.
+
+        :return: ``True`` if the command is allowed
+        :rtype: boolean
+
+        :raises CommandError: if the command is not allowed
+        """
+        command = self.get_command_object("ConfigureScan")
+        return command.is_allowed(raise_if_disallowed=True)
+
+    def _configure_scan_by_id(self, config_id):
+        """
+        Helper method that implements the ConfigureScanByID command:
+        configure the scan with a configuration previously stored by
+        PreloadConfiguration, without decoding or validating it again.
+
+        :param config_id: the ID of the preloaded scan configuration
+        :type config_id: str
+
+        :return: A tuple containing a return code and a string message
+            indicating status. The message is for information purpose
+            only.
+        :rtype: (ResultCode, str)
+        """
+        preloaded = self._preloaded_configurations.get(config_id)
+        if preloaded is None:
+            message = f"No preloaded configuration with ID {config_id}"
+            self.logger.error(message)
+            return (ResultCode.FAILED, message)
+
+        (config_hash, scan_configuration, configuration) = preloaded
+        command = self.get_command_object("ConfigureScan")
+        (result_code, message) = command(configuration)
+        if result_code in (ResultCode.OK, ResultCode.STARTED, ResultCode.QUEUED):
+            # store the configuration once the command has accepted it
+            self._set_last_scan_configuration(scan_configuration, config_hash)
+
+        return (result_code, message)
+
+    def is_ConfigureScanByHash_allowed(self):
+        """
+        Check if command `ConfigureScanByHash` is allowed in the current
+        device state. It is allowed in the same states as ConfigureScan.
+
+        :return: ``True`` if the command is allowed
+        :rtype: boolean
+
+        :raises CommandError: if the command is not allowed
+        """
+        command = self.get_command_object("ConfigureScan")
+        return command.is_allowed(raise_if_disallowed=True)
+
+    def _configure_scan_by_hash(self, config_hash):
+        """
+        Helper method that implements the ConfigureScanByHash command:
+        configure the scan with a recent configuration, held in the
+        device server's scan configuration cache, without the client
+        sending it again.
+
+        :param config_hash: the hash of the scan configuration, as
+            reported by lastScanConfigurationHash
+        :type config_hash: str
+
+        :return: A tuple containing a return code and a string message
+            indicating status. The message is for information purpose
+            only.
+        :rtype: (ResultCode, str)
+        """
+        scan_configuration = scan_configuration_cache.get(config_hash)
+        if scan_configuration is None:
+            message = f"No cached configuration with hash {config_hash}"
+            self.logger.error(message)
+            return (ResultCode.FAILED, message)
+
+        command = self.get_command_object("ConfigureScan")
+        (configuration, result_code, message) = command.validate_input(
+            scan_configuration
+        )
+        if result_code == ResultCode.OK:
+            (result_code, message) = command(configuration)
+            if result_code in (ResultCode.OK, ResultCode.STARTED, ResultCode.QUEUED):
+                # store the configuration once the command has accepted it
+                self._set_last_scan_configuration(scan_configuration, config_hash)
+
+        return (result_code, message)
+
+
+class SdpLinksMixin:
+    """
+    Mixin for a CSP device that holds the activity and destination
+    addresses of its links to SDP.
+
+    The device must have a ``NumSdpLinks`` property, and
+    ``sdpLinkActiveDelta`` and ``sdpDestinationAddressesDelta``
+    attributes.
+    """
+
+    def _init_sdp_links(self):
+        """
+        Helper method that initialises the SDP links, with all links
+        inactive and no destination addresses, and configures events
+        for the attributes that report changes to them; to be called
+        from the device's ``InitCommand``.
+        """
+        self._sdp_links = SdpLinks(self.NumSdpLinks)
+        self._sdp_link_active_delta = json.dumps({"indices": [], "values": []})
+        self._sdp_destination_addresses_delta = json.dumps(
+            self._sdp_links.addresses_delta([])
+        )
+        for attribute_name in [
+            "sdpLinkActiveDelta",
+            "sdpDestinationAddressesDelta",
+        ]:
+            self.set_change_event(attribute_name, True, False)
+            self.set_archive_event(attribute_name, True, False)
+
+    def set_sdp_links_active(self, indices, values):
+        """
+        Set whether some SDP links are active, and push an event
+        reporting those that changed.
+
+        :param indices: the indices of the links
+        :type indices: sequence of int
+        :param values: whether each link is active, or a single value
+            for all of them
+        :type values: sequence of bool, or bool
+        """
+        changed = self._sdp_links.set_active(indices, values)
+        if len(changed):
+            delta = json.dumps(
+                {
+                    "indices": changed.tolist(),
+                    "values": self._sdp_links.active[changed].tolist(),
+                }
+            )
+            self._sdp_link_active_delta = delta
+            self._push_change_event("sdpLinkActiveDelta", delta)
+            self._push_archive_event("sdpLinkActiveDelta", delta)
+
+    def set_sdp_destination_addresses(self, addresses, indices=None):
+        """
+        Set some or all of the SDP destination addresses, and push an
+        event reporting those that changed.
+
+        :param addresses: the addresses, as a dictionary of
+            equal-length "outputHost", "outputMac" and "outputPort"
+            lists, or a JSON encoding of one
+        :type addresses: dict or str
+        :param indices: the indices of the addresses to update, or None
+            to replace all of them
+        :type indices: sequence of int
+        """
+        if indices is None:
+            changed = self._sdp_links.set_addresses(addresses)
+        else:
+            changed = self._sdp_links.update_addresses(indices, addresses)
+        if len(changed):
+            delta = json.dumps(self._sdp_links.addresses_delta(changed))
+            self._sdp_destination_addresses_delta = delta
+            self._push_change_event("sdpDestinationAddressesDelta", delta)
+            self._push_archive_event("sdpDestinationAddressesDelta", delta)
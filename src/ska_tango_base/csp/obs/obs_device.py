@@ -9,15 +9,13 @@ General observing device for SKA CSP Subelement.
 """
 
 # PROTECTED REGION ID(CspSubElementObsDevice.additionnal_import) ENABLED START #
-import json
-from json.decoder import JSONDecodeError
-
 # Tango imports
 from tango import DebugIt
 from tango.server import run, attribute, command, device_property
 
 # SKA specific imports
 from ska_tango_base import SKAObsDevice
+from ska_tango_base.argument_codec import JsonArgumentCodec, encoded_text
 from ska_tango_base.commands import (
     ResultCode,
     CompletionCommand,
@@ -25,13 +23,16 @@ from ska_tango_base.commands import (
     ResponseCommand,
 )
 from ska_tango_base.control_model import ObsState
+from ska_tango_base.csp.device_mixins import ScanConfigurationMixin, SdpLinksMixin
 from ska_tango_base.csp.obs import CspObsComponentManager, CspSubElementObsStateModel
+from ska_tango_base.faults import ArgumentValidationError
+from ska_tango_base.sdp_links import MAX_SDP_LINKS
 
 
 __all__ = ["CspSubElementObsDevice", "main"]
 
 
-class CspSubElementObsDevice(SKAObsDevice):
+class CspSubElementObsDevice(ScanConfigurationMixin, SdpLinksMixin, SKAObsDevice):
     """
     General observing device for SKA CSP Subelement.
 
@@ -41,6 +42,12 @@ class CspSubElementObsDevice(SKAObsDevice):
         DeviceID
             - Identification number of the observing device.
             - Type:'DevUShort'
+        MaxPreloadedConfigurations
+            - Maximum number of configurations held by PreloadConfiguration.
+            - Type:'DevUShort'
+        NumSdpLinks
+            - Number of links to SDP, up to 65536.
+            - Type:'DevULong'
     """
 
     # PROTECTED REGION ID(CspSubElementObsDevice.class_variable) ENABLED START #
@@ -52,6 +59,10 @@ class CspSubElementObsDevice(SKAObsDevice):
 
     DeviceID = device_property(dtype="DevUShort", default_value=1)
 
+    MaxPreloadedConfigurations = device_property(dtype="DevUShort", default_value=16)
+
+    NumSdpLinks = device_property(dtype="DevULong", default_value=1)
+
     # ----------
     # Attributes
     # ----------
@@ -84,6 +95,14 @@ class CspSubElementObsDevice(SKAObsDevice):
     )
     """Device attribute."""
 
+    lastScanConfigurationHash = attribute(
+        dtype="DevString",
+        label="lastScanConfigurationHash",
+        doc="The SHA-256 hash of the last valid scan configuration, or an empty "
+        "string if there is none.",
+    )
+    """Device attribute."""
+
     sdpDestinationAddresses = attribute(
         dtype="DevString",
         label="sdpDestinationAddresses",
@@ -94,6 +113,23 @@ class CspSubElementObsDevice(SKAObsDevice):
     )
     """Device attribute."""
 
+    sdpDestinationAddressesEncoded = attribute(
+        dtype="DevEncoded",
+        label="sdpDestinationAddressesEncoded",
+        doc="The sdpDestinationAddresses attribute, encoded as msgpack if available, "
+        "otherwise as JSON.",
+    )
+    """Device attribute."""
+
+    sdpDestinationAddressesDelta = attribute(
+        dtype="DevString",
+        label="sdpDestinationAddressesDelta",
+        doc="JSON formatted string reporting the number of SDP destination "
+        "addresses, and the indices and new values of the addresses that changed "
+        "most recently.",
+    )
+    """Device attribute."""
+
     sdpLinkCapacity = attribute(
         dtype="DevFloat",
         label="sdpLinkCapacity",
@@ -103,12 +139,21 @@ class CspSubElementObsDevice(SKAObsDevice):
 
     sdpLinkActive = attribute(
         dtype=("DevBoolean",),
-        max_dim_x=100,
+        max_dim_x=MAX_SDP_LINKS,
         label="sdpLinkActive",
         doc="Flag reporting if the SDP link is active.\nTrue: active\nFalse:down",
     )
     """Device attribute."""
 
+    sdpLinkActiveDelta = attribute(
+        dtype="DevString",
+        label="sdpLinkActiveDelta",
+        doc="JSON formatted string reporting the indices of the SDP links whose "
+        'activity changed most recently, and their new values; e.g. {"indices": '
+        '[3], "values": [true]}.',
+    )
+    """Device attribute."""
+
     healthFailureMessage = attribute(
         dtype="DevString",
         label="healthFailureMessage",
@@ -128,6 +173,7 @@ class CspSubElementObsDevice(SKAObsDevice):
         self.obs_state_model = CspSubElementObsStateModel(
             logger=self.logger,
             callback=self._update_obs_state,
+            table_machine=self.UseTableStateMachines,
         )
 
     def create_component_manager(self):
@@ -176,20 +222,12 @@ class CspSubElementObsDevice(SKAObsDevice):
             device = self.target
             device._obs_state = ObsState.IDLE
 
-            device._sdp_addresses = {
-                "outputHost": [],
-                "outputMac": [],
-                "outputPort": [],
-            }
             # a sub-element obsdevice can have more than one link to the SDP
             # (for ex. Mid.CBF FSP)
-            device._sdp_links_active = [
-                False,
-            ]
+            device._init_sdp_links()
             device._sdp_links_capacity = 0.0
 
-            # JSON string, deliberately left in Tango layer
-            device._last_scan_configuration = ""
+            device._init_scan_configuration()
             device._health_failure_msg = ""
 
             message = "CspSubElementObsDevice Init command completed OK"
@@ -239,12 +277,30 @@ class CspSubElementObsDevice(SKAObsDevice):
         return self._last_scan_configuration
         # PROTECTED REGION END #    //  CspSubElementObsDevice.lastScanConfiguration_read
 
+    def read_lastScanConfigurationHash(self):
+        # PROTECTED REGION ID(CspSubElementObsDevice.lastScanConfigurationHash_read) ENABLED START #
+        """Return the lastScanConfigurationHash attribute."""
+        return self._last_scan_configuration_hash
+        # PROTECTED REGION END #    //  CspSubElementObsDevice.lastScanConfigurationHash_read
+
     def read_sdpDestinationAddresses(self):
         # PROTECTED REGION ID(CspSubElementObsDevice.sdpDestinationAddresses_read) ENABLED START #
         """Return the sdpDestinationAddresses attribute."""
-        return json.dumps(self._sdp_addresses)
+        return self._sdp_links.addresses_json
         # PROTECTED REGION END #    //  CspSubElementObsDevice.sdpDestinationAddresses_read
 
+    def read_sdpDestinationAddressesEncoded(self):
+        # PROTECTED REGION ID(CspSubElementObsDevice.sdpDestinationAddressesEncoded_read) ENABLED START #
+        """Return the sdpDestinationAddressesEncoded attribute."""
+        return self._sdp_links.addresses_encoded
+        # PROTECTED REGION END #    //  CspSubElementObsDevice.sdpDestinationAddressesEncoded_read
+
+    def read_sdpDestinationAddressesDelta(self):
+        # PROTECTED REGION ID(CspSubElementObsDevice.sdpDestinationAddressesDelta_read) ENABLED START #
+        """Return the sdpDestinationAddressesDelta attribute."""
+        return self._sdp_destination_addresses_delta
+        # PROTECTED REGION END #    //  CspSubElementObsDevice.sdpDestinationAddressesDelta_read
+
     def read_sdpLinkCapacity(self):
         # PROTECTED REGION ID(CspSubElementObsDevice.sdpLinkCapacity_read) ENABLED START #
         """Return the sdpLinkCapacity attribute."""
@@ -254,9 +310,15 @@ class CspSubElementObsDevice(SKAObsDevice):
     def read_sdpLinkActive(self):
         # PROTECTED REGION ID(CspSubElementObsDevice.sdpLinkActive_read) ENABLED START #
         """Return the sdpLinkActive attribute."""
-        return self._sdp_links_active
+        return self._sdp_links.active
         # PROTECTED REGION END #    //  CspSubElementObsDevice.sdpLinkActive_read
 
+    def read_sdpLinkActiveDelta(self):
+        # PROTECTED REGION ID(CspSubElementObsDevice.sdpLinkActiveDelta_read) ENABLED START #
+        """Return the sdpLinkActiveDelta attribute."""
+        return self._sdp_link_active_delta
+        # PROTECTED REGION END #    //  CspSubElementObsDevice.sdpLinkActiveDelta_read
+
     def read_healthFailureMessage(self):
         # PROTECTED REGION ID(CspSubElementObsDevice.healthFailureMessage_read) ENABLED START #
         """Return the healthFailureMessage attribute."""
@@ -272,6 +334,12 @@ class CspSubElementObsDevice(SKAObsDevice):
         A class for the CspSubElementObsDevices's ConfigureScan command.
         """
 
+        argument_codec = JsonArgumentCodec(dict, required_keys=["id"])
+        """
+        The codec that decodes and validates the JSON-encoded scan
+        configuration.
+        """
+
         def __init__(self, target, op_state_model, obs_state_model, logger=None):
             """
             Constructor for ConfigureScanCommand
@@ -321,14 +389,33 @@ class CspSubElementObsDevice(SKAObsDevice):
             :rtype: (ResultCode, str)
             """
             try:
-                configuration_dict = json.loads(argin)
-                _ = configuration_dict["id"]
-            except (KeyError, JSONDecodeError) as err:
+                configuration_dict = self.argument_codec.decode(argin)
+            except ArgumentValidationError as err:
                 msg = f"Validate configuration failed with error:{err}"
                 self.logger.error(msg)
                 return (None, ResultCode.FAILED, msg)
-            except Exception as other_errs:
-                msg = f"Validate configuration failed with unknown error: {other_errs}"
+
+            return (
+                configuration_dict,
+                ResultCode.OK,
+                "ConfigureScan arguments validation successful",
+            )
+
+        def validate_encoded_input(self, argin):
+            """
+            Validate a DevEncoded configuration, as for validate_input.
+
+            :param argin: The encoding name, and the encoded configuration.
+            :type argin: (str, bytes)
+            :return: A tuple containing the decoded configuration, a
+                return code and a string message.
+            :rtype: (dict, ResultCode, str)
+            """
+            try:
+                configuration_dict = self.argument_codec.decode_encoded(argin)
+            except ArgumentValidationError as err:
+                msg = f"Validate configuration failed with error:{err}"
+                self.logger.error(msg)
                 return (None, ResultCode.FAILED, msg)
 
             return (
@@ -588,12 +675,127 @@ class CspSubElementObsDevice(SKAObsDevice):
         (configuration, result_code, message) = command.validate_input(argin)
         if result_code == ResultCode.OK:
             # store the configuration on command success
-            self._last_scan_configuration = argin
+            self._set_last_scan_configuration(argin)
             (result_code, message) = command(configuration)
 
         return [[result_code], [message]]
         # PROTECTED REGION END #    //  CspSubElementObsDevice.ConfigureScan
 
+    @command(
+        dtype_in="DevString",
+        doc_in="JSON formatted string with the scan configuration.",
+        dtype_out="DevVarLongStringArray",
+        doc_out="A tuple containing a return code and a string message indicating status. "
+        "The message is for information purpose only.",
+    )
+    @DebugIt()
+    def PreloadConfiguration(self, argin):
+        # PROTECTED REGION ID(CspSubElementObsDevice.PreloadConfiguration) ENABLED START #
+        """
+        Validate a scan configuration, and store it under its ID, to be
+        applied later by ConfigureScanByID.
+
+        :param argin: JSON formatted string with the scan configuration.
+        :type argin: 'DevString'
+
+        :return: A tuple containing a return code and a string message indicating status.
+            The message is for information purpose only.
+        :rtype: (ResultCode, str)
+        """
+        (result_code, message) = self._preload_configuration(argin)
+        return [[result_code], [message]]
+        # PROTECTED REGION END #    //  CspSubElementObsDevice.PreloadConfiguration
+
+    @command(
+        dtype_in="DevString",
+        doc_in="The ID of a preloaded scan configuration.",
+        dtype_out="DevVarLongStringArray",
+        doc_out="A tuple containing a return code and a string message indicating status. "
+        "The message is for information purpose only.",
+    )
+    @DebugIt()
+    def ConfigureScanByID(self, argin):
+        # PROTECTED REGION ID(CspSubElementObsDevice.ConfigureScanByID) ENABLED START #
+        """
+        Configure the scan with a configuration previously stored by
+        PreloadConfiguration, without decoding or validating it again.
+
+        :param argin: the ID of the preloaded scan configuration.
+        :type argin: 'DevString'
+
+        :return: A tuple containing a return code and a string message indicating status.
+            The message is for information purpose only.
+        :rtype: (ResultCode, str)
+        """
+        (result_code, message) = self._configure_scan_by_id(argin)
+        return [[result_code], [message]]
+        # PROTECTED REGION END #    //  CspSubElementObsDevice.ConfigureScanByID
+
+    @command(
+        dtype_in="DevString",
+        doc_in="The hash of a recent scan configuration, as reported by "
+        "lastScanConfigurationHash.",
+        dtype_out="DevVarLongStringArray",
+        doc_out="A tuple containing a return code and a string message indicating status. "
+        "The message is for information purpose only.",
+    )
+    @DebugIt()
+    def ConfigureScanByHash(self, argin):
+        # PROTECTED REGION ID(CspSubElementObsDevice.ConfigureScanByHash) ENABLED START #
+        """
+        Configure the scan with a recent configuration, held in the
+        device server's scan configuration cache, without the client
+        sending it again.
+
+        :param argin: the hash of the scan configuration, as reported
+            by lastScanConfigurationHash.
+        :type argin: 'DevString'
+
+        :return: A tuple containing a return code and a string message indicating status.
+            The message is for information purpose only.
+        :rtype: (ResultCode, str)
+        """
+        (result_code, message) = self._configure_scan_by_hash(argin)
+        return [[result_code], [message]]
+        # PROTECTED REGION END #    //  CspSubElementObsDevice.ConfigureScanByHash
+
+    @command(
+        dtype_in="DevEncoded",
+        doc_in="Encoding name, 'json' or 'msgpack', and encoded scan configuration.",
+        dtype_out="DevVarLongStringArray",
+        doc_out="A tuple containing a return code and a string message indicating status. "
+        "The message is for information purpose only.",
+    )
+    @DebugIt()
+    def ConfigureScanEncoded(self, argin):
+        # PROTECTED REGION ID(CspSubElementObsDevice.ConfigureScanEncoded) ENABLED START #
+        """
+        Configure the scan from a DevEncoded configuration; otherwise the
+        same as ConfigureScan.
+
+        The lastScanConfiguration attribute reports the configuration
+        as JSON, whatever its encoding. A JSON-encoded configuration is
+        reported exactly as sent, so it has the same hash as the same
+        configuration sent to ConfigureScan.
+
+        :param argin: the encoding name, and the encoded scan configuration.
+        :type argin: (str, bytes)
+
+        :return: A tuple containing a return code and a string message indicating status.
+            The message is for information purpose only.
+        :rtype: (ResultCode, str)
+        """
+        command = self.get_command_object("ConfigureScan")
+
+        (configuration, result_code, message) = command.validate_encoded_input(argin)
+        if result_code == ResultCode.OK:
+            # store the configuration on command success
+            self._set_last_scan_configuration(encoded_text(argin, configuration))
+            (result_code, message) = command(configuration)
+
+        return [[result_code], [message]]
+        # PROTECTED REGION END #    //  CspSubElementObsDevice.ConfigureScanEncoded
+
     @command(
         dtype_in="DevString",
         doc_in="A string with the scan ID",
@@ -654,7 +856,7 @@ class CspSubElementObsDevice(SKAObsDevice):
             The message is for information purpose only.
         :rtype: (ResultCode, str)
         """
-        self._last_scan_configuration = ""
+        self._set_last_scan_configuration("")
 
         command = self.get_command_object("GoToIdle")
         (return_code, message) = command()
@@ -14,88 +14,16 @@ from transitions.extensions import LockedMachine as Machine
 
 from ska_tango_base.control_model import ObsState
 from ska_tango_base.obs import ObsStateModel
+from ska_tango_base.table_machine import TableMachine
 
 __all__ = ["CspSubElementObsStateModel"]
 
 
-class _CspSubElementObsStateMachine(Machine):
+class _CspSubElementObsStateMachineMixin:
     """
-    The observation state machine used by a generic CSP sub-element
-    ObsDevice (derived from SKAObsDevice).
-
-    Compared to the SKA Observation State Machine, it implements a
-    smaller number of states, number that can be further decreased
-    depending on the necessities of the different sub-elements.
-
-    The implemented states are:
-
-    * **IDLE**: the device is unconfigured.
-
-    * **CONFIGURING_IDLE**: the device in unconfigured, but
-      configuration is in progress.
-
-    * **CONFIGURING_READY**: the device in configured, and configuration
-      is in progress.
-
-    * **READY**: the device is configured and is ready to perform
-      observations
-
-    * **SCANNING**: the device is performing the observation.
-
-    * **ABORTING**: the device is processing an abort.
-
-      TODO: Need to understand if this state is really required by the
-      observing devices of any CSP sub-element.
-
-    * **ABORTED**: the device has completed the abort request.
-
-    * **FAULT**: the device component has experienced an error from
-      which it can be recovered only via manual intervention invoking a
-      reset command that force the device to the base state (IDLE).
-
-    The actions supported divide into command-oriented actions and
-    component monitoring actions.
-
-    The command-oriented actions are:
-
-    * **configure_invoked** and **configure_completed**: bookending the
-      Configure() command, and hence the CONFIGURING state
-    * **abort_invoked** and **abort_completed**: bookending the Abort()
-      command, and hence the ABORTING state
-    * **obsreset_invoked** and **obsreset_completed**: bookending the
-      ObsReset() command, and hence the OBSRESETTING state
-    * **end_invoked**, **scan_invoked**, **end_scan_invoked**: these
-      result in reflexive transitions, and are purely there to indicate
-      states in which the End(), Scan() and EndScan() commands are
-      permitted to be run
-
-    The component-oriented actions are:
-
-    * **component_obsfault**: the monitored component has experienced an
-      observation fault
-    * **component_unconfigured**: the monitored component has become
-      unconfigured
-    * **component_configured**: the monitored component has become
-      configured
-    * **component_scanning**: the monitored component has started
-      scanning
-    * **component_not_scanning**: the monitored component has stopped
-      scanning
-
-    A diagram of the state machine is shown below. Reflexive transitions
-    and transitions to FAULT obs state are omitted to simplify the
-    diagram.
-
-    .. uml:: csp_subelement_obs_state_machine.uml
-       :caption: Diagram of the CSP subelement obs state machine
-
-    The following is a diagram of the state machine, automatically
-    generated from the code. Its equivalence to the diagram above
-    demonstrates that the implementation is faithful to the design.
-
-    .. figure:: _CspSubElementObsStateMachine_autogenerated.png
-      :alt: Diagram of the CSP subelement obs state machine, as implemented
-
+    Mixin that defines the states and transitions of the CSP sub-element
+    observation state machine, independently of the engine that
+    implements it.
     """
 
     def __init__(self, callback=None, **extra_kwargs):
@@ -255,6 +183,99 @@ class _CspSubElementObsStateMachine(Machine):
             self._callback(self.state)
 
 
+class _CspSubElementObsStateMachine(_CspSubElementObsStateMachineMixin, Machine):
+    """
+    The observation state machine used by a generic CSP sub-element
+    ObsDevice (derived from SKAObsDevice).
+
+    Compared to the SKA Observation State Machine, it implements a
+    smaller number of states, number that can be further decreased
+    depending on the necessities of the different sub-elements.
+
+    The implemented states are:
+
+    * **IDLE**: the device is unconfigured.
+
+    * **CONFIGURING_IDLE**: the device in unconfigured, but
+      configuration is in progress.
+
+    * **CONFIGURING_READY**: the device in configured, and configuration
+      is in progress.
+
+    * **READY**: the device is configured and is ready to perform
+      observations
+
+    * **SCANNING**: the device is performing the observation.
+
+    * **ABORTING**: the device is processing an abort.
+
+      TODO: Need to understand if this state is really required by the
+      observing devices of any CSP sub-element.
+
+    * **ABORTED**: the device has completed the abort request.
+
+    * **FAULT**: the device component has experienced an error from
+      which it can be recovered only via manual intervention invoking a
+      reset command that force the device to the base state (IDLE).
+
+    The actions supported divide into command-oriented actions and
+    component monitoring actions.
+
+    The command-oriented actions are:
+
+    * **configure_invoked** and **configure_completed**: bookending the
+      Configure() command, and hence the CONFIGURING state
+    * **abort_invoked** and **abort_completed**: bookending the Abort()
+      command, and hence the ABORTING state
+    * **obsreset_invoked** and **obsreset_completed**: bookending the
+      ObsReset() command, and hence the OBSRESETTING state
+    * **end_invoked**, **scan_invoked**, **end_scan_invoked**: these
+      result in reflexive transitions, and are purely there to indicate
+      states in which the End(), Scan() and EndScan() commands are
+      permitted to be run
+
+    The component-oriented actions are:
+
+    * **component_obsfault**: the monitored component has experienced an
+      observation fault
+    * **component_unconfigured**: the monitored component has become
+      unconfigured
+    * **component_configured**: the monitored component has become
+      configured
+    * **component_scanning**: the monitored component has started
+      scanning
+    * **component_not_scanning**: the monitored component has stopped
+      scanning
+
+    A diagram of the state machine is shown below. Reflexive transitions
+    and transitions to FAULT obs state are omitted to simplify the
+    diagram.
+
+    .. uml:: csp_subelement_obs_state_machine.uml
+       :caption: Diagram of the CSP subelement obs state machine
+
+    The following is a diagram of the state machine, automatically
+    generated from the code. Its equivalence to the diagram above
+    demonstrates that the implementation is faithful to the design.
+
+    .. figure:: _CspSubElementObsStateMachine_autogenerated.png
+      :alt: Diagram of the CSP subelement obs state machine, as implemented
+
+    """
+
+
+class _CspSubElementObsStateTableMachine(
+    _CspSubElementObsStateMachineMixin, TableMachine
+):
+    """
+    The CSP sub-element observation state machine, implemented by the
+    compact, table-driven
+    :py:class:`~ska_tango_base.table_machine.TableMachine` engine rather
+    than by ``transitions``. See
+    :py:class:`._CspSubElementObsStateMachine`.
+    """
+
+
 class CspSubElementObsStateModel(ObsStateModel):
     """
     Implements the observation state model for a generic CSP sub-element
@@ -303,7 +324,7 @@ class CspSubElementObsStateModel(ObsStateModel):
        :caption: Diagram of the observation state model
     """
 
-    def __init__(self, logger, callback=None):
+    def __init__(self, logger, callback=None, table_machine=False):
         """
         Initialise the model.
 
@@ -313,8 +334,19 @@ class CspSubElementObsStateModel(ObsStateModel):
         :param callback: A callback to be called when a transition
             causes a change to device obs_state
         :type callback: callable
+        :param table_machine: whether to use the compact, table-driven
+            :py:class:`~ska_tango_base.table_machine.TableMachine`
+            engine for the underlying state machine, rather than
+            ``transitions``
+        :type table_machine: bool
         """
-        super().__init__(_CspSubElementObsStateMachine, logger, callback=callback)
+        super().__init__(
+            _CspSubElementObsStateTableMachine
+            if table_machine
+            else _CspSubElementObsStateMachine,
+            logger,
+            callback=callback,
+        )
 
     _obs_state_mapping = {
         "IDLE": ObsState.IDLE,
@@ -341,5 +373,4 @@ class CspSubElementObsStateModel(ObsStateModel):
         obs_state = self._obs_state_mapping[machine_state]
         if self._obs_state != obs_state:
             self._obs_state = obs_state
-            if self._callback is not None:
-                self._callback(obs_state)
+            self._call_callback(obs_state)
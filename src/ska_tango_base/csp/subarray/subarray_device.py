@@ -13,24 +13,28 @@ Subarray device for SKA CSP SubElement
 
 # PROTECTED REGION ID(CspSubElementSubarray.additionnal_import) ENABLED START #
 import json
-from json.decoder import JSONDecodeError
 from collections import defaultdict
 
 # Tango imports
 from tango import DebugIt
 from tango.server import run
-from tango.server import attribute, command
+from tango.server import attribute, command, device_property
 from tango import AttrWriteType
 
 # SKA import
 from ska_tango_base import SKASubarray
+from ska_tango_base.argument_codec import JsonArgumentCodec, encoded_text
+from ska_tango_base.command_progress import CommandProgress
 from ska_tango_base.commands import (
     CompletionCommand,
     ObservationCommand,
     ResponseCommand,
     ResultCode,
 )
+from ska_tango_base.csp.device_mixins import ScanConfigurationMixin, SdpLinksMixin
 from ska_tango_base.csp.subarray import CspSubarrayComponentManager
+from ska_tango_base.faults import ArgumentValidationError
+from ska_tango_base.sdp_links import MAX_SDP_LINKS
 
 # Additional import
 # PROTECTED REGION END #    //  CspSubElementSubarray.additionnal_import
@@ -38,7 +42,7 @@ from ska_tango_base.csp.subarray import CspSubarrayComponentManager
 __all__ = ["CspSubElementSubarray", "main"]
 
 
-class CspSubElementSubarray(SKASubarray):
+class CspSubElementSubarray(ScanConfigurationMixin, SdpLinksMixin, SKASubarray):
     """
     Subarray device for SKA CSP SubElement
     """
@@ -50,6 +54,12 @@ class CspSubElementSubarray(SKASubarray):
     # Device Properties
     # -----------------
 
+    MaxPreloadedConfigurations = device_property(dtype="DevUShort", default_value=16)
+
+    NumSdpLinks = device_property(dtype="DevULong", default_value=1)
+
+    CommandProgressGranularity = device_property(dtype="DevUShort", default_value=1)
+
     # ----------
     # Attributes
     # ----------
@@ -78,6 +88,23 @@ class CspSubElementSubarray(SKASubarray):
     )
     """Device attribute."""
 
+    sdpDestinationAddressesEncoded = attribute(
+        dtype="DevEncoded",
+        label="sdpDestinationAddressesEncoded",
+        doc="The sdpDestinationAddresses attribute, encoded as msgpack if available, "
+        "otherwise as JSON.",
+    )
+    """Device attribute."""
+
+    sdpDestinationAddressesDelta = attribute(
+        dtype="DevString",
+        label="sdpDestinationAddressesDelta",
+        doc="JSON formatted string reporting the number of SDP destination "
+        "addresses, and the indices and new values of the addresses that changed "
+        "most recently.",
+    )
+    """Device attribute."""
+
     outputDataRateToSdp = attribute(
         dtype="DevFloat",
         label="outputDataRateToSdp",
@@ -93,14 +120,31 @@ class CspSubElementSubarray(SKASubarray):
     )
     """Device attribute."""
 
+    lastScanConfigurationHash = attribute(
+        dtype="DevString",
+        label="lastScanConfigurationHash",
+        doc="The SHA-256 hash of the last valid scan configuration, or an empty "
+        "string if there is none.",
+    )
+    """Device attribute."""
+
     sdpLinkActive = attribute(
         dtype=("DevBoolean",),
-        max_dim_x=100,
+        max_dim_x=MAX_SDP_LINKS,
         label="sdpLinkActive",
         doc="Flag reporting if the SDP links are active.",
     )
     """Device attribute."""
 
+    sdpLinkActiveDelta = attribute(
+        dtype="DevString",
+        label="sdpLinkActiveDelta",
+        doc="JSON formatted string reporting the indices of the SDP links whose "
+        'activity changed most recently, and their new values; e.g. {"indices": '
+        '[3], "values": [true]}.',
+    )
+    """Device attribute."""
+
     listOfDevicesCompletedTasks = attribute(
         dtype="DevString",
         label="listOfDevicesCompletedTasks",
@@ -110,6 +154,15 @@ class CspSubElementSubarray(SKASubarray):
     )
     """Device attribute."""
 
+    configureScanMaximumDuration = attribute(
+        dtype="DevFloat",
+        access=AttrWriteType.READ_WRITE,
+        label="configureScanMaximumDuration",
+        unit="sec",
+        doc="The maximum expected command duration.",
+    )
+    """Device attribute."""
+
     configureScanMeasuredDuration = attribute(
         dtype="DevFloat",
         label="configureScanMeasuredDuration",
@@ -118,6 +171,15 @@ class CspSubElementSubarray(SKASubarray):
     )
     """Device attribute."""
 
+    configureScanProgress = attribute(
+        dtype="DevUShort",
+        label="configureScanProgress",
+        max_value=100,
+        min_value=0,
+        doc="The percentage progress of the command in the [0,100].",
+    )
+    """Device attribute."""
+
     configureScanTimeoutExpiredFlag = attribute(
         dtype="DevBoolean",
         label="configureScanTimeoutExpiredFlag",
@@ -215,6 +277,9 @@ class CspSubElementSubarray(SKASubarray):
         )
         self.register_command_object("GoToIdle", self.GoToIdleCommand(*device_args))
 
+        for (command_name, progress_tracker) in self._command_progress.items():
+            self.get_command_object(command_name).progress_tracker = progress_tracker
+
     class InitCommand(SKASubarray.InitCommand):
         """
         A class for the CspSubElementObsDevice's init_device() "command".
@@ -234,20 +299,12 @@ class CspSubElementSubarray(SKASubarray):
             device = self.target
             device._scan_id = 0
 
-            device._sdp_addresses = {
-                "outputHost": [],
-                "outputMac": [],
-                "outputPort": [],
-            }
-            device._sdp_links_active = [
-                False,
-            ]
+            device._init_sdp_links()
             device._sdp_output_data_rate = 0.0
 
             device._config_id = ""
 
-            # JSON string, deliberately left in Tango layer
-            device._last_scan_configuration = ""
+            device._init_scan_configuration()
 
             # _list_of_devices_completed_task: for each task/command reports
             # the list of the devices that successfully completed the task.
@@ -256,36 +313,27 @@ class CspSubElementSubarray(SKASubarray):
             # values: the list of devices' FQDN
             device._list_of_devices_completed_task = defaultdict(list)
 
-            # _cmd_progress: command execution's progress percentage
-            # implemented as a default dictionary:
-            # keys: the command name in lower case(configurescan,..)
-            # values: the progress percentage (default 0)
-            device._cmd_progress = defaultdict(int)
-
-            # _cmd_maximun_duration: command execution's expected maximum duration (sec.)
-            # implemented as a default dictionary:
-            # keys: the command name in lower case(configurescan, assignresources,..)
-            # values: the expected maximum duration in sec.
-            device._cmd_maximum_duration = defaultdict(float)
-
-            # _cmd_measure_duration: command execution's measured duration (sec.)
-            # implemented as a default dictionary:
-            # keys: the command name in lower case(configurescan, assignresources,..)
-            # values: the measured execution time (sec.)
-            device._cmd_measured_duration = defaultdict(float)
-
-            # _timeout_expired: boolean flag to signal timeout during command execution.
-            # To check and reset before a command execution.
-            # keys: the command name in lower case(configurescan, assignresources,..)
-            # values: True/False
-            device._timeout_expired = defaultdict(bool)
-            # configure the flags to push event from the device server
-            device.set_change_event("configureScanTimeoutExpiredFlag", True, True)
-            device.set_archive_event("configureScanTimeoutExpiredFlag", True, True)
-            device.set_change_event("assignResourcesTimeoutExpiredFlag", True, True)
-            device.set_archive_event("assignResourcesTimeoutExpiredFlag", True, True)
-            device.set_change_event("releaseResourcesTimeoutExpiredFlag", True, True)
-            device.set_archive_event("releaseResourcesTimeoutExpiredFlag", True, True)
+            # _command_progress: the progress percentage, expected maximum
+            # duration (sec.), measured duration (sec.) and timeout expired
+            # flag of each command's execution, implemented as a dictionary:
+            # keys: the command name (ConfigureScan, AssignResources,..)
+            # values: the CommandProgress that tracks the command
+            device._command_progress = {}
+            for (command_name, attribute_prefix) in [
+                ("ConfigureScan", "configureScan"),
+                ("AssignResources", "assignResources"),
+                ("ReleaseResources", "releaseResources"),
+            ]:
+                device._command_progress[command_name] = CommandProgress(
+                    attribute_prefix,
+                    publish=device._publish_command_progress,
+                    granularity=device.CommandProgressGranularity,
+                    logger=device.logger,
+                )
+                # configure the attributes to push event from the device server
+                for suffix in ["Progress", "MeasuredDuration", "TimeoutExpiredFlag"]:
+                    device.set_change_event(f"{attribute_prefix}{suffix}", True, False)
+                    device.set_archive_event(f"{attribute_prefix}{suffix}", True, False)
 
             message = "CspSubElementSubarray Init command completed OK"
             device.logger.info(message)
@@ -304,8 +352,31 @@ class CspSubElementSubarray(SKASubarray):
         destructor and by the device Init command.
         """
         # PROTECTED REGION ID(CspSubElementSubarray.delete_device) ENABLED START #
+        for progress_tracker in getattr(self, "_command_progress", {}).values():
+            progress_tracker.cancel()
+        super().delete_device()
         # PROTECTED REGION END #    //  CspSubElementSubarray.delete_device
 
+    def _publish_command_progress(self, name, value):
+        """
+        Helper method for publishing a change to the progress, measured
+        duration or timeout expired flag of a command; passed to each
+        command's progress tracker.
+
+        A timeout expired flag is pushed directly, rather than through
+        the event publisher, so that a flag that is set and then soon
+        reset is not coalesced away.
+
+        :param name: name of the attribute
+        :type name: str
+        :param value: the new value of the attribute
+        """
+        if name.endswith("TimeoutExpiredFlag"):
+            self._push_change_event(name, value)
+            self._push_archive_event(name, value)
+        else:
+            self._publish_event(name, value)
+
     # ------------------
     # Attributes methods
     # ------------------
@@ -325,13 +396,25 @@ class CspSubElementSubarray(SKASubarray):
     def read_sdpDestinationAddresses(self):
         # PROTECTED REGION ID(CspSubElementSubarray.sdpDestinationAddresses_read) ENABLED START #
         """Return the sdpDestinationAddresses attribute."""
-        return self._sdp_addresses
+        return self._sdp_links.addresses_json
         # PROTECTED REGION END #    //  CspSubElementSubarray.sdpDestinationAddresses_read
 
+    def read_sdpDestinationAddressesEncoded(self):
+        # PROTECTED REGION ID(CspSubElementSubarray.sdpDestinationAddressesEncoded_read) ENABLED START #
+        """Return the sdpDestinationAddressesEncoded attribute."""
+        return self._sdp_links.addresses_encoded
+        # PROTECTED REGION END #    //  CspSubElementSubarray.sdpDestinationAddressesEncoded_read
+
+    def read_sdpDestinationAddressesDelta(self):
+        # PROTECTED REGION ID(CspSubElementSubarray.sdpDestinationAddressesDelta_read) ENABLED START #
+        """Return the sdpDestinationAddressesDelta attribute."""
+        return self._sdp_destination_addresses_delta
+        # PROTECTED REGION END #    //  CspSubElementSubarray.sdpDestinationAddressesDelta_read
+
     def write_sdpDestinationAddresses(self, value):
         # PROTECTED REGION ID(CspSubElementSubarray.sdpDestinationAddresses_write) ENABLED START #
         """Set the sdpDestinationAddresses attribute."""
-        self._sdp_addresses = value
+        self.set_sdp_destination_addresses(value)
         # PROTECTED REGION END #    //  CspSubElementSubarray.sdpDestinationAddresses_write
 
     def read_outputDataRateToSdp(self):
@@ -346,16 +429,40 @@ class CspSubElementSubarray(SKASubarray):
         return self._last_scan_configuration
         # PROTECTED REGION END #    //  CspSubElementSubarray.lastScanConfiguration_read
 
+    def read_lastScanConfigurationHash(self):
+        # PROTECTED REGION ID(CspSubElementSubarray.lastScanConfigurationHash_read) ENABLED START #
+        """Return the lastScanConfigurationHash attribute."""
+        return self._last_scan_configuration_hash
+        # PROTECTED REGION END #    //  CspSubElementSubarray.lastScanConfigurationHash_read
+
+    def read_configureScanMaximumDuration(self):
+        # PROTECTED REGION ID(CspSubElementSubarray.configureScanMaximumDuration_read) ENABLED START #
+        """Return the configureScanMaximumDuration attribute."""
+        return self._command_progress["ConfigureScan"].maximum_duration
+        # PROTECTED REGION END #    //  CspSubElementSubarray.configureScanMaximumDuration_read
+
+    def write_configureScanMaximumDuration(self, value):
+        # PROTECTED REGION ID(CspSubElementSubarray.configureScanMaximumDuration_write) ENABLED START #
+        """Set the configureScanMaximumDuration attribute."""
+        self._command_progress["ConfigureScan"].maximum_duration = value
+        # PROTECTED REGION END #    //  CspSubElementSubarray.configureScanMaximumDuration_write
+
     def read_configureScanMeasuredDuration(self):
         # PROTECTED REGION ID(CspSubElementSubarray.configureScanMeasuredDuration_read) ENABLED START #
         """Return the configureScanMeasuredDuration attribute."""
-        return self._cmd_measured_duration["configurescan"]
+        return self._command_progress["ConfigureScan"].measured_duration
         # PROTECTED REGION END #    //  CspSubElementSubarray.configureScanMeasuredDuration_read
 
+    def read_configureScanProgress(self):
+        # PROTECTED REGION ID(CspSubElementSubarray.configureScanProgress_read) ENABLED START #
+        """Return the configureScanProgress attribute."""
+        return self._command_progress["ConfigureScan"].progress
+        # PROTECTED REGION END #    //  CspSubElementSubarray.configureScanProgress_read
+
     def read_configureScanTimeoutExpiredFlag(self):
         # PROTECTED REGION ID(CspSubElementSubarray.configureScanTimeoutExpiredFlag_read) ENABLED START #
         """Return the configureScanTimeoutExpiredFlag attribute."""
-        return self._timeout_expired["configurescan"]
+        return self._command_progress["ConfigureScan"].timeout_expired
         # PROTECTED REGION END #    //  CspSubElementSubarray.configureScanTimeoutExpiredFlag_read
 
     def read_listOfDevicesCompletedTasks(self):
@@ -368,69 +475,75 @@ class CspSubElementSubarray(SKASubarray):
     def read_assignResourcesMaximumDuration(self):
         # PROTECTED REGION ID(CspSubElementSubarray.assignResourcesMaximumDuration_read) ENABLED START #
         """Return the assignResourcesMaximumDuration attribute."""
-        return self._cmd_maximum_duration["assignresources"]
+        return self._command_progress["AssignResources"].maximum_duration
         # PROTECTED REGION END #    //  CspSubElementSubarray.assignResourcesMaximumDuration_read
 
     def write_assignResourcesMaximumDuration(self, value):
         # PROTECTED REGION ID(CspSubElementSubarray.assignResourcesMaximumDuration_write) ENABLED START #
         """Set the assignResourcesMaximumDuration attribute."""
-        self._cmd_maximum_duration["assignresources"] = value
+        self._command_progress["AssignResources"].maximum_duration = value
         # PROTECTED REGION END #    //  CspSubElementSubarray.assignResourcesMaximumDuration_write
 
     def read_assignResourcesMeasuredDuration(self):
         # PROTECTED REGION ID(CspSubElementSubarray.assignResourcesMeasuredDuration_read) ENABLED START #
         """Return the assignResourcesMeasuredDuration attribute."""
-        return self._cmd_measured_duration["assignresources"]
+        return self._command_progress["AssignResources"].measured_duration
         # PROTECTED REGION END #    //  CspSubElementSubarray.assignResourcesMeasuredDuration_read
 
     def read_assignResourcesProgress(self):
         # PROTECTED REGION ID(CspSubElementSubarray.assignResourcesProgress_read) ENABLED START #
         """Return the assignResourcesProgress attribute."""
-        return self._cmd_progress["assignresources"]
+        return self._command_progress["AssignResources"].progress
         # PROTECTED REGION END #    //  CspSubElementSubarray.assignResourcesProgress_read
 
     def read_assignResourcesTimeoutExpiredFlag(self):
         # PROTECTED REGION ID(CspSubElementSubarray.assignResourcesTimeoutExpiredFlag_read) ENABLED START #
         """Return the assignResourcesTimeoutExpiredFlag attribute."""
-        return self._timeout_expired["assignresources"]
+        return self._command_progress["AssignResources"].timeout_expired
         # PROTECTED REGION END #    //  CspSubElementSubarray.assignResourcesTimeoutExpiredFlag_read
 
     def read_releaseResourcesMaximumDuration(self):
         # PROTECTED REGION ID(CspSubElementSubarray.releaseResourcesMaximumDuration_read) ENABLED START #
         """Return the releaseResourcesMaximumDuration attribute."""
-        return self._cmd_maximum_duration["releaseresources"]
+        return self._command_progress["ReleaseResources"].maximum_duration
         # PROTECTED REGION END #    //  CspSubElementSubarray.releaseResourcesMaximumDuration_read
 
     def write_releaseResourcesMaximumDuration(self, value):
         # PROTECTED REGION ID(CspSubElementSubarray.releaseResourcesMaximumDuration_write) ENABLED START #
         """Set the releaseResourcesMaximumDuration attribute."""
-        self._cmd_maximum_duration["releaseresources"] = value
+        self._command_progress["ReleaseResources"].maximum_duration = value
         # PROTECTED REGION END #    //  CspSubElementSubarray.releaseResourcesMaximumDuration_write
 
     def read_releaseResourcesMeasuredDuration(self):
         # PROTECTED REGION ID(CspSubElementSubarray.releaseResourcesMeasuredDuration_read) ENABLED START #
         """Return the releaseResourcesMeasuredDuration attribute."""
-        return self._cmd_measured_duration["releaseresources"]
+        return self._command_progress["ReleaseResources"].measured_duration
         # PROTECTED REGION END #    //  CspSubElementSubarray.releaseResourcesMeasuredDuration_read
 
     def read_releaseResourcesProgress(self):
         # PROTECTED REGION ID(CspSubElementSubarray.releaseResourcesProgress_read) ENABLED START #
         """Return the releaseResourcesProgress attribute."""
-        return self._cmd_progress["releaseresources"]
+        return self._command_progress["ReleaseResources"].progress
         # PROTECTED REGION END #    //  CspSubElementSubarray.releaseResourcesProgress_read
 
     def read_releaseResourcesTimeoutExpiredFlag(self):
         # PROTECTED REGION ID(CspSubElementSubarray.releaseResourcesTimeoutExpiredFlag_read) ENABLED START #
         """Return the releaseResourcesTimeoutExpiredFlag attribute."""
-        return self._timeout_expired["releaseresources"]
+        return self._command_progress["ReleaseResources"].timeout_expired
         # PROTECTED REGION END #    //  CspSubElementSubarray.releaseResourcesTimeoutExpiredFlag_read
 
     def read_sdpLinkActive(self):
         # PROTECTED REGION ID(CspSubElementSubarray.sdpLinkActive_read) ENABLED START #
         """Return the sdpLinkActive attribute."""
-        return (False,)
+        return self._sdp_links.active
         # PROTECTED REGION END #    //  CspSubElementSubarray.sdpLinkActive_read
 
+    def read_sdpLinkActiveDelta(self):
+        # PROTECTED REGION ID(CspSubElementSubarray.sdpLinkActiveDelta_read) ENABLED START #
+        """Return the sdpLinkActiveDelta attribute."""
+        return self._sdp_link_active_delta
+        # PROTECTED REGION END #    //  CspSubElementSubarray.sdpLinkActiveDelta_read
+
     # --------
     # Commands
     # --------
@@ -440,6 +553,12 @@ class CspSubElementSubarray(SKASubarray):
         A class for the CspSubElementObsDevices's ConfigureScan command.
         """
 
+        argument_codec = JsonArgumentCodec(dict, required_keys=["id"])
+        """
+        The codec that decodes and validates the JSON-encoded scan
+        configuration.
+        """
+
         def __init__(self, target, op_state_model, obs_state_model, logger=None):
             """
             Constructor for ConfigureScanCommand
@@ -488,14 +607,32 @@ class CspSubElementSubarray(SKASubarray):
             :rtype: (ResultCode, str)
             """
             try:
-                configuration_dict = json.loads(argin)
-                _ = configuration_dict["id"]
-            except (KeyError, JSONDecodeError) as err:
+                configuration_dict = self.argument_codec.decode(argin)
+            except ArgumentValidationError as err:
                 msg = f"Validate configuration failed with error:{err}"
                 self.logger.error(msg)
                 return (None, ResultCode.FAILED, msg)
-            except Exception as other_errs:
-                msg = f"Validate configuration failed with unknown error:{other_errs}"
+
+            return (
+                configuration_dict,
+                ResultCode.OK,
+                "ConfigureScan arguments validation successful",
+            )
+
+        def validate_encoded_input(self, argin):
+            """
+            Validate a DevEncoded configuration, as for validate_input.
+
+            :param argin: The encoding name, and the encoded configuration.
+            :type argin: (str, bytes)
+            :return: A tuple containing the decoded configuration, a
+                return code and a string message.
+            :rtype: (dict, ResultCode, str)
+            """
+            try:
+                configuration_dict = self.argument_codec.decode_encoded(argin)
+            except ArgumentValidationError as err:
+                msg = f"Validate configuration failed with error:{err}"
                 self.logger.error(msg)
                 return (None, ResultCode.FAILED, msg)
 
@@ -572,12 +709,150 @@ class CspSubElementSubarray(SKASubarray):
         (configuration, result_code, message) = command.validate_input(argin)
         if result_code == ResultCode.OK:
             # store the configuration on command success
-            self._last_scan_configuration = argin
+            self._set_last_scan_configuration(argin)
             (result_code, message) = command(configuration)
 
         return [[result_code], [message]]
         # PROTECTED REGION END #    //  CspSubElementSubarray.Configure
 
+    @command(
+        dtype_in="DevString",
+        doc_in="JSON formatted string with the scan configuration.",
+        dtype_out="DevVarLongStringArray",
+        doc_out="A tuple containing a return code and a string message indicating status. "
+        "The message is for information purpose only.",
+    )
+    @DebugIt()
+    def PreloadConfiguration(self, argin):
+        # PROTECTED REGION ID(CspSubElementSubarray.PreloadConfiguration) ENABLED START #
+        """
+        Validate a scan configuration, and store it under its ID, to be
+        applied later by ConfigureScanByID.
+
+        :param argin: JSON formatted string with the scan configuration.
+        :type argin: 'DevString'
+
+        :return: A tuple containing a return code and a string message indicating status.
+            The message is for information purpose only.
+        :rtype: (ResultCode, str)
+        """
+        (result_code, message) = self._preload_configuration(argin)
+        return [[result_code], [message]]
+        # PROTECTED REGION END #    //  CspSubElementSubarray.PreloadConfiguration
+
+    @command(
+        dtype_in="DevString",
+        doc_in="The ID of a preloaded scan configuration.",
+        dtype_out="DevVarLongStringArray",
+        doc_out="A tuple containing a return code and a string message indicating status. "
+        "The message is for information purpose only.",
+    )
+    @DebugIt()
+    def ConfigureScanByID(self, argin):
+        # PROTECTED REGION ID(CspSubElementSubarray.ConfigureScanByID) ENABLED START #
+        """
+        Configure the scan with a configuration previously stored by
+        PreloadConfiguration, without decoding or validating it again.
+
+        :param argin: the ID of the preloaded scan configuration.
+        :type argin: 'DevString'
+
+        :return: A tuple containing a return code and a string message indicating status.
+            The message is for information purpose only.
+        :rtype: (ResultCode, str)
+        """
+        (result_code, message) = self._configure_scan_by_id(argin)
+        return [[result_code], [message]]
+        # PROTECTED REGION END #    //  CspSubElementSubarray.ConfigureScanByID
+
+    @command(
+        dtype_in="DevString",
+        doc_in="The hash of a recent scan configuration, as reported by "
+        "lastScanConfigurationHash.",
+        dtype_out="DevVarLongStringArray",
+        doc_out="A tuple containing a return code and a string message indicating status. "
+        "The message is for information purpose only.",
+    )
+    @DebugIt()
+    def ConfigureScanByHash(self, argin):
+        # PROTECTED REGION ID(CspSubElementSubarray.ConfigureScanByHash) ENABLED START #
+        """
+        Configure the scan with a recent configuration, held in the
+        device server's scan configuration cache, without the client
+        sending it again.
+
+        :param argin: the hash of the scan configuration, as reported
+            by lastScanConfigurationHash.
+        :type argin: 'DevString'
+
+        :return: A tuple containing a return code and a string message indicating status.
+            The message is for information purpose only.
+        :rtype: (ResultCode, str)
+        """
+        (result_code, message) = self._configure_scan_by_hash(argin)
+        return [[result_code], [message]]
+        # PROTECTED REGION END #    //  CspSubElementSubarray.ConfigureScanByHash
+
+    @command(
+        dtype_in="DevEncoded",
+        doc_in="Encoding name, 'json' or 'msgpack', and encoded scan configuration.",
+        dtype_out="DevVarLongStringArray",
+        doc_out="A tuple containing a return code and a string message indicating status. "
+        "The message is for information purpose only.",
+    )
+    @DebugIt()
+    def ConfigureScanEncoded(self, argin):
+        # PROTECTED REGION ID(CspSubElementSubarray.ConfigureScanEncoded) ENABLED START #
+        """
+        Configure the scan from a DevEncoded configuration; otherwise the
+        same as ConfigureScan.
+
+        The lastScanConfiguration attribute reports the configuration
+        as JSON, whatever its encoding. A JSON-encoded configuration is
+        reported exactly as sent, so it has the same hash as the same
+        configuration sent to ConfigureScan.
+
+        :param argin: the encoding name, and the encoded scan configuration.
+        :type argin: (str, bytes)
+
+        :return: A tuple containing a return code and a string message indicating status.
+            The message is for information purpose only.
+        :rtype: (ResultCode, str)
+        """
+        command = self.get_command_object("ConfigureScan")
+
+        (configuration, result_code, message) = command.validate_encoded_input(argin)
+        if result_code == ResultCode.OK:
+            # store the configuration on command success
+            self._set_last_scan_configuration(encoded_text(argin, configuration))
+            (result_code, message) = command(configuration)
+
+        return [[result_code], [message]]
+        # PROTECTED REGION END #    //  CspSubElementSubarray.ConfigureScanEncoded
+
+    @command(
+        dtype_in="DevEncoded",
+        doc_in="Encoding name, 'json' or 'msgpack', and encoded scan configuration.",
+        dtype_out="DevVarLongStringArray",
+        doc_out="A tuple containing a return code and a string message indicating status. "
+        "The message is for information purpose only.",
+    )
+    @DebugIt()
+    def ConfigureEncoded(self, argin):
+        # PROTECTED REGION ID(CspSubElementSubarray.ConfigureEncoded) ENABLED START #
+        """
+        Redirect to ConfigureScanEncoded method.
+
+        :param argin: the encoding name, and the encoded scan configuration.
+        :type argin: (str, bytes)
+
+        :return: A tuple containing a return code and a string message indicating status.
+            The message is for information purpose only.
+        :rtype: (ResultCode, str)
+        """
+        return self.ConfigureScanEncoded(argin)
+        # PROTECTED REGION END #    //  CspSubElementSubarray.ConfigureEncoded
+
     @command(
         dtype_in="DevString",
         doc_in="A Json-encoded string with the scan configuration.",
@@ -616,7 +891,7 @@ class CspSubElementSubarray(SKASubarray):
             A tuple containing a return code and a string  message indicating status.
             The message is for information purpose only.
         """
-        self._last_scan_configuration = ""
+        self._set_last_scan_configuration("")
 
         command = self.get_command_object("GoToIdle")
         (return_code, message) = command()
@@ -0,0 +1,310 @@
+"""
+This module provides an ``EventPublisher``, through which a device
+pushes change and archive events for its attributes, subject to rate
+limiting, archive decimation and duplicate dropping.
+
+By default, an ``EventPublisher`` pushes every event immediately, just
+as calling ``push_change_event`` and ``push_archive_event`` directly
+would. It may be configured:
+
+* with a minimum interval between change events for each attribute.
+  A change event that would follow the previous one too soon is held
+  back, and replaced by any later value;
+* to decimate archive events, so that only one in every so many values
+  of an attribute is archived;
+* to drop values that are equal to the value most recently published
+  for the attribute.
+
+Values that are held back are not lost: once no value has been
+published for an attribute for a given quiescence period, its most
+recent value is pushed, so that subscribers and archivers always end
+up with the attribute's final value.
+"""
+import logging
+import threading
+import time
+
+__all__ = ["EventPublisher"]
+
+module_logger = logging.getLogger(__name__)
+
+_NO_VALUE = object()
+
+
+class _AttributeEvents:
+    """
+    Record of the events published for a single attribute.
+    """
+
+    __slots__ = (
+        "value",
+        "change_value",
+        "change_time",
+        "pending_change",
+        "archive_value",
+        "archive_count",
+        "pending_archive",
+        "publish_time",
+        "timer",
+    )
+
+    def __init__(self):
+        """
+        Initialise a new record.
+        """
+        self.value = _NO_VALUE
+        self.change_value = _NO_VALUE
+        self.change_time = None
+        self.pending_change = _NO_VALUE
+        self.archive_value = _NO_VALUE
+        self.archive_count = 0
+        self.pending_archive = _NO_VALUE
+        self.publish_time = None
+        self.timer = None
+
+
+class EventPublisher:
+    """
+    Publisher of change and archive events for the attributes of a
+    device.
+    """
+
+    def __init__(
+        self,
+        push_change,
+        push_archive,
+        min_intervals=None,
+        archive_decimation=1,
+        drop_duplicates=False,
+        quiescence_period=1.0,
+        logger=None,
+    ):
+        """
+        Initialise a new EventPublisher.
+
+        :param push_change: callable that pushes a change event, called
+            with the attribute name and value
+        :type push_change: callable
+        :param push_archive: callable that pushes an archive event,
+            called with the attribute name and value
+        :type push_archive: callable
+        :param min_intervals: minimum interval, in seconds, between
+            change events for each attribute. Attributes not in this
+            dictionary are not rate limited.
+        :type min_intervals: dict
+        :param archive_decimation: archive only one in this many values
+            of each attribute
+        :type archive_decimation: int
+        :param drop_duplicates: whether to drop values that are equal to
+            the value most recently published for the attribute
+        :type drop_duplicates: bool
+        :param quiescence_period: the time, in seconds, for which no
+            value must be published for an attribute, before any value
+            that has been held back is pushed
+        :type quiescence_period: float
+        :param logger: the logger to be used by this publisher. If not
+            provided, then a default module logger will be used.
+        :type logger: a logger that implements the standard library
+            logger interface
+        """
+        self._push_change = push_change
+        self._push_archive = push_archive
+        self._min_intervals = dict(min_intervals or {})
+        self._archive_decimation = max(1, archive_decimation)
+        self._drop_duplicates = drop_duplicates
+        self._quiescence_period = quiescence_period
+        self._logger = logger or module_logger
+
+        self._lock = threading.RLock()
+        self._records = {}
+        self._shut_down = False
+
+    def publish(self, name, value, archive=True):
+        """
+        Publish a new value of an attribute.
+
+        :param name: name of the attribute
+        :type name: str
+        :param value: the new value of the attribute. It must be
+            comparable with ``==`` if duplicates are to be dropped.
+        :param archive: whether an archive event, as well as a change
+            event, is to be published
+        :type archive: bool
+        """
+        with self._lock:
+            record = self._records.get(name)
+            if record is None:
+                record = self._records[name] = _AttributeEvents()
+
+            if self._drop_duplicates and record.value == value:
+                return
+            record.value = value
+
+            now = time.monotonic()
+            record.publish_time = now
+
+            min_interval = self._min_intervals.get(name, 0.0)
+            if record.change_time is None or now - record.change_time >= min_interval:
+                self._change(name, record, value, now)
+            else:
+                record.pending_change = value
+
+            if archive:
+                if record.archive_count == 0:
+                    self._archive(name, record, value)
+                else:
+                    record.pending_archive = value
+                record.archive_count = (
+                    record.archive_count + 1
+                ) % self._archive_decimation
+
+            if self._is_pending(record) and record.timer is None:
+                if self._shut_down:
+                    self._flush_record(name, record)
+                else:
+                    self._start_timer(name, record, self._quiescence_period)
+
+    def flush(self):
+        """
+        Push any values that have been held back, without waiting for
+        the quiescence period to elapse.
+        """
+        with self._lock:
+            for (name, record) in self._records.items():
+                self._flush_record(name, record)
+
+    def shutdown(self):
+        """
+        Shut down this publisher, pushing any values that have been held
+        back. Values published afterwards are pushed immediately.
+        """
+        with self._lock:
+            self._shut_down = True
+            for record in self._records.values():
+                if record.timer is not None:
+                    record.timer.cancel()
+                    record.timer = None
+            self.flush()
+
+    def _change(self, name, record, value, now):
+        """
+        Helper method that pushes a change event.
+
+        Must be called with the lock held.
+
+        :param name: name of the attribute
+        :type name: str
+        :param record: the record of events for the attribute
+        :type record: :py:class:`._AttributeEvents`
+        :param value: the value to push
+        :param now: the current monotonic time
+        :type now: float
+        """
+        record.change_value = value
+        record.change_time = now
+        record.pending_change = _NO_VALUE
+        self._push_change(name, value)
+
+    def _archive(self, name, record, value):
+        """
+        Helper method that pushes an archive event.
+
+        Must be called with the lock held.
+
+        :param name: name of the attribute
+        :type name: str
+        :param record: the record of events for the attribute
+        :type record: :py:class:`._AttributeEvents`
+        :param value: the value to push
+        """
+        record.archive_value = value
+        record.pending_archive = _NO_VALUE
+        self._push_archive(name, value)
+
+    def _is_pending(self, record):
+        """
+        Helper method that returns whether any event for an attribute
+        has been held back.
+
+        :param record: the record of events for the attribute
+        :type record: :py:class:`._AttributeEvents`
+
+        :return: whether any event has been held back
+        :rtype: bool
+        """
+        return (
+            record.pending_change is not _NO_VALUE
+            or record.pending_archive is not _NO_VALUE
+        )
+
+    def _flush_record(self, name, record):
+        """
+        Helper method that pushes the events that have been held back
+        for an attribute, except for values that have already been
+        pushed, if duplicates are being dropped.
+
+        Must be called with the lock held.
+
+        :param name: name of the attribute
+        :type name: str
+        :param record: the record of events for the attribute
+        :type record: :py:class:`._AttributeEvents`
+        """
+        value = record.pending_change
+        if value is not _NO_VALUE:
+            if self._drop_duplicates and value == record.change_value:
+                record.pending_change = _NO_VALUE
+            else:
+                self._change(name, record, value, time.monotonic())
+
+        value = record.pending_archive
+        if value is not _NO_VALUE:
+            if self._drop_duplicates and value == record.archive_value:
+                record.pending_archive = _NO_VALUE
+            else:
+                self._archive(name, record, value)
+        record.archive_count = 0
+
+    def _start_timer(self, name, record, delay):
+        """
+        Helper method that starts a timer, at the end of which held-back
+        events for an attribute are pushed, if it has been quiescent.
+
+        Must be called with the lock held.
+
+        :param name: name of the attribute
+        :type name: str
+        :param record: the record of events for the attribute
+        :type record: :py:class:`._AttributeEvents`
+        :param delay: the time, in seconds, until the timer fires
+        :type delay: float
+        """
+        record.timer = threading.Timer(delay, self._timer_fired, args=(name,))
+        record.timer.daemon = True
+        record.timer.start()
+
+    def _timer_fired(self, name):
+        """
+        Callback for the quiescence timer of an attribute. If values
+        have been published for the attribute since the timer was
+        started, the timer is restarted for the remainder of the
+        quiescence period; otherwise held-back events are pushed.
+
+        :param name: name of the attribute
+        :type name: str
+        """
+        with self._lock:
+            record = self._records[name]
+            if record.timer is None:
+                # cancelled by shutdown
+                return
+            remaining = record.publish_time + self._quiescence_period - time.monotonic()
+            if remaining > 0:
+                self._start_timer(name, record, remaining)
+                return
+
+            record.timer = None
+            try:
+                self._flush_record(name, record)
+            except Exception:
+                self._logger.exception(f"Failed to push held-back events for {name}.")
@@ -0,0 +1,445 @@
+"""
+This module provides a ``CommandExecutor``: a bounded FIFO queue of
+commands, executed asynchronously by a bounded pool of worker threads.
+
+A command that runs on an executor does not hold the Tango device's
+serialisation monitor while it executes. Instead, it returns
+``ResultCode.QUEUED`` and a unique command ID to the client straight
+away, and its ``do()`` method is run later on one of the executor's
+worker threads. If the queue is already full, the command is rejected
+with ``ResultCode.REJECTED``. See
+:py:class:`~ska_tango_base.commands.ResponseCommand`.
+
+The executor reports changes to its queue, and to the status, progress
+and result of its commands, through callbacks, so that a device can
+publish them as change events. Callbacks are delivered one at a time,
+in the order in which the changes were made.
+"""
+import collections
+import concurrent.futures
+import enum
+import logging
+import queue
+import threading
+import uuid
+
+from ska_tango_base.commands import ResultCode
+
+module_logger = logging.getLogger(__name__)
+
+
+class CommandStatus(enum.IntEnum):
+    """
+    Python enumerated type for the status of a queued command.
+    """
+
+    QUEUED = 0
+    """
+    The command is in the queue, waiting to be executed.
+    """
+
+    IN_PROGRESS = 1
+    """
+    The command is being executed by a worker thread.
+    """
+
+    COMPLETED = 2
+    """
+    The command's ``do()`` method has returned.
+    """
+
+    FAILED = 3
+    """
+    The command raised an exception.
+    """
+
+    CANCELLED = 4
+    """
+    The command was removed from the queue without being executed,
+    because the executor was shut down.
+    """
+
+
+class CommandExecutor:
+    """
+    A bounded FIFO queue of commands, executed by a bounded pool of
+    worker threads.
+    """
+
+    def __init__(
+        self,
+        max_workers=1,
+        max_queue_size=16,
+        logger=None,
+        queue_callback=None,
+        status_callback=None,
+        progress_callback=None,
+        result_callback=None,
+    ):
+        """
+        Initialise a new CommandExecutor.
+
+        :param max_workers: the maximum number of worker threads. With
+            the default of a single worker, queued commands are executed
+            one at a time, in the order in which they were submitted.
+        :type max_workers: int
+        :param max_queue_size: the maximum number of commands that may
+            be in the queue at one time, including those that are being
+            executed.
+        :type max_queue_size: int
+        :param logger: the logger to be used by this executor. If not
+            provided, then a default module logger will be used.
+        :type logger: a logger that implements the standard library
+            logger interface
+        :param queue_callback: callback to be called with a list of
+            ``(command_id, command_name)`` tuples whenever the contents
+            of the queue change
+        :type queue_callback: callable
+        :param status_callback: callback to be called with a list of
+            ``(command_id, CommandStatus)`` tuples whenever the status
+            of a command changes
+        :type status_callback: callable
+        :param progress_callback: callback to be called with a list of
+            ``(command_id, progress)`` tuples whenever the progress of
+            a command is updated
+        :type progress_callback: callable
+        :param result_callback: callback to be called with a
+            ``(command_id, result_code, message)`` tuple whenever a
+            command returns a result
+        :type result_callback: callable
+        """
+        self._logger = logger or module_logger
+        self._max_queue_size = max_queue_size
+        self._queue_callback = queue_callback
+        self._status_callback = status_callback
+        self._progress_callback = progress_callback
+        self._result_callback = result_callback
+
+        self._lock = threading.Lock()
+        self._delivery_lock = threading.RLock()
+        self._local = threading.local()
+        self._reservations = set()
+        self._queue = collections.OrderedDict()
+        self._statuses = collections.OrderedDict()
+        self._progresses = collections.OrderedDict()
+        self._result = None
+
+        self._shutting_down = False
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="CommandExecutor"
+        )
+
+    @property
+    def queue_full(self):
+        """
+        Return whether the queue is full. Reserved places count towards
+        the size of the queue.
+
+        :return: whether the queue is full
+        :rtype: bool
+        """
+        with self._lock:
+            return self._is_full()
+
+    @property
+    def commands_in_queue(self):
+        """
+        Return the commands in the queue, including those that are
+        being executed, in the order in which they were submitted.
+
+        :return: a list of ``(command_id, command_name)`` tuples
+        :rtype: list
+        """
+        with self._lock:
+            return list(self._queue.items())
+
+    @property
+    def command_statuses(self):
+        """
+        Return the status of the commands in the queue, and of the
+        commands that most recently left it.
+
+        :return: a list of ``(command_id, CommandStatus)`` tuples
+        :rtype: list
+        """
+        with self._lock:
+            return list(self._statuses.items())
+
+    @property
+    def command_progresses(self):
+        """
+        Return the most recently reported progress of the commands in
+        the queue.
+
+        :return: a list of ``(command_id, progress)`` tuples
+        :rtype: list
+        """
+        with self._lock:
+            return list(self._progresses.items())
+
+    @property
+    def command_result(self):
+        """
+        Return the result of the command that most recently completed.
+
+        :return: a ``(command_id, result_code, message)`` tuple, or
+            None if no command has yet completed
+        :rtype: tuple
+        """
+        with self._lock:
+            return self._result
+
+    def reserve(self):
+        """
+        Reserve a place in the queue, for a command that is to be
+        submitted later with :py:meth:`.submit_reserved`. This allows a
+        caller to find out whether a command will be accepted before it
+        does anything that cannot be undone, such as performing an
+        action on a state model.
+
+        A reservation that is not used must be given back with
+        :py:meth:`.release`.
+
+        :return: a reservation, or None if the queue is full
+        :rtype: object
+        """
+        with self._lock:
+            if self._is_full():
+                return None
+            reservation = object()
+            self._reservations.add(reservation)
+            return reservation
+
+    def release(self, reservation):
+        """
+        Give back a place in the queue that was reserved but not used.
+
+        :param reservation: the reservation returned by
+            :py:meth:`.reserve`
+        :type reservation: object
+        """
+        with self._lock:
+            self._reservations.discard(reservation)
+
+    def submit(self, command_name, func, *args, **kwargs):
+        """
+        Submit a call for execution on a worker thread.
+
+        The callable is expected to return a ``(result_code, message)``
+        tuple, which is reported to the result callback.
+
+        :param command_name: the name of the command being submitted;
+            used to construct the command ID
+        :type command_name: str
+        :param func: the callable to be run on the worker thread
+        :type func: callable
+        :param args: positional arguments to the callable
+        :param kwargs: keyword arguments to the callable
+
+        :return: a unique ID for this command call
+        :rtype: str
+
+        :raises queue.Full: if the queue is full
+        """
+        reservation = self.reserve()
+        if reservation is None:
+            raise queue.Full(
+                f"Command queue is full ({self._max_queue_size} commands)."
+            )
+        return self.submit_reserved(reservation, command_name, func, *args, **kwargs)
+
+    def submit_reserved(self, reservation, command_name, func, *args, **kwargs):
+        """
+        Submit a call for execution on a worker thread, in a place in the
+        queue that has already been reserved. Unlike :py:meth:`.submit`,
+        this cannot fail because the queue is full.
+
+        :param reservation: the reservation returned by
+            :py:meth:`.reserve`
+        :type reservation: object
+        :param command_name: the name of the command being submitted;
+            used to construct the command ID
+        :type command_name: str
+        :param func: the callable to be run on the worker thread
+        :type func: callable
+        :param args: positional arguments to the callable
+        :param kwargs: keyword arguments to the callable
+
+        :return: a unique ID for this command call
+        :rtype: str
+
+        :raises ValueError: if the reservation is not held
+        """
+        command_id = f"{uuid.uuid4()}_{command_name}"
+        with self._delivery_lock:
+            with self._lock:
+                if reservation not in self._reservations:
+                    raise ValueError("Queue reservation is not held.")
+                self._reservations.remove(reservation)
+                self._queue[command_id] = command_name
+                self._set_status(command_id, CommandStatus.QUEUED)
+                queue_snapshot = list(self._queue.items())
+                status_snapshot = list(self._statuses.items())
+
+            self._call(self._queue_callback, queue_snapshot)
+            self._call(self._status_callback, status_snapshot)
+
+        self._pool.submit(self._run, command_id, func, *args, **kwargs)
+        return command_id
+
+    def update_progress(self, progress):
+        """
+        Update the progress of the command that is being executed by the
+        calling worker thread. This has no effect if called from any
+        other thread.
+
+        :param progress: the progress of the command; for example, a
+            percentage
+        :type progress: int or str
+        """
+        command_id = getattr(self._local, "command_id", None)
+        if command_id is None:
+            return
+
+        with self._delivery_lock:
+            with self._lock:
+                self._progresses[command_id] = progress
+                progress_snapshot = list(self._progresses.items())
+            self._call(self._progress_callback, progress_snapshot)
+
+    def _run(self, command_id, func, *args, **kwargs):
+        """
+        Run a submitted call on a worker thread, recording its status
+        and result.
+
+        :param command_id: the unique ID of the command call
+        :type command_id: str
+        :param func: the callable to be run
+        :type func: callable
+        :param args: positional arguments to the callable
+        :param kwargs: keyword arguments to the callable
+        """
+        if self._shutting_down:
+            self._logger.info(f"Command {command_id} cancelled by shutdown.")
+            self._finish(command_id, CommandStatus.CANCELLED)
+            return
+
+        self._logger.debug(f"Executing command {command_id}")
+        self._update_status(command_id, CommandStatus.IN_PROGRESS)
+        self._local.command_id = command_id
+        try:
+            (result_code, message) = func(*args, **kwargs)
+        except Exception as exc:
+            self._logger.exception(f"Command {command_id} failed.")
+            self._finish(
+                command_id, CommandStatus.FAILED, (ResultCode.FAILED, str(exc))
+            )
+        else:
+            self._finish(command_id, CommandStatus.COMPLETED, (result_code, message))
+        finally:
+            self._local.command_id = None
+
+    def _is_full(self):
+        """
+        Helper method that returns whether the queue, including reserved
+        places, is full.
+
+        Must be called with the lock held.
+
+        :return: whether the queue is full
+        :rtype: bool
+        """
+        return len(self._queue) + len(self._reservations) >= self._max_queue_size
+
+    def _set_status(self, command_id, status):
+        """
+        Helper method that records the status of a command, discarding
+        the oldest statuses of commands that have left the queue, so
+        that no more than ``max_queue_size`` of them are retained.
+
+        Must be called with the lock held.
+
+        :param command_id: the unique ID of the command call
+        :type command_id: str
+        :param status: the new status of the command
+        :type status: :py:class:`CommandStatus`
+        """
+        self._statuses[command_id] = status
+        self._statuses.move_to_end(command_id)
+
+        finished = [cid for cid in self._statuses if cid not in self._queue]
+        for cid in finished[: max(0, len(finished) - self._max_queue_size)]:
+            del self._statuses[cid]
+
+    def _update_status(self, command_id, status):
+        """
+        Helper method that updates the status of a command, and calls
+        the status callback.
+
+        :param command_id: the unique ID of the command call
+        :type command_id: str
+        :param status: the new status of the command
+        :type status: :py:class:`CommandStatus`
+        """
+        with self._delivery_lock:
+            with self._lock:
+                self._set_status(command_id, status)
+                status_snapshot = list(self._statuses.items())
+            self._call(self._status_callback, status_snapshot)
+
+    def _finish(self, command_id, status, result=None):
+        """
+        Helper method that removes a command from the queue, records its
+        final status and result, and calls the callbacks.
+
+        :param command_id: the unique ID of the command call
+        :type command_id: str
+        :param status: the final status of the command
+        :type status: :py:class:`CommandStatus`
+        :param result: the ``(result_code, message)`` returned by the
+            command, if any
+        :type result: tuple
+        """
+        with self._delivery_lock:
+            with self._lock:
+                del self._queue[command_id]
+                self._progresses.pop(command_id, None)
+                self._set_status(command_id, status)
+                if result is not None:
+                    self._result = (command_id,) + tuple(result)
+                queue_snapshot = list(self._queue.items())
+                status_snapshot = list(self._statuses.items())
+                progress_snapshot = list(self._progresses.items())
+                result_snapshot = self._result
+
+            self._call(self._queue_callback, queue_snapshot)
+            self._call(self._status_callback, status_snapshot)
+            self._call(self._progress_callback, progress_snapshot)
+            if result is not None:
+                self._call(self._result_callback, result_snapshot)
+
+    def _call(self, callback, value):
+        """
+        Helper method that calls a callback, if there is one. Callbacks
+        are called without the lock held, so that they may read this
+        executor's properties; but with the delivery lock held, so that
+        a snapshot is never delivered after a later one.
+
+        :param callback: the callback to call
+        :type callback: callable
+        :param value: the value to pass to the callback
+        """
+        if callback is not None:
+            callback(value)
+
+    def shutdown(self, wait=True):
+        """
+        Shut down this executor. Commands that have not yet started are
+        cancelled.
+
+        :param wait: whether to block until the currently executing
+            command, if any, has finished
+        :type wait: bool
+        """
+        self._shutting_down = True
+        self._pool.shutdown(wait=wait)
@@ -39,3 +39,24 @@ class ComponentError(Exception):
 
 class ComponentFault(ComponentError):
     """Component is in FAULT state and cannot perform as requested."""
+
+
+class ResourceConflictError(ValueError):
+    """Resources are already assigned to another owner."""
+
+    def __init__(self, message, conflicts=None):
+        """
+        Initialise a new instance.
+
+        :param message: the error message
+        :type message: str
+        :param conflicts: the owners of the conflicting resources, keyed
+            by resource
+        :type conflicts: dict
+        """
+        super().__init__(message)
+        self.conflicts = dict(conflicts or {})
+
+
+class ArgumentValidationError(ValueError):
+    """A command argument cannot be decoded or fails validation."""
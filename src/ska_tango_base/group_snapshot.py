@@ -0,0 +1,247 @@
+"""
+This module provides a ``GroupSnapshotReader``, which reads a set of
+attributes from every device in a Tango group in a single asynchronous
+batch, and returns the result as a ``GroupSnapshot``: for each
+attribute, a column of values, qualities and timestamps, with one row
+per device, held in NumPy arrays.
+
+Snapshots are cached for a configurable time-to-live, so that a device
+that aggregates, for example, the ``healthState`` of hundreds of
+subservient devices whenever it is asked, reads them at most once per
+time-to-live, rather than once per request.
+"""
+import threading
+import time
+
+import numpy as np
+
+__all__ = ["GroupSnapshot", "GroupSnapshotReader", "SnapshotColumn"]
+
+
+class SnapshotColumn:
+    """
+    The values of one attribute across the devices of a group.
+
+    :ivar value: the value read from each device, or None where the read
+        failed. Scalar values are held in an array of their own type;
+        otherwise, or if any read failed, in an array of objects.
+    :vartype value: :py:class:`numpy.ndarray`
+    :ivar quality: the quality of each value, as an integer
+        :py:class:`tango.AttrQuality`, or -1 where the read failed
+    :vartype quality: :py:class:`numpy.ndarray`
+    :ivar timestamp: the timestamp of each value, in seconds since the
+        epoch, or NaN where the read failed
+    :vartype timestamp: :py:class:`numpy.ndarray`
+    :ivar failed: whether the read from each device failed
+    :vartype failed: :py:class:`numpy.ndarray`
+    """
+
+    __slots__ = ("value", "quality", "timestamp", "failed")
+
+    def __init__(self, value, quality, timestamp, failed):
+        """
+        Initialise a new SnapshotColumn.
+
+        :param value: the value read from each device
+        :type value: :py:class:`numpy.ndarray`
+        :param quality: the quality of each value
+        :type quality: :py:class:`numpy.ndarray`
+        :param timestamp: the timestamp of each value
+        :type timestamp: :py:class:`numpy.ndarray`
+        :param failed: whether the read from each device failed
+        :type failed: :py:class:`numpy.ndarray`
+        """
+        self.value = value
+        self.quality = quality
+        self.timestamp = timestamp
+        self.failed = failed
+
+
+class GroupSnapshot:
+    """
+    The values of a set of attributes across the devices of a group, at
+    one time.
+
+    Index a snapshot by attribute name to get that attribute's
+    :py:class:`.SnapshotColumn`; rows are in the order of
+    :py:attr:`.device_names`.
+    """
+
+    def __init__(self, device_names, columns, read_time):
+        """
+        Initialise a new GroupSnapshot.
+
+        :param device_names: the names of the devices, one per row
+        :type device_names: :py:class:`numpy.ndarray`
+        :param columns: a column for each attribute, keyed by attribute
+            name
+        :type columns: dict
+        :param read_time: the time at which the snapshot was read, in
+            seconds since the epoch
+        :type read_time: float
+        """
+        self.device_names = device_names
+        self.read_time = read_time
+        self._columns = columns
+
+    def __getitem__(self, attribute_name):
+        """
+        Return the column for an attribute.
+
+        :param attribute_name: the name of the attribute
+        :type attribute_name: str
+
+        :return: the column for the attribute
+        :rtype: :py:class:`.SnapshotColumn`
+
+        :raises KeyError: if the attribute is not in this snapshot
+        """
+        return self._columns[attribute_name]
+
+    @property
+    def attribute_names(self):
+        """
+        Return the names of the attributes in this snapshot.
+
+        :return: the names of the attributes
+        :rtype: list of str
+        """
+        return list(self._columns)
+
+
+class GroupSnapshotReader:
+    """
+    Reader of cached snapshots of attributes across named Tango groups.
+    """
+
+    def __init__(self, groups, time_to_live=1.0, timeout=3.0):
+        """
+        Initialise a new GroupSnapshotReader.
+
+        :param groups: the groups that may be read, keyed by group name;
+            for example, a device's ``groups``
+        :type groups: mapping of str to :py:class:`tango.Group`
+        :param time_to_live: the time, in seconds, for which a snapshot
+            is cached, or 0 to read afresh every time
+        :type time_to_live: float
+        :param timeout: the time, in seconds, to wait for each device to
+            reply, after which its read is deemed to have failed
+        :type timeout: float
+        """
+        self._groups = groups
+        self._time_to_live = time_to_live
+        self._timeout_ms = max(1, int(timeout * 1000))
+
+        self._lock = threading.Lock()
+        self._cache = {}
+
+    def read(self, group_name, attribute_names):
+        """
+        Return a snapshot of attributes across the devices of a group,
+        from the cache if a recent enough snapshot is cached.
+
+        :param group_name: the name of the group, including its
+            subgroups
+        :type group_name: str
+        :param attribute_names: the names of the attributes
+        :type attribute_names: sequence of str
+
+        :return: the snapshot
+        :rtype: :py:class:`.GroupSnapshot`
+
+        :raises KeyError: if there is no such group
+        """
+        key = (group_name, tuple(attribute_names))
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and now < cached[0]:
+                return cached[1]
+
+        snapshot = self._read(self._groups[group_name], key[1])
+        with self._lock:
+            self._cache[key] = (now + self._time_to_live, snapshot)
+        return snapshot
+
+    def invalidate(self, group_name=None):
+        """
+        Discard cached snapshots, so that they are read afresh.
+
+        :param group_name: the name of the group whose snapshots are to
+            be discarded, or None to discard all snapshots
+        :type group_name: str
+        """
+        with self._lock:
+            if group_name is None:
+                self._cache.clear()
+            else:
+                for key in [key for key in self._cache if key[0] == group_name]:
+                    del self._cache[key]
+
+    def _read(self, group, attribute_names):
+        """
+        Helper method that reads a snapshot in a single asynchronous
+        request to every device in a group.
+
+        :param group: the group
+        :type group: :py:class:`tango.Group`
+        :param attribute_names: the names of the attributes
+        :type attribute_names: tuple of str
+
+        :return: the snapshot
+        :rtype: :py:class:`.GroupSnapshot`
+        """
+        read_time = time.time()
+        request_id = group.read_attributes_asynch(list(attribute_names))
+        replies = group.read_attributes_reply(request_id, self._timeout_ms)
+
+        rows = {}
+        data = {}
+        for reply in replies:
+            device_name = reply.dev_name()
+            rows.setdefault(device_name, len(rows))
+            if not reply.has_failed():
+                data[(device_name, reply.obj_name())] = reply.get_data()
+
+        columns = {
+            attribute_name: self._column(
+                [data.get((device_name, attribute_name)) for device_name in rows]
+            )
+            for attribute_name in attribute_names
+        }
+        return GroupSnapshot(np.array(list(rows), dtype=object), columns, read_time)
+
+    @staticmethod
+    def _column(readings):
+        """
+        Helper method that builds a column from the readings of an
+        attribute.
+
+        :param readings: the reading from each device, as a
+            :py:class:`tango.DeviceAttribute`, or None if the read
+            failed
+        :type readings: list
+
+        :return: the column
+        :rtype: :py:class:`.SnapshotColumn`
+        """
+        rows = len(readings)
+        failed = np.fromiter(
+            (reading is None for reading in readings), dtype=bool, count=rows
+        )
+        quality = np.full(rows, -1, dtype=np.int8)
+        timestamp = np.full(rows, np.nan)
+        values = [None] * rows
+        for (row, reading) in enumerate(readings):
+            if reading is not None:
+                values[row] = reading.value
+                quality[row] = int(reading.quality)
+                timestamp[row] = reading.time.totime()
+
+        if not failed.any() and all(np.isscalar(value) for value in values):
+            value = np.array(values)
+        else:
+            value = np.empty(rows, dtype=object)
+            for (row, item) in enumerate(values):
+                value[row] = item
+        return SnapshotColumn(value, quality, timestamp, failed)
@@ -0,0 +1,297 @@
+"""
+This module provides ``HealthRollup``: an engine that rolls up the
+health of a set of subservient devices into a single
+:py:class:`~ska_tango_base.control_model.HealthState`.
+
+The engine keeps the health of each device, and a count of the devices
+in each health state, up to date as it is told of changes; typically by
+change events to which it subscribes. Each change adjusts the counts and
+re-evaluates the rolled-up health from them in constant time, however
+many devices there are, and the callback is called only when the
+rolled-up health changes. The callback is called without the engine's
+lock held, so that it may read the engine's properties, but one call
+at a time, in the order in which the changes were made.
+
+Subscribing to the devices may be done on a background thread, so that
+a device that rolls up the health of many others need not wait for them
+all to be reached before it finishes initialising.
+
+The rolled-up health is:
+
+* FAILED, if more than ``failed_threshold`` devices are FAILED;
+* otherwise DEGRADED, if more than ``degraded_threshold`` devices are
+  FAILED or DEGRADED;
+* otherwise UNKNOWN, if more than ``unknown_threshold`` devices are
+  UNKNOWN;
+* otherwise OK.
+
+With the default thresholds of zero, the rolled-up health is the worst
+health of any device.
+"""
+import functools
+import logging
+import threading
+
+import tango
+
+from ska_tango_base.control_model import HealthState
+from ska_tango_base.utils import get_device_proxy
+
+__all__ = ["HealthRollup"]
+
+module_logger = logging.getLogger(__name__)
+
+
+class HealthRollup:
+    """
+    Engine that rolls up the health of a set of devices.
+    """
+
+    def __init__(
+        self,
+        callback=None,
+        failed_threshold=0,
+        degraded_threshold=0,
+        unknown_threshold=0,
+        logger=None,
+    ):
+        """
+        Initialise a new HealthRollup, with no devices.
+
+        :param callback: callback to be called with the rolled-up health
+            whenever it changes
+        :type callback: callable
+        :param failed_threshold: the rolled-up health is FAILED if more
+            than this many devices are FAILED
+        :type failed_threshold: int
+        :param degraded_threshold: the rolled-up health is DEGRADED if
+            more than this many devices are FAILED or DEGRADED
+        :type degraded_threshold: int
+        :param unknown_threshold: the rolled-up health is UNKNOWN if
+            more than this many devices are UNKNOWN
+        :type unknown_threshold: int
+        :param logger: the logger to be used by this engine. If not
+            provided, then a default module logger will be used.
+        :type logger: a logger that implements the standard library
+            logger interface
+        """
+        self._callback = callback
+        self._failed_threshold = failed_threshold
+        self._degraded_threshold = degraded_threshold
+        self._unknown_threshold = unknown_threshold
+        self._logger = logger or module_logger
+
+        self._lock = threading.Lock()
+        self._delivery_lock = threading.RLock()
+        self._healths = {}
+        self._counts = {health: 0 for health in HealthState}
+        self._health = HealthState.OK
+        self._subscriptions = []
+        self._unsubscribed = threading.Event()
+
+    @property
+    def health(self):
+        """
+        Return the rolled-up health.
+
+        :return: the rolled-up health
+        :rtype: :py:class:`~ska_tango_base.control_model.HealthState`
+        """
+        return self._health
+
+    @property
+    def counts(self):
+        """
+        Return the number of devices in each health state.
+
+        :return: the number of devices, keyed by health state
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def update(self, device_name, health):
+        """
+        Record the health of a device, adding it if it is new.
+
+        :param device_name: the name of the device
+        :type device_name: str
+        :param health: the health of the device
+        :type health: :py:class:`~ska_tango_base.control_model.HealthState`
+        """
+        with self._delivery_lock:
+            with self._lock:
+                old_health = self._healths.get(device_name)
+                if old_health == health:
+                    return
+                if old_health is not None:
+                    self._counts[old_health] -= 1
+                self._counts[health] += 1
+                self._healths[device_name] = health
+                changed = self._evaluate()
+            self._call_callback(changed)
+
+    def remove(self, device_name):
+        """
+        Remove a device, if present.
+
+        :param device_name: the name of the device
+        :type device_name: str
+        """
+        with self._delivery_lock:
+            with self._lock:
+                old_health = self._healths.pop(device_name, None)
+                if old_health is None:
+                    return
+                self._counts[old_health] -= 1
+                changed = self._evaluate()
+            self._call_callback(changed)
+
+    def subscribe(self, device_names, background=False):
+        """
+        Subscribe to change events for the ``healthState`` of devices,
+        and roll up their health as the events arrive. Each device is
+        UNKNOWN until its first event arrives, or while it cannot be
+        reached.
+
+        Subscriptions are stateless, so a device that is not yet running
+        is subscribed to when it starts.
+
+        :param device_names: the names of the devices
+        :type device_names: iterable of str
+        :param background: whether to subscribe on a background thread,
+            and return as soon as the devices have been added as
+            UNKNOWN, rather than once every device has been subscribed
+            to
+        :type background: bool
+        """
+        device_names = list(device_names)
+        for device_name in device_names:
+            self.update(device_name, HealthState.UNKNOWN)
+
+        if not background:
+            self._subscribe_all(device_names, self._unsubscribed)
+            return
+        threading.Thread(
+            target=self._subscribe_all,
+            args=(device_names, self._unsubscribed),
+            name="HealthRollup",
+            daemon=True,
+        ).start()
+
+    def unsubscribe(self):
+        """
+        Unsubscribe from all change events subscribed to by
+        :py:meth:`.subscribe`, including any that a background thread
+        has yet to subscribe to.
+        """
+        with self._lock:
+            self._unsubscribed.set()
+            self._unsubscribed = threading.Event()
+            subscriptions, self._subscriptions = self._subscriptions, []
+        for (proxy, event_id) in subscriptions:
+            try:
+                proxy.unsubscribe_event(event_id)
+            except tango.DevFailed:
+                self._logger.warning(
+                    "Failed to unsubscribe from healthState of %s", proxy.dev_name()
+                )
+
+    def _subscribe_all(self, device_names, unsubscribed):
+        """
+        Helper method that subscribes to change events for the
+        ``healthState`` of devices, stopping early if
+        :py:meth:`.unsubscribe` is called.
+
+        :param device_names: the names of the devices
+        :type device_names: list of str
+        :param unsubscribed: event that is set when
+            :py:meth:`.unsubscribe` is called
+        :type unsubscribed: :py:class:`threading.Event`
+        """
+        for device_name in device_names:
+            if unsubscribed.is_set():
+                return
+            try:
+                proxy = get_device_proxy(device_name)
+                event_id = proxy.subscribe_event(
+                    "healthState",
+                    tango.EventType.CHANGE_EVENT,
+                    functools.partial(self._health_changed, device_name),
+                    stateless=True,
+                )
+            except tango.DevFailed:
+                self._logger.exception(
+                    "Failed to subscribe to healthState of %s", device_name
+                )
+                continue
+
+            with self._lock:
+                if not unsubscribed.is_set():
+                    self._subscriptions.append((proxy, event_id))
+                    continue
+            # unsubscribed while this subscription was being made
+            try:
+                proxy.unsubscribe_event(event_id)
+            except tango.DevFailed:
+                self._logger.warning(
+                    "Failed to unsubscribe from healthState of %s", device_name
+                )
+
+    def _health_changed(self, device_name, event):
+        """
+        Callback for a change event for the ``healthState`` of a device.
+
+        :param device_name: the name of the device
+        :type device_name: str
+        :param event: the change event
+        :type event: :py:class:`tango.EventData`
+        """
+        if event.err or event.attr_value is None:
+            health = HealthState.UNKNOWN
+        else:
+            health = HealthState(event.attr_value.value)
+        self.update(device_name, health)
+
+    def _evaluate(self):
+        """
+        Helper method that re-evaluates the rolled-up health from the
+        counts.
+
+        Must be called with the lock held.
+
+        :return: the new rolled-up health if it has changed, otherwise
+            None
+        :rtype: :py:class:`~ska_tango_base.control_model.HealthState`
+        """
+        counts = self._counts
+        if counts[HealthState.FAILED] > self._failed_threshold:
+            health = HealthState.FAILED
+        elif (
+            counts[HealthState.FAILED] + counts[HealthState.DEGRADED]
+            > self._degraded_threshold
+        ):
+            health = HealthState.DEGRADED
+        elif counts[HealthState.UNKNOWN] > self._unknown_threshold:
+            health = HealthState.UNKNOWN
+        else:
+            health = HealthState.OK
+
+        if health == self._health:
+            return None
+        self._health = health
+        return health
+
+    def _call_callback(self, health):
+        """
+        Helper method that calls the callback with a new rolled-up
+        health, if there is a callback and the health has changed.
+
+        Must be called with the delivery lock held, but not the lock.
+
+        :param health: the new rolled-up health, or None if it has not
+            changed
+        :type health: :py:class:`~ska_tango_base.control_model.HealthState`
+        """
+        if health is not None and self._callback is not None:
+            self._callback(health)
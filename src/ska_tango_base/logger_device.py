@@ -11,14 +11,19 @@ Logging Services and to store logs using Python logging. It configures
 the log levels of remote logging for selected devices.
 """
 # PROTECTED REGION ID(SKALogger.additionnal_import) ENABLED START #
+# Standard imports
+import concurrent.futures
+import json
+
 # Tango imports
-from tango import DebugIt, DeviceProxy, DevFailed
-from tango.server import run, command
+from tango import DebugIt, DevFailed, EnsureOmniThread
+from tango.server import run, command, device_property
 
 # SKA specific imports
 from ska_tango_base import SKABaseDevice
 from ska_tango_base.commands import ResponseCommand, ResultCode
 from ska_tango_base.control_model import LoggingLevel
+from ska_tango_base.utils import get_device_proxy
 
 # PROTECTED REGION END #    //  SKALogger.additionnal_import
 
@@ -37,6 +42,15 @@ class SKALogger(SKABaseDevice):
     # Device Properties
     # -----------------
 
+    SetLoggingLevelMaxWorkers = device_property(dtype="uint16", default_value=1)
+    """
+    Device property.
+
+    Maximum number of devices whose logging level the SetLoggingLevel()
+    command sets in parallel, each on its own worker thread. With the
+    default of 1, devices are set one at a time, in the order given.
+    """
+
     # ----------
     # Attributes
     # ----------
@@ -51,7 +65,12 @@ class SKALogger(SKABaseDevice):
         super().init_command_objects()
         self.register_command_object(
             "SetLoggingLevel",
-            self.SetLoggingLevelCommand(self, self.op_state_model, self.logger),
+            self.SetLoggingLevelCommand(
+                self,
+                self.op_state_model,
+                self.logger,
+                max_workers=self.SetLoggingLevelMaxWorkers,
+            ),
         )
 
     def always_executed_hook(self):
@@ -76,7 +95,7 @@ class SKALogger(SKABaseDevice):
         A class for the SKALoggerDevice's SetLoggingLevel() command.
         """
 
-        def __init__(self, target, state_model, logger=None):
+        def __init__(self, target, state_model, logger=None, max_workers=1):
             """
             Constructor for SetLoggingLevelCommand
 
@@ -92,36 +111,98 @@ class SKALogger(SKABaseDevice):
                 provided, then a default module logger will be used.
             :type logger: a logger that implements the standard library
                 logger interface
+            :param max_workers: the maximum number of devices whose
+                logging level is set in parallel
+            :type max_workers: int
             """
             super().__init__(target, state_model, logger=logger)
+            self._max_workers = max(1, max_workers)
 
         def do(self, argin):
             """
             Stateless hook for SetLoggingLevel() command functionality.
 
-            :return: A tuple containing a return code and a string
-                message indicating status. The message is for
-                information purpose only.
+            :return: A tuple containing a return code and a JSON-encoded
+                dictionary of the outcome for each device: "OK", or a
+                description of the failure. The return code is FAILED if
+                setting the logging level of any device failed.
             :rtype: (ResultCode, str)
             """
             logging_levels = argin[0][:]
             logging_devices = argin[1][:]
-            for level, device in zip(logging_levels, logging_devices):
-                try:
-                    new_level = LoggingLevel(level)
-                    self.logger.info(
-                        "Setting logging level %s for %s", new_level, device
-                    )
-                    dev_proxy = DeviceProxy(device)
-                    dev_proxy.loggingLevel = new_level
-                except DevFailed:
-                    self.logger.exception(
-                        "Failed to set logging level %s for %s", level, device
+            requests = list(zip(logging_levels, logging_devices))
+
+            max_workers = min(self._max_workers, len(requests))
+            if max_workers > 1:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="SetLoggingLevel"
+                ) as pool:
+                    outcomes = list(
+                        pool.map(self._set_logging_level_in_worker, requests)
                     )
+            else:
+                outcomes = [
+                    self._set_logging_level(level, device)
+                    for (level, device) in requests
+                ]
+
+            results = {
+                device: outcome for ((_, device), outcome) in zip(requests, outcomes)
+            }
+            failures = sum(1 for outcome in outcomes if outcome != "OK")
+            if failures:
+                self.logger.warning(
+                    "SetLoggingLevel command failed for %s of %s devices",
+                    failures,
+                    len(requests),
+                )
+                return (ResultCode.FAILED, json.dumps(results))
+
+            self.logger.info("SetLoggingLevel command completed OK")
+            return (ResultCode.OK, json.dumps(results))
+
+        def _set_logging_level_in_worker(self, request):
+            """
+            Helper method that sets the logging level of a device, on a
+            worker thread.
+
+            :param request: the logging level and the device name
+            :type request: (int, str)
+
+            :return: "OK", or a description of the failure
+            :rtype: str
+            """
+            with EnsureOmniThread():
+                return self._set_logging_level(*request)
+
+        def _set_logging_level(self, level, device):
+            """
+            Helper method that sets the logging level of a device.
+
+            :param level: the logging level
+            :type level: int
+            :param device: the name of the device
+            :type device: str
 
-            message = "SetLoggingLevel command completed OK"
-            self.logger.info(message)
-            return (ResultCode.OK, message)
+            :return: "OK", or a description of the failure
+            :rtype: str
+            """
+            try:
+                new_level = LoggingLevel(level)
+            except ValueError:
+                self.logger.error("Invalid logging level %s for %s", level, device)
+                return f"Invalid logging level {level}"
+
+            try:
+                self.logger.info("Setting logging level %s for %s", new_level, device)
+                dev_proxy = get_device_proxy(device)
+                dev_proxy.loggingLevel = new_level
+            except DevFailed as df:
+                self.logger.exception(
+                    "Failed to set logging level %s for %s", level, device
+                )
+                return f"Failed: {df.args[0].desc.strip()}"
+            return "OK"
 
     @command(
         dtype_in="DevVarLongStringArray",
@@ -129,7 +210,8 @@ class SKALogger(SKABaseDevice):
         "(0=OFF, 1=FATAL, 2=ERROR, 3=WARNING, 4=INFO, 5=DEBUG)."
         "Example: [[4, 5], ['my/dev/1', 'my/dev/2']].",
         dtype_out="DevVarLongStringArray",
-        doc_out="(ReturnType, 'informational message')",
+        doc_out="(ReturnType, JSON-encoded outcome for each device, e.g. "
+        '\'{"my/dev/1": "OK"}\')',
     )
     @DebugIt()
     def SetLoggingLevel(self, argin):
@@ -145,6 +227,9 @@ class SKALogger(SKABaseDevice):
             * argin[0]: list of DevLong. Desired logging level.
             * argin[1]: list of DevString. Desired tango device.
 
+            The devices are set in parallel, up to the number given by
+            the SetLoggingLevelMaxWorkers property.
+
         :type argin: :py:class:`tango.DevVarLongStringArray`
 
         :returns: None.
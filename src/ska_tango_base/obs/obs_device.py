@@ -112,8 +112,7 @@ class SKAObsDevice(SKABaseDevice):
         :type obs_state: :py:class:`~ska_tango_base.control_model.ObsState`
         """
         self._obs_state = obs_state
-        self.push_change_event("obsState", obs_state)
-        self.push_archive_event("obsState", obs_state)
+        self._publish_event("obsState", obs_state)
 
     def always_executed_hook(self):
         # PROTECTED REGION ID(SKAObsDevice.always_executed_hook) ENABLED START #
@@ -5,15 +5,16 @@ which drives a state machine to manage device "obs state", represented
 by the :py:class:`ska_tango_base.control_model.ObsState` enum, and
 published by Tango devices via the ``obsState`` attribute.
 """
+from ska_tango_base.batching import BatchedActionsMixin
 from ska_tango_base.control_model import ObsState
 from ska_tango_base.faults import StateModelError
-from ska_tango_base.utils import for_testing_only
+from ska_tango_base.utils import compile_trigger_table, for_testing_only
 
 
 __all__ = ["ObsStateModel"]
 
 
-class ObsStateModel:
+class ObsStateModel(BatchedActionsMixin):
     """
     This class implements the state model for observation state
     ("obsState").
@@ -25,6 +26,8 @@ class ObsStateModel:
     are not determined in advance.
     """
 
+    _batched_attribute = "obs_state"
+
     def __init__(
         self,
         state_machine_factory,
@@ -48,10 +51,12 @@ class ObsStateModel:
 
         self._obs_state = None
         self._callback = callback
+        self._init_batching()
 
         self._obs_state_machine = state_machine_factory(
             callback=self._obs_state_changed
         )
+        self._allowed_actions = compile_trigger_table(self._obs_state_machine)
 
     @property
     def obs_state(self):
@@ -76,8 +81,7 @@ class ObsStateModel:
         obs_state = ObsState[machine_state]
         if self._obs_state != obs_state:
             self._obs_state = obs_state
-            if self._callback is not None:
-                self._callback(obs_state)
+            self._call_callback(obs_state)
 
     def is_action_allowed(self, action, raise_if_disallowed=False):
         """
@@ -97,9 +101,7 @@ class ObsStateModel:
         :return: whether the action is allowed in the current state
         :rtype: bool
         """
-        if action in self._obs_state_machine.get_triggers(
-            self._obs_state_machine.state
-        ):
+        if action in self._allowed_actions[self._obs_state_machine.state]:
             return True
 
         if raise_if_disallowed:
@@ -115,8 +117,9 @@ class ObsStateModel:
         :param action: an action, as given in the transitions table
         :type action: ANY
         """
-        _ = self.is_action_allowed(action, raise_if_disallowed=True)
-        self._obs_state_machine.trigger(action)
+        with self._batch_lock:
+            _ = self.is_action_allowed(action, raise_if_disallowed=True)
+            self._obs_state_machine.trigger(action)
 
     @for_testing_only
     def _straight_to_state(self, obs_state_name):
@@ -0,0 +1,226 @@
+"""
+This module provides ``ResourceRegistry``: an in-process index of which
+owner, such as a subarray, each resource is assigned to.
+
+The registry is a hash index from resource ID to owner, together with
+the set of resources held by each owner. Claims are compare-and-set:
+all of the requested resources are checked and claimed under a single
+lock, so that claiming k resources costs O(k), and either all of them
+are claimed or, if any is already held by another owner, none are.
+Looking up the owner of a resource costs a dictionary lookup, without
+querying any device.
+
+A process-wide registry, ``resource_registry``, is provided for the
+subarrays in a device server to share.
+"""
+import threading
+
+from ska_tango_base.faults import ResourceConflictError
+
+__all__ = ["ResourceRegistry", "resource_registry"]
+
+
+class ResourceRegistry:
+    """
+    An index of which owner each resource is assigned to.
+    """
+
+    def __init__(self):
+        """
+        Initialise a new, empty ResourceRegistry.
+        """
+        self._lock = threading.Lock()
+        self._owners = {}
+        self._resources = {}
+
+    def __len__(self):
+        """
+        Return the number of resources in this registry.
+
+        :return: the number of resources assigned to any owner
+        :rtype: int
+        """
+        return len(self._owners)
+
+    def __contains__(self, resource):
+        """
+        Return whether a resource is assigned to any owner.
+
+        :param resource: the resource ID
+        :type resource: str
+
+        :return: whether the resource is assigned
+        :rtype: bool
+        """
+        return resource in self._owners
+
+    def owner_of(self, resource):
+        """
+        Return the owner of a resource.
+
+        :param resource: the resource ID
+        :type resource: str
+
+        :return: the owner of the resource, or None if it is not
+            assigned
+        """
+        return self._owners.get(resource)
+
+    def owners_of(self, resources):
+        """
+        Return the owners of some resources.
+
+        :param resources: the resource IDs
+        :type resources: iterable of str
+
+        :return: the owner of each assigned resource, keyed by resource;
+            resources that are not assigned are omitted
+        :rtype: dict
+        """
+        owners = self._owners
+        with self._lock:
+            return {
+                resource: owners[resource]
+                for resource in resources
+                if resource in owners
+            }
+
+    def resources_of(self, owner):
+        """
+        Return the resources assigned to an owner.
+
+        :param owner: the owner
+
+        :return: the resources assigned to the owner
+        :rtype: frozenset of str
+        """
+        with self._lock:
+            return frozenset(self._resources.get(owner, ()))
+
+    def compare_and_set(self, resource, expected, owner):
+        """
+        Set the owner of a resource, but only if its current owner is
+        as expected.
+
+        :param resource: the resource ID
+        :type resource: str
+        :param expected: the expected current owner, or None if the
+            resource is expected not to be assigned
+        :param owner: the new owner, or None to unassign the resource
+
+        :return: whether the owner was set
+        :rtype: bool
+        """
+        with self._lock:
+            if self._owners.get(resource) != expected:
+                return False
+            self._set(resource, expected, owner)
+            return True
+
+    def claim(self, owner, resources):
+        """
+        Assign some resources to an owner.
+
+        All of the resources are claimed, or none are. Claiming a
+        resource that is already assigned to the owner does nothing.
+
+        :param owner: the owner
+        :param resources: the resource IDs
+        :type resources: iterable of str
+
+        :return: the resources newly assigned to the owner
+        :rtype: tuple of str
+
+        :raises ResourceConflictError: if any of the resources is
+            assigned to another owner
+        :raises ValueError: if the owner is None
+        """
+        if owner is None:
+            raise ValueError("Resources cannot be claimed without an owner.")
+        resources = set(resources)
+        with self._lock:
+            owners = self._owners
+            conflicts = {
+                resource: owners[resource]
+                for resource in resources
+                if owners.get(resource, owner) != owner
+            }
+            if conflicts:
+                raise ResourceConflictError(
+                    f"Resources already assigned elsewhere: {conflicts}", conflicts
+                )
+            claimed = tuple(
+                sorted(
+                    (resource for resource in resources if resource not in owners),
+                    key=str,
+                )
+            )
+            for resource in claimed:
+                self._set(resource, None, owner)
+        return claimed
+
+    def release(self, owner, resources):
+        """
+        Release some resources from an owner.
+
+        Releasing a resource that is not assigned to the owner does
+        nothing.
+
+        :param owner: the owner
+        :param resources: the resource IDs
+        :type resources: iterable of str
+
+        :return: the resources released
+        :rtype: tuple of str
+        """
+        with self._lock:
+            held = self._resources.get(owner, set())
+            released = tuple(sorted(set(resources) & held, key=str))
+            for resource in released:
+                self._set(resource, owner, None)
+        return released
+
+    def release_all(self, owner):
+        """
+        Release all resources from an owner.
+
+        :param owner: the owner
+
+        :return: the resources released
+        :rtype: tuple of str
+        """
+        with self._lock:
+            released = tuple(sorted(self._resources.pop(owner, ()), key=str))
+            for resource in released:
+                del self._owners[resource]
+        return released
+
+    def _set(self, resource, current, owner):
+        """
+        Helper method that moves a resource from its current owner to
+        a new owner.
+
+        Must be called with the lock held.
+
+        :param resource: the resource ID
+        :type resource: str
+        :param current: the current owner, or None if the resource is
+            not assigned
+        :param owner: the new owner, or None to unassign the resource
+        """
+        if current is not None:
+            held = self._resources[current]
+            held.discard(resource)
+            if not held:
+                del self._resources[current]
+            del self._owners[resource]
+        if owner is not None:
+            self._owners[resource] = owner
+            self._resources.setdefault(owner, set()).add(resource)
+
+
+resource_registry = ResourceRegistry()
+"""
+The process-wide registry of resource owners, shared by the subarrays in
+a device server.
+"""
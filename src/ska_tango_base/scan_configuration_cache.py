@@ -0,0 +1,216 @@
+"""
+This module provides ``ScanConfigurationCache``: a bounded,
+content-addressed cache of scan configurations.
+
+Each configuration is keyed by the SHA-256 hash of its text. Adding a
+configuration that is already cached returns the cached string, so that
+a configuration repeated many times, by one device or by several in the
+same device server, is held in memory once. The cache holds the most
+recently used configurations, evicting the least recently used when it
+is full, so that a recent configuration can be retrieved again by its
+hash; for example, by the ``ConfigureScanByHash`` command of the CSP
+devices.
+
+A process-wide cache, ``scan_configuration_cache``, is provided for the
+devices in a device server to share.
+
+This module also provides ``PreloadedConfigurations``: a bounded store
+of configurations that have already been decoded and validated, keyed
+by configuration ID, so that a device can apply a preloaded
+configuration by its ID without receiving or parsing it again.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+__all__ = [
+    "PreloadedConfigurations",
+    "ScanConfigurationCache",
+    "scan_configuration_cache",
+]
+
+
+class ScanConfigurationCache:
+    """
+    A bounded cache of scan configurations, keyed by hash.
+    """
+
+    def __init__(self, max_entries=32):
+        """
+        Initialise a new, empty ScanConfigurationCache.
+
+        :param max_entries: the maximum number of configurations to hold
+        :type max_entries: int
+        """
+        self._max_entries = max_entries
+        self._configurations = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Return the number of configurations in this cache.
+
+        :return: the number of configurations
+        :rtype: int
+        """
+        return len(self._configurations)
+
+    def __contains__(self, config_hash):
+        """
+        Return whether a configuration with a given hash is cached.
+
+        :param config_hash: the configuration hash
+        :type config_hash: str
+
+        :return: whether the configuration is cached
+        :rtype: bool
+        """
+        return config_hash in self._configurations
+
+    @staticmethod
+    def hash_of(configuration):
+        """
+        Return the hash of a configuration.
+
+        :param configuration: the configuration
+        :type configuration: str
+
+        :return: the hex-encoded SHA-256 hash of the configuration
+        :rtype: str
+        """
+        return hashlib.sha256(configuration.encode()).hexdigest()
+
+    def add(self, configuration):
+        """
+        Add a configuration to this cache, unless it is already cached.
+
+        :param configuration: the configuration
+        :type configuration: str
+
+        :return: the hash of the configuration, and the cached
+            configuration, which is the configuration that was already
+            cached, if any, rather than the one given
+        :rtype: (str, str)
+        """
+        config_hash = self.hash_of(configuration)
+        with self._lock:
+            cached = self._configurations.get(config_hash)
+            if cached is None:
+                cached = configuration
+                self._configurations[config_hash] = cached
+                while len(self._configurations) > self._max_entries:
+                    self._configurations.popitem(last=False)
+            else:
+                self._configurations.move_to_end(config_hash)
+        return (config_hash, cached)
+
+    def get(self, config_hash):
+        """
+        Return the configuration with a given hash.
+
+        :param config_hash: the configuration hash
+        :type config_hash: str
+
+        :return: the configuration, or None if it is not cached
+        :rtype: str
+        """
+        with self._lock:
+            configuration = self._configurations.get(config_hash)
+            if configuration is not None:
+                self._configurations.move_to_end(config_hash)
+            return configuration
+
+    def clear(self):
+        """
+        Remove all configurations from this cache.
+        """
+        with self._lock:
+            self._configurations.clear()
+
+
+class PreloadedConfigurations:
+    """
+    A bounded store of decoded and validated configurations, keyed by
+    configuration ID.
+    """
+
+    def __init__(self, max_entries=16):
+        """
+        Initialise a new, empty PreloadedConfigurations.
+
+        :param max_entries: the maximum number of configurations to
+            hold; when it is exceeded, the least recently used
+            configuration is evicted
+        :type max_entries: int
+        """
+        self._max_entries = max_entries
+        self._configurations = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Return the number of configurations in this store.
+
+        :return: the number of configurations
+        :rtype: int
+        """
+        return len(self._configurations)
+
+    def __contains__(self, config_id):
+        """
+        Return whether a configuration with a given ID is preloaded.
+
+        :param config_id: the configuration ID
+        :type config_id: str
+
+        :return: whether the configuration is preloaded
+        :rtype: bool
+        """
+        return config_id in self._configurations
+
+    def store(self, config_id, config_hash, configuration, decoded):
+        """
+        Store a configuration, replacing any with the same ID.
+
+        The decoded configuration is shared by every use of it, so it
+        must not be modified.
+
+        :param config_id: the configuration ID
+        :type config_id: str
+        :param config_hash: the hash of the configuration
+        :type config_hash: str
+        :param configuration: the configuration
+        :type configuration: str
+        :param decoded: the decoded and validated configuration
+        :type decoded: dict
+        """
+        with self._lock:
+            self._configurations[config_id] = (config_hash, configuration, decoded)
+            self._configurations.move_to_end(config_id)
+            while len(self._configurations) > self._max_entries:
+                self._configurations.popitem(last=False)
+
+    def get(self, config_id):
+        """
+        Return the configuration with a given ID.
+
+        :param config_id: the configuration ID
+        :type config_id: str
+
+        :return: the hash of the configuration, the configuration, and
+            the decoded configuration; or None if no configuration with
+            the ID is preloaded
+        :rtype: (str, str, dict)
+        """
+        with self._lock:
+            preloaded = self._configurations.get(config_id)
+            if preloaded is not None:
+                self._configurations.move_to_end(config_id)
+            return preloaded
+
+
+scan_configuration_cache = ScanConfigurationCache()
+"""
+The process-wide cache of scan configurations, shared by the devices in
+a device server.
+"""
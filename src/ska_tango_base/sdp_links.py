@@ -0,0 +1,363 @@
+"""
+This module provides ``SdpLinks``: the state of a CSP device's links to
+SDP, held in NumPy arrays.
+
+Whether each link is active is held in a boolean array, and the SDP
+destination addresses are held in a structured array of host, MAC and
+port, so that updating some links costs in proportion to the number
+updated, rather than to the number of links. Host names are held as
+references to interned strings, rather than in a fixed-width field
+wide enough for the longest allowed host name, so that a link costs a
+pointer for its host, and links to the same host share one string. Every update reports the
+indices that changed, so that a device can publish only those. The
+serialised forms of the addresses, as reported by the
+``sdpDestinationAddresses`` attributes, are cached, and rebuilt only
+after a change.
+
+Addresses are exchanged as a dictionary of equal-length lists, as in
+the ``sdpDestinationAddresses`` attributes::
+
+    {
+        "outputHost": ["10.0.0.1", "10.0.0.2"],
+        "outputMac": ["06:00:00:00:00:01", "06:00:00:00:00:02"],
+        "outputPort": [9000, 9001],
+    }
+"""
+
+import json
+import sys
+import threading
+
+import numpy as np
+
+from ska_tango_base.argument_codec import dumps_encoded, loads
+
+__all__ = [
+    "ADDRESS_DTYPE",
+    "MAX_HOST_LENGTH",
+    "MAX_MAC_LENGTH",
+    "MAX_PORT",
+    "MAX_SDP_LINKS",
+    "SdpLinks",
+]
+
+
+MAX_SDP_LINKS = 65536
+"""The maximum number of SDP links that a device can report."""
+
+MAX_HOST_LENGTH = 255
+"""The maximum length of an SDP destination host name."""
+
+MAX_MAC_LENGTH = 17
+"""The maximum length of an SDP destination MAC address."""
+
+MAX_PORT = 65535
+"""The highest SDP destination port number."""
+
+ADDRESS_DTYPE = np.dtype(
+    [
+        ("host", object),
+        ("mac", f"U{MAX_MAC_LENGTH}"),
+        ("port", np.int32),
+    ]
+)
+"""
+The NumPy data type of an SDP destination address. The host is a
+Python string.
+"""
+
+
+class SdpLinks:
+    """
+    The activity and destination addresses of a device's SDP links.
+    """
+
+    def __init__(self, num_links=1):
+        """
+        Initialise a new SdpLinks, with all links inactive and no
+        destination addresses.
+
+        :param num_links: the number of SDP links
+        :type num_links: int
+
+        :raises ValueError: if the number of links is more than
+            :py:data:`.MAX_SDP_LINKS`
+        """
+        if num_links > MAX_SDP_LINKS:
+            raise ValueError(
+                f"Number of SDP links {num_links} exceeds maximum {MAX_SDP_LINKS}"
+            )
+        self._active = np.zeros(num_links, dtype=bool)
+        self._addresses = np.zeros(0, dtype=ADDRESS_DTYPE)
+
+        self._lock = threading.Lock()
+        self._addresses_json = None
+        self._addresses_encoded = None
+
+    @property
+    def num_links(self):
+        """
+        Return the number of SDP links.
+
+        :return: the number of SDP links
+        :rtype: int
+        """
+        return len(self._active)
+
+    @property
+    def active(self):
+        """
+        Return whether each SDP link is active.
+
+        :return: a read-only array of whether each link is active
+        :rtype: :py:class:`numpy.ndarray`
+        """
+        active = self._active.view()
+        active.flags.writeable = False
+        return active
+
+    def set_active(self, indices, values):
+        """
+        Set whether some SDP links are active.
+
+        :param indices: the indices of the links
+        :type indices: sequence of int
+        :param values: whether each link is active, or a single value
+            for all of them
+        :type values: sequence of bool, or bool
+
+        :return: the indices of the links that changed, sorted
+        :rtype: :py:class:`numpy.ndarray`
+
+        :raises IndexError: if any index is out of range, including
+            any negative index
+        """
+        with self._lock:
+            indices = self._checked_indices(indices, len(self._active))
+            before = self._active[indices]
+            self._active[indices] = values
+            return np.unique(indices[before != self._active[indices]])
+
+    @property
+    def addresses(self):
+        """
+        Return the SDP destination addresses.
+
+        :return: a read-only structured array of host, MAC and port
+        :rtype: :py:class:`numpy.ndarray`
+        """
+        addresses = self._addresses.view()
+        addresses.flags.writeable = False
+        return addresses
+
+    @property
+    def addresses_json(self):
+        """
+        Return the SDP destination addresses, as JSON.
+
+        :return: the addresses, as a JSON-encoded dictionary of lists
+        :rtype: str
+        """
+        with self._lock:
+            if self._addresses_json is None:
+                self._addresses_json = json.dumps(self._to_dict(self._addresses))
+            return self._addresses_json
+
+    @property
+    def addresses_encoded(self):
+        """
+        Return the SDP destination addresses, in the most compact
+        ``DevEncoded`` encoding available.
+
+        :return: the encoding name, and the encoded addresses
+        :rtype: (str, bytes)
+        """
+        with self._lock:
+            if self._addresses_encoded is None:
+                self._addresses_encoded = dumps_encoded(self._to_dict(self._addresses))
+            return self._addresses_encoded
+
+    def set_addresses(self, addresses):
+        """
+        Replace all of the SDP destination addresses.
+
+        :param addresses: the addresses, as a dictionary of
+            equal-length "outputHost", "outputMac" and "outputPort"
+            lists, or a JSON encoding of one
+        :type addresses: dict or str
+
+        :return: the indices of the addresses that changed, sorted,
+            including the indices of any addresses removed
+        :rtype: :py:class:`numpy.ndarray`
+
+        :raises ValueError: if the addresses are malformed, or any host
+            or MAC address is too long, or any port is out of range
+        """
+        if isinstance(addresses, str):
+            addresses = loads(addresses)
+        new = self._from_dict(addresses)
+
+        with self._lock:
+            old = self._addresses
+            common = min(len(old), len(new))
+            changed = np.concatenate(
+                [
+                    np.flatnonzero(old[:common] != new[:common]),
+                    np.arange(common, max(len(old), len(new))),
+                ]
+            )
+            if len(changed):
+                self._addresses = new
+                self._addresses_json = None
+                self._addresses_encoded = None
+            return changed
+
+    def update_addresses(self, indices, addresses):
+        """
+        Update some of the SDP destination addresses.
+
+        :param indices: the indices of the addresses
+        :type indices: sequence of int
+        :param addresses: the new addresses, as a dictionary of
+            "outputHost", "outputMac" and "outputPort" lists, each the
+            same length as ``indices``
+        :type addresses: dict
+
+        :return: the indices of the addresses that changed, sorted
+        :rtype: :py:class:`numpy.ndarray`
+
+        :raises IndexError: if any index is out of range, including
+            any negative index
+        :raises ValueError: if the addresses are malformed, or any host
+            or MAC address is too long, or any port is out of range
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        new = self._from_dict(addresses)
+        if len(new) != len(indices):
+            raise ValueError(f"Expected {len(indices)} addresses, got {len(new)}")
+
+        with self._lock:
+            indices = self._checked_indices(indices, len(self._addresses))
+            before = self._addresses[indices]
+            self._addresses[indices] = new
+            changed = np.unique(indices[before != self._addresses[indices]])
+            if len(changed):
+                self._addresses_json = None
+                self._addresses_encoded = None
+            return changed
+
+    def addresses_delta(self, indices):
+        """
+        Return some of the SDP destination addresses, for publishing a
+        change to them.
+
+        :param indices: the indices of the addresses
+        :type indices: sequence of int
+
+        :return: the number of addresses, the indices, and the
+            addresses at those indices as lists
+        :rtype: dict
+        """
+        with self._lock:
+            addresses = self._addresses
+            indices = np.asarray(indices, dtype=np.intp)
+            indices = indices[indices < len(addresses)]
+            delta = {"length": len(addresses), "indices": indices.tolist()}
+            delta.update(self._to_dict(addresses[indices]))
+            return delta
+
+    @staticmethod
+    def _checked_indices(indices, length):
+        """
+        Helper method that converts indices to an array, and checks that
+        they are in range. Negative indices are rejected, rather than
+        counted from the end, so that the indices reported as changed
+        are the indices given.
+
+        :param indices: the indices
+        :type indices: sequence of int
+        :param length: the length of the array that they index
+        :type length: int
+
+        :return: the indices
+        :rtype: :py:class:`numpy.ndarray`
+
+        :raises IndexError: if any index is out of range
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        if len(indices) and (indices.min() < 0 or indices.max() >= length):
+            raise IndexError(f"SDP link index out of range 0 to {length - 1}")
+        return indices
+
+    @staticmethod
+    def _from_dict(addresses):
+        """
+        Helper method that converts addresses from a dictionary of
+        lists to a structured array.
+
+        :param addresses: the addresses, as a dictionary of
+            equal-length "outputHost", "outputMac" and "outputPort"
+            lists
+        :type addresses: dict
+
+        :return: the addresses
+        :rtype: :py:class:`numpy.ndarray`
+
+        :raises ValueError: if the addresses are malformed, or any host
+            or MAC address is too long, or any port is out of range
+        """
+        try:
+            hosts = np.asarray(addresses["outputHost"], dtype=object)
+            macs = np.asarray(addresses["outputMac"], dtype=np.str_)
+            ports = np.asarray(addresses["outputPort"])
+        except (KeyError, TypeError) as error:
+            raise ValueError(f"Malformed SDP destination addresses: {error}") from error
+        if not hosts.ndim == macs.ndim == ports.ndim == 1:
+            raise ValueError("Malformed SDP destination addresses: expected lists")
+        if not len(hosts) == len(macs) == len(ports):
+            raise ValueError(
+                "SDP destination addresses have unequal numbers of hosts, MACs and "
+                "ports"
+            )
+
+        hosts = [sys.intern(str(host)) for host in hosts.tolist()]
+        if max(map(len, hosts), default=0) > MAX_HOST_LENGTH:
+            raise ValueError(
+                f"SDP destination host longer than {MAX_HOST_LENGTH} characters"
+            )
+        # a string array is as wide as its longest element, so this
+        # check need not look at each element
+        if macs.dtype.itemsize // np.dtype("U1").itemsize > MAX_MAC_LENGTH:
+            raise ValueError(
+                f"SDP destination MAC longer than {MAX_MAC_LENGTH} characters"
+            )
+        if len(ports):
+            if ports.dtype.kind not in "iu":
+                raise ValueError("SDP destination ports must be integers")
+            if ports.min() < 0 or ports.max() > MAX_PORT:
+                raise ValueError(f"SDP destination port out of range 0 to {MAX_PORT}")
+
+        new = np.empty(len(hosts), dtype=ADDRESS_DTYPE)
+        new["host"] = hosts
+        new["mac"] = macs
+        new["port"] = ports
+        return new
+
+    @staticmethod
+    def _to_dict(addresses):
+        """
+        Helper method that converts addresses from a structured array
+        to a dictionary of lists.
+
+        :param addresses: the addresses
+        :type addresses: :py:class:`numpy.ndarray`
+
+        :return: the addresses, as a dictionary of "outputHost",
+            "outputMac" and "outputPort" lists
+        :rtype: dict
+        """
+        return {
+            "outputHost": addresses["host"].tolist(),
+            "outputMac": addresses["mac"].tolist(),
+            "outputPort": addresses["port"].tolist(),
+        }
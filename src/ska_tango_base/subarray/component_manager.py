@@ -26,6 +26,7 @@ class SubarrayComponentManager(BaseComponentManager):
         :param obs_state_model: the obs state model used by this component manager
         """
         self.obs_state_model = obs_state_model
+        self._resources_changed_callback = None
 
         super().__init__(op_state_model)
 
@@ -132,6 +133,29 @@ class SubarrayComponentManager(BaseComponentManager):
         else:
             self.obs_state_model.perform_action("component_unresourced")
 
+    def set_resources_changed_callback(self, callback):
+        """
+        Set the callback to be called with the resources added and
+        removed whenever the assigned resources change.
+
+        :param callback: the callback, or None for no callback
+        :type callback: callable
+        """
+        self._resources_changed_callback = callback
+
+    def component_resources_changed(self, added, removed):
+        """
+        Callback hook, called when resources are assigned to or
+        released from the component
+
+        :param added: the resources assigned
+        :type added: tuple of str
+        :param removed: the resources released
+        :type removed: tuple of str
+        """
+        if self._resources_changed_callback is not None:
+            self._resources_changed_callback(added, removed)
+
     def component_configured(self, configured):
         """
         Callback hook, called when whether the component is configured
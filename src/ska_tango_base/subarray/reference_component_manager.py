@@ -2,6 +2,7 @@
 This module models component management for SKA subarray devices.
 """
 import functools
+import threading
 
 from ska_tango_base.subarray import SubarrayComponentManager
 from ska_tango_base.base import (
@@ -63,20 +64,33 @@ class ReferenceSubarrayComponentManager(
 
     class _ResourcePool:
         """
-        A simple class for managing subarray resources
+        A simple class for managing subarray resources.
+
+        The pool keeps a sorted, immutable snapshot of its resources,
+        which is built only when first requested after a change, so that
+        reading the resources does not copy or sort them each time.
+        Resources are sorted by their string form, so they need not be
+        orderable.
         """
 
-        def __init__(self, callback=None):
+        def __init__(self, callback=None, delta_callback=None):
             """
             Initialise a new instance
 
             :param callback: callback to call when the resource pool
                 goes from empty to non-empty or vice-versa
+            :param delta_callback: callback to call with the resources
+                added and removed, as sorted tuples, whenever the
+                resource pool changes
             """
+            self._lock = threading.Lock()
             self._resources = set()
+            self._frozen = frozenset()
+            self._snapshot = ()
 
             self._nonempty = False
             self._callback = callback
+            self._delta_callback = delta_callback
 
         def __len__(self):
             """
@@ -94,36 +108,91 @@ class ReferenceSubarrayComponentManager(
             Assign some resources
 
             :param resources: resources to be assigned
-            :type resources: set(str)
+            :type resources: iterable(str)
+
+            :return: the resources added, and the resources removed
+            :rtype: (tuple(str), tuple(str))
             """
-            self._resources |= set(resources)
-            self._update()
+            return self.update(assign=resources)
 
         def release(self, resources):
             """
             Release some resources
 
             :param resources: resources to be released
-            :type resources: set(str)
+            :type resources: iterable(str)
+
+            :return: the resources added, and the resources removed
+            :rtype: (tuple(str), tuple(str))
             """
-            self._resources -= set(resources)
-            self._update()
+            return self.update(release=resources)
 
         def release_all(self):
             """
             Release all resources
+
+            :return: the resources added, and the resources removed
+            :rtype: (tuple(str), tuple(str))
             """
-            self._resources.clear()
-            self._update()
+            with self._lock:
+                delta = self._apply(set(), set(self._resources))
+            self._notify(delta)
+            return delta
+
+        def update(self, assign=(), release=()):
+            """
+            Assign and release resources in a single batch.
+
+            The whole batch is validated before any change is made: if
+            it is invalid, then no resources are assigned or released.
+            Releasing a resource that is not assigned does nothing.
+
+            :param assign: resources to be assigned
+            :type assign: iterable(str)
+            :param release: resources to be released
+            :type release: iterable(str)
+
+            :return: the resources added, and the resources removed
+            :rtype: (tuple(str), tuple(str))
+
+            :raises ValueError: if any resource is both assigned and
+                released
+            """
+            assign = set(assign)
+            release = set(release)
+            both = assign & release
+            if both:
+                raise ValueError(f"Resources both assigned and released: {list(both)}")
+
+            with self._lock:
+                delta = self._apply(assign - self._resources, release & self._resources)
+            self._notify(delta)
+            return delta
 
         def get(self):
             """
             Get current resources
 
             :return: current resources.
-            :rtype: set(str)
+            :rtype: frozenset(str)
+            """
+            with self._lock:
+                if self._frozen is None:
+                    self._frozen = frozenset(self._resources)
+                return self._frozen
+
+        @property
+        def snapshot(self):
             """
-            return set(self._resources)
+            Get current resources, sorted
+
+            :return: current resources, sorted
+            :rtype: tuple(str)
+            """
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = tuple(sorted(self._resources, key=str))
+                return self._snapshot
 
         def check(self, resources):
             """
@@ -139,6 +208,51 @@ class ReferenceSubarrayComponentManager(
             """
             return resources in self._resources
 
+        def _apply(self, added, removed):
+            """
+            Helper method that adds and removes resources.
+
+            Must be called with the lock held.
+
+            :param added: resources to be added, none of which are
+                already in this pool
+            :type added: set(str)
+            :param removed: resources to be removed, all of which are
+                in this pool
+            :type removed: set(str)
+
+            :return: the resources added, and the resources removed;
+                each sorted if there is a delta callback
+            :rtype: (tuple(str), tuple(str))
+            """
+            if not added and not removed:
+                return ((), ())
+
+            self._resources -= removed
+            self._resources |= added
+            self._frozen = None
+            self._snapshot = None
+            if self._delta_callback is None:
+                return (tuple(added), tuple(removed))
+            return (tuple(sorted(added, key=str)), tuple(sorted(removed, key=str)))
+
+        def _notify(self, delta):
+            """
+            Helper method that calls the callbacks for a change, if
+            anything changed.
+
+            Must be called without the lock held, so that the callbacks
+            may read this pool.
+
+            :param delta: the resources added, and the resources removed
+            :type delta: (tuple(str), tuple(str))
+            """
+            if not any(delta):
+                return
+            self._update()
+            if self._delta_callback is not None:
+                self._delta_callback(*delta)
+
         def _update(self):
             nonempty = bool(len(self))
             if self._nonempty != nonempty:
@@ -432,6 +546,8 @@ class ReferenceSubarrayComponentManager(
         obs_state_model,
         capability_types,
         logger=None,
+        resource_registry=None,
+        resource_owner=None,
         _component=None,
     ):
         """
@@ -444,11 +560,32 @@ class ReferenceSubarrayComponentManager(
         :param capability_types: types of capability supported by this
             component manager
         :param logger: a logger for this component manager
+        :param resource_registry: an optional registry of resource
+            owners, shared with other subarrays, in which resources are
+            claimed before they are assigned, so that no resource is
+            assigned to two subarrays at once; for example,
+            :py:data:`ska_tango_base.resource_registry.resource_registry`
+        :type resource_registry:
+            :py:class:`ska_tango_base.resource_registry.ResourceRegistry`
+        :param resource_owner: the owner under which this component
+            manager claims resources in the registry; for example, the
+            subarray device name. Required if a resource registry is
+            given.
         :param _component: allows setting of the component to be
             managed; for testing purposes only
+
+        :raises ValueError: if a resource registry is given without a
+            resource owner
         """
+        if resource_registry is not None and resource_owner is None:
+            raise ValueError("A resource registry requires a resource owner.")
+
         self.obs_state_model = obs_state_model
-        self._resource_pool = self._ResourcePool(self.component_resourced)
+        self._resource_registry = resource_registry
+        self._resource_owner = resource_owner
+        self._resource_pool = self._ResourcePool(
+            self.component_resourced, self.component_resources_changed
+        )
 
         super().__init__(
             op_state_model,
@@ -518,9 +655,21 @@ class ReferenceSubarrayComponentManager(
 
         :param resources: resources to be assigned
         :type resources: list(str)
+
+        :raises ResourceConflictError: if any of the resources is
+            assigned to another subarray in the resource registry
         """
         self.logger.info("Assigning resources to component")
-        self._resource_pool.assign(resources)
+        if self._resource_registry is None:
+            self._resource_pool.assign(resources)
+            return
+
+        claimed = self._resource_registry.claim(self._resource_owner, resources)
+        try:
+            self._resource_pool.assign(resources)
+        except Exception:
+            self._resource_registry.release(self._resource_owner, claimed)
+            raise
 
     @check_communicating
     def release(self, resources):
@@ -531,7 +680,8 @@ class ReferenceSubarrayComponentManager(
         :type resources: list(str)
         """
         self.logger.info("Releasing resources in component")
-        self._resource_pool.release(resources)
+        (_, released) = self._resource_pool.release(resources)
+        self._release_from_registry(released)
 
     @check_communicating
     def release_all(self):
@@ -539,7 +689,8 @@ class ReferenceSubarrayComponentManager(
         Release all resources
         """
         self.logger.info("Releasing all resources in component")
-        self._resource_pool.release_all()
+        (_, released) = self._resource_pool.release_all()
+        self._release_from_registry(released)
 
     @check_communicating
     def configure(self, configuration):
@@ -604,7 +755,28 @@ class ReferenceSubarrayComponentManager(
         self.logger.info("Restarting component")
         if self._component.configured:
             self._component.deconfigure()
-        self._resource_pool.release_all()
+        (_, released) = self._resource_pool.release_all()
+        self._release_from_registry(released)
+
+    def teardown(self):
+        """
+        Release all resources claimed by this component manager in the
+        resource registry, so that other subarrays may claim them once
+        this component manager is discarded.
+        """
+        if self._resource_registry is not None:
+            self._resource_registry.release_all(self._resource_owner)
+
+    def _release_from_registry(self, resources):
+        """
+        Helper method that releases resources from the resource
+        registry, if there is one.
+
+        :param resources: the resources released from the component
+        :type resources: tuple(str)
+        """
+        if self._resource_registry is not None:
+            self._resource_registry.release(self._resource_owner, resources)
 
     @property
     @check_communicating
@@ -615,7 +787,7 @@ class ReferenceSubarrayComponentManager(
         :return: the resources assigned to the component
         :rtype: list of str
         """
-        return sorted(self._resource_pool.get())
+        return list(self._resource_pool.snapshot)
 
     @property
     @check_communicating
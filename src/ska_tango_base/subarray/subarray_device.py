@@ -19,12 +19,14 @@ from tango.server import device_property
 
 # SKA specific imports
 from ska_tango_base import SKAObsDevice
+from ska_tango_base.argument_codec import JsonArgumentCodec
 from ska_tango_base.commands import (
     CompletionCommand,
     ObservationCommand,
     ResponseCommand,
     ResultCode,
 )
+from ska_tango_base.faults import ResourceConflictError
 from ska_tango_base.subarray import SubarrayComponentManager, SubarrayObsStateModel
 
 # PROTECTED REGION END #    //  SKASubarray.additionnal_imports
@@ -56,6 +58,13 @@ class SKASubarray(SKAObsDevice):
             device = self.target
             device._activation_time = 0.0
 
+            device._assigned_resources_delta = json.dumps({"added": [], "removed": []})
+            device.set_change_event("assignedResourcesDelta", True, False)
+            device.set_archive_event("assignedResourcesDelta", True, False)
+            device.component_manager.set_resources_changed_callback(
+                device._update_assigned_resources_delta
+            )
+
             message = "SKASubarray Init command completed OK"
             self.logger.info(message)
             return (ResultCode.OK, message)
@@ -67,6 +76,9 @@ class SKASubarray(SKAObsDevice):
         A class for SKASubarray's AssignResources() command.
         """
 
+        argument_codec = JsonArgumentCodec()
+        """The codec that decodes the JSON-encoded command argument."""
+
         def __init__(self, target, op_state_model, obs_state_model, logger=None):
             """
             Constructor for AssignResourcesCommand
@@ -99,11 +111,17 @@ class SKASubarray(SKAObsDevice):
 
             :return: A tuple containing a return code and a string
                 message indicating status. The message is for
-                information purpose only.
+                information purpose only. The command fails if any of
+                the resources is already assigned to another subarray.
             :rtype: (ResultCode, str)
             """
             component_manager = self.target
-            component_manager.assign(argin)
+            try:
+                component_manager.assign(argin)
+            except ResourceConflictError as conflict:
+                message = f"AssignResources command rejected: {conflict}"
+                self.logger.error(message)
+                return (ResultCode.FAILED, message)
 
             message = "AssignResources command completed OK"
             self.logger.info(message)
@@ -116,6 +134,9 @@ class SKASubarray(SKAObsDevice):
         A class for SKASubarray's ReleaseResources() command.
         """
 
+        argument_codec = JsonArgumentCodec()
+        """The codec that decodes the JSON-encoded command argument."""
+
         def __init__(self, target, op_state_model, obs_state_model, logger=None):
             """
             Constructor for ReleaseResourcesCommand
@@ -209,6 +230,9 @@ class SKASubarray(SKAObsDevice):
         A class for SKASubarray's Configure() command.
         """
 
+        argument_codec = JsonArgumentCodec()
+        """The codec that decodes the JSON-encoded command argument."""
+
         def __init__(self, target, op_state_model, obs_state_model, logger=None):
             """
             Constructor for ConfigureCommand
@@ -256,6 +280,9 @@ class SKASubarray(SKAObsDevice):
         A class for SKASubarray's Scan() command.
         """
 
+        argument_codec = JsonArgumentCodec()
+        """The codec that decodes the JSON-encoded command argument."""
+
         def __init__(self, target, op_state_model, obs_state_model, logger=None):
             """
             Constructor for ScanCommand
@@ -525,7 +552,9 @@ class SKASubarray(SKAObsDevice):
         """
         super()._init_state_model()
         self.obs_state_model = SubarrayObsStateModel(
-            logger=self.logger, callback=self._update_obs_state
+            logger=self.logger,
+            callback=self._update_obs_state,
+            table_machine=self.UseTableStateMachines,
         )
 
     def create_component_manager(self):
@@ -589,6 +618,13 @@ class SKASubarray(SKAObsDevice):
     )
     """Device attribute."""
 
+    assignedResourcesDelta = attribute(
+        dtype="str",
+        doc="JSON-encoded resources added to and removed from the subarray by "
+        'the most recent change; e.g. {"added": ["BAND1"], "removed": []}.',
+    )
+    """Device attribute."""
+
     configuredCapabilities = attribute(
         dtype=("str",),
         max_dim_x=10,
@@ -602,6 +638,26 @@ class SKASubarray(SKAObsDevice):
     # ---------------
     # General methods
     # ---------------
+    def _update_assigned_resources_delta(self, added, removed):
+        """
+        Helper method for publishing the resources added and removed by
+        a change to the assigned resources; passed to the component
+        manager as a callback.
+
+        The change is pushed directly, rather than through the event
+        publisher, so that no change is ever held back and replaced by a
+        later one.
+
+        :param added: the resources assigned, sorted
+        :type added: tuple of str
+        :param removed: the resources released, sorted
+        :type removed: tuple of str
+        """
+        delta = json.dumps({"added": list(added), "removed": list(removed)})
+        self._assigned_resources_delta = delta
+        self._push_change_event("assignedResourcesDelta", delta)
+        self._push_archive_event("assignedResourcesDelta", delta)
+
     def always_executed_hook(self):
         # PROTECTED REGION ID(SKASubarray.always_executed_hook) ENABLED START #
         """
@@ -615,7 +671,9 @@ class SKASubarray(SKAObsDevice):
         """
         Method to cleanup when device is stopped.
         """
-        pass
+        if getattr(self, "component_manager", None) is not None:
+            # release any resources claimed in a shared registry
+            self.component_manager.teardown()
         # PROTECTED REGION END #    //  SKASubarray.delete_device
 
     # ------------------
@@ -641,6 +699,17 @@ class SKASubarray(SKAObsDevice):
         return self.component_manager.assigned_resources
         # PROTECTED REGION END #    //  SKASubarray.assignedResources_read
 
+    def read_assignedResourcesDelta(self):
+        # PROTECTED REGION ID(SKASubarray.assignedResourcesDelta_read) ENABLED START #
+        """
+        Reads the resources added and removed by the most recent change
+        to the resources assigned to the device.
+
+        :return: JSON-encoded resources added and removed.
+        """
+        return self._assigned_resources_delta
+        # PROTECTED REGION END #    //  SKASubarray.assignedResourcesDelta_read
+
     def read_configuredCapabilities(self):
         # PROTECTED REGION ID(SKASubarray.configuredCapabilities_read) ENABLED START #
         """
@@ -690,7 +759,45 @@ class SKASubarray(SKAObsDevice):
         :rtype: (ResultCode, str)
         """
         command = self.get_command_object("AssignResources")
-        args = json.loads(argin)
+        args = command.argument_codec.decode(argin)
+        (return_code, message) = command(args)
+        return [[return_code], [message]]
+
+    def is_AssignResourcesEncoded_allowed(self):
+        """
+        Check if command `AssignResourcesEncoded` is allowed in the
+        current device state.
+
+        :return: ``True`` if the command is allowed
+        :rtype: boolean
+        """
+        command = self.get_command_object("AssignResources")
+        return command.is_allowed(raise_if_disallowed=True)
+
+    @command(
+        dtype_in="DevEncoded",
+        doc_in="Encoding name, 'json' or 'msgpack', and encoded bytes of "
+        "the resources to add to the subarray",
+        dtype_out="DevVarLongStringArray",
+        doc_out="(ReturnType, 'informational message')",
+    )
+    @DebugIt()
+    def AssignResourcesEncoded(self, argin):
+        """
+        Assign resources to this subarray, from a ``DevEncoded``
+        argument; otherwise the same as AssignResources().
+
+        :param argin: the encoding name, and the encoded bytes of
+            the resources to be assigned
+        :type argin: (str, bytes)
+
+        :return: A tuple containing a return code and a string
+            message indicating status. The message is for
+            information purpose only.
+        :rtype: (ResultCode, str)
+        """
+        command = self.get_command_object("AssignResources")
+        args = command.argument_codec.decode_encoded(argin)
         (return_code, message) = command(args)
         return [[return_code], [message]]
 
@@ -728,7 +835,45 @@ class SKASubarray(SKAObsDevice):
         :rtype: (ResultCode, str)
         """
         command = self.get_command_object("ReleaseResources")
-        args = json.loads(argin)
+        args = command.argument_codec.decode(argin)
+        (return_code, message) = command(args)
+        return [[return_code], [message]]
+
+    def is_ReleaseResourcesEncoded_allowed(self):
+        """
+        Check if command `ReleaseResourcesEncoded` is allowed in the
+        current device state.
+
+        :return: ``True`` if the command is allowed
+        :rtype: boolean
+        """
+        command = self.get_command_object("ReleaseResources")
+        return command.is_allowed(raise_if_disallowed=True)
+
+    @command(
+        dtype_in="DevEncoded",
+        doc_in="Encoding name, 'json' or 'msgpack', and encoded bytes of "
+        "the resources to remove from the subarray",
+        dtype_out="DevVarLongStringArray",
+        doc_out="(ReturnType, 'informational message')",
+    )
+    @DebugIt()
+    def ReleaseResourcesEncoded(self, argin):
+        """
+        Delta removal of assigned resources, from a ``DevEncoded``
+        argument; otherwise the same as ReleaseResources().
+
+        :param argin: the encoding name, and the encoded bytes of
+            the resources to be released
+        :type argin: (str, bytes)
+
+        :return: A tuple containing a return code and a string
+            message indicating status. The message is for
+            information purpose only.
+        :rtype: (ResultCode, str)
+        """
+        command = self.get_command_object("ReleaseResources")
+        args = command.argument_codec.decode_encoded(argin)
         (return_code, message) = command(args)
         return [[return_code], [message]]
 
@@ -798,7 +943,45 @@ class SKASubarray(SKAObsDevice):
         :rtype: (ResultCode, str)
         """
         command = self.get_command_object("Configure")
-        args = json.loads(argin)
+        args = command.argument_codec.decode(argin)
+        (return_code, message) = command(args)
+        return [[return_code], [message]]
+
+    def is_ConfigureEncoded_allowed(self):
+        """
+        Check if command `ConfigureEncoded` is allowed in the
+        current device state.
+
+        :return: ``True`` if the command is allowed
+        :rtype: boolean
+        """
+        command = self.get_command_object("Configure")
+        return command.is_allowed(raise_if_disallowed=True)
+
+    @command(
+        dtype_in="DevEncoded",
+        doc_in="Encoding name, 'json' or 'msgpack', and encoded bytes of "
+        "the scan configuration",
+        dtype_out="DevVarLongStringArray",
+        doc_out="(ReturnType, 'informational message')",
+    )
+    @DebugIt()
+    def ConfigureEncoded(self, argin):
+        """
+        Configures the capabilities of this subarray, from a ``DevEncoded``
+        argument; otherwise the same as Configure().
+
+        :param argin: the encoding name, and the encoded bytes of
+            configuration specification
+        :type argin: (str, bytes)
+
+        :return: A tuple containing a return code and a string
+            message indicating status. The message is for
+            information purpose only.
+        :rtype: (ResultCode, str)
+        """
+        command = self.get_command_object("Configure")
+        args = command.argument_codec.decode_encoded(argin)
         (return_code, message) = command(args)
         return [[return_code], [message]]
 
@@ -835,7 +1018,45 @@ class SKASubarray(SKAObsDevice):
         :rtype: (ResultCode, str)
         """
         command = self.get_command_object("Scan")
-        args = json.loads(argin)
+        args = command.argument_codec.decode(argin)
+        (return_code, message) = command(args)
+        return [[return_code], [message]]
+
+    def is_ScanEncoded_allowed(self):
+        """
+        Check if command `ScanEncoded` is allowed in the
+        current device state.
+
+        :return: ``True`` if the command is allowed
+        :rtype: boolean
+        """
+        command = self.get_command_object("Scan")
+        return command.is_allowed(raise_if_disallowed=True)
+
+    @command(
+        dtype_in="DevEncoded",
+        doc_in="Encoding name, 'json' or 'msgpack', and encoded bytes of "
+        "the per-scan configuration",
+        dtype_out="DevVarLongStringArray",
+        doc_out="(ReturnType, 'informational message')",
+    )
+    @DebugIt()
+    def ScanEncoded(self, argin):
+        """
+        Start scanning, from a ``DevEncoded``
+        argument; otherwise the same as Scan().
+
+        :param argin: the encoding name, and the encoded bytes of
+            information about the scan
+        :type argin: (str, bytes)
+
+        :return: A tuple containing a return code and a string
+            message indicating status. The message is for
+            information purpose only.
+        :rtype: (ResultCode, str)
+        """
+        command = self.get_command_object("Scan")
+        args = command.argument_codec.decode_encoded(argin)
         (return_code, message) = command(args)
         return [[return_code], [message]]
 
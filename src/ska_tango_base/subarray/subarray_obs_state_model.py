@@ -13,118 +13,16 @@ from transitions.extensions import LockedMachine as Machine
 
 from ska_tango_base.control_model import ObsState
 from ska_tango_base.obs import ObsStateModel
+from ska_tango_base.table_machine import TableMachine
 
 __all__ = ["SubarrayObsStateModel"]
 
 
-class _SubarrayObsStateMachine(Machine):
+class _SubarrayObsStateMachineMixin:
     """
-    State machine representing the observation state machine for
-    subarrays.
-
-    The machine implemented is essentially as agreed in ADR-8, but with
-    some states broken down into sub-states to account for the
-    interactions between commands and monitoring of the underlying
-    component.
-
-    For example, ADR-8 says that a configuring subarray moves from IDLE
-    to CONFIGURING to READY. But in a device model where the state
-    machine is responsive to both commands and changes to the monitored
-    component, the sequence is better represented as follows:
-
-    1. The Configure() command triggers the "configure_invoked" action
-       on the state machine, resulting in a transition from IDLE to
-       CONFIGURING_IDLE
-    2. The Configure() command invokes methods on its component in order
-       to effect configuration. At some point in this process, the
-       component triggers the "component_configured" action on the
-       state machine, resulting in a transition from CONFIGURING_IDLE to
-       CONFIGURING_READY.
-    3. At completion of configuration, the action "configure_completed"
-       is triggered on the state machine, resulting in a transition from
-       CONFIGURING_READY to READY.
-
-    Thus, this machine contains substates CONFIGURING_IDLE and
-    CONFIGURING_READY, rather than the ADR-8 state CONFIGURING
-
-    The full list of supported states are:
-
-    * **EMPTY**: the subarray is unresourced
-    * **RESOURCING_EMPTY**: the subarray is unresourced, but performing
-      a resourcing operation
-    * **RESOURCING_IDLE**: the subarray is resourced, and currently
-      performing a resourcing operation
-    * **IDLE**: the subarray is resourced but unconfigured
-    * **CONFIGURING_IDLE**: the subarray is resourced but unconfigured;
-      it is currently performing a configuring operation
-    * **CONFIGURING_READY**: the subarray is resourced and configured;
-      it is currently performing a configuring operation
-    * **READY**: the subarray is resourced and configured
-    * **SCANNING**: the subarray is scanning
-    * **ABORTING**: the subarray is aborting
-    * **ABORTED**: the subarray has aborted
-    * **RESETTING**: the subarray is resetting from an ABORTED or FAULT
-      state back to IDLE
-    * **RESTARTING**: the subarray is restarting from an ABORTED or
-      FAULT state back to EMPTY
-    * **FAULT**: the subarray has encountered a observation fault.
-
-    The actions supported divide into command-oriented actions and
-    component monitoring actions.
-
-    The command-oriented actions are:
-
-    * **assign_invoked** and **assign_completed**: bookending the
-      AssignResources() command, and hence the RESOURCING transitional
-      state
-    * **release_invoked** and **release_completed**: bookending the
-      ReleaseResources() and ReleaseAllResources() commands, hence the
-      RESOURCING transitional state
-    * **configure_invoked** and **configure_completed**: bookending the
-      Configure() command, and hence the CONFIGURING state
-    * **abort_invoked** and **abort_completed**: bookending the Abort()
-      command, and hence the ABORTING state
-    * **obsreset_invoked** and **obsreset_completed**: bookending the
-      ObsReset() command, and hence the OBSRESETTING state
-    * **restart_invoked** and **restart_completed**: bookending the
-      Restart() command, and hence the RESTARTING state
-    * **end_invoked**, **scan_invoked**, **end_scan_invoked**: these
-      result in reflexive transitions, and are purely there to indicate
-      states in which the End(), Scan() and EndScan() commands are
-      permitted to be run
-
-    The component-oriented actions are:
-
-    * **component_obsfault**: the monitored component has experienced an
-      observation fault
-    * **component_unresourced**: the monitored component has become
-      unresourced
-    * **component_resourced**: the monitored component has become
-      resourced
-    * **component_unconfigured**: the monitored component has become
-      unconfigured
-    * **component_configured**: the monitored component has become
-      configured
-    * **component_scanning**: the monitored component has started
-      scanning
-    * **component_not_scanning**: the monitored component has stopped
-      scanning
-
-    A diagram of the state machine is shown below. Reflexive transitions
-    and transitions to FAULT obs state are omitted to simplify the
-    diagram.
-
-    .. uml:: subarray_obs_state_machine.uml
-      :caption: Diagram of the subarray obs state machine
-
-    The following is a diagram of the state machine, automatically
-    generated from the code. Its equivalence to the diagram above
-    demonstrates that the implementation is faithful to the design.
-
-    .. figure:: _SubarrayObsStateMachine_autogenerated.png
-      :alt: Diagram of the subarray obs state machine, as implemented
-
-
+    Mixin that defines the states and transitions of the subarray
+    observation state machine, independently of the engine that
+    implements it.
     """
 
     def __init__(self, callback=None, **extra_kwargs):
@@ -359,6 +257,126 @@ class _SubarrayObsStateMachine(Machine):
             self._callback(self.state)
 
 
+class _SubarrayObsStateMachine(_SubarrayObsStateMachineMixin, Machine):
+    """
+    State machine representing the observation state machine for
+    subarrays.
+
+    The machine implemented is essentially as agreed in ADR-8, but with
+    some states broken down into sub-states to account for the
+    interactions between commands and monitoring of the underlying
+    component.
+
+    For example, ADR-8 says that a configuring subarray moves from IDLE
+    to CONFIGURING to READY. But in a device model where the state
+    machine is responsive to both commands and changes to the monitored
+    component, the sequence is better represented as follows:
+
+    1. The Configure() command triggers the "configure_invoked" action
+       on the state machine, resulting in a transition from IDLE to
+       CONFIGURING_IDLE
+    2. The Configure() command invokes methods on its component in order
+       to effect configuration. At some point in this process, the
+       component triggers the "component_configured" action on the
+       state machine, resulting in a transition from CONFIGURING_IDLE to
+       CONFIGURING_READY.
+    3. At completion of configuration, the action "configure_completed"
+       is triggered on the state machine, resulting in a transition from
+       CONFIGURING_READY to READY.
+
+    Thus, this machine contains substates CONFIGURING_IDLE and
+    CONFIGURING_READY, rather than the ADR-8 state CONFIGURING
+
+    The full list of supported states are:
+
+    * **EMPTY**: the subarray is unresourced
+    * **RESOURCING_EMPTY**: the subarray is unresourced, but performing
+      a resourcing operation
+    * **RESOURCING_IDLE**: the subarray is resourced, and currently
+      performing a resourcing operation
+    * **IDLE**: the subarray is resourced but unconfigured
+    * **CONFIGURING_IDLE**: the subarray is resourced but unconfigured;
+      it is currently performing a configuring operation
+    * **CONFIGURING_READY**: the subarray is resourced and configured;
+      it is currently performing a configuring operation
+    * **READY**: the subarray is resourced and configured
+    * **SCANNING**: the subarray is scanning
+    * **ABORTING**: the subarray is aborting
+    * **ABORTED**: the subarray has aborted
+    * **RESETTING**: the subarray is resetting from an ABORTED or FAULT
+      state back to IDLE
+    * **RESTARTING**: the subarray is restarting from an ABORTED or
+      FAULT state back to EMPTY
+    * **FAULT**: the subarray has encountered a observation fault.
+
+    The actions supported divide into command-oriented actions and
+    component monitoring actions.
+
+    The command-oriented actions are:
+
+    * **assign_invoked** and **assign_completed**: bookending the
+      AssignResources() command, and hence the RESOURCING transitional
+      state
+    * **release_invoked** and **release_completed**: bookending the
+      ReleaseResources() and ReleaseAllResources() commands, hence the
+      RESOURCING transitional state
+    * **configure_invoked** and **configure_completed**: bookending the
+      Configure() command, and hence the CONFIGURING state
+    * **abort_invoked** and **abort_completed**: bookending the Abort()
+      command, and hence the ABORTING state
+    * **obsreset_invoked** and **obsreset_completed**: bookending the
+      ObsReset() command, and hence the OBSRESETTING state
+    * **restart_invoked** and **restart_completed**: bookending the
+      Restart() command, and hence the RESTARTING state
+    * **end_invoked**, **scan_invoked**, **end_scan_invoked**: these
+      result in reflexive transitions, and are purely there to indicate
+      states in which the End(), Scan() and EndScan() commands are
+      permitted to be run
+
+    The component-oriented actions are:
+
+    * **component_obsfault**: the monitored component has experienced an
+      observation fault
+    * **component_unresourced**: the monitored component has become
+      unresourced
+    * **component_resourced**: the monitored component has become
+      resourced
+    * **component_unconfigured**: the monitored component has become
+      unconfigured
+    * **component_configured**: the monitored component has become
+      configured
+    * **component_scanning**: the monitored component has started
+      scanning
+    * **component_not_scanning**: the monitored component has stopped
+      scanning
+
+    A diagram of the state machine is shown below. Reflexive transitions
+    and transitions to FAULT obs state are omitted to simplify the
+    diagram.
+
+    .. uml:: subarray_obs_state_machine.uml
+      :caption: Diagram of the subarray obs state machine
+
+    The following is a diagram of the state machine, automatically
+    generated from the code. Its equivalence to the diagram above
+    demonstrates that the implementation is faithful to the design.
+
+    .. figure:: _SubarrayObsStateMachine_autogenerated.png
+      :alt: Diagram of the subarray obs state machine, as implemented
+
+
+    """
+
+
+class _SubarrayObsStateTableMachine(_SubarrayObsStateMachineMixin, TableMachine):
+    """
+    The subarray observation state machine, implemented by the compact,
+    table-driven :py:class:`~ska_tango_base.table_machine.TableMachine`
+    engine rather than by ``transitions``. See
+    :py:class:`._SubarrayObsStateMachine`.
+    """
+
+
 class SubarrayObsStateModel(ObsStateModel):
     """
     Implements the observation state model for subarray
@@ -391,7 +409,7 @@ class SubarrayObsStateModel(ObsStateModel):
        :caption: Diagram of the subarray observation state model
     """
 
-    def __init__(self, logger, callback=None):
+    def __init__(self, logger, callback=None, table_machine=False):
         """
         Initialises the model.
 
@@ -401,8 +419,19 @@ class SubarrayObsStateModel(ObsStateModel):
         :param callback: A callback to be called when a transition
             causes a change to device obs_state
         :type callback: callable
+        :param table_machine: whether to use the compact, table-driven
+            :py:class:`~ska_tango_base.table_machine.TableMachine`
+            engine for the underlying state machine, rather than
+            ``transitions``
+        :type table_machine: bool
         """
-        super().__init__(_SubarrayObsStateMachine, logger, callback=callback)
+        super().__init__(
+            _SubarrayObsStateTableMachine
+            if table_machine
+            else _SubarrayObsStateMachine,
+            logger,
+            callback=callback,
+        )
 
     _obs_state_mapping = {
         "EMPTY": ObsState.EMPTY,
@@ -433,5 +462,4 @@ class SubarrayObsStateModel(ObsStateModel):
         obs_state = self._obs_state_mapping[machine_state]
         if self._obs_state != obs_state:
             self._obs_state = obs_state
-            if self._callback is not None:
-                self._callback(obs_state)
+            self._call_callback(obs_state)
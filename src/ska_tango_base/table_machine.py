@@ -0,0 +1,211 @@
+"""
+This module provides a compact, table-driven state machine engine,
+:py:class:`.TableMachine`.
+
+``TableMachine`` implements the subset of the ``transitions.Machine``
+interface that is used by the state machines in this package, with the
+same trigger and callback semantics:
+
+* states are given by name, and a machine has a single initial state;
+* transitions are given as dictionaries with "source", "trigger" and
+  "dest" keys. A source of "*" means every state, and a dest of "="
+  means a reflexive transition back to the source state;
+* an automatic ``to_<STATE>`` trigger is provided for every state,
+  leading to that state from any state;
+* the ``after_state_change`` callback is called after every transition,
+  including reflexive and automatic ones;
+* triggers may be invoked through ``trigger(name)``, or as methods of
+  the machine; and ``get_triggers(state)`` returns the triggers that
+  are accepted in a given state;
+* a trigger that is not accepted in the current state raises
+  ``transitions.MachineError``.
+
+Internally, states are represented by integer codes, and all
+transitions are held in a single dictionary keyed on ``(state code,
+trigger)``. This makes construction cheap, and each instance small,
+compared with a ``transitions`` machine, which builds an object for
+every state, event and transition, and a method for every trigger.
+Transitions are serialised by a non-reentrant lock, held only for the
+table lookup and the state update. Delivery of the
+``after_state_change`` callback is serialised by a separate reentrant
+lock, held from before the state update until the callback returns, so
+that callbacks are delivered in the order of the transitions, and each
+callback sees the state that its transition led to; and a callback may
+itself trigger further transitions.
+"""
+import functools
+import threading
+
+from transitions import MachineError
+
+__all__ = ["TableMachine"]
+
+
+class TableMachine:
+    """
+    A compact, table-driven state machine.
+    """
+
+    def __init__(
+        self,
+        states,
+        initial,
+        transitions=(),
+        after_state_change=None,
+        auto_transitions=True,
+    ):
+        """
+        Initialise a new TableMachine.
+
+        :param states: names of the states of the machine
+        :type states: list of str
+        :param initial: name of the initial state of the machine
+        :type initial: str
+        :param transitions: the transitions of the machine, each a
+            dictionary with "source", "trigger" and "dest" keys. Where
+            more than one transition is given for the same source and
+            trigger, the first one applies.
+        :type transitions: list of dict
+        :param after_state_change: callback to be called, without
+            arguments, after every transition
+        :type after_state_change: callable
+        :param auto_transitions: whether to provide a ``to_<STATE>``
+            trigger for every state
+        :type auto_transitions: bool
+        """
+        self._state_names = tuple(states)
+        codes = {name: code for (code, name) in enumerate(self._state_names)}
+
+        table = {}
+        for transition in transitions:
+            sources = transition["source"]
+            if sources == "*":
+                sources = self._state_names
+            elif isinstance(sources, str):
+                sources = [sources]
+
+            trigger = transition["trigger"]
+            dest = transition["dest"]
+            for source in sources:
+                source_code = codes[source]
+                dest_code = source_code if dest == "=" else codes[dest]
+                table.setdefault((source_code, trigger), dest_code)
+        self._transitions = table
+
+        if auto_transitions:
+            self._auto_transitions = {
+                f"to_{name}": code for (name, code) in codes.items()
+            }
+        else:
+            self._auto_transitions = {}
+
+        self._after_state_change = after_state_change
+        self._lock = threading.Lock()
+        self._delivery_lock = threading.RLock()
+        self._state = codes[initial]
+
+    @property
+    def state(self):
+        """
+        Return the name of the current state of this machine.
+
+        :return: the name of the current state
+        :rtype: str
+        """
+        return self._state_names[self._state]
+
+    @property
+    def states(self):
+        """
+        Return the names of the states of this machine.
+
+        :return: the names of the states
+        :rtype: tuple of str
+        """
+        return self._state_names
+
+    def get_triggers(self, *states):
+        """
+        Return the triggers that are accepted in any of the given
+        states.
+
+        :param states: names of states
+        :type states: str
+
+        :return: the triggers accepted in any of the given states
+        :rtype: list of str
+        """
+        codes = {self._state_names.index(state) for state in states}
+        triggers = [
+            trigger for (source, trigger) in self._transitions if source in codes
+        ]
+        triggers.extend(self._auto_transitions)
+        return list(dict.fromkeys(triggers))
+
+    def trigger(self, trigger_name):
+        """
+        Trigger a transition.
+
+        :param trigger_name: name of the trigger
+        :type trigger_name: str
+
+        :return: True, since the transition was performed
+        :rtype: bool
+
+        :raises AttributeError: if no transition in this machine has
+            this trigger
+        :raises MachineError: if the trigger is not accepted in the
+            current state
+        """
+        with self._delivery_lock:
+            with self._lock:
+                dest = self._transitions.get((self._state, trigger_name))
+                if dest is None:
+                    dest = self._auto_transitions.get(trigger_name)
+                if dest is None:
+                    if not self._is_trigger(trigger_name):
+                        raise AttributeError(
+                            f"Do not know event named '{trigger_name}'."
+                        )
+                    raise MachineError(
+                        f"Can't trigger event {trigger_name} from state {self.state}!"
+                    )
+                self._state = dest
+
+            if self._after_state_change is not None:
+                self._after_state_change()
+        return True
+
+    def _is_trigger(self, trigger_name):
+        """
+        Helper method that returns whether a trigger is known to this
+        machine, in any state.
+
+        :param trigger_name: name of the trigger
+        :type trigger_name: str
+
+        :return: whether the trigger is known to this machine
+        :rtype: bool
+        """
+        return trigger_name in self._auto_transitions or any(
+            trigger == trigger_name for (_, trigger) in self._transitions
+        )
+
+    def __getattr__(self, name):
+        """
+        Return a trigger of this machine as a method, as
+        ``transitions`` does; for example, ``machine.to_ON()``.
+
+        :param name: name of the trigger
+        :type name: str
+
+        :return: a callable that triggers the named transition
+        :rtype: callable
+
+        :raises AttributeError: if there is no such trigger
+        """
+        if name.startswith("_") or not self._is_trigger(name):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        return functools.partial(self.trigger, name)
@@ -1,12 +1,17 @@
 """General utilities that may be useful to SKA devices and clients."""
 from builtins import str
 import ast
+import collections
+import collections.abc
 import functools
 import inspect
 import json
 import pydoc
+import threading
+import time
 import traceback
 import sys
+import types
 import warnings
 
 from datetime import datetime
@@ -14,6 +19,7 @@ from datetime import datetime
 import tango
 from tango import (
     DeviceProxy,
+    DevFailed,
     DbDatum,
     DbDevInfo,
     AttrQuality,
@@ -149,7 +155,7 @@ def get_dev_info(domain_name, device_server_name, device_ref):
 
 
 def dp_set_property(device_name, property_name, property_value):
-    dp = DeviceProxy(device_name)
+    dp = get_device_proxy(device_name)
     db_datum = DbDatum()
     db_datum.name = property_name
     if isinstance(property_value, list):
@@ -160,6 +166,213 @@ def dp_set_property(device_name, property_name, property_value):
     dp.put_property(db_datum)
 
 
+class _CachedProxy:
+    """
+    A device proxy held by a :py:class:`.DeviceProxyCache`.
+    """
+
+    __slots__ = ("proxy", "last_used", "last_checked")
+
+    def __init__(self, proxy, now):
+        """
+        Initialise a new cache entry.
+
+        :param proxy: the device proxy
+        :type proxy: :py:class:`tango.DeviceProxy`
+        :param now: the current monotonic time
+        :type now: float
+        """
+        self.proxy = proxy
+        self.last_used = now
+        self.last_checked = now
+
+
+class DeviceProxyCache:
+    """
+    A thread-safe cache of device proxies, keyed by device name.
+
+    Constructing a device proxy requires a database lookup and an import
+    of the device's interface, so callers that talk to the same devices
+    repeatedly should get their proxies from a cache rather than
+    constructing them each time.
+
+    The cache holds at most a given number of proxies, evicting the
+    least recently used when full, and evicts proxies that have not been
+    used for a given idle timeout. A proxy that has not been checked for
+    a given interval is pinged before it is returned, and replaced by a
+    new proxy if the ping fails.
+    """
+
+    def __init__(self, max_size=256, idle_timeout=600.0, health_check_interval=10.0):
+        """
+        Initialise a new, empty, DeviceProxyCache.
+
+        :param max_size: the maximum number of proxies held
+        :type max_size: int
+        :param idle_timeout: the time, in seconds, after which a proxy
+            that has not been used is evicted, or None for no timeout
+        :type idle_timeout: float
+        :param health_check_interval: the time, in seconds, after which
+            a proxy is pinged before it is returned, or None to never
+            ping proxies
+        :type health_check_interval: float
+        """
+        self._max_size = max(1, max_size)
+        self._idle_timeout = idle_timeout
+        self._health_check_interval = health_check_interval
+
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._reconnections = 0
+
+    def get(self, device_name):
+        """
+        Return a proxy to a device, from the cache if possible.
+
+        :param device_name: the name of the device
+        :type device_name: str
+
+        :return: a proxy to the device
+        :rtype: :py:class:`tango.DeviceProxy`
+
+        :raises DevFailed: if a proxy to the device cannot be constructed
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._entries.get(device_name)
+            if entry is not None:
+                self._entries.move_to_end(device_name)
+                entry.last_used = now
+                if not self._needs_check(entry, now):
+                    self._hits += 1
+                    return entry.proxy
+
+        if entry is not None:
+            try:
+                entry.proxy.ping()
+            except DevFailed:
+                pass
+            else:
+                with self._lock:
+                    entry.last_checked = now
+                    self._hits += 1
+                return entry.proxy
+
+        proxy = DeviceProxy(device_name)
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+            else:
+                self._reconnections += 1
+            current = self._entries.get(device_name)
+            if current is not None and current is not entry:
+                # another thread has already replaced the proxy
+                return current.proxy
+            self._entries[device_name] = _CachedProxy(proxy, now)
+            self._entries.move_to_end(device_name)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return proxy
+
+    def invalidate(self, device_name):
+        """
+        Remove the proxy to a device from the cache, if present; for
+        example, because it has been found not to work.
+
+        :param device_name: the name of the device
+        :type device_name: str
+        """
+        with self._lock:
+            self._entries.pop(device_name, None)
+
+    def clear(self):
+        """
+        Remove all proxies from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def statistics(self):
+        """
+        Return the statistics of this cache: the number of proxies held,
+        and the number of hits, misses, evictions and reconnections.
+
+        :return: a dictionary of statistics
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "reconnections": self._reconnections,
+            }
+
+    def _needs_check(self, entry, now):
+        """
+        Helper method that returns whether a proxy is due a health check.
+
+        :param entry: the cache entry for the proxy
+        :type entry: :py:class:`._CachedProxy`
+        :param now: the current monotonic time
+        :type now: float
+
+        :return: whether the proxy is due a health check
+        :rtype: bool
+        """
+        if self._health_check_interval is None:
+            return False
+        return now - entry.last_checked >= self._health_check_interval
+
+    def _evict_idle(self, now):
+        """
+        Helper method that evicts proxies that have not been used within
+        the idle timeout. Entries are held in order of use, so only the
+        least recently used need be examined.
+
+        Must be called with the lock held.
+
+        :param now: the current monotonic time
+        :type now: float
+        """
+        if self._idle_timeout is None:
+            return
+        while self._entries:
+            entry = next(iter(self._entries.values()))
+            if now - entry.last_used < self._idle_timeout:
+                return
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+device_proxy_cache = DeviceProxyCache()
+"""
+The process-wide cache of device proxies, used throughout this package.
+"""
+
+
+def get_device_proxy(device_name):
+    """
+    Return a proxy to a device from the process-wide device proxy cache.
+
+    :param device_name: the name of the device
+    :type device_name: str
+
+    :return: a proxy to the device
+    :rtype: :py:class:`tango.DeviceProxy`
+
+    :raises DevFailed: if a proxy to the device cannot be constructed
+    """
+    return device_proxy_cache.get(device_name)
+
+
 def get_device_group_and_id(device_name):
     device_name = device_name
     return device_name.split("/")[1:]
@@ -389,20 +602,158 @@ def get_groups_from_json(json_definitions):
     """
     try:
         # Parse and validate user's definitions
-        groups = {}
-        for json_definition in json_definitions:
-            json_definition = json_definition.strip()
-            if json_definition:
-                definition = json.loads(json_definition)
-                _validate_group(definition)
-                group_name = definition["group_name"]
-                groups[group_name] = _build_group(definition)
-        return groups
+        definitions = _parse_group_definitions(tuple(json_definitions))
+        return {
+            group_name: _build_group(definition)
+            for (group_name, definition) in definitions.items()
+        }
+
+    except Exception as exc:
+        # the exc_info is included for detailed traceback
+        ska_error = SKABaseError(exc)
+        raise GroupDefinitionsError(ska_error).with_traceback(sys.exc_info()[2])
+
+
+def get_lazy_groups_from_json(json_definitions):
+    """Return a lazily built mapping of tango.Group objects matching the JSON definitions.
+
+    Like :py:func:`get_groups_from_json`, except that the definitions are
+    only validated here, and each tango.Group is built on first access.
+    Building a group resolves each of its devices, which for large
+    hierarchies can take a long time.
 
+    :param json_definitions: Sequence of strings, each one a JSON dict
+        with keys "group_name", and one or both of:  "devices" and
+        "subgroups", recursively defining the hierarchy.  See
+        :py:func:`get_groups_from_json`.
+    :type json_definitions: sequence of str
+
+    :return: A read-only mapping from group name to tango.Group, which
+        builds each group when it is first accessed.
+    :rtype: :py:class:`LazyGroups`
+
+    :raises GroupDefinitionsError: as for :py:func:`get_groups_from_json`,
+        except for errors that arise in building the groups, which are
+        raised on access instead.
+    """
+    try:
+        definitions = _parse_group_definitions(tuple(json_definitions))
     except Exception as exc:
         # the exc_info is included for detailed traceback
         ska_error = SKABaseError(exc)
         raise GroupDefinitionsError(ska_error).with_traceback(sys.exc_info()[2])
+    return LazyGroups(definitions)
+
+
+class LazyGroups(collections.abc.Mapping):
+    """
+    A read-only mapping from group name to tango.Group, which builds
+    each group when it is first accessed.
+
+    Used by :py:func:`get_lazy_groups_from_json`.
+    """
+
+    def __init__(self, definitions):
+        """
+        Initialise a new LazyGroups mapping.
+
+        :param definitions: validated group definitions, keyed by group
+            name
+        :type definitions: dict
+        """
+        self._definitions = definitions
+        self._groups = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, group_name):
+        """
+        Return a group, building it if this is its first access.
+
+        :param group_name: the name of the group
+        :type group_name: str
+
+        :return: the group
+        :rtype: :py:class:`tango.Group`
+
+        :raises KeyError: if there is no such group
+        :raises GroupDefinitionsError: if the group cannot be built
+        """
+        with self._lock:
+            group = self._groups.get(group_name)
+            if group is None:
+                definition = self._definitions[group_name]
+                try:
+                    group = _build_group(definition)
+                except Exception as exc:
+                    ska_error = SKABaseError(exc)
+                    raise GroupDefinitionsError(ska_error).with_traceback(
+                        sys.exc_info()[2]
+                    )
+                self._groups[group_name] = group
+            return group
+
+    def __iter__(self):
+        return iter(self._definitions)
+
+    def __len__(self):
+        return len(self._definitions)
+
+    def device_names(self):
+        """
+        Return the names of the devices in all of the groups, including
+        their subgroups, without building any group.
+
+        :return: the names of the devices, each once, in the order in
+            which they are first defined
+        :rtype: list of str
+        """
+        names = {}
+
+        def collect(definition):
+            for device_name in definition.get("devices", []):
+                names.setdefault(device_name)
+            for subgroup_definition in definition.get("subgroups", []):
+                collect(subgroup_definition)  # recurse
+
+        for definition in self._definitions.values():
+            collect(definition)
+        return list(names)
+
+    def is_built(self, group_name):
+        """
+        Return whether a group has been built.
+
+        :param group_name: the name of the group
+        :type group_name: str
+
+        :return: whether the group has been built
+        :rtype: bool
+        """
+        return group_name in self._groups
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_group_definitions(json_definitions):
+    """Parse and validate group definitions.
+
+    Used internally by `get_groups_from_json` and `get_lazy_groups_from_json`.
+    The result is cached, so that unchanged definitions are not parsed again;
+    it must therefore not be modified.
+
+    :param json_definitions: the JSON group definitions
+    :type json_definitions: tuple of str
+
+    :return: a read-only mapping from group name to validated definition
+    :rtype: :py:class:`types.MappingProxyType`
+    """
+    definitions = {}
+    for json_definition in json_definitions:
+        json_definition = json_definition.strip()
+        if json_definition:
+            definition = json.loads(json_definition)
+            _validate_group(definition)
+            definitions[definition["group_name"]] = definition
+    return types.MappingProxyType(definitions)
 
 
 def _validate_group(definition):
@@ -507,6 +858,28 @@ def convert_dict_to_list(dictionary):
     return sorted(the_list)
 
 
+def compile_trigger_table(machine):
+    """
+    Compiles a frozen table of the triggers that a state machine accepts
+    in each of its states, so that checking whether an action is allowed
+    is a dictionary lookup and a set membership test, rather than a scan
+    of all the machine's events.
+
+    The table must be compiled after all states and transitions have
+    been added to the machine.
+
+    :param machine: a state machine
+    :type machine: :py:class:`transitions.Machine`
+
+    :return: a read-only mapping from state name to the frozenset of
+        triggers accepted in that state
+    :rtype: :py:class:`types.MappingProxyType`
+    """
+    return types.MappingProxyType(
+        {state: frozenset(machine.get_triggers(state)) for state in machine.states}
+    )
+
+
 def for_testing_only(func, _testing_check=lambda: "pytest" in sys.modules):
     """
     A decorator that marks a function as available for testing purposes only.
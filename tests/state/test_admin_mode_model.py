@@ -16,18 +16,20 @@ class TestAdminModeModel(StateModelTester):
     This class contains the test for the AdminModeModel class.
     """
 
-    @pytest.fixture
-    def machine_under_test(self, logger):
+    @pytest.fixture(params=[False, True], ids=["transitions", "table"])
+    def machine_under_test(self, logger, request):
         """
-        Fixture that returns the state model under test in this class
+        Fixture that returns the state model under test in this class,
+        using each of the state machine engines in turn
 
         :param logger: a logger for the model under test
         :type logger: :py:class:`logging.Logger`
+        :param request: a pytest request for the fixture parameter
 
         :returns: the state model under test
         :rtype: :py:class:`ska_tango_base.base.AdminModeModel`
         """
-        return AdminModeModel(logger)
+        return AdminModeModel(logger, table_machine=request.param)
 
     def assert_state(self, machine_under_test, state):
         """
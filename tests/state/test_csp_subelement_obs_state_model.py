@@ -6,6 +6,7 @@ import pytest
 
 from ska_tango_base.csp.obs.obs_state_model import (
     _CspSubElementObsStateMachine,
+    _CspSubElementObsStateTableMachine,
 )
 
 from .conftest import load_state_machine_spec, TransitionsStateMachineTester
@@ -19,11 +20,17 @@ class TestCspSubElementObsStateMachine(TransitionsStateMachineTester):
     This class contains the test for the CspSubElementObsStateMachine class.
     """
 
-    @pytest.fixture
-    def machine_under_test(self):
+    @pytest.fixture(
+        params=[_CspSubElementObsStateMachine, _CspSubElementObsStateTableMachine],
+        ids=["transitions", "table"],
+    )
+    def machine_under_test(self, request):
         """
-        Fixture that returns the state model under test in this class
+        Fixture that returns the state model under test in this class,
+        implemented by each of the state machine engines in turn
+
+        :param request: a pytest request for the fixture parameter
 
         :returns: the state machine under test
         """
-        yield _CspSubElementObsStateMachine()
+        yield request.param()
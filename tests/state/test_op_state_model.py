@@ -4,7 +4,10 @@ This module contains the tests for the
 """
 import pytest
 
-from ska_tango_base.base.op_state_model import _OpStateMachine
+from ska_tango_base.base.op_state_model import (
+    _OpStateMachine,
+    _OpStateTableMachine,
+)
 
 from .conftest import load_state_machine_spec, TransitionsStateMachineTester
 
@@ -15,11 +18,16 @@ class TestOpStateMachine(TransitionsStateMachineTester):
     This class contains the test for the _OpStateMachine class.
     """
 
-    @pytest.fixture
-    def machine_under_test(self):
+    @pytest.fixture(
+        params=[_OpStateMachine, _OpStateTableMachine], ids=["transitions", "table"]
+    )
+    def machine_under_test(self, request):
         """
-        Fixture that returns the state machine under test in this class
+        Fixture that returns the state machine under test in this class,
+        implemented by each of the state machine engines in turn
+
+        :param request: a pytest request for the fixture parameter
 
         :returns: the state machine under test
         """
-        yield _OpStateMachine()
+        yield request.param()
@@ -4,7 +4,10 @@ This module contains the tests for the
 """
 import pytest
 
-from ska_tango_base.subarray.subarray_obs_state_model import _SubarrayObsStateMachine
+from ska_tango_base.subarray.subarray_obs_state_model import (
+    _SubarrayObsStateMachine,
+    _SubarrayObsStateTableMachine,
+)
 
 from .conftest import load_state_machine_spec, TransitionsStateMachineTester
 
@@ -15,11 +18,17 @@ class TestSubarrayObsStateMachine(TransitionsStateMachineTester):
     This class contains the test for the SubarrayObsStateModel class.
     """
 
-    @pytest.fixture
-    def machine_under_test(self):
+    @pytest.fixture(
+        params=[_SubarrayObsStateMachine, _SubarrayObsStateTableMachine],
+        ids=["transitions", "table"],
+    )
+    def machine_under_test(self, request):
         """
-        Fixture that returns the state model under test in this class
+        Fixture that returns the state model under test in this class,
+        implemented by each of the state machine engines in turn
+
+        :param request: a pytest request for the fixture parameter
 
         :returns: the state machine under test
         """
-        yield _SubarrayObsStateMachine()
+        yield request.param()
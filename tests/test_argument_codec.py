@@ -0,0 +1,134 @@
+"""
+Tests for the :py:mod:`ska_tango_base.argument_codec` module.
+"""
+import json
+import math
+
+import pytest
+
+from ska_tango_base.argument_codec import (
+    ArgumentCodec,
+    JsonArgumentCodec,
+    dumps_encoded,
+    encoded_text,
+    encodings,
+    loads,
+    loads_encoded,
+    preferred_encoding,
+)
+from ska_tango_base.faults import ArgumentValidationError
+
+
+def test_loads():
+    """
+    Test that JSON is decoded, falling back to the standard library for
+    documents that the fast decoder rejects.
+    """
+    assert loads('{"id": 1, "receptors": ["SKA001"]}') == {
+        "id": 1,
+        "receptors": ["SKA001"],
+    }
+    assert math.isnan(loads('{"value": NaN}')["value"])
+    assert loads(str(2 ** 70)) == 2 ** 70
+    with pytest.raises(ValueError):
+        loads("Invalid JSON")
+
+
+class TestJsonArgumentCodec:
+    """
+    Tests of the
+    :py:class:`ska_tango_base.argument_codec.JsonArgumentCodec` class.
+    """
+
+    def test_decode(self):
+        """
+        Test that any valid JSON is decoded by a codec without
+        validation rules, and that a plain codec does not decode at all.
+        """
+        assert JsonArgumentCodec().decode('["BAND1", "BAND2"]') == ["BAND1", "BAND2"]
+        assert ArgumentCodec().decode('["BAND1"]') == '["BAND1"]'
+        assert ArgumentCodec().decode_encoded(("json", b'["BAND1"]')) == ["BAND1"]
+        with pytest.raises(ArgumentValidationError, match="Invalid JSON"):
+            JsonArgumentCodec().decode("Invalid JSON")
+
+    def test_validate(self):
+        """
+        Test that the decoded argument is checked for type and for
+        required keys and their value types.
+        """
+        codec = JsonArgumentCodec(dict, required_keys={"id": str, "scan": None})
+        assert codec.decode('{"id": "sbi-001", "scan": 1}') == {
+            "id": "sbi-001",
+            "scan": 1,
+        }
+
+        with pytest.raises(ArgumentValidationError, match="Expected dict, got list"):
+            codec.decode('["id"]')
+        with pytest.raises(ArgumentValidationError, match="Missing key 'scan'"):
+            codec.decode('{"id": "sbi-001"}')
+        with pytest.raises(
+            ArgumentValidationError, match="Expected str for key 'id', got int"
+        ):
+            codec.decode('{"id": 1, "scan": 1}')
+
+        with pytest.raises(ArgumentValidationError, match="Missing key 'scan'"):
+            codec.decode_encoded(("json", b'{"id": "sbi-001"}'))
+
+        codec = JsonArgumentCodec((dict, list), required_keys=["id"])
+        with pytest.raises(ArgumentValidationError, match="Expected dict, got list"):
+            codec.decode("[1, 2]")
+        with pytest.raises(
+            ArgumentValidationError, match="Expected dict or list, got int"
+        ):
+            codec.decode("1")
+
+
+def test_encoded():
+    """
+    Test that values round-trip through each available encoding, and
+    that unsupported encodings are rejected.
+    """
+    value = {"id": "sbi-001", "receptors": ["SKA001", "SKA002"], "scan": 1}
+    for encoding in encodings:
+        encoded = dumps_encoded(value, encoding)
+        assert encoded[0] == encoding
+        assert loads_encoded(encoded) == value
+    assert dumps_encoded(value)[0] == preferred_encoding
+
+    with pytest.raises(ArgumentValidationError, match="Unsupported encoding"):
+        loads_encoded(("xml", b"<id>sbi-001</id>"))
+    with pytest.raises(ArgumentValidationError, match="Invalid json"):
+        loads_encoded(("json", b"Invalid JSON"))
+    with pytest.raises(ValueError, match="Unsupported encoding"):
+        dumps_encoded(value, "xml")
+
+
+def test_encoded_text():
+    """
+    Test that the JSON text of a JSON-encoded value is the text that was
+    sent, and that a value in another encoding is serialised, even if
+    it contains bytes.
+    """
+    text = '{"id": "sbi-001",   "scan": 1}'
+    argin = ("json", text.encode("utf-8"))
+    assert encoded_text(argin, loads_encoded(argin)) == text
+
+    decoded = {"id": "sbi-001", "key": b"\x00\xff"}
+    assert json.loads(encoded_text(("msgpack", b""), decoded)) == {
+        "id": "sbi-001",
+        "key": "\x00\\xff",
+    }
+    with pytest.raises(TypeError):
+        encoded_text(("msgpack", b""), {"id": object()})
+
+
+def test_msgpack():
+    """
+    Test that msgpack-encoded arguments are decoded and validated, if
+    msgpack is installed.
+    """
+    msgpack = pytest.importorskip("msgpack")
+    codec = JsonArgumentCodec(dict, required_keys=["id"])
+    assert codec.decode_encoded(("msgpack", msgpack.packb({"id": 1}))) == {"id": 1}
+    with pytest.raises(ArgumentValidationError, match="Missing key 'id'"):
+        codec.decode_encoded(("msgpack", msgpack.packb({"scan": 1})))
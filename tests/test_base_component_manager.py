@@ -79,10 +79,9 @@ class TestBaseComponentManager:
         assert not component_manager.is_communicating
         component_manager.start_communicating()
         assert component_manager.is_communicating
-        assert mock_op_state_model.perform_action.call_args_list == [
-            (("component_unknown",),),
-            ((expected_action,),),
-        ]
+        mock_op_state_model.perform_actions.assert_called_once_with(
+            ["component_unknown", expected_action]
+        )
 
         mock_op_state_model.reset_mock()
 
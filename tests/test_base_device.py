@@ -11,11 +11,14 @@ This module contains the tests for the SKABaseDevice.
 """
 
 # PROTECTED REGION ID(SKABaseDevice.test_additional_imports) ENABLED START #
+import json
 import logging
 import re
 import pytest
 import socket
 import tango
+import threading
+import time
 
 from unittest import mock
 from tango import DevFailed, DevState
@@ -28,6 +31,7 @@ from ska_tango_base.base.base_device import (
     _DEBUGGER_PORT,
     _Log4TangoLoggingLevel,
     _PYTHON_TO_TANGO_LOGGING_LEVEL,
+    AsyncLoggingHandler,
     LoggingUtils,
     LoggingTargetError,
     TangoLoggingServiceHandler,
@@ -125,6 +129,125 @@ class TestTangoLoggingServiceHandler:
         assert repr(tls_handler) == expected
 
 
+class TestAsyncLoggingHandler:
+    class BlockingHandler(logging.Handler):
+        """Handler that records messages, once it is unblocked."""
+
+        def __init__(self):
+            super().__init__()
+            self.unblocked = threading.Event()
+            self.messages = []
+
+        def emit(self, record):
+            self.unblocked.wait()
+            self.messages.append(record.getMessage())
+
+    @pytest.fixture()
+    def inner_handler(self):
+        return self.BlockingHandler()
+
+    @staticmethod
+    def emit(handler, level, message, *args):
+        handler.handle(logging.LogRecord("test", level, "", 1, message, args, None))
+
+    def test_records_are_handled_in_order(self, inner_handler):
+        handler = AsyncLoggingHandler(inner_handler)
+        inner_handler.unblocked.set()
+        for i in range(10):
+            self.emit(handler, logging.INFO, "message %s", i)
+        handler.close()
+        assert inner_handler.messages == [f"message {i}" for i in range(10)]
+        assert handler.dropped == 0
+        assert handler.handled == 10
+        assert 0.0 < handler.mean_latency <= handler.max_latency
+
+    def test_emit_does_not_block(self, inner_handler):
+        handler = AsyncLoggingHandler(inner_handler, capacity=5, close_timeout=0.1)
+        start = time.monotonic()
+        for i in range(100):
+            self.emit(handler, logging.INFO, "message %s", i)
+        assert time.monotonic() - start < 1.0
+        assert handler.dropped >= 94
+        inner_handler.unblocked.set()
+        handler.close()
+
+    @pytest.mark.parametrize(
+        ("drop_policy", "expected"),
+        [
+            ("oldest", ["warning 1", "info 2", "debug 3"]),
+            ("newest", ["info 0", "warning 1", "info 2"]),
+            ("level", ["info 0", "warning 1", "info 2"]),
+        ],
+    )
+    def test_drop_policy(self, inner_handler, drop_policy, expected):
+        handler = AsyncLoggingHandler(
+            inner_handler, capacity=3, drop_policy=drop_policy
+        )
+        # occupy the drain thread, so that later records stay buffered
+        self.emit(handler, logging.INFO, "blocking")
+        deadline = time.monotonic() + 5.0
+        while handler._records and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.emit(handler, logging.INFO, "info 0")
+        self.emit(handler, logging.WARNING, "warning 1")
+        self.emit(handler, logging.INFO, "info 2")
+        self.emit(handler, logging.DEBUG, "debug 3")
+        inner_handler.unblocked.set()
+        handler.close()
+        assert inner_handler.messages == ["blocking"] + expected
+        assert handler.dropped == 1
+
+    def test_level_drop_policy_drops_lowest_level(self, inner_handler):
+        handler = AsyncLoggingHandler(inner_handler, capacity=3, drop_policy="level")
+        self.emit(handler, logging.INFO, "blocking")
+        deadline = time.monotonic() + 5.0
+        while handler._records and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.emit(handler, logging.WARNING, "warning 0")
+        self.emit(handler, logging.INFO, "info 1")
+        self.emit(handler, logging.INFO, "info 2")
+        self.emit(handler, logging.ERROR, "error 3")
+        inner_handler.unblocked.set()
+        handler.close()
+        assert inner_handler.messages == [
+            "blocking",
+            "warning 0",
+            "info 2",
+            "error 3",
+        ]
+
+    def test_level_drop_policy_keeps_order(self, inner_handler):
+        handler = AsyncLoggingHandler(inner_handler, capacity=4, drop_policy="level")
+        self.emit(handler, logging.INFO, "blocking")
+        deadline = time.monotonic() + 5.0
+        while handler._records and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.emit(handler, logging.DEBUG, "debug 0")
+        self.emit(handler, logging.INFO, "info 1")
+        self.emit(handler, logging.DEBUG, "debug 2")
+        self.emit(handler, logging.WARNING, "warning 3")
+        self.emit(handler, logging.INFO, "info 4")
+        self.emit(handler, logging.ERROR, "error 5")
+        self.emit(handler, logging.DEBUG, "debug 6")
+        inner_handler.unblocked.set()
+        handler.close()
+        assert inner_handler.messages == [
+            "blocking",
+            "info 1",
+            "warning 3",
+            "info 4",
+            "error 5",
+        ]
+        assert handler.dropped == 3
+
+    def test_invalid_drop_policy(self, inner_handler):
+        with pytest.raises(ValueError):
+            AsyncLoggingHandler(inner_handler, drop_policy="invalid")
+
+
 class TestLoggingUtils:
     @pytest.fixture(
         params=[
@@ -149,6 +272,12 @@ class TestLoggingUtils:
             (["tango::logger"], ["tango::logger"]),
             (["tango::anything"], ["tango::anything"]),
             (["console", "file"], ["console::cout", "file::my_dev_name.log"]),
+            (["async::file"], ["async::file::my_dev_name.log"]),
+            (["async::tango::"], ["async::tango::logger"]),
+            (
+                ["async::syslog::tcp://somehost:601"],
+                ["async::syslog::tcp://somehost:601"],
+            ),
         ]
     )
     def good_logging_targets(self, request):
@@ -162,6 +291,10 @@ class TestLoggingUtils:
             ["invalid", "console"],
             ["invalid::type"],
             ["syslog"],
+            ["async"],
+            ["async::"],
+            ["async::syslog"],
+            ["async::async::console"],
         ]
     )
     def bad_logging_targets(self, request):
@@ -287,6 +420,22 @@ class TestLoggingUtils:
         assert handler == mock_tango_handler()
         handler.setFormatter.assert_called_once_with(mock_formatter)
 
+        mock_stream_handler.reset_mock()
+        handler = LoggingUtils.create_logging_handler(
+            "async::console::cout", buffer_size=10, drop_policy="newest"
+        )
+        assert isinstance(handler, AsyncLoggingHandler)
+        assert handler.name == "async::console::cout"
+        assert handler.handler == mock_stream_handler()
+        assert handler.handler.name == "console::cout"
+        handler.handler.setFormatter.assert_called_once_with(mock_formatter)
+        handler.close()
+
+        with pytest.raises(LoggingTargetError):
+            LoggingUtils.create_logging_handler(
+                "async::console::cout", drop_policy="invalid"
+            )
+
         with pytest.raises(LoggingTargetError):
             LoggingUtils.create_logging_handler("invalid::target")
 
@@ -362,6 +511,45 @@ class TestLoggingUtils:
         finally:
             LoggingUtils.create_logging_handler = orig_create_logging_handler
 
+    def test_logging_handlers_are_shared(self):
+        loggers = [logging.getLogger(f"testing/shared/{i}") for i in range(2)]
+        for logger in loggers:
+            logger.tango_logger = mock.MagicMock(spec=tango.Logger)
+
+        def null_creator(target, tango_logger):
+            handler = mock.MagicMock(wraps=logging.NullHandler())
+            handler.name = target
+            return handler
+
+        with mock.patch.object(
+            LoggingUtils, "create_logging_handler", side_effect=null_creator
+        ) as mocked_creator:
+            for logger in loggers:
+                LoggingUtils.update_logging_handlers(
+                    ["file::/tmp/dummy", "tango::logger"], logger
+                )
+
+            # file handler is shared, but tango handlers are per device
+            assert mocked_creator.call_count == 3
+            assert loggers[0].handlers[0] is loggers[1].handlers[0]
+            assert loggers[0].handlers[1] is not loggers[1].handlers[1]
+
+            shared_handler = loggers[0].handlers[0]
+            tango_handler = loggers[0].handlers[1]
+            LoggingUtils.update_logging_handlers([], loggers[0])
+            tango_handler.close.assert_called_once_with()
+            shared_handler.close.assert_not_called()
+
+            LoggingUtils.update_logging_handlers([], loggers[1])
+            shared_handler.close.assert_called_once_with()
+
+            # once closed, a new handler is created for the target
+            mocked_creator.reset_mock()
+            LoggingUtils.update_logging_handlers(["file::/tmp/dummy"], loggers[0])
+            mocked_creator.assert_called_once_with("file::/tmp/dummy", mock.ANY)
+            assert loggers[0].handlers[0] is not shared_handler
+            LoggingUtils.update_logging_handlers([], loggers[0])
+
 
 # PROTECTED REGION END #    //  SKABaseDevice.test_SKABaseDevice_decorators
 class TestSKABaseDevice(object):
@@ -586,6 +774,21 @@ class TestSKABaseDevice(object):
             mocked_creator.assert_not_called()
         # PROTECTED REGION END #    //  SKABaseDevice.test_loggingTargets
 
+    def test_asyncLoggingAttributes(self, tango_context):
+        """Test for the asynchronous logging attributes"""
+        # PROTECTED REGION ID(SKABaseDevice.test_asyncLoggingAttributes) ENABLED START #
+        assert tango_context.device.asyncLoggingDroppedRecords == 0
+        assert tango_context.device.asyncLoggingMeanLatency == 0.0
+        assert tango_context.device.asyncLoggingMaxLatency == 0.0
+
+        tango_context.device.loggingTargets = ["async::console::cout"]
+        assert tango_context.device.loggingTargets == ("async::console::cout",)
+        tango_context.device.GetVersionInfo()
+        assert tango_context.device.asyncLoggingDroppedRecords == 0
+        assert tango_context.device.asyncLoggingMaxLatency >= 0.0
+        tango_context.device.loggingTargets = ["tango::logger"]
+        # PROTECTED REGION END #    //  SKABaseDevice.test_asyncLoggingAttributes
+
     # PROTECTED REGION ID(SKABaseDevice.test_healthState_decorators) ENABLED START #
     # PROTECTED REGION END #    //  SKABaseDevice.test_healthState_decorators
     def test_healthState(self, tango_context):
@@ -645,6 +848,44 @@ class TestSKABaseDevice(object):
         assert tango_context.device.testMode == TestMode.NONE
         # PROTECTED REGION END #    //  SKABaseDevice.test_testMode
 
+    def test_longRunningCommandAttributes(self, tango_context):
+        """Test that the command queue attributes are initially empty"""
+        # PROTECTED REGION ID(SKABaseDevice.test_longRunningCommandAttributes) ENABLED START #
+        for attribute_name in [
+            "longRunningCommandsInQueue",
+            "longRunningCommandIDsInQueue",
+            "longRunningCommandStatus",
+            "longRunningCommandProgress",
+            "longRunningCommandResult",
+        ]:
+            assert not tango_context.device.read_attribute(attribute_name).value
+        # PROTECTED REGION END #    //  SKABaseDevice.test_longRunningCommandAttributes
+
+    def test_commandStatistics(self, tango_context):
+        """Test for commandStatistics and ResetCommandStatistics"""
+        # PROTECTED REGION ID(SKABaseDevice.test_commandStatistics) ENABLED START #
+        tango_context.device.GetVersionInfo()
+        tango_context.device.GetVersionInfo()
+        statistics = json.loads(tango_context.device.commandStatistics)
+        assert statistics["GetVersionInfo"]["count"] == 2
+        assert statistics["GetVersionInfo"]["failures"] == 0
+        assert statistics["GetVersionInfo"]["latency_ms"]["p99"] > 0
+        assert statistics["On"]["count"] == 0
+
+        [[result_code], _] = tango_context.device.ResetCommandStatistics()
+        assert result_code == ResultCode.OK
+        statistics = json.loads(tango_context.device.commandStatistics)
+        assert statistics["GetVersionInfo"]["count"] == 0
+        assert statistics["ResetCommandStatistics"]["count"] == 0
+        # PROTECTED REGION END #    //  SKABaseDevice.test_commandStatistics
+
+    def test_commandTraces(self, tango_context):
+        """Test that commandTraces is empty when there is no trace buffer"""
+        # PROTECTED REGION ID(SKABaseDevice.test_commandTraces) ENABLED START #
+        tango_context.device.GetVersionInfo()
+        assert not tango_context.device.commandTraces
+        # PROTECTED REGION END #    //  SKABaseDevice.test_commandTraces
+
     def test_debugger_not_listening_by_default(self, tango_context):
         assert not SKABaseDevice._global_debugger_listening
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
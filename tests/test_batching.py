@@ -0,0 +1,116 @@
+"""
+Tests for the :py:mod:`ska_tango_base.batching` module.
+"""
+import pytest
+from tango import DevState
+
+from ska_tango_base.base import AdminModeModel, OpStateModel
+from ska_tango_base.control_model import AdminMode, ObsState
+from ska_tango_base.faults import StateModelError
+from ska_tango_base.subarray import SubarrayObsStateModel
+
+
+class TestBatchedActions:
+    """
+    Tests of batched actions on the state models that support them.
+    """
+
+    @pytest.fixture()
+    def callback(self, mocker):
+        """
+        Fixture that returns a mock callback for the state model.
+
+        :param mocker: pytest fixture that wraps
+            :py:mod:`unittest.mock`.
+
+        :return: a mock callback
+        """
+        return mocker.Mock()
+
+    @pytest.fixture()
+    def op_state_model(self, logger, callback):
+        """
+        Fixture that returns an op state model in DISABLE state.
+
+        :param logger: a logger for the model
+        :param callback: a mock callback for the model
+
+        :return: an op state model
+        """
+        model = OpStateModel(logger, callback=callback)
+        model.perform_actions(["init_invoked", "init_completed"])
+        callback.reset_mock()
+        return model
+
+    def test_net_change_reported_once(self, op_state_model, callback):
+        """
+        Test that a batch of actions results in a single call to the
+        callback, with the final state.
+        """
+        op_state_model.perform_actions(["component_unknown", "component_on"])
+        assert op_state_model.op_state == DevState.ON
+        callback.assert_called_once_with(DevState.ON)
+
+    def test_no_net_change_not_reported(self, op_state_model, callback):
+        """
+        Test that a batch of actions that leaves the model in the state
+        in which it started does not result in a call to the callback.
+        """
+        op_state_model.perform_actions(["component_unknown", "component_disconnected"])
+        assert op_state_model.op_state == DevState.DISABLE
+        callback.assert_not_called()
+
+    def test_nested_batches(self, op_state_model, callback):
+        """
+        Test that the callback is called only when the outermost of
+        nested batches is closed.
+        """
+        with op_state_model.batch():
+            op_state_model.perform_action("component_unknown")
+            op_state_model.perform_actions(["component_off", "component_on"])
+            assert op_state_model.op_state == DevState.ON
+            callback.assert_not_called()
+        callback.assert_called_once_with(DevState.ON)
+
+    def test_disallowed_action(self, op_state_model, callback):
+        """
+        Test that a disallowed action in a batch raises an exception,
+        and that the net change from the actions before it is still
+        reported.
+        """
+        with pytest.raises(StateModelError):
+            op_state_model.perform_actions(["component_unknown", "init_completed"])
+        assert op_state_model.op_state == DevState.UNKNOWN
+        callback.assert_called_once_with(DevState.UNKNOWN)
+
+    def test_admin_mode_model(self, logger, callback):
+        """
+        Test batched actions on the admin mode model.
+        """
+        model = AdminModeModel(logger, callback=callback)
+        callback.reset_mock()
+        model.perform_actions(["to_notfitted", "to_offline"])
+        assert model.admin_mode == AdminMode.OFFLINE
+        callback.assert_not_called()
+
+        model.perform_actions(["to_online", "to_maintenance"])
+        callback.assert_called_once_with(AdminMode.MAINTENANCE)
+
+    def test_obs_state_model(self, logger, callback):
+        """
+        Test batched actions on an obs state model.
+        """
+        model = SubarrayObsStateModel(logger, callback=callback)
+        callback.reset_mock()
+        model.perform_actions(
+            [
+                "assign_invoked",
+                "component_resourced",
+                "assign_completed",
+                "configure_invoked",
+                "component_configured",
+                "configure_completed",
+            ]
+        )
+        assert model.obs_state == ObsState.READY
+        callback.assert_called_once_with(ObsState.READY)
@@ -0,0 +1,142 @@
+"""
+Tests for the :py:mod:`ska_tango_base.capability_ledger` module.
+"""
+import pytest
+
+from ska_tango_base.capability_ledger import CapabilityCounts, CapabilityLedger
+from ska_tango_base.faults import CapabilityValidationError
+
+
+class TestCapabilityLedger:
+    """
+    Tests of the
+    :py:class:`ska_tango_base.capability_ledger.CapabilityLedger` class.
+    """
+
+    @pytest.fixture()
+    def ledger(self):
+        """
+        Fixture that returns a ledger of two capability types.
+
+        :return: a capability ledger
+        :rtype: :py:class:`ska_tango_base.capability_ledger.CapabilityLedger`
+        """
+        return CapabilityLedger.from_strings(["CORRELATOR:512", "PSS-BEAMS:4"])
+
+    def test_from_strings(self, ledger):
+        """
+        Test that a ledger is built from "type:n" strings, and that its
+        formatted capabilities match those previously reported.
+        """
+        assert ledger.capability_types == ("CORRELATOR", "PSS-BEAMS")
+        assert ledger.max_instances("PSS-BEAMS") == 4
+        assert ledger.max_capabilities == ["CORRELATOR:512", "PSS-BEAMS:4"]
+        assert ledger.available_capabilities == ["CORRELATOR:512", "PSS-BEAMS:4"]
+        assert CapabilityLedger.from_strings(None).available_capabilities == []
+
+    def test_is_achievable(self, ledger):
+        """
+        Test that each requested number of instances is checked against
+        the available instances, and that unknown types are rejected.
+        """
+        assert ledger.is_achievable([4, 512], ["PSS-BEAMS", "CORRELATOR"])
+        assert not ledger.is_achievable([5], ["PSS-BEAMS"])
+        assert ledger.has_types(["PSS-BEAMS"])
+        assert not ledger.has_types(["PST-BEAMS"])
+        with pytest.raises(CapabilityValidationError):
+            ledger.is_achievable([1], ["PST-BEAMS"])
+
+    def test_are_achievable(self, ledger):
+        """
+        Test that many candidate allocations are checked at once, with
+        repeated types summed, and that malformed candidates are
+        rejected.
+        """
+        ledger.allocate([2], ["PSS-BEAMS"])
+        result = ledger.are_achievable(
+            [[2, 0, 512], [2, 1, 0], [0, 0, 513]],
+            ["PSS-BEAMS", "PSS-BEAMS", "CORRELATOR"],
+        )
+        assert result.tolist() == [True, False, False]
+        assert ledger.are_achievable([], ["PSS-BEAMS"]).tolist() == []
+
+        with pytest.raises(CapabilityValidationError):
+            ledger.are_achievable([[1, 2]], ["PSS-BEAMS"])
+        with pytest.raises(CapabilityValidationError):
+            ledger.are_achievable([[1]], ["PST-BEAMS"])
+        with pytest.raises(CapabilityValidationError):
+            ledger.are_achievable([[3, -1]], ["PSS-BEAMS", "PSS-BEAMS"])
+
+    def test_allocate_and_free(self, ledger):
+        """
+        Test that allocations are all-or-nothing, that repeated types
+        are summed, and that formatted capabilities follow changes.
+        """
+        formatted = ledger.available_capabilities
+        assert ledger.available_capabilities is formatted
+
+        assert ledger.allocate([2, 1], ["PSS-BEAMS", "PSS-BEAMS"])
+        assert ledger.available_instances("PSS-BEAMS") == 1
+        assert ledger.available_capabilities == ["CORRELATOR:512", "PSS-BEAMS:1"]
+
+        assert not ledger.allocate([10, 2], ["CORRELATOR", "PSS-BEAMS"])
+        assert ledger.available_instances("CORRELATOR") == 512
+
+        ledger.free([3], ["PSS-BEAMS"])
+        assert ledger.available_capabilities == ["CORRELATOR:512", "PSS-BEAMS:4"]
+
+        with pytest.raises(CapabilityValidationError):
+            ledger.free([1], ["PSS-BEAMS"])
+        with pytest.raises(CapabilityValidationError):
+            ledger.allocate([-1], ["PSS-BEAMS"])
+        with pytest.raises(CapabilityValidationError):
+            ledger.allocate([1, 1], ["PSS-BEAMS"])
+        with pytest.raises(CapabilityValidationError):
+            ledger.free([1], ["PSS-BEAMS", "CORRELATOR"])
+
+        ledger.allocate([512], ["CORRELATOR"])
+        ledger.reset()
+        assert ledger.available_instances("CORRELATOR") == 512
+
+    def test_set_available_and_reconfigure(self, ledger):
+        """
+        Test that available instances can be set within range, and that
+        reconfiguring keeps the instances allocated.
+        """
+        ledger.set_available({"PSS-BEAMS": 1})
+        assert ledger.available_capabilities == ["CORRELATOR:512", "PSS-BEAMS:1"]
+        with pytest.raises(CapabilityValidationError):
+            ledger.set_available({"PSS-BEAMS": 5})
+        with pytest.raises(CapabilityValidationError):
+            ledger.set_available({"CORRELATOR": 1, "PSS-BEAMS": -1})
+        assert ledger.available_instances("CORRELATOR") == 512
+        with pytest.raises(CapabilityValidationError):
+            ledger.set_available({"PST-BEAMS": 1})
+
+        ledger.reconfigure({"PSS-BEAMS": 6, "PST-BEAMS": 2})
+        assert ledger.capability_types == ("PSS-BEAMS", "PST-BEAMS")
+        assert ledger.max_capabilities == ["PSS-BEAMS:6", "PST-BEAMS:2"]
+        assert ledger.available_capabilities == ["PSS-BEAMS:3", "PST-BEAMS:2"]
+        ledger.reconfigure({"PSS-BEAMS": 2})
+        assert ledger.available_instances("PSS-BEAMS") == 0
+
+    def test_capability_counts(self, ledger):
+        """
+        Test that dictionary views of the ledger read from it, and write
+        to it.
+        """
+        max_counts = CapabilityCounts(ledger, available=False)
+        available = CapabilityCounts(ledger, available=True)
+        assert max_counts == {"CORRELATOR": 512, "PSS-BEAMS": 4}
+        assert "PST-BEAMS" not in available
+
+        available["PSS-BEAMS"] -= 1
+        assert ledger.available_instances("PSS-BEAMS") == 3
+        with pytest.raises(CapabilityValidationError):
+            available["PSS-BEAMS"] += 2
+        with pytest.raises(CapabilityValidationError):
+            del available["PSS-BEAMS"]
+
+        max_counts["PST-BEAMS"] = 2
+        del max_counts["CORRELATOR"]
+        assert dict(available) == {"PSS-BEAMS": 3, "PST-BEAMS": 2}
@@ -0,0 +1,125 @@
+"""
+Tests for the :py:mod:`ska_tango_base.command_logging` module.
+"""
+import logging
+import re
+
+import pytest
+
+from ska_tango_base.command_logging import TRACE_ARGIN_MAX_LENGTH, CommandLogging
+from ska_tango_base.commands import ResponseCommand, ResultCode
+
+
+class TestCommandLogging:
+    """
+    Tests of the :py:class:`ska_tango_base.command_logging.CommandLogging`
+    class, and of its use by commands.
+    """
+
+    @pytest.fixture()
+    def command(self):
+        """
+        Fixture that returns a command that echoes its argument, with a
+        logger whose records are captured by pytest.
+
+        :return: a command
+        """
+
+        class EchoCommand(ResponseCommand):
+            def do(self, argin):
+                if argin == "fail":
+                    return (ResultCode.FAILED, "EchoCommand failed")
+                return (ResultCode.OK, argin)
+
+        return EchoCommand(None, logger=logging.getLogger(__name__))
+
+    def test_summarise(self):
+        """
+        Test that command arguments are truncated or hashed as
+        configured, and only when converted to a string.
+        """
+        argin = "x" * 100
+        assert str(CommandLogging().summarise(argin)) == argin
+        assert (
+            str(CommandLogging(argin_max_length=10).summarise(argin))
+            == "xxxxxxxxxx... <100 chars>"
+        )
+        assert str(CommandLogging(hash_argin=True).summarise(argin)).startswith(
+            "<100 chars, sha256 "
+        )
+
+        class Unprintable:
+            def __str__(self):
+                raise AssertionError("Argument formatted eagerly")
+
+        CommandLogging().summarise(Unprintable())
+
+    def test_logging(self, command, caplog):
+        """
+        Test that, without a trace buffer, entry records are logged at
+        DEBUG level and exit records at INFO level, with the argument
+        summarised.
+        """
+        command.command_logging = CommandLogging(argin_max_length=5)
+        with caplog.at_level(logging.DEBUG, logger=command.logger.name):
+            command("0123456789")
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert "Entering command EchoCommand with argin '01234... <10 chars>'" in (
+            messages
+        )
+        assert (
+            "Exiting command EchoCommand with return_code 0, message: '0123456789'."
+            in messages
+        )
+
+    def test_trace_buffer(self, command, caplog):
+        """
+        Test that, with a trace buffer, a sample of calls is traced
+        instead of logged, and that failures are still logged.
+        """
+        command_logging = CommandLogging(trace_buffer_size=4, trace_sample_rate=2)
+        command.command_logging = command_logging
+        with caplog.at_level(logging.DEBUG, logger=command.logger.name):
+            for argin in ["a", "b", "c", "d", "e"]:
+                command(argin)
+        assert not caplog.records
+
+        traces = [trace.split(" ", 1)[1] for trace in command_logging.traces]
+        assert traces == [
+            "Entering command EchoCommand with argin 'c'",
+            "Exiting command EchoCommand with return_code 0, message: 'c'.",
+            "Entering command EchoCommand with argin 'e'",
+            "Exiting command EchoCommand with return_code 0, message: 'e'.",
+        ]
+
+        assert all(
+            re.match(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(\.\d+)?Z ", trace)
+            for trace in command_logging.traces
+        )
+
+        command("fail")
+        assert any(record.levelno == logging.ERROR for record in caplog.records)
+
+        command_logging.clear_traces()
+        assert command_logging.traces == []
+
+    def test_trace_argin_bounded(self, command):
+        """
+        Test that the trace buffer holds a bounded summary of each
+        command argument, rather than the argument itself.
+        """
+
+        class Argument(str):
+            pass
+
+        argin = Argument("x" * (10 * TRACE_ARGIN_MAX_LENGTH))
+        command_logging = CommandLogging(trace_buffer_size=4)
+        command.command_logging = command_logging
+        command.do = lambda argin: (ResultCode.OK, "done")
+        command(argin)
+
+        (_, _, args) = command_logging._traces[0]
+        assert not any(arg is argin for arg in args)
+        assert all(len(str(arg)) < 2 * TRACE_ARGIN_MAX_LENGTH for arg in args)
+        assert f"<{len(argin)} chars>" in command_logging.traces[0]
@@ -0,0 +1,206 @@
+"""
+Tests for the :py:mod:`ska_tango_base.command_progress` module.
+"""
+
+import threading
+import time
+
+import pytest
+
+from ska_tango_base.command_progress import CommandProgress, TimerWheel
+from ska_tango_base.commands import ResponseCommand, ResultCode
+
+
+@pytest.fixture
+def wheel():
+    """
+    Fixture that returns a fine-grained timer wheel.
+
+    :return: a timer wheel
+    """
+    return TimerWheel(tick=0.01, slot_count=8)
+
+
+@pytest.fixture
+def published():
+    """
+    Fixture that returns a list into which published values are
+    recorded.
+
+    :return: an empty list
+    """
+    return []
+
+
+@pytest.fixture
+def progress_tracker(wheel, published, logger):
+    """
+    Fixture that returns a progress tracker, which records published
+    values in the ``published`` list.
+
+    :param wheel: the timer wheel on which watchdogs are scheduled
+    :param published: list into which published values are recorded
+    :param logger: a logger
+
+    :return: a progress tracker
+    """
+    return CommandProgress(
+        "assignResources",
+        publish=lambda name, value: published.append((name, value)),
+        granularity=10,
+        wheel=wheel,
+        logger=logger,
+    )
+
+
+class TestTimerWheel:
+    """
+    Tests of the :py:class:`ska_tango_base.command_progress.TimerWheel`
+    class.
+    """
+
+    def test_schedule(self, wheel):
+        """
+        Test that timers fire no earlier than their delay, in order,
+        including timers whose delay exceeds a turn of the wheel.
+
+        :param wheel: the timer wheel under test
+        """
+        fired = []
+        all_fired = threading.Event()
+        start = time.monotonic()
+
+        def record(name):
+            fired.append((name, time.monotonic() - start))
+            if len(fired) == 3:
+                all_fired.set()
+
+        for name, delay in [("c", 0.25), ("a", 0.0), ("b", 0.05)]:
+            wheel.schedule(delay, lambda name=name: record(name))
+        assert all_fired.wait(2.0)
+
+        assert [name for (name, _) in fired] == ["a", "b", "c"]
+        assert fired[1][1] >= 0.05
+        assert fired[2][1] >= 0.25
+        assert len(wheel) == 0
+
+    def test_cancel(self, wheel):
+        """
+        Test that a cancelled timer does not fire, and that a timer
+        cannot be cancelled after it has fired.
+
+        :param wheel: the timer wheel under test
+        """
+        cancelled = threading.Event()
+        fired = threading.Event()
+
+        timer = wheel.schedule(0.05, cancelled.set)
+        assert wheel.cancel(timer)
+        other = wheel.schedule(0.1, fired.set)
+        assert fired.wait(2.0)
+        assert not cancelled.is_set()
+        assert not wheel.cancel(other)
+
+
+class TestCommandProgress:
+    """
+    Tests of the
+    :py:class:`ska_tango_base.command_progress.CommandProgress` class.
+    """
+
+    def test_progress(self, progress_tracker, published):
+        """
+        Test that progress is published at the configured granularity,
+        and that the measured duration is published when a call
+        finishes.
+
+        :param progress_tracker: the progress tracker under test
+        :param published: list into which published values are recorded
+        """
+        progress_tracker.update(50)
+        assert progress_tracker.progress == 0
+        assert not progress_tracker.running
+
+        progress_tracker.start()
+        assert progress_tracker.running
+        for progress in range(0, 60, 5):
+            progress_tracker.update(progress)
+        assert progress_tracker.progress == 55
+        progress_tracker.finish()
+
+        assert [value for (name, value) in published if name.endswith("Progress")] == [
+            0,
+            10,
+            20,
+            30,
+            40,
+            50,
+            100,
+        ]
+        assert published[-1][0] == "assignResourcesMeasuredDuration"
+        assert progress_tracker.measured_duration == published[-1][1] >= 0
+        assert not progress_tracker.running
+
+    def test_failed_call(self, progress_tracker, published):
+        """
+        Test that a failed call publishes its last progress, rather than
+        completion.
+
+        :param progress_tracker: the progress tracker under test
+        :param published: list into which published values are recorded
+        """
+        progress_tracker.start()
+        progress_tracker.update(15)
+        progress_tracker.finish(succeeded=False)
+        assert progress_tracker.progress == 15
+        assert ("assignResourcesProgress", 15) in published
+        assert ("assignResourcesProgress", 100) not in published
+
+    def test_timeout(self, progress_tracker, published):
+        """
+        Test that the timeout expired flag is set if a call runs for
+        longer than the maximum duration, and reset by the next call.
+
+        :param progress_tracker: the progress tracker under test
+        :param published: list into which published values are recorded
+        """
+        progress_tracker.maximum_duration = 0.05
+        progress_tracker.start()
+        time.sleep(0.2)
+        assert progress_tracker.timeout_expired
+        assert ("assignResourcesTimeoutExpiredFlag", True) in published
+        progress_tracker.finish()
+        assert progress_tracker.measured_duration >= 0.05
+
+        progress_tracker.start()
+        assert not progress_tracker.timeout_expired
+        assert published[-1] == ("assignResourcesTimeoutExpiredFlag", False)
+        progress_tracker.finish()
+        time.sleep(0.1)
+        assert not progress_tracker.timeout_expired
+
+    def test_command_tracked(self, progress_tracker, published, logger):
+        """
+        Test that calls to a command with a progress tracker are
+        tracked, including the progress that the command reports.
+
+        :param progress_tracker: the progress tracker under test
+        :param published: list into which published values are recorded
+        :param logger: a logger
+        """
+
+        class ReportingCommand(ResponseCommand):
+            def do(self, argin):
+                self.update_progress(50)
+                return (ResultCode(argin), "ReportingCommand returned")
+
+        command = ReportingCommand(None, logger=logger)
+        command.progress_tracker = progress_tracker
+
+        command(ResultCode.OK)
+        assert ("assignResourcesProgress", 50) in published
+        assert progress_tracker.progress == 100
+        assert progress_tracker.measured_duration >= 0
+
+        command(ResultCode.FAILED)
+        assert progress_tracker.progress == 50
@@ -0,0 +1,122 @@
+"""
+Tests for the :py:mod:`ska_tango_base.command_statistics` module.
+"""
+import threading
+
+import pytest
+
+from ska_tango_base.command_statistics import CommandStatistics
+from ska_tango_base.commands import BaseCommand, ResponseCommand, ResultCode
+from ska_tango_base.executor import CommandExecutor
+
+
+class TestCommandStatistics:
+    """
+    Tests of the
+    :py:class:`ska_tango_base.command_statistics.CommandStatistics`
+    class, and of the recording of command calls in it.
+    """
+
+    def test_empty(self):
+        """
+        Test the statistics of a command that has not been called.
+        """
+        statistics = CommandStatistics()
+        assert statistics.as_dict() == {
+            "count": 0,
+            "failures": 0,
+            "latency_ms": {"p50": None, "p95": None, "p99": None, "max": None},
+        }
+
+    def test_percentiles(self):
+        """
+        Test that latency percentiles are reported to within the width
+        of a histogram bucket, and the maximum exactly.
+        """
+        statistics = CommandStatistics()
+        for latency_us in range(1, 1001):
+            statistics.record(latency_us * 1000, failed=(latency_us % 10 == 0))
+
+        assert statistics.count == 1000
+        assert statistics.failures == 100
+        for percentile in [50, 95, 99]:
+            latency = statistics.latency_percentile(percentile)
+            assert percentile * 1e-5 <= latency <= percentile * 1e-5 * 1.125
+        assert statistics.as_dict()["latency_ms"]["max"] == pytest.approx(1.0)
+
+        statistics.reset()
+        assert statistics.count == 0
+        assert statistics.latency_percentile(50) is None
+
+    def test_command_calls_recorded(self, logger):
+        """
+        Test that calls to a command with statistics are recorded,
+        including failures and exceptions.
+        """
+
+        class FlakyCommand(ResponseCommand):
+            def do(self, argin):
+                if argin == "raise":
+                    raise ValueError("Raised as requested")
+                return (ResultCode(argin), "FlakyCommand returned")
+
+        command = FlakyCommand(None, logger=logger)
+        command.statistics = CommandStatistics()
+
+        command(ResultCode.OK)
+        command(ResultCode.FAILED)
+        with pytest.raises(ValueError):
+            command("raise")
+
+        assert command.statistics.count == 3
+        assert command.statistics.failures == 2
+
+    def test_queued_calls_recorded(self, logger):
+        """
+        Test that calls to a command on an executor are recorded once
+        ``do()`` has run on the worker thread, with the latency of
+        ``do()`` rather than of queueing the call.
+        """
+        release = threading.Event()
+
+        class SlowCommand(ResponseCommand):
+            def do(self, argin):
+                release.wait(timeout=5.0)
+                if argin == "raise":
+                    raise ValueError("Raised as requested")
+                return (ResultCode(argin), "SlowCommand returned")
+
+        finished = threading.Semaphore(0)
+        executor = CommandExecutor(
+            max_queue_size=2,
+            logger=logger,
+            result_callback=lambda result: finished.release(),
+        )
+        command = SlowCommand(None, executor=executor, logger=logger)
+        command.statistics = CommandStatistics()
+
+        assert command(ResultCode.OK)[0] == ResultCode.QUEUED
+        assert command("raise")[0] == ResultCode.QUEUED
+        assert command(ResultCode.OK)[0] == ResultCode.REJECTED
+        assert command.statistics.count == 1
+
+        threading.Timer(0.05, release.set).start()
+        for _ in range(2):
+            assert finished.acquire(timeout=5.0)
+        executor.shutdown()
+        assert command.statistics.count == 3
+        assert command.statistics.failures == 2
+        assert command.statistics.as_dict()["latency_ms"]["max"] >= 50
+
+    def test_command_without_statistics(self, logger):
+        """
+        Test that a command without statistics is unaffected.
+        """
+
+        class EchoCommand(BaseCommand):
+            def do(self, argin):
+                return argin
+
+        command = EchoCommand(None, logger=logger)
+        assert command.statistics is None
+        assert command("foo") == "foo"
@@ -8,9 +8,10 @@
 #########################################################################################
 """Contain the tests for the SKAController."""
 
+import json
 import re
 import pytest
-from tango import DevState
+from tango import DevFailed, DevState
 
 # PROTECTED REGION ID(SKAController.test_additional_imports) ENABLED START #
 from ska_tango_base import SKAController
@@ -123,6 +124,34 @@ class TestSKAController(object):
         assert tango_context.device.isCapabilityAchievable([[1], ["BAND1"]]) is True
         # PROTECTED REGION END #    //  SKAController.test_isCapabilityAchievable_success
 
+    def test_isCapabilityAchievableBulk(self, tango_context):
+        """Test for isCapabilityAchievableBulk with a flat matrix and a header"""
+        result = tango_context.device.isCapabilityAchievableBulk(
+            [[1, 0, 2, 0, 1, 1, 0, 1], ["BAND1", "BAND2"]]
+        )
+        assert list(result) == [True, False, True, True]
+
+        with pytest.raises(DevFailed):
+            tango_context.device.isCapabilityAchievableBulk(
+                [[1, 0, 1], ["BAND1", "BAND2"]]
+            )
+        with pytest.raises(DevFailed):
+            tango_context.device.isCapabilityAchievableBulk([[1], ["BAND3"]])
+
+    def test_isCapabilityAchievableBulkJson(self, tango_context):
+        """Test for isCapabilityAchievableBulkJson"""
+        argin = json.dumps(
+            {
+                "capability_types": ["BAND1", "BAND1"],
+                "candidates": [[1, 0], [1, 1], [0, 0]],
+            }
+        )
+        result = tango_context.device.isCapabilityAchievableBulkJson(argin)
+        assert list(result) == [True, False, True]
+
+        with pytest.raises(DevFailed):
+            tango_context.device.isCapabilityAchievableBulkJson('{"candidates": []}')
+
     # PROTECTED REGION ID(SKAController.test_elementLoggerAddress_decorators) ENABLED START #
     # PROTECTED REGION END #    //  SKAController.test_elementLoggerAddress_decorators
     def test_elementLoggerAddress(self, tango_context):
@@ -231,3 +260,59 @@ class TestSKAController(object):
         # PROTECTED REGION ID(SKAController.test_availableCapabilities) ENABLED START #
         assert tango_context.device.availableCapabilities == ("BAND1:1", "BAND2:1")
         # PROTECTED REGION END #    //  SKAController.test_availableCapabilities
+
+
+class DictCapabilitiesController(SKAController):
+    """
+    A controller subclass that sets and changes its capabilities through
+    the ``_max_capabilities`` and ``_available_capabilities``
+    dictionaries, as subclasses written before the capability ledger do.
+    """
+
+    class InitCommand(SKAController.InitCommand):
+        def do(self):
+            result = super().do()
+            device = self.target
+            device._max_capabilities = {"BAND1": 2, "BAND2": 1, "BAND3": 3}
+            device._available_capabilities = {"BAND1": 2, "BAND2": 1, "BAND3": 3}
+            device._available_capabilities["BAND3"] -= 1
+            device._max_capabilities["BAND2"] = 4
+            del device._max_capabilities["BAND1"]
+            return result
+
+
+@pytest.mark.usefixtures("tango_context")
+class TestSKAController_dict_capabilities:
+    """
+    Tests of a controller subclass that writes its capabilities as
+    dictionaries.
+    """
+
+    @pytest.fixture(scope="class")
+    def device_test_config(self):
+        """
+        Fixture that specifies the device to be tested, along with its
+        properties and memorized attributes.
+        """
+        return {
+            "device": DictCapabilitiesController,
+            "component_manager_patch": lambda self: ReferenceBaseComponentManager(
+                self.op_state_model, logger=self.logger
+            ),
+            "properties": {
+                "SkaLevel": "4",
+                "LoggingTargetsDefault": "",
+                "MaxCapabilities": ["BAND1:1"],
+            },
+            "memorized": {"adminMode": str(AdminMode.ONLINE.value)},
+        }
+
+    def test_capabilities(self, tango_context):
+        """
+        Test that capabilities assigned and changed as dictionaries are
+        written to the capability ledger.
+        """
+        assert tango_context.device.maxCapabilities == ("BAND2:4", "BAND3:3")
+        assert tango_context.device.availableCapabilities == ("BAND2:4", "BAND3:2")
+        assert tango_context.device.isCapabilityAchievable([[2], ["BAND3"]])
+        assert not tango_context.device.isCapabilityAchievable([[3], ["BAND3"]])
@@ -208,6 +208,28 @@ class TestCspSubElementController(object):
         assert tango_context.device.onMeasuredDuration == 0
         # PROTECTED REGION END #    //  CspSubelementController.test_onMeasuredDuration
 
+    def test_onTimeoutExpiredFlag(self, tango_context):
+        """Test for onTimeoutExpiredFlag"""
+        assert not tango_context.device.onTimeoutExpiredFlag
+
+    def test_publish_command_progress(self, mocker):
+        """
+        Test that timeout expired flags are pushed directly, and other
+        command progress attributes through the event publisher.
+        """
+        device = mocker.Mock()
+        CspSubElementController._publish_command_progress(device, "onTimeoutExpiredFlag", True)
+        device._push_change_event.assert_called_once_with(
+            "onTimeoutExpiredFlag", True
+        )
+        device._push_archive_event.assert_called_once_with(
+            "onTimeoutExpiredFlag", True
+        )
+        device._publish_event.assert_not_called()
+
+        CspSubElementController._publish_command_progress(device, "onProgress", 50)
+        device._publish_event.assert_called_once_with("onProgress", 50)
+
     # PROTECTED REGION ID(CspSubelementController.test_standbyProgress_decorators) ENABLED START #
     # PROTECTED REGION END #    //  CspSubelementController.test_standbyProgress_decorators
     def test_standbyProgress(self, tango_context):
@@ -233,6 +255,10 @@ class TestCspSubElementController(object):
         assert tango_context.device.standbyMeasuredDuration == 0
         # PROTECTED REGION END #    //  CspSubelementController.test_standbyMeasuredDuration
 
+    def test_standbyTimeoutExpiredFlag(self, tango_context):
+        """Test for standbyTimeoutExpiredFlag"""
+        assert not tango_context.device.standbyTimeoutExpiredFlag
+
     # PROTECTED REGION ID(CspSubelementController.test_offProgress_decorators) ENABLED START #
     # PROTECTED REGION END #    //  CspSubelementController.test_offProgress_decorators
     def test_offProgress(self, tango_context):
@@ -258,6 +284,10 @@ class TestCspSubElementController(object):
         assert tango_context.device.offMeasuredDuration == 0
         # PROTECTED REGION END #    //  CspSubelementController.test_offMeasuredDuration
 
+    def test_offTimeoutExpiredFlag(self, tango_context):
+        """Test for offTimeoutExpiredFlag"""
+        assert not tango_context.device.offTimeoutExpiredFlag
+
     # PROTECTED REGION ID(CspSubelementController.test_loadFirmwareProgress_decorators) ENABLED START #
     # PROTECTED REGION END #    //  CspSubelementController.test_loadFirmwareProgress_decorators
     def test_loadFirmwareProgress(self, tango_context):
@@ -283,6 +313,10 @@ class TestCspSubElementController(object):
         assert tango_context.device.loadFirmwareMeasuredDuration == 0
         # PROTECTED REGION END #    //  CspSubelementController.test_loadFirmwareMeasuredDuration
 
+    def test_loadFirmwareTimeoutExpiredFlag(self, tango_context):
+        """Test for loadFirmwareTimeoutExpiredFlag"""
+        assert not tango_context.device.loadFirmwareTimeoutExpiredFlag
+
     # PROTECTED REGION ID(CspSubelementController.test_LoadFirmware_decorators) ENABLED START #
     # PROTECTED REGION END #    //  CspSubelementController.test_LoadFirmware_decorators
     def test_LoadFirmware(self, tango_context):
@@ -294,6 +328,9 @@ class TestCspSubElementController(object):
         assert tango_context.device.LoadFirmware(
             ["file", "test/dev/b", "918698a7fea3"]
         ) == [[ResultCode.OK], ["LoadFirmware command completed OK"]]
+        assert tango_context.device.loadFirmwareProgress == 100
+        assert tango_context.device.loadFirmwareMeasuredDuration > 0
+        assert not tango_context.device.loadFirmwareTimeoutExpiredFlag
         # PROTECTED REGION END #    //  CspSubelementController.test_LoadFirmware
 
     # PROTECTED REGION ID(CspSubelementController.test_LoadFirmware_when_in_wrong_state_decorators) ENABLED START #
@@ -10,6 +10,7 @@
    such device.
 """
 # Imports
+import hashlib
 import re
 import pytest
 import json
@@ -19,6 +20,7 @@ from tango.test_context import MultiDeviceTestContext
 
 # PROTECTED REGION ID(CspSubelementObsDevice.test_additional_imports) ENABLED START #
 from ska_tango_base import SKAObsDevice, CspSubElementObsDevice
+from ska_tango_base.argument_codec import dumps_encoded, loads_encoded
 from ska_tango_base.commands import ResultCode
 from ska_tango_base.control_model import (
     ObsState,
@@ -201,6 +203,14 @@ class TestCspSubElementObsDevice(object):
         )
         # PROTECTED REGION END #    //  CspSubelementObsDevice.test_sdpDestinationAddresses
 
+    def test_sdpDestinationAddressesEncoded(self, tango_context):
+        """Test for sdpDestinationAddressesEncoded"""
+        addresses_dict = {"outputHost": [], "outputMac": [], "outputPort": []}
+        assert (
+            loads_encoded(tango_context.device.sdpDestinationAddressesEncoded)
+            == addresses_dict
+        )
+
     # PROTECTED REGION ID(CspSubelementObsDevice.test_sdpLinkActive_decorators) ENABLED START #
     # PROTECTED REGION END #    //  CspSubelementObsDevice.test_sdpLinkActive_decorators
     def test_sdpLinkActivity(self, tango_context):
@@ -248,6 +258,113 @@ class TestCspSubElementObsDevice(object):
         assert device_under_test.lastScanConfiguration == scan_configuration
         # PROTECTED REGION END #    //  CspSubelementObsDevice.test_ConfigureScan
 
+    def test_lastScanConfigurationHash(self, tango_context, tango_change_event_helper):
+        """Test for lastScanConfigurationHash"""
+        device_under_test = tango_context.device
+        device_under_test.On()
+        hash_callback = tango_change_event_helper.subscribe("lastScanConfigurationHash")
+        hash_callback.assert_call("")
+
+        scan_configuration = '{"id":"sbi-mvp01-20200325-00002"}'
+        device_under_test.ConfigureScan(scan_configuration)
+        hash_callback.assert_call(
+            hashlib.sha256(scan_configuration.encode()).hexdigest()
+        )
+        assert device_under_test.lastScanConfiguration == scan_configuration
+
+        device_under_test.GoToIdle()
+        hash_callback.assert_call("")
+        assert device_under_test.lastScanConfiguration == ""
+
+    def test_ConfigureScanByID(self, tango_context):
+        """Test for PreloadConfiguration and ConfigureScanByID"""
+        device_under_test = tango_context.device
+        with pytest.raises(DevFailed):
+            device_under_test.PreloadConfiguration('{"id":"sbi-mvp01-20200325-00002"}')
+        with pytest.raises(DevFailed):
+            device_under_test.ConfigureScanByID("sbi-mvp01-20200325-00002")
+        assert device_under_test.lastScanConfiguration == ""
+        device_under_test.On()
+
+        (result_code, _) = device_under_test.ConfigureScanByID("sbi-unknown")
+        assert result_code == ResultCode.FAILED
+        (result_code, _) = device_under_test.PreloadConfiguration('{"foo": 1}')
+        assert result_code == ResultCode.FAILED
+
+        scan_configuration = '{"id":"sbi-mvp01-20200325-00002"}'
+        (result_code, _) = device_under_test.PreloadConfiguration(scan_configuration)
+        assert result_code == ResultCode.OK
+        assert device_under_test.obsState == ObsState.IDLE
+
+        (result_code, _) = device_under_test.ConfigureScanByID(
+            "sbi-mvp01-20200325-00002"
+        )
+        assert result_code == ResultCode.OK
+        assert device_under_test.obsState == ObsState.READY
+        assert device_under_test.configurationID == "sbi-mvp01-20200325-00002"
+        assert device_under_test.lastScanConfiguration == scan_configuration
+        assert (
+            device_under_test.lastScanConfigurationHash
+            == hashlib.sha256(scan_configuration.encode()).hexdigest()
+        )
+
+    def test_ConfigureScanByHash(self, tango_context):
+        """Test for ConfigureScanByHash"""
+        device_under_test = tango_context.device
+        with pytest.raises(DevFailed):
+            device_under_test.ConfigureScanByHash("0" * 64)
+        device_under_test.On()
+
+        (result_code, _) = device_under_test.ConfigureScanByHash("0" * 64)
+        assert result_code == ResultCode.FAILED
+
+        scan_configuration = '{"id":"sbi-mvp01-20200325-00003"}'
+        device_under_test.ConfigureScan(scan_configuration)
+        config_hash = device_under_test.lastScanConfigurationHash
+        device_under_test.GoToIdle()
+        assert device_under_test.lastScanConfiguration == ""
+
+        (result_code, _) = device_under_test.ConfigureScanByHash(config_hash)
+        assert result_code == ResultCode.OK
+        assert device_under_test.obsState == ObsState.READY
+        assert device_under_test.configurationID == "sbi-mvp01-20200325-00003"
+        assert device_under_test.lastScanConfiguration == scan_configuration
+        assert device_under_test.lastScanConfigurationHash == config_hash
+
+    def test_ConfigureScanEncoded(self, tango_context):
+        """Test for ConfigureScanEncoded"""
+        device_under_test = tango_context.device
+        device_under_test.On()
+
+        (result_code, _) = device_under_test.ConfigureScanEncoded(("json", b'{"foo": 1}'))
+        assert result_code == ResultCode.FAILED
+        (result_code, _) = device_under_test.ConfigureScanEncoded(
+            ("xml", b"<id>sbi-mvp01-20200325-00002</id>")
+        )
+        assert result_code == ResultCode.FAILED
+
+        (result_code, _) = device_under_test.ConfigureScanEncoded(
+            dumps_encoded({"id": "sbi-mvp01-20200325-00002"})
+        )
+        assert result_code == ResultCode.OK
+        assert device_under_test.obsState == ObsState.READY
+        assert device_under_test.configurationID == "sbi-mvp01-20200325-00002"
+        assert json.loads(device_under_test.lastScanConfiguration) == {
+            "id": "sbi-mvp01-20200325-00002"
+        }
+
+        # a JSON-encoded configuration is reported, and hashed, as sent
+        scan_configuration = '{"id":"sbi-mvp01-20200325-00003"}'
+        (result_code, _) = device_under_test.ConfigureScanEncoded(
+            ("json", scan_configuration.encode())
+        )
+        assert result_code == ResultCode.OK
+        assert device_under_test.lastScanConfiguration == scan_configuration
+        assert (
+            device_under_test.lastScanConfigurationHash
+            == hashlib.sha256(scan_configuration.encode()).hexdigest()
+        )
+
     # PROTECTED REGION ID(CspSubelementObsDevice.test_ConfigureScan_when_in_wrong_state_decorators) ENABLED START #
     # PROTECTED REGION END #    //  CspSubelementObsDevice.test_ConfigureScan_when_in_wrong_state_decorators
     def test_ConfigureScan_when_in_wrong_state(self, tango_context):
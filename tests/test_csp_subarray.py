@@ -190,6 +190,40 @@ class TestCspSubElementSubarray(object):
         )
         # PROTECTED REGION END #    //  CspSubelementSubarray.test_sdpDestinationAddresses
 
+    def test_sdpDestinationAddressesDelta(self, tango_context):
+        """Test for sdpDestinationAddressesDelta"""
+        assert json.loads(tango_context.device.sdpDestinationAddressesDelta) == {
+            "length": 0,
+            "indices": [],
+            "outputHost": [],
+            "outputMac": [],
+            "outputPort": [],
+        }
+        addresses_dict = {
+            "outputHost": ["10.0.0.1", "10.0.0.2"],
+            "outputMac": ["06:00:00:00:00:01", "06:00:00:00:00:02"],
+            "outputPort": [9000, 9001],
+        }
+        tango_context.device.sdpDestinationAddresses = json.dumps(addresses_dict)
+        assert json.loads(tango_context.device.sdpDestinationAddresses) == (
+            addresses_dict
+        )
+        assert json.loads(tango_context.device.sdpDestinationAddressesDelta) == {
+            "length": 2,
+            "indices": [0, 1],
+            **addresses_dict,
+        }
+
+        addresses_dict["outputPort"][1] = 9002
+        tango_context.device.sdpDestinationAddresses = json.dumps(addresses_dict)
+        assert json.loads(tango_context.device.sdpDestinationAddressesDelta) == {
+            "length": 2,
+            "indices": [1],
+            "outputHost": ["10.0.0.2"],
+            "outputMac": ["06:00:00:00:00:02"],
+            "outputPort": [9002],
+        }
+
     # PROTECTED REGION ID(CspSubelementSubarray.test_sdpLinkActive_decorators) ENABLED START #
     # PROTECTED REGION END #    //  CspSubelementSubarray.test_sdpLinkActive_decorators
     def test_sdpLinkActivity(self, tango_context):
@@ -232,6 +266,11 @@ class TestCspSubElementSubarray(object):
         assert tango_context.device.assignResourcesMaximumDuration == 5
         # PROTECTED REGION END #    //  CspSubelementSubarray.test_assignResourcesMaximumDuration
 
+    def test_configureScanMaximumDuration(self, tango_context):
+        """Test for configureScanMaximumDuration"""
+        tango_context.device.configureScanMaximumDuration = 5
+        assert tango_context.device.configureScanMaximumDuration == 5
+
     # PROTECTED REGION ID(CspSubelementSubarray.test_configureScanMeasuredDuration_decorators) ENABLED START #
     # PROTECTED REGION END #    //  CspSubelementSubarray.test_configureScanMeasuredDuration_decorators
     def test_configureScanMeasuredDuration(self, tango_context):
@@ -240,6 +279,10 @@ class TestCspSubElementSubarray(object):
         assert tango_context.device.configureScanMeasuredDuration == 0
         # PROTECTED REGION END #    //  CspSubelementSubarray.test_configureScanMeasuredDuration
 
+    def test_configureScanProgress(self, tango_context):
+        """Test for configureScanProgress"""
+        assert tango_context.device.configureScanProgress == 0
+
     # PROTECTED REGION ID(CspSubelementSubarray.test_configurationProgress_decorators) ENABLED START #
     # PROTECTED REGION END #    //  CspSubelementSubarray.test_configurationProgress_decorators
     def test_configurationProgress(self, tango_context):
@@ -313,6 +356,24 @@ class TestCspSubElementSubarray(object):
         assert not tango_context.device.releaseResourcesTimeoutExpiredFlag
         # PROTECTED REGION END #    //  CspSubelementSubarray.test_timeoutExpiredFlag
 
+    def test_publish_command_progress(self, mocker):
+        """
+        Test that timeout expired flags are pushed directly, and other
+        command progress attributes through the event publisher.
+        """
+        device = mocker.Mock()
+        CspSubElementSubarray._publish_command_progress(device, "configureScanTimeoutExpiredFlag", True)
+        device._push_change_event.assert_called_once_with(
+            "configureScanTimeoutExpiredFlag", True
+        )
+        device._push_archive_event.assert_called_once_with(
+            "configureScanTimeoutExpiredFlag", True
+        )
+        device._publish_event.assert_not_called()
+
+        CspSubElementSubarray._publish_command_progress(device, "configureScanProgress", 50)
+        device._publish_event.assert_called_once_with("configureScanProgress", 50)
+
     # PROTECTED REGION ID(CspSubelementSubarray.test_ConfigureScan_decorators) ENABLED START #
     # PROTECTED REGION END #    //  CspSubelementSubarray.test_ConfigureScan_decorators
     @pytest.mark.parametrize("command_alias", ["Configure", "ConfigureScan"])
@@ -335,8 +396,81 @@ class TestCspSubElementSubarray(object):
         assert device_under_test.obsState == ObsState.READY
         assert tango_context.device.configurationID == "sbi-mvp01-20200325-00002"
         assert tango_context.device.lastScanConfiguration == scan_configuration
+        assert tango_context.device.configureScanProgress == 100
+        assert tango_context.device.configureScanMeasuredDuration > 0
+        assert not tango_context.device.configureScanTimeoutExpiredFlag
         # PROTECTED REGION END #    //  CspSubelementSubarray.test_ConfigureScan
 
+    def test_ConfigureScanByID(self, tango_context):
+        """Test for PreloadConfiguration and ConfigureScanByID"""
+        device_under_test = tango_context.device
+        device_under_test.On()
+        with pytest.raises(DevFailed):
+            device_under_test.PreloadConfiguration('{"id":"sbi-mvp01-20200325-00002"}')
+        with pytest.raises(DevFailed):
+            device_under_test.ConfigureScanByID("sbi-mvp01-20200325-00002")
+        assert device_under_test.lastScanConfiguration == ""
+        device_under_test.AssignResources(json.dumps([1, 2, 3]))
+
+        (result_code, _) = device_under_test.ConfigureScanByID("sbi-unknown")
+        assert result_code == ResultCode.FAILED
+
+        scan_configuration = '{"id":"sbi-mvp01-20200325-00002"}'
+        (result_code, _) = device_under_test.PreloadConfiguration(scan_configuration)
+        assert result_code == ResultCode.OK
+        assert device_under_test.obsState == ObsState.IDLE
+
+        (result_code, _) = device_under_test.ConfigureScanByID(
+            "sbi-mvp01-20200325-00002"
+        )
+        assert result_code == ResultCode.OK
+        assert device_under_test.obsState == ObsState.READY
+        assert device_under_test.configurationID == "sbi-mvp01-20200325-00002"
+        assert device_under_test.lastScanConfiguration == scan_configuration
+
+    def test_ConfigureScanByHash(self, tango_context):
+        """Test for ConfigureScanByHash"""
+        device_under_test = tango_context.device
+        with pytest.raises(DevFailed):
+            device_under_test.ConfigureScanByHash("0" * 64)
+        device_under_test.On()
+        device_under_test.AssignResources(json.dumps([1, 2, 3]))
+
+        (result_code, _) = device_under_test.ConfigureScanByHash("0" * 64)
+        assert result_code == ResultCode.FAILED
+
+        scan_configuration = '{"id":"sbi-mvp01-20200325-00003"}'
+        device_under_test.ConfigureScan(scan_configuration)
+        config_hash = device_under_test.lastScanConfigurationHash
+        device_under_test.GoToIdle()
+        assert device_under_test.lastScanConfiguration == ""
+
+        (result_code, _) = device_under_test.ConfigureScanByHash(config_hash)
+        assert result_code == ResultCode.OK
+        assert device_under_test.obsState == ObsState.READY
+        assert device_under_test.configurationID == "sbi-mvp01-20200325-00003"
+        assert device_under_test.lastScanConfiguration == scan_configuration
+        assert device_under_test.lastScanConfigurationHash == config_hash
+
+    def test_ConfigureScanEncoded(self, tango_context):
+        """Test for ConfigureScanEncoded"""
+        device_under_test = tango_context.device
+        device_under_test.On()
+        device_under_test.AssignResources(json.dumps([1, 2, 3]))
+
+        scan_configuration = '{"id":"sbi-mvp01-20200325-00002"}'
+        device_under_test.ConfigureScan(scan_configuration)
+        config_hash = device_under_test.lastScanConfigurationHash
+        device_under_test.GoToIdle()
+
+        (result_code, _) = device_under_test.ConfigureScanEncoded(
+            ("json", scan_configuration.encode())
+        )
+        assert result_code == ResultCode.OK
+        assert device_under_test.obsState == ObsState.READY
+        assert device_under_test.lastScanConfiguration == scan_configuration
+        assert device_under_test.lastScanConfigurationHash == config_hash
+
     # PROTECTED REGION ID(CspSubelementSubarray.test_ConfigureScan_when_in_wrong_state_decorators) ENABLED START #
     # PROTECTED REGION END #    //  CspSubelementSubarray.test_ConfigureScan_when_in_wrong_state_decorators
     def test_ConfigureScan_when_in_wrong_state(self, tango_context):
@@ -0,0 +1,152 @@
+"""
+Tests for the :py:mod:`ska_tango_base.event_publisher` module.
+"""
+import time
+
+import pytest
+
+from ska_tango_base.event_publisher import EventPublisher
+
+
+class TestEventPublisher:
+    """
+    Tests of the :py:class:`ska_tango_base.event_publisher.EventPublisher`
+    class.
+    """
+
+    @pytest.fixture()
+    def push_change(self, mocker):
+        """
+        Fixture that returns a mock callable for pushing change events.
+
+        :param mocker: pytest fixture that wraps
+            :py:mod:`unittest.mock`.
+
+        :return: a mock callable
+        """
+        return mocker.Mock()
+
+    @pytest.fixture()
+    def push_archive(self, mocker):
+        """
+        Fixture that returns a mock callable for pushing archive events.
+
+        :param mocker: pytest fixture that wraps
+            :py:mod:`unittest.mock`.
+
+        :return: a mock callable
+        """
+        return mocker.Mock()
+
+    @pytest.fixture()
+    def publisher_factory(self, push_change, push_archive, logger):
+        """
+        Fixture that returns a factory for event publishers under test,
+        and shuts them down after the test.
+
+        :param push_change: mock callable for pushing change events
+        :param push_archive: mock callable for pushing archive events
+        :param logger: a logger for the publishers
+
+        :yield: a factory for event publishers
+        """
+        publishers = []
+
+        def factory(**kwargs):
+            publisher = EventPublisher(
+                push_change, push_archive, logger=logger, **kwargs
+            )
+            publishers.append(publisher)
+            return publisher
+
+        yield factory
+        for publisher in publishers:
+            publisher.shutdown()
+
+    def test_default_pushes_everything(
+        self, publisher_factory, push_change, push_archive
+    ):
+        """
+        Test that, by default, every value is pushed immediately.
+        """
+        publisher = publisher_factory()
+        for value in [1, 1, 2]:
+            publisher.publish("foo", value)
+        assert [c.args for c in push_change.call_args_list] == [
+            ("foo", 1),
+            ("foo", 1),
+            ("foo", 2),
+        ]
+        assert push_archive.call_args_list == push_change.call_args_list
+
+    def test_drop_duplicates(self, publisher_factory, push_change, push_archive):
+        """
+        Test that values equal to the previous value are dropped.
+        """
+        publisher = publisher_factory(drop_duplicates=True)
+        for value in [1, 1, 2, 2, 1]:
+            publisher.publish("foo", value)
+        publisher.publish("bar", 1, archive=False)
+        assert [c.args for c in push_change.call_args_list] == [
+            ("foo", 1),
+            ("foo", 2),
+            ("foo", 1),
+            ("bar", 1),
+        ]
+        assert push_archive.call_count == 3
+
+    def test_min_interval(self, publisher_factory, push_change, push_archive):
+        """
+        Test that change events are rate limited, and that the final
+        value is pushed once the attribute is quiescent.
+        """
+        publisher = publisher_factory(
+            min_intervals={"foo": 10.0}, quiescence_period=0.05
+        )
+        for value in range(100):
+            publisher.publish("foo", value)
+            publisher.publish("bar", value)
+        assert push_change.call_count == 101
+        push_change.assert_any_call("foo", 0)
+        push_change.assert_called_with("bar", 99)
+        assert push_archive.call_count == 200
+
+        time.sleep(0.2)
+        push_change.assert_called_with("foo", 99)
+        assert push_change.call_count == 102
+
+    def test_archive_decimation(self, publisher_factory, push_change, push_archive):
+        """
+        Test that archive events are decimated, and that the final value
+        is archived once the attribute is quiescent.
+        """
+        publisher = publisher_factory(archive_decimation=4, quiescence_period=0.05)
+        for value in range(10):
+            publisher.publish("foo", value)
+        assert push_change.call_count == 10
+        assert [c.args for c in push_archive.call_args_list] == [
+            ("foo", 0),
+            ("foo", 4),
+            ("foo", 8),
+        ]
+
+        time.sleep(0.2)
+        push_archive.assert_called_with("foo", 9)
+        assert push_archive.call_count == 4
+
+    def test_shutdown_flushes(self, publisher_factory, push_change):
+        """
+        Test that held-back values are pushed on shutdown, and that
+        values are pushed immediately thereafter.
+        """
+        publisher = publisher_factory(
+            min_intervals={"foo": 10.0}, quiescence_period=10.0
+        )
+        publisher.publish("foo", 1)
+        publisher.publish("foo", 2)
+        assert push_change.call_count == 1
+
+        publisher.shutdown()
+        push_change.assert_called_with("foo", 2)
+        publisher.publish("foo", 3)
+        push_change.assert_called_with("foo", 3)
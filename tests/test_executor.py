@@ -0,0 +1,292 @@
+"""
+Tests for the :py:mod:`ska_tango_base.executor` module.
+"""
+import threading
+
+import pytest
+
+from ska_tango_base.commands import (
+    CompletionCommand,
+    ResponseCommand,
+    ResultCode,
+)
+from ska_tango_base.executor import CommandExecutor, CommandStatus
+
+
+class TestCommandExecutor:
+    """
+    Tests of the :py:class:`ska_tango_base.executor.CommandExecutor`
+    class, and of commands that run on it.
+    """
+
+    @pytest.fixture()
+    def callbacks(self, mocker):
+        """
+        Fixture that returns mock callbacks for the executor.
+
+        :param mocker: pytest fixture that wraps
+            :py:mod:`unittest.mock`.
+
+        :return: a dictionary of mock callbacks
+        """
+        return {
+            "queue_callback": mocker.Mock(),
+            "status_callback": mocker.Mock(),
+            "progress_callback": mocker.Mock(),
+            "result_callback": mocker.Mock(),
+        }
+
+    @pytest.fixture()
+    def executor(self, logger, callbacks):
+        """
+        Fixture that returns the command executor under test.
+
+        :param logger: a logger for the executor
+        :param callbacks: mock callbacks for the executor
+
+        :return: the command executor under test
+        """
+        executor = CommandExecutor(
+            max_workers=1, max_queue_size=3, logger=logger, **callbacks
+        )
+        yield executor
+        executor.shutdown()
+
+    @pytest.fixture()
+    def mock_state_model(self, mocker):
+        """
+        Fixture that returns a mock state model.
+
+        :param mocker: pytest fixture that wraps
+            :py:mod:`unittest.mock`.
+
+        :return: a mock state model
+        """
+        return mocker.Mock()
+
+    @pytest.fixture()
+    def release(self):
+        """
+        Fixture that returns an event that blocking commands wait on
+        before returning.
+
+        :return: an event
+        """
+        return threading.Event()
+
+    @pytest.fixture()
+    def finished(self):
+        """
+        Fixture that returns a semaphore that is released by a command
+        each time it finishes.
+
+        :return: a semaphore
+        """
+        return threading.Semaphore(0)
+
+    @pytest.fixture()
+    def command(self, mock_state_model, executor, release, finished, logger):
+        """
+        Fixture that returns a command that runs on the executor.
+
+        :param mock_state_model: a mock state model
+        :param executor: the executor under test
+        :param release: event that the command waits on
+        :param finished: semaphore that the command releases when it
+            finishes
+        :param logger: a logger for the command
+
+        :return: a command that runs on the executor
+        """
+
+        class BlockingCommand(ResponseCommand, CompletionCommand):
+            def __init__(self, target, state_model, executor=None, logger=None):
+                super().__init__(
+                    target, state_model, "block", executor=executor, logger=logger
+                )
+
+            def do(self, argin):
+                self.update_progress(50)
+                release.wait(timeout=5.0)
+                if argin == "fail":
+                    raise ValueError("BlockingCommand failed")
+                self.target.append(argin)
+                return (ResultCode.OK, "BlockingCommand completed OK")
+
+            def completed(self):
+                super().completed()
+                finished.release()
+
+        return BlockingCommand([], mock_state_model, executor=executor, logger=logger)
+
+    def test_call_returns_queued(self, command, mock_state_model, release, finished):
+        """
+        Test that a command with an executor returns QUEUED
+        immediately, and that the completed action is performed only
+        once the worker has run the command.
+        """
+        (result_code, command_id) = command("foo")
+        assert result_code == ResultCode.QUEUED
+        assert command_id.endswith("_BlockingCommand")
+
+        mock_state_model.perform_action.assert_called_once_with("block_invoked")
+        assert command.target == []
+
+        release.set()
+        assert finished.acquire(timeout=5.0)
+        assert command.target == ["foo"]
+        mock_state_model.perform_action.assert_called_with("block_completed")
+
+    def test_queued_call_raises(
+        self, command, mock_state_model, callbacks, release, finished
+    ):
+        """
+        Test that a queued call that raises is still completed, so that
+        the state model is not left waiting, and that its failure is
+        reported as its result.
+        """
+        (_, command_id) = command("fail")
+        release.set()
+        assert finished.acquire(timeout=5.0)
+        command.executor.shutdown()
+
+        mock_state_model.perform_action.assert_called_with("block_completed")
+        callbacks["status_callback"].assert_called_with(
+            [(command_id, CommandStatus.FAILED)]
+        )
+        callbacks["result_callback"].assert_called_once_with(
+            (command_id, ResultCode.FAILED, "BlockingCommand failed")
+        )
+
+    def test_queued_calls_run_in_order(self, command, release, finished):
+        """
+        Test that calls queued on a single-worker executor are run in
+        the order in which they were made, and each has its own ID.
+        """
+        command_ids = {command(argin)[1] for argin in ["a", "b", "c"]}
+        assert len(command_ids) == 3
+
+        release.set()
+        for _ in range(3):
+            assert finished.acquire(timeout=5.0)
+        assert command.target == ["a", "b", "c"]
+
+    def test_call_without_executor(self, command, mock_state_model, release):
+        """
+        Test that a command with no executor still runs synchronously.
+        """
+        command.executor = None
+        release.set()
+        assert command("foo") == (ResultCode.OK, "BlockingCommand completed OK")
+        assert command.target == ["foo"]
+        mock_state_model.perform_action.assert_called_with("block_completed")
+
+    def test_full_queue_rejects(self, command, mock_state_model, release, finished):
+        """
+        Test that a call is rejected when the queue is full, without an
+        action being performed on the state model.
+        """
+        for argin in ["a", "b", "c"]:
+            assert command(argin)[0] == ResultCode.QUEUED
+        assert command.executor.queue_full
+        mock_state_model.perform_action.reset_mock()
+
+        (result_code, _) = command("d")
+        assert result_code == ResultCode.REJECTED
+        mock_state_model.perform_action.assert_not_called()
+
+        release.set()
+        for _ in range(3):
+            assert finished.acquire(timeout=5.0)
+        assert command.target == ["a", "b", "c"]
+        assert command("e")[0] == ResultCode.QUEUED
+
+    def test_callbacks(self, command, callbacks, release, finished):
+        """
+        Test that the executor reports the queue, and the status,
+        progress and result of commands, through its callbacks.
+        """
+        (_, command_id) = command("foo")
+        callbacks["queue_callback"].assert_called_with(
+            [(command_id, "BlockingCommand")]
+        )
+        callbacks["status_callback"].assert_any_call(
+            [(command_id, CommandStatus.QUEUED)]
+        )
+
+        release.set()
+        assert finished.acquire(timeout=5.0)
+        command.executor.shutdown()
+
+        callbacks["progress_callback"].assert_any_call([(command_id, 50)])
+        callbacks["queue_callback"].assert_called_with([])
+        callbacks["status_callback"].assert_called_with(
+            [(command_id, CommandStatus.COMPLETED)]
+        )
+        callbacks["result_callback"].assert_called_once_with(
+            (command_id, ResultCode.OK, "BlockingCommand completed OK")
+        )
+        assert command.executor.commands_in_queue == []
+        assert command.executor.command_result == (
+            command_id,
+            ResultCode.OK,
+            "BlockingCommand completed OK",
+        )
+
+    def test_reservation(self, executor, command, mock_state_model):
+        """
+        Test that a reserved place counts towards the size of the queue,
+        and that the place reserved by a call is given back if the call
+        fails before it is queued.
+        """
+        reservations = [executor.reserve() for _ in range(3)]
+        assert executor.queue_full
+        assert executor.reserve() is None
+        assert command("a")[0] == ResultCode.REJECTED
+
+        for reservation in reservations:
+            executor.release(reservation)
+        assert not executor.queue_full
+        with pytest.raises(ValueError):
+            executor.submit_reserved(reservations[0], "Command", lambda: None)
+
+        mock_state_model.perform_action.side_effect = ValueError("not allowed")
+        with pytest.raises(ValueError):
+            command("b")
+        assert not executor.queue_full
+        assert executor.commands_in_queue == []
+
+    def test_callbacks_in_order(self, logger):
+        """
+        Test that callbacks are delivered in the order in which the
+        changes they report were made, even when they are made from
+        several threads at once.
+        """
+        delivered = []
+        executor = CommandExecutor(
+            max_workers=4,
+            max_queue_size=64,
+            logger=logger,
+            queue_callback=lambda queue: delivered.append(len(queue)),
+        )
+        threads = [
+            threading.Thread(
+                target=lambda: executor.submit(
+                    "Command", lambda: (ResultCode.OK, "done")
+                )
+            )
+            for _ in range(32)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        executor.shutdown()
+
+        # every change adds or removes exactly one command, so
+        # consecutive snapshots, if delivered in order, differ by one
+        assert len(delivered) == 64
+        assert delivered[0] == 1
+        assert delivered[-1] == 0
+        for (before, after) in zip(delivered, delivered[1:]):
+            assert abs(after - before) == 1
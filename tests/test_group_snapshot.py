@@ -0,0 +1,122 @@
+"""
+Tests for the :py:mod:`ska_tango_base.group_snapshot` module.
+"""
+import math
+import time
+
+import numpy as np
+import pytest
+import tango
+
+from ska_tango_base.control_model import HealthState
+from ska_tango_base.group_snapshot import GroupSnapshotReader
+
+
+class TestGroupSnapshotReader:
+    """
+    Tests of the
+    :py:class:`ska_tango_base.group_snapshot.GroupSnapshotReader` class.
+    """
+
+    @pytest.fixture()
+    def group(self, mocker):
+        """
+        Fixture that returns a mock group of three devices, from the
+        last of which reads fail.
+
+        :param mocker: pytest fixture that wraps
+            :py:mod:`unittest.mock`.
+
+        :return: a mock group
+        """
+
+        def reply(device_name, attribute_name, value):
+            attribute_reply = mocker.Mock()
+            attribute_reply.dev_name.return_value = device_name
+            attribute_reply.obj_name.return_value = attribute_name
+            attribute_reply.has_failed.return_value = value is None
+            data = attribute_reply.get_data.return_value
+            data.value = value
+            data.quality = tango.AttrQuality.ATTR_VALID
+            data.time.totime.return_value = 1000.0
+            return attribute_reply
+
+        def read_attributes_reply(request_id, timeout_ms):
+            return [
+                reply(device_name, attribute_name, value)
+                for (device_name, values) in [
+                    ("my/dev/1", [HealthState.OK, "one"]),
+                    ("my/dev/2", [HealthState.DEGRADED, "two"]),
+                    ("my/dev/3", [None, None]),
+                ]
+                for (attribute_name, value) in zip(["healthState", "name"], values)
+            ]
+
+        group = mocker.Mock(spec=tango.Group)
+        group.read_attributes_asynch.return_value = 1
+        group.read_attributes_reply.side_effect = read_attributes_reply
+        return group
+
+    def test_read(self, group):
+        """
+        Test that a snapshot is read in one request, and laid out in
+        columns.
+        """
+        reader = GroupSnapshotReader({"devices": group})
+        snapshot = reader.read("devices", ["healthState", "name"])
+        group.read_attributes_asynch.assert_called_once_with(["healthState", "name"])
+
+        assert list(snapshot.device_names) == ["my/dev/1", "my/dev/2", "my/dev/3"]
+        assert snapshot.attribute_names == ["healthState", "name"]
+
+        health = snapshot["healthState"]
+        assert list(health.failed) == [False, False, True]
+        assert list(health.value) == [HealthState.OK, HealthState.DEGRADED, None]
+        assert list(health.quality) == [int(tango.AttrQuality.ATTR_VALID)] * 2 + [-1]
+        assert health.timestamp[0] == 1000.0
+        assert math.isnan(health.timestamp[2])
+
+        valid = ~health.failed
+        assert np.array(list(health.value[valid])).max() == HealthState.DEGRADED
+
+    def test_scalar_column_has_native_dtype(self, mocker):
+        """
+        Test that a column of scalars that were all read successfully is
+        held in an array of their own type.
+        """
+        readings = []
+        for value in [1.5, 2.5]:
+            reading = mocker.Mock(value=value, quality=tango.AttrQuality.ATTR_VALID)
+            reading.time.totime.return_value = 1000.0
+            readings.append(reading)
+
+        column = GroupSnapshotReader._column(readings)
+        assert column.value.dtype == np.float64
+        assert column.value.sum() == 4.0
+
+        column = GroupSnapshotReader._column(readings + [None])
+        assert column.value.dtype == object
+
+    def test_cache(self, group):
+        """
+        Test that snapshots are cached for their time-to-live, and can be
+        invalidated.
+        """
+        reader = GroupSnapshotReader({"devices": group}, time_to_live=0.1)
+        snapshot = reader.read("devices", ["healthState"])
+        assert reader.read("devices", ["healthState"]) is snapshot
+        assert group.read_attributes_asynch.call_count == 1
+
+        reader.read("devices", ["name"])
+        assert group.read_attributes_asynch.call_count == 2
+
+        time.sleep(0.2)
+        assert reader.read("devices", ["healthState"]) is not snapshot
+        assert group.read_attributes_asynch.call_count == 3
+
+        reader.invalidate("devices")
+        reader.read("devices", ["healthState"])
+        assert group.read_attributes_asynch.call_count == 4
+
+        with pytest.raises(KeyError):
+            reader.read("no such group", ["healthState"])
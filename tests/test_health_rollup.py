@@ -0,0 +1,167 @@
+"""
+Tests for the :py:mod:`ska_tango_base.health_rollup` module.
+"""
+import threading
+import time
+
+import pytest
+import tango
+
+from ska_tango_base.control_model import HealthState
+from ska_tango_base.health_rollup import HealthRollup
+
+
+class TestHealthRollup:
+    """
+    Tests of the :py:class:`ska_tango_base.health_rollup.HealthRollup`
+    class.
+    """
+
+    @pytest.fixture()
+    def callback(self, mocker):
+        """
+        Fixture that returns a mock callback for changes to the rolled-up
+        health.
+
+        :param mocker: pytest fixture that wraps
+            :py:mod:`unittest.mock`.
+
+        :return: a mock callable
+        """
+        return mocker.Mock()
+
+    def test_worst_health_by_default(self, callback):
+        """
+        Test that, with the default thresholds, the rolled-up health is
+        the worst health of any device, and that the callback is called
+        only when it changes.
+        """
+        rollup = HealthRollup(callback)
+        assert rollup.health == HealthState.OK
+
+        for device_name in ["a", "b", "c"]:
+            rollup.update(device_name, HealthState.OK)
+        rollup.update("a", HealthState.UNKNOWN)
+        rollup.update("b", HealthState.DEGRADED)
+        rollup.update("c", HealthState.DEGRADED)
+        rollup.update("c", HealthState.FAILED)
+        rollup.update("c", HealthState.OK)
+        rollup.update("b", HealthState.OK)
+        rollup.remove("a")
+
+        assert [call.args[0] for call in callback.call_args_list] == [
+            HealthState.UNKNOWN,
+            HealthState.DEGRADED,
+            HealthState.FAILED,
+            HealthState.DEGRADED,
+            HealthState.UNKNOWN,
+            HealthState.OK,
+        ]
+        assert rollup.counts[HealthState.OK] == 2
+
+    def test_callback_without_lock(self):
+        """
+        Test that the callback is called without the engine's lock held,
+        so that it may read the engine's properties.
+        """
+        counts = []
+        rollup = HealthRollup(lambda health: counts.append(rollup.counts))
+        rollup.update("a", HealthState.FAILED)
+        assert counts == [
+            {**{health: 0 for health in HealthState}, HealthState.FAILED: 1}
+        ]
+
+    def test_thresholds(self, callback):
+        """
+        Test that the thresholds allow some devices to be unhealthy.
+        """
+        rollup = HealthRollup(
+            callback, failed_threshold=2, degraded_threshold=1, unknown_threshold=1
+        )
+        for device_name in "abcdef":
+            rollup.update(device_name, HealthState.OK)
+
+        rollup.update("a", HealthState.UNKNOWN)
+        assert rollup.health == HealthState.OK
+        rollup.update("b", HealthState.UNKNOWN)
+        assert rollup.health == HealthState.UNKNOWN
+
+        rollup.update("c", HealthState.FAILED)
+        assert rollup.health == HealthState.UNKNOWN
+        rollup.update("d", HealthState.DEGRADED)
+        assert rollup.health == HealthState.DEGRADED
+        rollup.update("e", HealthState.FAILED)
+        assert rollup.health == HealthState.DEGRADED
+        rollup.update("f", HealthState.FAILED)
+        assert rollup.health == HealthState.FAILED
+
+    def test_subscribe(self, callback, mocker):
+        """
+        Test that the engine subscribes to healthState change events,
+        and rolls up the health they report.
+        """
+        proxies = {}
+
+        def get_proxy(device_name):
+            proxies[device_name] = mocker.Mock()
+            proxies[device_name].subscribe_event.return_value = len(proxies)
+            return proxies[device_name]
+
+        mocker.patch(
+            "ska_tango_base.health_rollup.get_device_proxy", side_effect=get_proxy
+        )
+        rollup = HealthRollup(callback)
+        rollup.subscribe(["a", "b"])
+        assert rollup.health == HealthState.UNKNOWN
+
+        def push(device_name, health):
+            event_callback = proxies[device_name].subscribe_event.call_args.args[2]
+            event = mocker.Mock(err=health is None)
+            event.attr_value.value = health
+            event_callback(event)
+
+        push("a", HealthState.OK)
+        assert rollup.health == HealthState.UNKNOWN
+        push("b", HealthState.OK)
+        assert rollup.health == HealthState.OK
+        push("b", None)
+        assert rollup.health == HealthState.UNKNOWN
+
+        proxies["a"].subscribe_event.assert_called_once_with(
+            "healthState", tango.EventType.CHANGE_EVENT, mocker.ANY, stateless=True
+        )
+        rollup.unsubscribe()
+        proxies["a"].unsubscribe_event.assert_called_once_with(1)
+        proxies["b"].unsubscribe_event.assert_called_once_with(2)
+
+    def test_subscribe_in_background(self, callback, mocker):
+        """
+        Test that the engine can subscribe on a background thread, and
+        that unsubscribing stops it from subscribing to any more devices.
+        """
+        subscribing = threading.Event()
+        proceed = threading.Event()
+        proxies = {}
+
+        def get_proxy(device_name):
+            subscribing.set()
+            proceed.wait(timeout=5.0)
+            proxies[device_name] = mocker.Mock()
+            return proxies[device_name]
+
+        mocker.patch(
+            "ska_tango_base.health_rollup.get_device_proxy", side_effect=get_proxy
+        )
+        rollup = HealthRollup(callback)
+        rollup.subscribe(["a", "b"], background=True)
+        assert rollup.counts[HealthState.UNKNOWN] == 2
+        assert subscribing.wait(timeout=5.0)
+
+        rollup.unsubscribe()
+        proceed.set()
+        for _ in range(50):
+            if "a" in proxies and proxies["a"].unsubscribe_event.called:
+                break
+            time.sleep(0.1)
+        proxies["a"].unsubscribe_event.assert_called_once()
+        assert "b" not in proxies
@@ -8,11 +8,13 @@
 #########################################################################################
 """Contain the tests for the SKALogger."""
 
+import json
 import re
 import pytest
 from tango import DevState
 from tango.test_context import MultiDeviceTestContext
 from ska_tango_base.base import ReferenceBaseComponentManager
+from ska_tango_base.commands import ResultCode
 from ska_tango_base.logger_device import SKALogger
 from ska_tango_base.subarray import SKASubarray
 import tango
@@ -183,5 +185,52 @@ def test_SetLoggingLevel():
         device_details = []
         device_details.append(levels)
         device_details.append(targets)
-        multi_context.get_device(logger_device).SetLoggingLevel(device_details)
+        [[result_code], [message]] = multi_context.get_device(
+            logger_device
+        ).SetLoggingLevel(device_details)
+        assert result_code == ResultCode.OK
+        assert json.loads(message) == {targets[0]: "OK"}
         assert dev_proxy.loggingLevel == logging_level
+
+
+@pytest.mark.forked
+def test_SetLoggingLevel_parallel():
+    """Test for SetLoggingLevel with parallel workers, and a failing device"""
+    logging_level = int(tango.LogLevel.LOG_ERROR)
+    logging_targets = [f"logger/target/{i}" for i in range(1, 4)]
+    logger_device = "logger/device/1"
+    devices_info = (
+        {
+            "class": SKALogger,
+            "devices": [
+                {
+                    "name": logger_device,
+                    "properties": {"SetLoggingLevelMaxWorkers": "4"},
+                }
+            ],
+        },
+        {
+            "class": SKASubarray,
+            "devices": [{"name": name} for name in logging_targets],
+        },
+    )
+
+    with MultiDeviceTestContext(devices_info, process=False) as multi_context:
+        dev_proxies = [multi_context.get_device(name) for name in logging_targets]
+        for dev_proxy in dev_proxies:
+            dev_proxy.loggingLevel = int(tango.LogLevel.LOG_FATAL)
+
+        targets = [multi_context.get_device_access(name) for name in logging_targets]
+        levels = [logging_level] * len(targets)
+        # an invalid logging level fails for that device alone
+        levels.append(99)
+        targets.append(targets[0] + "_invalid")
+        [[result_code], [message]] = multi_context.get_device(
+            logger_device
+        ).SetLoggingLevel([levels, targets])
+        assert result_code == ResultCode.FAILED
+        results = json.loads(message)
+        assert [results[target] for target in targets[:-1]] == ["OK"] * 3
+        assert results[targets[-1]] != "OK"
+        for dev_proxy in dev_proxies:
+            assert dev_proxy.loggingLevel == logging_level
@@ -0,0 +1,77 @@
+"""
+Tests for the :py:mod:`ska_tango_base.resource_registry` module.
+"""
+import pytest
+
+from ska_tango_base.faults import ResourceConflictError
+from ska_tango_base.resource_registry import ResourceRegistry
+
+
+class TestResourceRegistry:
+    """
+    Tests of the
+    :py:class:`ska_tango_base.resource_registry.ResourceRegistry` class.
+    """
+
+    @pytest.fixture()
+    def registry(self):
+        """
+        Fixture that returns a registry with resources claimed by one
+        subarray.
+
+        :return: a resource registry
+        :rtype: :py:class:`ska_tango_base.resource_registry.ResourceRegistry`
+        """
+        registry = ResourceRegistry()
+        registry.claim("subarray/01", ["A", "B"])
+        return registry
+
+    def test_claim(self, registry):
+        """
+        Test that claims are all-or-nothing, and that re-claiming a
+        resource already held by the same owner does nothing.
+        """
+        assert registry.claim("subarray/01", ["B", "C"]) == ("C",)
+
+        with pytest.raises(ResourceConflictError) as info:
+            registry.claim("subarray/02", ["C", "D"])
+        assert info.value.conflicts == {"C": "subarray/01"}
+        assert "D" not in registry
+
+        assert registry.owners_of(["A", "C", "D"]) == {
+            "A": "subarray/01",
+            "C": "subarray/01",
+        }
+        assert registry.owner_of("D") is None
+        assert registry.resources_of("subarray/01") == {"A", "B", "C"}
+        assert len(registry) == 3
+
+        with pytest.raises(ValueError):
+            registry.claim(None, ["D"])
+        assert "D" not in registry
+
+    def test_release(self, registry):
+        """
+        Test that an owner can release only its own resources.
+        """
+        registry.claim("subarray/02", ["C"])
+        assert registry.release("subarray/02", ["A", "C"]) == ("C",)
+        assert registry.owner_of("A") == "subarray/01"
+
+        assert registry.release_all("subarray/01") == ("A", "B")
+        assert registry.release_all("subarray/01") == ()
+        assert len(registry) == 0
+        assert registry.resources_of("subarray/01") == frozenset()
+
+    def test_compare_and_set(self, registry):
+        """
+        Test that a resource changes owner only if its current owner is
+        as expected.
+        """
+        assert not registry.compare_and_set("A", None, "subarray/02")
+        assert registry.compare_and_set("A", "subarray/01", "subarray/02")
+        assert registry.resources_of("subarray/01") == {"B"}
+        assert registry.compare_and_set("A", "subarray/02", None)
+        assert registry.owner_of("A") is None
+        assert registry.compare_and_set("C", None, "subarray/02")
+        assert registry.owner_of("C") == "subarray/02"
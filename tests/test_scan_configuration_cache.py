@@ -0,0 +1,84 @@
+"""
+Tests for the :py:mod:`ska_tango_base.scan_configuration_cache` module.
+"""
+import hashlib
+
+from ska_tango_base.scan_configuration_cache import (
+    PreloadedConfigurations,
+    ScanConfigurationCache,
+)
+
+
+class TestScanConfigurationCache:
+    """
+    Tests of the
+    :py:class:`ska_tango_base.scan_configuration_cache.ScanConfigurationCache`
+    class.
+    """
+
+    def test_add_and_get(self):
+        """
+        Test that configurations are keyed by hash, and that a repeated
+        configuration is stored once.
+        """
+        cache = ScanConfigurationCache()
+        configuration = '{"id": "sbi-mvp01-20200325-00002"}'
+        (config_hash, cached) = cache.add(configuration)
+        assert config_hash == hashlib.sha256(configuration.encode()).hexdigest()
+        assert cached is configuration
+
+        repeat = "".join(['{"id": ', '"sbi-mvp01-20200325-00002"}'])
+        assert repeat is not configuration
+        assert cache.add(repeat) == (config_hash, configuration)
+        assert cache.add(repeat)[1] is configuration
+        assert len(cache) == 1
+
+        assert cache.get(config_hash) is configuration
+        assert cache.get("unknown") is None
+
+        cache.clear()
+        assert config_hash not in cache
+
+    def test_eviction(self):
+        """
+        Test that the least recently used configuration is evicted when
+        the cache is full.
+        """
+        cache = ScanConfigurationCache(max_entries=2)
+        (first_hash, _) = cache.add('{"id": 1}')
+        (second_hash, _) = cache.add('{"id": 2}')
+        assert cache.get(first_hash) == '{"id": 1}'
+
+        (third_hash, _) = cache.add('{"id": 3}')
+        assert len(cache) == 2
+        assert first_hash in cache
+        assert second_hash not in cache
+        assert third_hash in cache
+
+
+class TestPreloadedConfigurations:
+    """
+    Tests of the
+    :py:class:`ska_tango_base.scan_configuration_cache.PreloadedConfigurations`
+    class.
+    """
+
+    def test_store_and_get(self):
+        """
+        Test that configurations are stored by ID, replacing any with
+        the same ID, and that the least recently used configuration is
+        evicted when the store is full.
+        """
+        preloaded = PreloadedConfigurations(max_entries=2)
+        preloaded.store("sbi-1", "hash-1", '{"id": "sbi-1"}', {"id": "sbi-1"})
+        preloaded.store("sbi-2", "hash-2", '{"id": "sbi-2"}', {"id": "sbi-2"})
+        assert preloaded.get("sbi-1") == ("hash-1", '{"id": "sbi-1"}', {"id": "sbi-1"})
+
+        preloaded.store("sbi-3", "hash-3", '{"id": "sbi-3"}', {"id": "sbi-3"})
+        assert len(preloaded) == 2
+        assert "sbi-2" not in preloaded
+        assert preloaded.get("sbi-2") is None
+
+        preloaded.store("sbi-1", "hash-4", '{"id": "sbi-1", "x": 1}', {"id": "sbi-1"})
+        assert preloaded.get("sbi-1")[0] == "hash-4"
+        assert len(preloaded) == 2
@@ -0,0 +1,210 @@
+"""
+Tests for the :py:mod:`ska_tango_base.sdp_links` module.
+"""
+
+import json
+
+import pytest
+
+from ska_tango_base.argument_codec import loads_encoded
+from ska_tango_base.sdp_links import (
+    ADDRESS_DTYPE,
+    MAX_HOST_LENGTH,
+    MAX_MAC_LENGTH,
+    MAX_PORT,
+    MAX_SDP_LINKS,
+    SdpLinks,
+)
+
+
+class TestSdpLinks:
+    """
+    Tests of the :py:class:`ska_tango_base.sdp_links.SdpLinks` class.
+    """
+
+    @pytest.fixture
+    def addresses(self):
+        """
+        Fixture that returns some SDP destination addresses.
+
+        :return: a dictionary of addresses
+        """
+        return {
+            "outputHost": ["10.0.0.1", "10.0.0.2", "10.0.0.3"],
+            "outputMac": [
+                "06:00:00:00:00:01",
+                "06:00:00:00:00:02",
+                "06:00:00:00:00:03",
+            ],
+            "outputPort": [9000, 9001, 9002],
+        }
+
+    def test_num_links(self):
+        """
+        Test that the number of links is bounded.
+        """
+        assert SdpLinks().num_links == 1
+        assert SdpLinks(MAX_SDP_LINKS).num_links == MAX_SDP_LINKS
+        with pytest.raises(ValueError):
+            SdpLinks(MAX_SDP_LINKS + 1)
+
+    def test_set_active(self):
+        """
+        Test that setting link activity reports only the links that
+        changed, and that the activity cannot be modified directly.
+        """
+        links = SdpLinks(8)
+        assert not links.active.any()
+
+        assert links.set_active([5, 2, 3], True).tolist() == [2, 3, 5]
+        assert links.active.nonzero()[0].tolist() == [2, 3, 5]
+        assert links.set_active([3, 4], [True, False]).tolist() == []
+        assert links.set_active([3, 4], [False, True]).tolist() == [3, 4]
+
+        with pytest.raises(ValueError):
+            links.active[0] = True
+        with pytest.raises(IndexError):
+            links.set_active([8], True)
+        with pytest.raises(IndexError):
+            links.set_active([-1], True)
+        assert not links.active[7]
+
+    def test_set_addresses(self, addresses):
+        """
+        Test that replacing the addresses reports only the addresses
+        that changed, or were added or removed.
+        """
+        links = SdpLinks()
+        assert links.set_addresses(addresses).tolist() == [0, 1, 2]
+        assert json.loads(links.addresses_json) == addresses
+        assert links.set_addresses(json.dumps(addresses)).tolist() == []
+
+        addresses["outputPort"][1] = 9011
+        assert links.set_addresses(addresses).tolist() == [1]
+        assert links.addresses["port"].tolist() == [9000, 9011, 9002]
+
+        truncated = {key: value[:1] for key, value in addresses.items()}
+        assert links.set_addresses(truncated).tolist() == [1, 2]
+        assert links.addresses_delta([1, 2]) == {
+            "length": 1,
+            "indices": [],
+            "outputHost": [],
+            "outputMac": [],
+            "outputPort": [],
+        }
+
+    def test_update_addresses(self, addresses):
+        """
+        Test that updating some addresses reports only those that
+        changed.
+        """
+        links = SdpLinks()
+        links.set_addresses(addresses)
+        update = {
+            "outputHost": ["10.0.0.3", "10.0.1.1"],
+            "outputMac": ["06:00:00:00:00:03", "06:00:00:00:01:01"],
+            "outputPort": [9002, 9100],
+        }
+        assert links.update_addresses([2, 0], update).tolist() == [0]
+        assert links.addresses_delta([0]) == {
+            "length": 3,
+            "indices": [0],
+            "outputHost": ["10.0.1.1"],
+            "outputMac": ["06:00:00:00:01:01"],
+            "outputPort": [9100],
+        }
+
+        with pytest.raises(ValueError):
+            links.update_addresses([0], update)
+        with pytest.raises(IndexError):
+            links.update_addresses([3, 4], update)
+        with pytest.raises(IndexError):
+            links.update_addresses([-1, 0], update)
+        assert links.addresses["host"].tolist()[-1] == "10.0.0.3"
+
+    def test_compact_hosts(self):
+        """
+        Test that host names are held compactly, with links to the same
+        host sharing one string, and that the longest allowed host name
+        is accepted.
+        """
+        assert ADDRESS_DTYPE.itemsize < 128
+
+        links = SdpLinks(3)
+        long_host = "h" * MAX_HOST_LENGTH
+        links.set_addresses(
+            {
+                "outputHost": ["10.0.0.1", "".join(["10.0.0.", "1"]), long_host],
+                "outputMac": ["06:00:00:00:00:01"] * 3,
+                "outputPort": [9000, 9001, 9002],
+            }
+        )
+        hosts = links.addresses["host"]
+        assert hosts[0] is hosts[1]
+        assert hosts.tolist() == ["10.0.0.1", "10.0.0.1", long_host]
+
+    def test_serialised_addresses(self, addresses):
+        """
+        Test that the serialised addresses are cached until the
+        addresses change.
+        """
+        links = SdpLinks()
+        empty = links.addresses_json
+        assert json.loads(empty) == {
+            "outputHost": [],
+            "outputMac": [],
+            "outputPort": [],
+        }
+        assert links.addresses_json is empty
+
+        links.set_addresses(addresses)
+        assert json.loads(links.addresses_json) == addresses
+        encoded = links.addresses_encoded
+        assert loads_encoded(encoded) == addresses
+
+        links.set_addresses(addresses)
+        assert links.addresses_encoded is encoded
+
+    @pytest.mark.parametrize(
+        "malformed",
+        [
+            {"outputHost": [], "outputMac": []},
+            {"outputHost": ["10.0.0.1"], "outputMac": [], "outputPort": []},
+            {"outputHost": ["10.0.0.1"], "outputMac": ["mac"], "outputPort": ["x"]},
+            ["10.0.0.1"],
+            {
+                "outputHost": ["h" * (MAX_HOST_LENGTH + 1)],
+                "outputMac": ["06:00:00:00:00:01"],
+                "outputPort": [9000],
+            },
+            {
+                "outputHost": ["10.0.0.1"],
+                "outputMac": ["06:00:00:00:00:01" + "0" * (MAX_MAC_LENGTH - 16)],
+                "outputPort": [9000],
+            },
+            {
+                "outputHost": ["10.0.0.1"],
+                "outputMac": ["06:00:00:00:00:01"],
+                "outputPort": [MAX_PORT + 1],
+            },
+            {
+                "outputHost": ["10.0.0.1"],
+                "outputMac": ["06:00:00:00:00:01"],
+                "outputPort": [-1],
+            },
+            {
+                "outputHost": ["10.0.0.1"],
+                "outputMac": ["06:00:00:00:00:01"],
+                "outputPort": [9000.5],
+            },
+        ],
+    )
+    def test_malformed_addresses(self, malformed):
+        """
+        Test that malformed addresses are rejected.
+
+        :param malformed: malformed addresses
+        """
+        links = SdpLinks()
+        with pytest.raises(ValueError):
+            links.set_addresses(malformed)
@@ -9,7 +9,12 @@ import pytest
 
 # from tango import DevState
 
-from ska_tango_base.faults import ComponentError, ComponentFault
+from ska_tango_base.faults import (
+    ComponentError,
+    ComponentFault,
+    ResourceConflictError,
+)
+from ska_tango_base.resource_registry import ResourceRegistry
 from ska_tango_base.subarray import ReferenceSubarrayComponentManager
 from ska_tango_base.control_model import PowerMode
 
@@ -111,6 +116,135 @@ class TestSubarrayComponentResourceManager:
         assert resource_pool.get() == set()
         mock_callback.assert_not_called()
 
+    def test_ResourceManager_snapshot_and_delta(self, mocker):
+        """
+        Test that the ResourceManager caches a sorted snapshot until the
+        next change, and reports the resources added and removed.
+        """
+        delta_callback = mocker.Mock()
+        resource_pool = ReferenceSubarrayComponentManager._ResourcePool(
+            delta_callback=delta_callback
+        )
+        assert resource_pool.snapshot == ()
+
+        assert resource_pool.assign(["C", "A", "B"]) == (("A", "B", "C"), ())
+        delta_callback.assert_called_once_with(("A", "B", "C"), ())
+        delta_callback.reset_mock()
+
+        snapshot = resource_pool.snapshot
+        assert snapshot == ("A", "B", "C")
+        assert resource_pool.snapshot is snapshot
+        assert resource_pool.get() is resource_pool.get()
+
+        # nothing changes, so no delta is reported
+        assert resource_pool.update(assign=["A"], release=["E"]) == ((), ())
+        delta_callback.assert_not_called()
+        assert resource_pool.snapshot is snapshot
+
+        assert resource_pool.update(assign=["D"], release=["A", "E"]) == (
+            ("D",),
+            ("A",),
+        )
+        delta_callback.assert_called_once_with(("D",), ("A",))
+        assert resource_pool.snapshot == ("B", "C", "D")
+
+    def test_ResourceManager_batch_validation(self, resource_pool, mock_callback):
+        """
+        Test that the ResourceManager validates a whole batch before
+        changing anything.
+        """
+        with pytest.raises(ValueError, match="both assigned and released"):
+            resource_pool.update(assign=["A", "B"], release=["B"])
+        assert resource_pool.get() == set()
+        mock_callback.assert_not_called()
+
+
+class TestSubarrayComponentManagerResourceRegistry:
+    """
+    Tests that subarray component managers sharing a resource registry
+    cannot be assigned the same resource.
+    """
+
+    @pytest.fixture
+    def component_managers(self, mocker, logger):
+        """
+        Fixture that returns two communicating component managers that
+        share a resource registry.
+
+        :param logger: a logger for the component managers
+
+        :return: the component managers under test
+        """
+        registry = ResourceRegistry()
+        component_managers = []
+        for owner in ["subarray/01", "subarray/02"]:
+            component_manager = ReferenceSubarrayComponentManager(
+                mocker.Mock(),
+                mocker.Mock(),
+                ["foo", "bah"],
+                logger=logger,
+                resource_registry=registry,
+                resource_owner=owner,
+                _component=ReferenceSubarrayComponentManager._Component(
+                    ["foo", "bah"], _power_mode=PowerMode.ON
+                ),
+            )
+            component_manager.start_communicating()
+            component_managers.append(component_manager)
+        return (registry, component_managers)
+
+    def test_registry_requires_owner(self, logger, mocker):
+        """
+        Test that a component manager cannot be given a resource
+        registry without an owner under which to claim resources.
+        """
+        with pytest.raises(ValueError):
+            ReferenceSubarrayComponentManager(
+                mocker.Mock(),
+                mocker.Mock(),
+                ["foo", "bah"],
+                logger=logger,
+                resource_registry=ResourceRegistry(),
+            )
+
+    def test_teardown(self, component_managers):
+        """
+        Test that a component manager's claims are released when it is
+        torn down, so that another subarray may assign its resources.
+        """
+        (registry, (first, second)) = component_managers
+
+        first.assign(["A", "B"])
+        first.teardown()
+        assert registry.owner_of("A") is None
+        assert registry.owner_of("B") is None
+        second.assign(["A", "B"])
+        assert second.assigned_resources == ["A", "B"]
+
+    def test_assign_conflict(self, component_managers):
+        """
+        Test that a resource assigned to one subarray cannot be assigned
+        to another until it is released.
+        """
+        (registry, (first, second)) = component_managers
+
+        first.assign(["A", "B"])
+        with pytest.raises(ResourceConflictError):
+            second.assign(["B", "C"])
+        assert second.assigned_resources == []
+        assert registry.owners_of(["A", "B", "C"]) == {
+            "A": "subarray/01",
+            "B": "subarray/01",
+        }
+
+        first.release(["B"])
+        second.assign(["B", "C"])
+        assert registry.resources_of("subarray/02") == {"B", "C"}
+
+        first.release_all()
+        second.restart()
+        assert len(registry) == 0
+
 
 class TestSubarrayComponentManager:
     """
@@ -238,10 +372,9 @@ class TestSubarrayComponentManager:
 
         component_manager.start_communicating()
         assert component_manager.is_communicating
-        assert mock_op_state_model.perform_action.call_args_list == [
-            (("component_unknown",),),
-            ((expected_action,),),
-        ]
+        mock_op_state_model.perform_actions.assert_called_once_with(
+            ["component_unknown", expected_action]
+        )
 
         if initial_power_mode == PowerMode.ON and not initial_fault:
             # The component manager has noticed that it missed a change
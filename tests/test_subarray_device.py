@@ -16,6 +16,7 @@ from tango import DevState, DevFailed
 
 # PROTECTED REGION ID(SKASubarray.test_additional_imports) ENABLED START #
 from ska_tango_base import SKASubarray
+from ska_tango_base.argument_codec import dumps_encoded
 from ska_tango_base.base import OpStateModel
 from ska_tango_base.commands import ResultCode
 from ska_tango_base.control_model import (
@@ -28,6 +29,7 @@ from ska_tango_base.control_model import (
     TestMode,
 )
 from ska_tango_base.faults import CommandError
+from ska_tango_base.resource_registry import ResourceRegistry
 from ska_tango_base.subarray import (
     ReferenceSubarrayComponentManager,
     SubarrayObsStateModel,
@@ -176,6 +178,20 @@ class TestSKASubarray:
             tango_context.device.AssignResources("Invalid JSON")
         # PROTECTED REGION END #    //  SKASubarray.test_AssignResources
 
+    def test_AssignResourcesEncoded(self, tango_context):
+        """Test for AssignResourcesEncoded and ReleaseResourcesEncoded"""
+        tango_context.device.On()
+
+        tango_context.device.AssignResourcesEncoded(dumps_encoded(["BAND1", "BAND2"]))
+        assert tango_context.device.ObsState == ObsState.IDLE
+        assert tango_context.device.assignedResources == ("BAND1", "BAND2")
+
+        tango_context.device.ReleaseResourcesEncoded(("json", b'["BAND1"]'))
+        assert tango_context.device.assignedResources == ("BAND2",)
+
+        with pytest.raises(DevFailed):
+            tango_context.device.AssignResourcesEncoded(("json", b"Invalid JSON"))
+
     # PROTECTED REGION ID(SKASubarray.test_EndSB_decorators) ENABLED START #
     # PROTECTED REGION END #    //  SKASubarray.test_EndSB_decorators
     def test_End(self, tango_context, tango_change_event_helper):
@@ -254,6 +270,21 @@ class TestSKASubarray:
         assert tango_context.device.assignedResources == ("BAND2",)
         # PROTECTED REGION END #    //  SKASubarray.test_ReleaseResources
 
+    def test_assignedResourcesDelta(self, tango_context, tango_change_event_helper):
+        """Test for assignedResourcesDelta"""
+        tango_context.device.On()
+        delta_callback = tango_change_event_helper.subscribe("assignedResourcesDelta")
+        delta_callback.assert_call(json.dumps({"added": [], "removed": []}))
+
+        tango_context.device.AssignResources(json.dumps(["BAND2", "BAND1"]))
+        delta_callback.assert_call(
+            json.dumps({"added": ["BAND1", "BAND2"], "removed": []})
+        )
+
+        tango_context.device.ReleaseResources(json.dumps(["BAND1", "BAND3"]))
+        delta_callback.assert_call(json.dumps({"added": [], "removed": ["BAND1"]}))
+        assert tango_context.device.assignedResources == ("BAND2",)
+
     # PROTECTED REGION ID(SKASubarray.test_Reset_decorators) ENABLED START #
     # PROTECTED REGION END #    //  SKASubarray.test_Reset_decorators
     def test_ObsReset(self, tango_context, tango_change_event_helper):
@@ -333,7 +364,8 @@ class TestSKASubarray:
         assert device_under_test.state() == DevState.OFF
         assert device_under_test.adminMode == AdminMode.MAINTENANCE
         admin_mode_callback.assert_call(AdminMode.MAINTENANCE)
-        op_state_callback.assert_calls([DevState.UNKNOWN, DevState.OFF])
+        # reconnection is batched, so the transient UNKNOWN state is not published
+        op_state_callback.assert_call(DevState.OFF)
         # PROTECTED REGION END #    //  SKASubarray.test_adminMode
 
     # PROTECTED REGION ID(SKASubarray.test_buildState_decorators) ENABLED START #
@@ -528,3 +560,93 @@ class TestSKASubarray_commands:
         )
         assert component_manager.assigned_resources == ["bar", "foo"]
         assert subarray_state_model.obs_state == ObsState.IDLE
+
+
+class TestSKASubarray_resource_registry:
+    """
+    This class contains tests of an SKASubarray whose component manager
+    claims resources in a registry shared with other subarrays.
+    """
+
+    registry = ResourceRegistry()
+    """The registry shared by the subarray under test and others."""
+
+    @pytest.fixture(scope="class")
+    def device_properties(self):
+        """
+        Fixture that returns device_properties to be provided to the
+        device under test.
+        """
+        return {
+            "CapabilityTypes": ["BAND1", "BAND2"],
+            "LoggingTargetsDefault": "",
+            "SkaLevel": "4",
+            "SubID": "1",
+        }
+
+    @pytest.fixture(scope="class")
+    def device_test_config(self, device_properties):
+        """
+        Fixture that specifies the device to be tested, along with its
+        properties and memorized attributes.
+
+        This implementation patches the device to create a component
+        manager that claims resources in a shared registry.
+        """
+        registry = self.registry
+        return {
+            "device": SKASubarray,
+            "component_manager_patch": lambda self: ReferenceSubarrayComponentManager(
+                self.op_state_model,
+                self.obs_state_model,
+                self.CapabilityTypes,
+                logger=self.logger,
+                resource_registry=registry,
+                resource_owner=self.get_name(),
+            ),
+            "properties": device_properties,
+            "memorized": {"adminMode": str(AdminMode.ONLINE.value)},
+        }
+
+    def test_AssignResources_conflict(self, tango_context):
+        """
+        Test that AssignResources fails, and assigns nothing, if any of
+        the resources is already assigned to another subarray.
+        """
+        self.registry.claim("test/subarray/02", ["BAND2"])
+        tango_context.device.On()
+
+        [[result_code], [message]] = tango_context.device.AssignResources(
+            json.dumps(["BAND1", "BAND2"])
+        )
+        assert result_code == ResultCode.FAILED
+        assert "BAND2" in message
+        assert tango_context.device.ObsState == ObsState.EMPTY
+        assert not tango_context.device.assignedResources
+        assert self.registry.owner_of("BAND1") is None
+
+        [[result_code], _] = tango_context.device.AssignResources(
+            json.dumps(["BAND1"])
+        )
+        assert result_code == ResultCode.OK
+        assert list(tango_context.device.assignedResources) == ["BAND1"]
+        assert self.registry.owner_of("BAND1") == tango_context.device.name()
+
+    def test_Init_releases_claims(self, tango_context):
+        """
+        Test that reinitialising a subarray releases the resources that
+        it claimed in the registry, so that another subarray may claim
+        them.
+        """
+        self.registry.release_all("test/subarray/02")
+        tango_context.device.On()
+        tango_context.device.AssignResources(json.dumps(["BAND1", "BAND2"]))
+        assert self.registry.owner_of("BAND2") == tango_context.device.name()
+
+        tango_context.device.Init()
+        assert self.registry.owner_of("BAND1") is None
+        assert self.registry.owner_of("BAND2") is None
+        assert self.registry.claim("test/subarray/02", ["BAND1", "BAND2"]) == (
+            "BAND1",
+            "BAND2",
+        )
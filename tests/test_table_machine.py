@@ -0,0 +1,149 @@
+"""
+Tests for the :py:mod:`ska_tango_base.table_machine` module.
+"""
+import threading
+import time
+
+import pytest
+from transitions import Machine, MachineError
+
+from ska_tango_base.table_machine import TableMachine
+
+
+class TestTableMachine:
+    """
+    Tests of the :py:class:`ska_tango_base.table_machine.TableMachine`
+    class, comparing its behaviour with that of ``transitions``.
+    """
+
+    @pytest.fixture(params=[Machine, TableMachine], ids=["transitions", "table"])
+    def machine(self, request, mocker):
+        """
+        Fixture that returns a small state machine, implemented by each
+        engine in turn, with a mock ``after_state_change`` callback.
+
+        :param request: a pytest request for the fixture parameter
+        :param mocker: pytest fixture that wraps
+            :py:mod:`unittest.mock`.
+
+        :return: a state machine
+        """
+        callback = mocker.Mock()
+        machine = request.param(
+            states=["A", "B", "C"],
+            initial="A",
+            transitions=[
+                {"source": "A", "trigger": "go", "dest": "B"},
+                {"source": ["B", "C"], "trigger": "go", "dest": "C"},
+                {"source": "B", "trigger": "stay", "dest": "="},
+                {"source": "*", "trigger": "reset", "dest": "A"},
+            ],
+            after_state_change=callback,
+        )
+        machine.callback = callback
+        return machine
+
+    def test_transitions(self, machine):
+        """
+        Test that triggers, reflexive transitions, wildcard sources and
+        automatic transitions behave as they do in ``transitions``, and
+        that the callback is called after each of them.
+        """
+        assert machine.state == "A"
+        machine.callback.assert_not_called()
+
+        assert machine.trigger("go")
+        assert machine.state == "B"
+        machine.stay()
+        assert machine.state == "B"
+        machine.go()
+        assert machine.state == "C"
+        machine.reset()
+        assert machine.state == "A"
+        machine.to_C()
+        assert machine.state == "C"
+        assert machine.callback.call_count == 5
+
+    def test_disallowed_trigger(self, machine):
+        """
+        Test that a trigger that is not accepted in the current state
+        raises MachineError without changing state, and that an unknown
+        trigger raises AttributeError.
+        """
+        with pytest.raises(MachineError):
+            machine.trigger("stay")
+        assert machine.state == "A"
+        machine.callback.assert_not_called()
+
+        with pytest.raises(AttributeError):
+            machine.trigger("unknown")
+        with pytest.raises(AttributeError):
+            machine.unknown()
+
+    def test_get_triggers(self, machine):
+        """
+        Test that the triggers accepted in each state are the same as
+        those reported by ``transitions``.
+        """
+        autos = {"to_A", "to_B", "to_C"}
+        assert set(machine.get_triggers("A")) == {"go", "reset"} | autos
+        assert set(machine.get_triggers("B")) == {"go", "stay", "reset"} | autos
+        assert set(machine.get_triggers("C")) == {"go", "reset"} | autos
+
+
+class TestTableMachineConcurrency:
+    """
+    Tests of the delivery of callbacks by the
+    :py:class:`ska_tango_base.table_machine.TableMachine` class, when it
+    is triggered from several threads.
+    """
+
+    def test_callbacks_delivered_in_order(self):
+        """
+        Test that, when transitions are triggered concurrently, each
+        callback sees the state that its transition led to, and the
+        last callback sees the final state.
+        """
+        seen = []
+
+        def callback():
+            state = machine.state
+            time.sleep(0.001)
+            seen.append(state)
+
+        machine = TableMachine(
+            states=["A", "B", "C", "D"], initial="A", after_state_change=callback
+        )
+
+        def trigger(state):
+            for _ in range(20):
+                machine.trigger(f"to_{state}")
+
+        threads = [
+            threading.Thread(target=trigger, args=(state,)) for state in "BCD"
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(seen) == ["B"] * 20 + ["C"] * 20 + ["D"] * 20
+        assert seen[-1] == machine.state
+
+    def test_callback_may_trigger(self):
+        """
+        Test that a callback may itself trigger a further transition.
+        """
+        seen = []
+
+        def callback():
+            seen.append(machine.state)
+            if machine.state == "B":
+                machine.trigger("to_C")
+
+        machine = TableMachine(
+            states=["A", "B", "C"], initial="A", after_state_change=callback
+        )
+        machine.trigger("to_B")
+        assert seen == ["B", "C"]
+        assert machine.state == "C"
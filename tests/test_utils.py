@@ -1,10 +1,18 @@
 """Tests for skabase.utils."""
 from contextlib import nullcontext
 import json
+import time
+
 import pytest
+import tango
+from transitions import Machine
 
+import ska_tango_base.utils
 from ska_tango_base.utils import (
+    compile_trigger_table,
+    DeviceProxyCache,
     get_groups_from_json,
+    get_lazy_groups_from_json,
     get_tango_device_type_id,
     GroupDefinitionsError,
     for_testing_only,
@@ -198,6 +206,64 @@ def test_get_groups_from_json_invalid(bad_group_configs):
         get_groups_from_json(json_definitions)
 
 
+def test_get_lazy_groups_from_json_valid(valid_group_configs, mocker):
+    json_definitions = _jsonify_group_configs(valid_group_configs)
+    build_group = mocker.spy(ska_tango_base.utils, "_build_group")
+    groups = get_lazy_groups_from_json(json_definitions)
+
+    # groups are not built until they are accessed
+    assert len(groups) == len(valid_group_configs)
+    build_group.assert_not_called()
+    for group_config in valid_group_configs:
+        name = group_config["group_name"]
+        assert not groups.is_built(name)
+        group = groups[name]
+        assert groups.is_built(name)
+        assert groups[name] is group
+        _validate_group(group_config, group)
+
+    with pytest.raises(KeyError):
+        groups["no such group"]
+
+
+def test_lazy_groups_device_names():
+    json_definitions = _jsonify_group_configs(
+        _get_group_configs_from_keys(["basic_no_subgroups", "multi_level"])
+    )
+    groups = get_lazy_groups_from_json(json_definitions)
+    assert groups.device_names() == [
+        "my/dev/1",
+        "dc1/aircon/1",
+        "dc1/aircon/2",
+        "dc1/server/1",
+        "dc1/server/2",
+        "dc1/switch/A",
+        "dc1/pdu/rackA",
+        "dc1/server/3",
+        "dc1/server/4",
+        "dc1/switch/B",
+        "dc1/pdu/rackB",
+    ]
+    assert not any(groups.is_built(name) for name in groups)
+
+
+def test_get_lazy_groups_from_json_invalid(bad_group_configs):
+    json_definitions = _jsonify_group_configs(bad_group_configs)
+    with pytest.raises(GroupDefinitionsError):
+        get_lazy_groups_from_json(json_definitions)
+
+
+def test_group_definitions_are_parsed_once(mocker):
+    json_definitions = _jsonify_group_configs(
+        _get_group_configs_from_keys(["basic_no_subgroups"])
+    )
+    get_lazy_groups_from_json(json_definitions)
+    loads = mocker.spy(json, "loads")
+    get_lazy_groups_from_json(json_definitions)
+    get_groups_from_json(json_definitions)
+    loads.assert_not_called()
+
+
 def test_get_tango_device_type_id():
     device_name = "domain/family/member"
     result = get_tango_device_type_id(device_name)
@@ -246,3 +312,110 @@ def test_for_testing_only_decorator():
     with pytest.warns(None) as warning_record:
         assert bah() == "bah"
     assert len(warning_record) == 0  # no warning was raised because we are testing
+
+
+def test_compile_trigger_table():
+    """
+    Test that the compiled trigger table agrees with the state machine's
+    own view of which triggers are accepted in each state.
+    """
+    machine = Machine(
+        states=["A", "B"],
+        initial="A",
+        transitions=[
+            {"source": "A", "trigger": "go", "dest": "B"},
+            {"source": "*", "trigger": "reset", "dest": "A"},
+        ],
+    )
+    table = compile_trigger_table(machine)
+
+    assert set(table) == {"A", "B"}
+    for state in machine.states:
+        assert table[state] == frozenset(machine.get_triggers(state))
+    assert "go" in table["A"]
+    assert "go" not in table["B"]
+
+    with pytest.raises(TypeError):
+        table["A"] = frozenset()
+
+
+class TestDeviceProxyCache:
+    """
+    Tests of the :py:class:`ska_tango_base.utils.DeviceProxyCache` class.
+    """
+
+    @pytest.fixture()
+    def mock_device_proxy(self, mocker):
+        """
+        Fixture that patches ``DeviceProxy``, so that each call returns
+        a new mock proxy.
+
+        :param mocker: pytest fixture that wraps
+            :py:mod:`unittest.mock`.
+
+        :return: the patched ``DeviceProxy`` class
+        """
+        return mocker.patch(
+            "ska_tango_base.utils.DeviceProxy",
+            side_effect=lambda name: mocker.Mock(name=name),
+        )
+
+    def test_hits_and_misses(self, mock_device_proxy):
+        """
+        Test that proxies are constructed once, and then reused.
+        """
+        cache = DeviceProxyCache()
+        proxy = cache.get("my/dev/1")
+        assert cache.get("my/dev/1") is proxy
+        assert cache.get("my/dev/2") is not proxy
+        assert mock_device_proxy.call_count == 2
+        assert cache.statistics == {
+            "size": 2,
+            "hits": 1,
+            "misses": 2,
+            "evictions": 0,
+            "reconnections": 0,
+        }
+
+        cache.invalidate("my/dev/1")
+        assert cache.get("my/dev/1") is not proxy
+
+    def test_lru_eviction(self, mock_device_proxy):
+        """
+        Test that the least recently used proxy is evicted when the
+        cache is full.
+        """
+        cache = DeviceProxyCache(max_size=2)
+        proxy_1 = cache.get("my/dev/1")
+        proxy_2 = cache.get("my/dev/2")
+        cache.get("my/dev/1")
+        cache.get("my/dev/3")
+        assert cache.statistics["evictions"] == 1
+        assert cache.get("my/dev/1") is proxy_1
+        assert cache.get("my/dev/2") is not proxy_2
+
+    def test_idle_timeout(self, mock_device_proxy):
+        """
+        Test that proxies that have not been used within the idle
+        timeout are evicted.
+        """
+        cache = DeviceProxyCache(idle_timeout=0.05)
+        proxy = cache.get("my/dev/1")
+        time.sleep(0.1)
+        assert cache.get("my/dev/1") is not proxy
+        assert cache.statistics["evictions"] == 1
+
+    def test_health_check(self, mock_device_proxy):
+        """
+        Test that a proxy that fails its health check is replaced.
+        """
+        cache = DeviceProxyCache(health_check_interval=0.0)
+        proxy = cache.get("my/dev/1")
+        assert cache.get("my/dev/1") is proxy
+        proxy.ping.assert_called_once_with()
+
+        proxy.ping.side_effect = tango.DevFailed()
+        new_proxy = cache.get("my/dev/1")
+        assert new_proxy is not proxy
+        assert cache.get("my/dev/1") is new_proxy
+        assert cache.statistics["reconnections"] == 1